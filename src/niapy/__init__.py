@@ -2,11 +2,18 @@
 
 """Python micro framework for building nature-inspired algorithms."""
 
-from niapy import util, algorithms, problems, task
-from niapy.runner import Runner
+from niapy.util.lazy import lazy_exports
 
 __all__ = ["algorithms", "problems", "util", "task", "Runner"]
 __project__ = "NiaPy"
 __version__ = "2.7.1"
 
 VERSION = "{0} v{1}".format(__project__, __version__)
+
+__getattr__, __dir__ = lazy_exports(__name__, {
+    'algorithms': 'algorithms',
+    'problems': 'problems',
+    'util': 'util',
+    'task': 'task',
+    'Runner': 'runner'
+})
@@ -2,10 +2,9 @@
 
 """Module with implementations of basic and hybrid algorithms."""
 
-from niapy.algorithms import basic
-from niapy.algorithms import modified
-from niapy.algorithms import other
-from niapy.algorithms.algorithm import Algorithm, Individual, default_numpy_init, default_individual_init
+from niapy.algorithms.algorithm import Algorithm, Individual, Population, default_numpy_init, default_individual_init, \
+    evaluate_individuals
+from niapy.util.lazy import lazy_exports
 
 __all__ = [
     'basic',
@@ -14,5 +13,13 @@ __all__ = [
     'Algorithm',
     'default_numpy_init',
     'default_individual_init',
+    'evaluate_individuals',
     'Individual',
+    'Population',
 ]
+
+__getattr__, __dir__ = lazy_exports(__name__, {
+    'basic': 'basic',
+    'modified': 'modified',
+    'other': 'other'
+})
@@ -1,4 +1,5 @@
 # encoding=utf8
+import copy
 import logging
 import multiprocessing
 import threading
@@ -8,6 +9,8 @@ from numpy.random import default_rng
 
 from niapy.util.array import objects_to_array
 from niapy.callbacks import CallbackList
+from niapy.checkpoint import load_checkpoint
+from niapy.evaluators import AsyncEvaluator
 
 logging.basicConfig()
 logger = logging.getLogger('niapy.util.utility')
@@ -16,8 +19,10 @@ logger.setLevel('INFO')
 __all__ = [
     'Algorithm',
     'Individual',
+    'Population',
     'default_individual_init',
-    'default_numpy_init'
+    'default_numpy_init',
+    'evaluate_individuals'
 ]
 
 
@@ -36,7 +41,7 @@ def default_numpy_init(task, population_size, rng, **_kwargs):
 
     """
     pop = rng.uniform(task.lower, task.upper, (population_size, task.dimension))
-    fpop = np.apply_along_axis(task.eval, 1, pop)
+    fpop = task.eval_batch(pop)
     return pop, fpop
 
 
@@ -59,6 +64,33 @@ def default_individual_init(task, population_size, rng, individual_type=None, **
     return pop, np.asarray([x.f for x in pop])
 
 
+def evaluate_individuals(task, population, rng=None):
+    r"""Repair and evaluate individuals with one batch evaluation.
+
+    Equivalent to calling :meth:`Individual.evaluate` on every individual, but lets the task's
+    evaluator process the whole population at once. Only use it for individual types that do not
+    derive any state from their fitness value when they are created.
+
+    Args:
+        task (Task): Optimization task.
+        population (Iterable[Individual]): Individuals to evaluate. Their ``x`` and ``f`` attributes are updated.
+        rng (Optional[numpy.random.Generator]): Random number generator used for repairing.
+
+    Returns:
+        numpy.ndarray[float]: Individuals function/fitness values.
+
+    See Also:
+        * :func:`niapy.task.Task.eval_batch`
+
+    """
+    for individual in population:
+        individual.x = task.repair(individual.x, rng=rng)
+    fitness = task.eval_batch(np.asarray([individual.x for individual in population]))
+    for individual, f in zip(population, fitness):
+        individual.f = f
+    return fitness
+
+
 class Algorithm:
     r"""Class for implementing algorithms.
 
@@ -236,6 +268,8 @@ class Algorithm:
                 2. beset fitness/function value.
 
         """
+        if isinstance(population, Population):
+            population = population.x
         ib = np.argmin(population_fitness)
         if isinstance(population_fitness, (float, int)) and best_fitness >= population_fitness:
             best_x, best_fitness = population, population_fitness
@@ -290,11 +324,71 @@ class Algorithm:
         """
         return population, population_fitness, best_x, best_fitness, params
 
-    def run(self, task):
+    def get_state(self, task, population, population_fitness, best_x, best_fitness, params):
+        r"""Get the state of an optimization run.
+
+        Besides the population and additional arguments, the state holds all attributes of the algorithm,
+        including the random generator, and the counters and convergence history of the task.
+        Callbacks are not part of the state.
+
+        Args:
+            task (Task): Optimization task.
+            population (numpy.ndarray): Current population.
+            population_fitness (numpy.ndarray): Current population fitness/function values.
+            best_x (numpy.ndarray): Global best individual.
+            best_fitness (float): Global best individuals function/fitness value.
+            params (Dict[str, Any]): Additional arguments of the algorithm.
+
+        Returns:
+            Dict[str, Any]: State of the optimization run.
+
+        See Also:
+            * :func:`niapy.algorithms.Algorithm.resume`
+
+        """
+        return {
+            'algorithm': type(self).__name__,
+            'attributes': {name: value for name, value in vars(self).items() if name not in ('callbacks', 'exception')},
+            'task': task.get_state(),
+            'population': population,
+            'population_fitness': population_fitness,
+            'best_x': best_x,
+            'best_fitness': best_fitness,
+            'params': params
+        }
+
+    def set_state(self, state, task):
+        r"""Restore the state of an optimization run.
+
+        Args:
+            state (Dict[str, Any]): State returned by :func:`niapy.algorithms.Algorithm.get_state`.
+            task (Task): Optimization task to restore counters and convergence history to.
+
+        Returns:
+            Tuple[numpy.ndarray, numpy.ndarray, numpy.ndarray, float, Dict[str, Any]]:
+                1. Population.
+                2. Population fitness/function values.
+                3. Global best individual.
+                4. Global best individuals function/fitness value.
+                5. Additional arguments of the algorithm.
+
+        Raises:
+            ValueError: If the state was saved by a different algorithm.
+
+        """
+        if state['algorithm'] != type(self).__name__:
+            raise ValueError('Checkpoint of %s can not be resumed by %s.' % (state['algorithm'], type(self).__name__))
+        state = copy.deepcopy(state)
+        vars(self).update(state['attributes'])
+        task.set_state(state['task'])
+        return state['population'], state['population_fitness'], state['best_x'], state['best_fitness'], state['params']
+
+    def run(self, task, checkpointer=None):
         r"""Start the optimization.
 
         Args:
             task (Task): Optimization task.
+            checkpointer (Optional[Checkpointer]): Periodically saves the state of the run.
 
         Returns:
             Tuple[numpy.ndarray, float]:
@@ -304,16 +398,62 @@ class Algorithm:
         See Also:
             * :func:`niapy.algorithms.Algorithm.run_iteration`
 
+        """
+        return self._run(task, None, checkpointer)
+
+    def resume(self, checkpoint, task, checkpointer=None):
+        r"""Continue an optimization run from a checkpoint.
+
+        The resumed run continues exactly like the run the checkpoint was saved from would have.
+
+        Args:
+            checkpoint (Union[str, Dict[str, Any]]): Path of checkpoint file or loaded checkpoint.
+            task (Task): Optimization task on the same problem with the same stopping conditions as the saved run.
+            checkpointer (Optional[Checkpointer]): Periodically saves the state of the resumed run.
+
+        Returns:
+            Tuple[numpy.ndarray, float]:
+                1. Best individuals components found in optimization process.
+                2. Best fitness value found in optimization process.
+
+        See Also:
+            * :class:`niapy.checkpoint.Checkpointer`
+
+        """
+        if not isinstance(checkpoint, dict):
+            checkpoint = load_checkpoint(checkpoint)
+        return self._run(task, checkpoint, checkpointer)
+
+    def _run(self, task, checkpoint, checkpointer):
+        r"""Run the optimization from the start or from a checkpoint.
+
+        Args:
+            task (Task): Optimization task.
+            checkpoint (Optional[Dict[str, Any]]): State to continue from.
+            checkpointer (Optional[Checkpointer]): Periodically saves the state of the run.
+
+        Returns:
+            Tuple[numpy.ndarray, float]:
+                1. Best individuals components found in optimization process.
+                2. Best fitness value found in optimization process.
+
         """
         try:
             self.callbacks.before_run()
-            pop, fpop, params = self.init_population(task)
-            xb, fxb = self.get_best(pop, fpop)
+            if checkpoint is None:
+                pop, fpop, params = self.init_population(task)
+                xb, fxb = self.get_best(pop, fpop)
+            else:
+                pop, fpop, xb, fxb, params = self.set_state(checkpoint, task)
+            if checkpointer is not None:
+                checkpointer.start(task)
             while not task.stopping_condition():
                 self.callbacks.before_iteration(pop, fpop, xb, fxb, **params)
                 pop, fpop, xb, fxb, params = self.run_iteration(task, pop, fpop, xb, fxb, **params)
                 self.callbacks.after_iteration(pop, fpop, xb, fxb, **params)
                 task.next_iter()
+                if checkpointer is not None and checkpointer.due(task):
+                    checkpointer.save(self.get_state(task, pop, fpop, xb, fxb, params), task)
             self.callbacks.after_run()
             return xb, fxb * task.optimization_type.value
         except BaseException as e:
@@ -322,6 +462,41 @@ class Algorithm:
             self.exception = e
             return None, None
 
+    async def run_async(self, task, max_concurrency=None):
+        r"""Start the optimization with evaluations running concurrently on the current event loop.
+
+        The algorithm runs in a worker thread, while every evaluation it requests is awaited on the
+        running event loop with :meth:`niapy.problems.Problem.evaluate_async`. Populations evaluated
+        with :meth:`niapy.task.Task.eval_batch` are gathered concurrently, so problems whose
+        evaluation waits on I/O can be kept busy. Evaluation counters stay exact.
+
+        Args:
+            task (Task): Optimization task.
+            max_concurrency (Optional[int]): Maximum number of evaluations in flight. Unlimited by default.
+
+        Returns:
+            Tuple[numpy.ndarray, float]:
+                1. Best individuals components found in optimization process.
+                2. Best fitness value found in optimization process.
+
+        See Also:
+            * :func:`niapy.algorithms.Algorithm.run`
+            * :class:`niapy.evaluators.AsyncEvaluator`
+
+        """
+        import asyncio
+
+        evaluator = task.evaluator
+        task.evaluator = AsyncEvaluator(asyncio.get_running_loop(), max_concurrency)
+        self.exception = None
+        try:
+            result = await asyncio.to_thread(self.run, task)
+        finally:
+            task.evaluator = evaluator
+        if self.bad_run():
+            raise self.exception
+        return result
+
     def bad_run(self):
         r"""Check if some exceptions where thrown when the algorithm was running.
 
@@ -466,3 +641,113 @@ class Individual:
 
         """
         return len(self.x)
+
+
+class Population:
+    r"""Population of individuals stored as a structure of arrays.
+
+    Solutions are the rows of one contiguous array ``x`` and their function/fitness values are stored in ``f``.
+    Additional per-individual parameters, e.g. the scale factor and crossover probability of jDE, are stored
+    as columns, i.e. arrays whose first axis is aligned with the rows of ``x``, and are accessible as attributes.
+
+    Indexing a population along the first axis returns a new population with all columns indexed the same way.
+    Same as with NumPy arrays, integers and slices return views that share memory with this population, while
+    integer arrays and boolean masks return copies. An integer selects a population of one individual.
+
+    Attributes:
+        x (numpy.ndarray): Solutions with shape `(n, dimension)`.
+        f (numpy.ndarray[float]): Function/fitness values of solutions with shape `(n,)`.
+        columns (Tuple[str, ...]): Names of per-individual parameter columns.
+
+    """
+
+    def __init__(self, x, f=None, **columns):
+        r"""Initialize population.
+
+        Args:
+            x (numpy.ndarray): Solutions with shape `(n, dimension)`.
+            f (Optional[numpy.ndarray[float]]): Function/fitness values of solutions. Defaults to `numpy.inf` for all solutions.
+            **columns (Dict[str, Union[float, numpy.ndarray]]): Per-individual parameters.
+                Scalars are broadcast to all individuals, arrays must have `n` rows.
+
+        """
+        self.x = np.asarray(x, dtype=float)
+        self.f = np.full(len(self.x), np.inf) if f is None else np.asarray(f, dtype=float)
+        self.columns = tuple(columns)
+        for name, value in columns.items():
+            setattr(self, name, np.full(len(self.x), value) if np.ndim(value) == 0 else np.asarray(value))
+
+    def _index(self, index):
+        if isinstance(index, (int, np.integer)):
+            if not -len(self) <= index < len(self):
+                raise IndexError('population index out of range')
+            return slice(index, index + 1 or None)
+        return index
+
+    def __len__(self):
+        r"""Get the number of individuals in population.
+
+        Returns:
+            int: Number of individuals.
+
+        """
+        return len(self.x)
+
+    def __getitem__(self, index):
+        r"""Get individuals of population.
+
+        Args:
+            index (Union[int, slice, numpy.ndarray]): Index of individuals along the first axis.
+
+        Returns:
+            Population: Selected individuals.
+
+        """
+        index = self._index(index)
+        return Population(self.x[index], self.f[index], **{name: getattr(self, name)[index] for name in self.columns})
+
+    def __setitem__(self, index, other):
+        r"""Replace individuals of population.
+
+        Args:
+            index (Union[int, slice, numpy.ndarray]): Index of individuals along the first axis.
+            other (Population): Individuals with the same columns.
+
+        """
+        index = self._index(index)
+        self.x[index] = other.x
+        self.f[index] = other.f
+        for name in self.columns:
+            getattr(self, name)[index] = getattr(other, name)
+
+    def copy(self):
+        r"""Return a deep copy of population.
+
+        Returns:
+            Population: Copy of self.
+
+        """
+        return Population(self.x.copy(), self.f.copy(), **{name: getattr(self, name).copy() for name in self.columns})
+
+    @staticmethod
+    def concatenate(populations):
+        r"""Join populations with the same columns.
+
+        Args:
+            populations (Sequence[Population]): Populations to join.
+
+        Returns:
+            Population: Joined population.
+
+        """
+        return Population(np.concatenate([p.x for p in populations]), np.concatenate([p.f for p in populations]),
+                          **{name: np.concatenate([getattr(p, name) for p in populations]) for name in populations[0].columns})
+
+    def __str__(self):
+        r"""Get string representation of population.
+
+        Returns:
+            str: String representation of self.
+
+        """
+        return '\n'.join('%s -> %s' % (x, f) for x, f in zip(self.x, self.f))
@@ -1,42 +1,6 @@
 """Implementation of basic nature-inspired algorithms."""
 
-from niapy.algorithms.basic.abc import ArtificialBeeColonyAlgorithm
-from niapy.algorithms.basic.ba import BatAlgorithm
-from niapy.algorithms.basic.bea import BeesAlgorithm
-from niapy.algorithms.basic.bfo import BacterialForagingOptimization
-from niapy.algorithms.basic.ca import CamelAlgorithm
-from niapy.algorithms.basic.cro import CoralReefsOptimization
-from niapy.algorithms.basic.cs import CuckooSearch
-from niapy.algorithms.basic.cso import CatSwarmOptimization
-from niapy.algorithms.basic.de import DifferentialEvolution, MultiStrategyDifferentialEvolution, \
-    DynNpDifferentialEvolution, AgingNpDifferentialEvolution, DynNpMultiStrategyDifferentialEvolution, multi_mutations
-from niapy.algorithms.basic.es import EvolutionStrategy1p1, EvolutionStrategyMp1, EvolutionStrategyMpL, \
-    EvolutionStrategyML
-from niapy.algorithms.basic.fa import FireflyAlgorithm
-from niapy.algorithms.basic.foa import ForestOptimizationAlgorithm
-from niapy.algorithms.basic.fpa import FlowerPollinationAlgorithm
-from niapy.algorithms.basic.fss import FishSchoolSearch
-from niapy.algorithms.basic.fwa import FireworksAlgorithm, EnhancedFireworksAlgorithm, DynamicFireworksAlgorithm, \
-    DynamicFireworksAlgorithmGauss, BareBonesFireworksAlgorithm
-from niapy.algorithms.basic.ga import GeneticAlgorithm
-from niapy.algorithms.basic.gsa import GravitationalSearchAlgorithm
-from niapy.algorithms.basic.gso import GlowwormSwarmOptimization, GlowwormSwarmOptimizationV1, \
-    GlowwormSwarmOptimizationV2, GlowwormSwarmOptimizationV3
-from niapy.algorithms.basic.gwo import GreyWolfOptimizer
-from niapy.algorithms.basic.hho import HarrisHawksOptimization
-from niapy.algorithms.basic.hs import HarmonySearch, HarmonySearchV1
-from niapy.algorithms.basic.kh import KrillHerd
-from niapy.algorithms.basic.loa import LionOptimizationAlgorithm
-from niapy.algorithms.basic.mbo import MonarchButterflyOptimization
-from niapy.algorithms.basic.mfo import MothFlameOptimizer
-from niapy.algorithms.basic.mke import MonkeyKingEvolutionV1, MonkeyKingEvolutionV2, MonkeyKingEvolutionV3
-from niapy.algorithms.basic.mshoa import MantisSearchAlgorithm, MShOA
-from niapy.algorithms.basic.pso import ParticleSwarmAlgorithm, ParticleSwarmOptimization, \
-    CenterParticleSwarmOptimization, ComprehensiveLearningParticleSwarmOptimizer, \
-    OppositionVelocityClampingParticleSwarmOptimization, MutatedCenterParticleSwarmOptimization, \
-    MutatedCenterUnifiedParticleSwarmOptimization, MutatedParticleSwarmOptimization
-from niapy.algorithms.basic.sca import SineCosineAlgorithm
-from niapy.algorithms.basic.clonalg import ClonalSelectionAlgorithm
+from niapy.util.lazy import lazy_exports
 
 __all__ = [
     'BatAlgorithm',
@@ -96,3 +60,62 @@ __all__ = [
     'BacterialForagingOptimization',
     'ClonalSelectionAlgorithm'
 ]
+
+__getattr__, __dir__ = lazy_exports(__name__, {
+    'ArtificialBeeColonyAlgorithm': 'abc',
+    'BatAlgorithm': 'ba',
+    'BeesAlgorithm': 'bea',
+    'BacterialForagingOptimization': 'bfo',
+    'CamelAlgorithm': 'ca',
+    'CoralReefsOptimization': 'cro',
+    'CuckooSearch': 'cs',
+    'CatSwarmOptimization': 'cso',
+    'DifferentialEvolution': 'de',
+    'MultiStrategyDifferentialEvolution': 'de',
+    'DynNpDifferentialEvolution': 'de',
+    'AgingNpDifferentialEvolution': 'de',
+    'DynNpMultiStrategyDifferentialEvolution': 'de',
+    'multi_mutations': 'de',
+    'EvolutionStrategy1p1': 'es',
+    'EvolutionStrategyMp1': 'es',
+    'EvolutionStrategyMpL': 'es',
+    'EvolutionStrategyML': 'es',
+    'FireflyAlgorithm': 'fa',
+    'ForestOptimizationAlgorithm': 'foa',
+    'FlowerPollinationAlgorithm': 'fpa',
+    'FishSchoolSearch': 'fss',
+    'FireworksAlgorithm': 'fwa',
+    'EnhancedFireworksAlgorithm': 'fwa',
+    'DynamicFireworksAlgorithm': 'fwa',
+    'DynamicFireworksAlgorithmGauss': 'fwa',
+    'BareBonesFireworksAlgorithm': 'fwa',
+    'GeneticAlgorithm': 'ga',
+    'GravitationalSearchAlgorithm': 'gsa',
+    'GlowwormSwarmOptimization': 'gso',
+    'GlowwormSwarmOptimizationV1': 'gso',
+    'GlowwormSwarmOptimizationV2': 'gso',
+    'GlowwormSwarmOptimizationV3': 'gso',
+    'GreyWolfOptimizer': 'gwo',
+    'HarrisHawksOptimization': 'hho',
+    'HarmonySearch': 'hs',
+    'HarmonySearchV1': 'hs',
+    'KrillHerd': 'kh',
+    'LionOptimizationAlgorithm': 'loa',
+    'MonarchButterflyOptimization': 'mbo',
+    'MothFlameOptimizer': 'mfo',
+    'MonkeyKingEvolutionV1': 'mke',
+    'MonkeyKingEvolutionV2': 'mke',
+    'MonkeyKingEvolutionV3': 'mke',
+    'MantisSearchAlgorithm': 'mshoa',
+    'MShOA': 'mshoa',
+    'ParticleSwarmAlgorithm': 'pso',
+    'ParticleSwarmOptimization': 'pso',
+    'CenterParticleSwarmOptimization': 'pso',
+    'ComprehensiveLearningParticleSwarmOptimizer': 'pso',
+    'OppositionVelocityClampingParticleSwarmOptimization': 'pso',
+    'MutatedCenterParticleSwarmOptimization': 'pso',
+    'MutatedCenterUnifiedParticleSwarmOptimization': 'pso',
+    'MutatedParticleSwarmOptimization': 'pso',
+    'SineCosineAlgorithm': 'sca',
+    'ClonalSelectionAlgorithm': 'clonalg'
+})
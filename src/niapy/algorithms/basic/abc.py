@@ -1,16 +1,15 @@
 # encoding=utf8
-import copy
 import logging
 
 import numpy as np
 
-from niapy.algorithms.algorithm import Algorithm, Individual, default_individual_init
+from niapy.algorithms.algorithm import Algorithm, Individual
 
 logging.basicConfig()
 logger = logging.getLogger('niapy.algorithms.basic')
 logger.setLevel('INFO')
 
-__all__ = ['ArtificialBeeColonyAlgorithm']
+__all__ = ['SolutionABC', 'ArtificialBeeColonyAlgorithm']
 
 
 class SolutionABC(Individual):
@@ -83,8 +82,7 @@ class ArtificialBeeColonyAlgorithm(Algorithm):
             :func:`niapy.algorithms.Algorithm.__init__`
 
         """
-        super().__init__(population_size, initialization_function=default_individual_init, individual_type=SolutionABC,
-                         *args, **kwargs)
+        super().__init__(population_size, *args, **kwargs)
         self.limit = limit
         self.food_number = self.population_size // 2
 
@@ -99,8 +97,7 @@ class ArtificialBeeColonyAlgorithm(Algorithm):
             * :func:`niapy.algorithms.Algorithm.set_parameters`
 
         """
-        super().set_parameters(population_size=population_size, initialization_function=default_individual_init,
-                               individual_type=SolutionABC, **kwargs)
+        super().set_parameters(population_size=population_size, **kwargs)
         self.food_number = self.population_size // 2
         self.limit = limit
 
@@ -116,24 +113,26 @@ class ArtificialBeeColonyAlgorithm(Algorithm):
         r"""Calculate the probes.
 
         Args:
-            foods (numpy.ndarray): Current population.
+            foods (Union[numpy.ndarray[float], Sequence[Individual]]): Function/fitness values of food sources, or
+                food sources with their function/fitness values in `f`.
 
         Returns:
             numpy.ndarray: Probabilities.
 
         """
-        probs = np.asarray([1.0 / (foods[i].f + 0.01) for i in range(self.food_number)])
-        return probs / np.sum(probs)
+        fitness = np.asarray([food.f for food in foods] if hasattr(foods[0], 'f') else foods, dtype=float)[:self.food_number]
+        quality = np.where(fitness >= 0, 1 / (1 + np.abs(fitness)), 1 + np.abs(fitness))
+        return quality / np.sum(quality)
 
     def init_population(self, task):
-        r"""Initialize the starting population.
+        r"""Initialize the starting food sources.
 
         Args:
             task (Task): Optimization task
 
         Returns:
             Tuple[numpy.ndarray, numpy.ndarray[float], Dict[str, Any]]:
-                1. New population
+                1. New population of `food_number` food sources.
                 2. New population fitness/function values
                 3. Additional arguments:
                     * trials (numpy.ndarray): Number of cycles without improvement.
@@ -142,10 +141,44 @@ class ArtificialBeeColonyAlgorithm(Algorithm):
             * :func:`niapy.algorithms.Algorithm.init_population`
 
         """
-        foods, fpop, _ = super().init_population(task)
+        foods, fpop = self.initialization_function(task=task, population_size=self.food_number, rng=self.rng,
+                                                   individual_type=self.individual_type)
         trials = np.zeros(self.food_number, dtype=np.int32)
         return foods, fpop, {'trials': trials}
 
+    def search(self, task, population, population_fitness, sources, trials):
+        r"""Search the neighbourhood of food sources, each at most once, and keep improvements.
+
+        For each food source one random dimension is moved towards or away from a random other food source.
+        All new solutions are evaluated as a batch.
+
+        Args:
+            task (Task): Optimization task.
+            population (numpy.ndarray): Food sources.
+            population_fitness (numpy.ndarray[float]): Function/fitness values of food sources.
+            sources (numpy.ndarray[int]): Distinct indices of food sources to search around.
+            trials (numpy.ndarray[int]): Number of cycles without improvement of food sources.
+
+        Returns:
+            Tuple[numpy.ndarray, numpy.ndarray[float]]:
+                1. New solutions.
+                2. New solutions function/fitness values.
+
+        """
+        n = len(sources)
+        dimensions = self.integers(task.dimension, size=n)
+        neighbors = (sources + self.integers(1, max(self.food_number, 2), size=n)) % self.food_number
+        rows = np.arange(n)
+        solutions = population[sources]
+        phi = self.uniform(-1, 1, n)
+        solutions[rows, dimensions] += phi * (solutions[rows, dimensions] - population[neighbors, dimensions])
+        task.repair_batch(solutions, self.rng, out=solutions)
+        fitness = task.eval_batch(solutions)
+        improved = fitness < population_fitness[sources]
+        population[sources[improved]], population_fitness[sources[improved]] = solutions[improved], fitness[improved]
+        trials[sources] = np.where(improved, 0, trials[sources] + 1)
+        return solutions, fitness
+
     def run_iteration(self, task, population, population_fitness, best_x, best_fitness, **params):
         r"""Core function of  the algorithm.
 
@@ -169,50 +202,24 @@ class ArtificialBeeColonyAlgorithm(Algorithm):
         """
         trials = params.pop('trials')
 
-        for i in range(self.food_number):
-            new_solution = copy.deepcopy(population[i])
-            param2change = int(self.random() * task.dimension)
-            neighbor = int(self.food_number * self.random())
-            new_solution.x[param2change] = population[i].x[param2change] + self.uniform(-1, 1) * (
-                    population[i].x[param2change] - population[neighbor].x[param2change])
-            new_solution.evaluate(task, rng=self.rng)
-            if new_solution.f < population[i].f:
-                population[i] = new_solution
-                trials[i] = 0
-                if new_solution.f < best_fitness:
-                    best_x = new_solution.x.copy()
-                    best_fitness = new_solution.f
-            else:
-                trials[i] += 1
-                if trials[i] >= self.limit:
-                    population[i], trials[i] = SolutionABC(task=task, rng=self.rng), 0
-                    if population[i].f < best_fitness:
-                        best_x, best_fitness = population[i].x.copy(), population[i].f
-        probabilities, t, s = self.calculate_probabilities(population), 0, 0
-        while t < self.food_number:
-            if self.random() < probabilities[s]:
-                t += 1
-                solution = copy.deepcopy(population[s])
-                param2change = int(self.random() * task.dimension)
-                neighbor = int(self.food_number * self.random())
-                while neighbor == s:
-                    neighbor = int(self.food_number * self.random())
-                solution.x[param2change] = population[s].x[param2change] + self.uniform(-1, 1) * (
-                        population[s].x[param2change] - population[neighbor].x[param2change])
-                solution.evaluate(task, rng=self.rng)
-                if solution.f < population[s].f:
-                    population[s] = solution
-                    trials[s] = 0
-                    if solution.f < best_fitness:
-                        best_x = solution.x.copy()
-                        best_fitness = solution.f
-                else:
-                    trials[s] += 1
-                    if trials[i] >= self.limit:
-                        population[i], trials[i] = SolutionABC(task=task, rng=self.rng), 0
-                        if population[i].f < best_fitness:
-                            best_x, best_fitness = population[i].x.copy(), population[i].f
-            s += 1
-            if s == self.food_number:
-                s = 0
-        return population, np.asarray([f.f for f in population]), best_x, best_fitness, {'trials': trials}
+        # Employed bees: one bee per food source.
+        solutions, fitness = self.search(task, population, population_fitness, np.arange(self.food_number), trials)
+        best_x, best_fitness = self.get_best(solutions, fitness, best_x, best_fitness)
+
+        # Onlooker bees: the k-th onlooker of every food source searches in round k, so it sees the earlier improvements.
+        probabilities = self.calculate_probabilities(population_fitness)
+        chosen = np.sort(self.rng.choice(self.food_number, self.food_number, p=probabilities))
+        first = np.searchsorted(chosen, chosen)
+        rounds = np.arange(self.food_number) - first
+        for r in range(rounds.max() + 1):
+            solutions, fitness = self.search(task, population, population_fitness, chosen[rounds == r], trials)
+            best_x, best_fitness = self.get_best(solutions, fitness, best_x, best_fitness)
+
+        # Scout bees: abandoned food sources are replaced by random solutions.
+        scouts = np.flatnonzero(trials >= self.limit)
+        if len(scouts):
+            population[scouts] = self.uniform(task.lower, task.upper, (len(scouts), task.dimension))
+            population_fitness[scouts] = task.eval_batch(population[scouts])
+            trials[scouts] = 0
+            best_x, best_fitness = self.get_best(population[scouts], population_fitness[scouts], best_x, best_fitness)
+        return population, population_fitness, best_x, best_fitness, {'trials': trials}
@@ -3,8 +3,7 @@ import logging
 
 import numpy as np
 
-from niapy.algorithms.algorithm import Algorithm, Individual
-from niapy.util import objects_to_array
+from niapy.algorithms.algorithm import Algorithm, Individual, Population, default_numpy_init
 
 logging.basicConfig()
 logger = logging.getLogger('niapy.algorithms.basic')
@@ -208,7 +207,7 @@ class CamelAlgorithm(Algorithm):
             * :func:`niapy.algorithms.Algorithm.__init__`
 
         """
-        super().__init__(population_size, individual_type=kwargs.pop('individual_type', Camel),
+        super().__init__(population_size, individual_type=kwargs.pop('individual_type', None),
                          initialization_function=kwargs.pop('initialization_function', self.init_pop), *args, **kwargs)
         self.burden_factor = burden_factor
         self.death_rate = death_rate
@@ -236,7 +235,7 @@ class CamelAlgorithm(Algorithm):
             * :func:`niapy.algorithms.Algorithm.set_parameters`
 
         """
-        super().set_parameters(population_size=population_size, individual_type=Camel,
+        super().set_parameters(population_size=population_size, individual_type=kwargs.pop('individual_type', None),
                                initialization_function=kwargs.pop('initialization_function', self.init_pop), **kwargs)
         self.burden_factor = burden_factor
         self.death_rate = death_rate
@@ -265,87 +264,117 @@ class CamelAlgorithm(Algorithm):
         })
         return d
 
-    def init_pop(self, task, population_size, rng, individual_type, **_kwargs):
+    def camels(self, x, fitness):
+        r"""Create caravan of newly born camels.
+
+        Args:
+            x (numpy.ndarray): Positions of camels.
+            fitness (numpy.ndarray[float]): Function/fitness values of camels.
+
+        Returns:
+            Population: Caravan with initial supply, endurance and age of camels.
+
+        """
+        return Population(x, fitness, endurance=float(self.endurance_init), endurance_past=float(self.endurance_init),
+                          supply=float(self.supply_init), supply_past=float(self.supply_init), x_past=np.copy(x),
+                          f_past=np.copy(fitness), temperature=0.0, steps=0)
+
+    def init_pop(self, task, population_size, rng, **_kwargs):
         r"""Initialize starting population.
 
         Args:
             task (Task): Optimization task.
             population_size (int): Number of camels in population.
             rng (numpy.random.Generator): Random number generator.
-            individual_type (Type[Individual]): Individual type.
 
         Returns:
-            Tuple[numpy.ndarray[Camel], numpy.ndarray[float]]:
+            Tuple[Population, numpy.ndarray[float]]:
                 1. Initialize population of camels.
                 2. Initialized populations function/fitness values.
 
         """
-        caravan = objects_to_array(
-            [individual_type(endurance_init=self.endurance_init, supply_init=self.supply_init, task=task, rng=rng,
-                             e=True) for _ in range(population_size)])
-        return caravan, np.asarray([c.f for c in caravan])
+        x, fitness = default_numpy_init(task, population_size, rng)
+        return self.camels(x, fitness), fitness
+
+    def walk(self, caravan, best_x, task):
+        r"""Move the camels in search space.
 
-    def walk(self, camel, best_x, task):
-        r"""Move the camel in search space.
+        Camels that would leave the search space stay at their past positions and are not evaluated.
 
         Args:
-            camel (Camel): Camel that we want to move.
+            caravan (Population): Camels that we want to move.
             best_x (numpy.ndarray): Global best coordinates.
             task (Task): Optimization task.
 
         Returns:
-            Camel: Camel that moved in the search space.
+            Population: Camels that moved in the search space.
 
         """
-        camel.next_temperature(self.min_temperature, self.max_temperature, self.rng)
-        camel.next_supply(self.burden_factor, task.max_iters)
-        camel.next_endurance(self.max_temperature, task.max_iters)
-        camel.next_x(best_x, self.endurance_init, self.supply_init, task, self.rng)
-        return camel
-
-    def oasis(self, c):
-        r"""Apply oasis function to camel.
+        n = len(caravan)
+        caravan.temperature = self.uniform(self.min_temperature, self.max_temperature, n)
+        caravan.supply = caravan.supply_past * (1 - self.burden_factor * caravan.steps / task.max_iters)
+        caravan.endurance = caravan.endurance_past * (1 - caravan.temperature / self.max_temperature) * (1 - caravan.steps / task.max_iters)
+        delta = self.uniform(-1, 1, n)
+        step = delta * (1 - caravan.endurance / self.endurance_init) * np.exp(1 - caravan.supply / self.supply_init)
+        x = caravan.x_past + step[:, np.newaxis] * (best_x - caravan.x_past)
+        feasible = np.all((x >= task.lower) & (x <= task.upper), axis=1)
+        caravan.x = np.where(feasible[:, np.newaxis], x, caravan.x_past)
+        caravan.f[feasible] = task.eval_batch(x[feasible])
+        return caravan
+
+    def oasis(self, caravan):
+        r"""Apply oasis function to camels.
 
         Args:
-            c (Camel): Camel to apply oasis on.
+            caravan (Population): Camels to apply oasis on.
 
         Returns:
-            Camel: Camel with applied oasis on.
+            Population: Camels with applied oasis on.
 
         """
-        if self.random() > (1 - self.visibility) and c.f < c.f_past:
-            c.refill(self.supply_init, self.endurance_init)
-        return c
+        refill = (self.random(len(caravan)) > (1 - self.visibility)) & (caravan.f < caravan.f_past)
+        caravan.supply[refill] = self.supply_init
+        caravan.endurance[refill] = self.endurance_init
+        return caravan
 
-    def life_cycle(self, camel, task):
-        r"""Apply life cycle to Camel.
+    def life_cycle(self, caravan, task):
+        r"""Apply life cycle to camels.
+
+        Dead camels are replaced with newly born camels at random positions, the rest get older.
 
         Args:
-            camel (Camel): Camel to apply life cycle.
+            caravan (Population): Camels to apply life cycle.
             task (Task): Optimization task.
 
         Returns:
-            Camel: Camel with life cycle applied to it.
+            Population: Camels with life cycle applied to them.
 
         """
-        if camel.f_past < self.death_rate * camel.f:
-            return Camel(self.endurance_init, self.supply_init, rng=self.rng, task=task)
-        else:
-            return camel.next()
+        dead = caravan.f_past < self.death_rate * caravan.f
+        alive = ~dead
+        caravan.x_past[alive] = caravan.x[alive]
+        caravan.f_past[alive] = caravan.f[alive]
+        caravan.endurance_past[alive] = caravan.endurance[alive]
+        caravan.supply_past[alive] = caravan.supply[alive]
+        caravan.steps[alive] += 1
+        if np.any(dead):
+            x = self.uniform(task.lower, task.upper, (np.count_nonzero(dead), task.dimension))
+            caravan[dead] = self.camels(x, task.eval_batch(x))
+        return caravan
 
     def run_iteration(self, task, population, population_fitness, best_x, best_fitness, **params):
         r"""Core function of Camel Algorithm.
 
         Args:
             task (Task): Optimization task.
-            population (numpy.ndarray[Camel]): Current population of Camels.
+            population (Population): Current population of Camels.
             population_fitness (numpy.ndarray[float]): Current population fitness/function values.
             best_x (numpy.ndarray): Current best Camel.
             best_fitness (float): Current best Camel fitness/function value.
             **params (Dict[str, Any]): Additional arguments.
 
         Returns:
-            Tuple[numpy.ndarray, numpy.ndarray, numpy.ndarray, float, dict]:
+            Tuple[Population, numpy.ndarray, numpy.ndarray, float, dict]:
                 1. New population
                 2. New population function/fitness value
                 3. New global best solution
@@ -353,9 +382,8 @@ class CamelAlgorithm(Algorithm):
                 5. Additional arguments
 
         """
-        new_caravan = objects_to_array([self.walk(c, best_x, task) for c in population])
-        new_caravan = objects_to_array([self.oasis(c) for c in new_caravan])
-        new_caravan = objects_to_array([self.life_cycle(c, task) for c in new_caravan])
-        new_caravan_fitness = np.asarray([c.f for c in new_caravan])
-        best_x, best_fitness = self.get_best(new_caravan, new_caravan_fitness, best_x, best_fitness)
-        return new_caravan, new_caravan_fitness, best_x, best_fitness, {}
+        new_caravan = self.walk(population.copy(), best_x, task)
+        new_caravan = self.oasis(new_caravan)
+        new_caravan = self.life_cycle(new_caravan, task)
+        best_x, best_fitness = self.get_best(new_caravan, new_caravan.f, best_x, best_fitness)
+        return new_caravan, new_caravan.f, best_x, best_fitness, {}
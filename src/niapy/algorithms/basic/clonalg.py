@@ -124,7 +124,7 @@ class ClonalSelectionAlgorithm(Algorithm):
 
     def evaluate(self, bitstrings, task):
         population = self.decode(bitstrings, task)
-        fitness = np.apply_along_axis(task.eval, 1, population)
+        fitness = task.eval_batch(population)
         return population, fitness
 
     def mutate(self, bitstring, mutation_rate):
@@ -29,7 +29,7 @@ def default_sexual_crossover(pop, p, task, rng, **_kwargs):
     """
     for i in range(len(pop) // 2):
         pop[i] = np.asarray([pop[i, d] if rng.random() < p else pop[i * 2, d] for d in range(task.dimension)])
-    return pop, np.apply_along_axis(task.eval, 1, pop)
+    return pop, task.eval_batch(pop)
 
 
 def default_brooding(pop, p, task, rng, **_kwargs):
@@ -51,7 +51,7 @@ def default_brooding(pop, p, task, rng, **_kwargs):
         pop[i] = task.repair(np.asarray(
             [pop[i, d] if rng.random() < p else task.lower[d] + task.range[d] * rng.random() for d in
              range(task.dimension)]), rng=rng)
-    return pop, np.apply_along_axis(task.eval, 1, pop)
+    return pop, task.eval_batch(pop)
 
 
 def move_corals(pop, p, f, task, rng, **_kwargs):
@@ -75,7 +75,7 @@ def move_corals(pop, p, f, task, rng, **_kwargs):
             np.asarray(
                 [pop[i, d] if rng.random() < p else pop[i, d] + f * rng.random() for d in range(task.dimension)]),
             rng=rng)
-    return pop, np.apply_along_axis(task.eval, 1, pop)
+    return pop, task.eval_batch(pop)
 
 
 class CoralReefsOptimization(Algorithm):
@@ -1,8 +1,6 @@
 # encoding=utf8
 import logging
 
-import numpy as np
-
 from niapy.algorithms.algorithm import Algorithm
 from niapy.util import levy_flight
 
@@ -126,7 +124,7 @@ class CuckooSearch(Algorithm):
 
         """
         new_nests = self.get_cuckoos(population, best_x, task)
-        new_fitness = np.apply_along_axis(task.eval, 1, new_nests)
+        new_fitness = task.eval_batch(new_nests)
 
         replace = new_fitness < population_fitness
         population[replace] = new_nests[replace]
@@ -134,7 +132,7 @@ class CuckooSearch(Algorithm):
         best_x, best_fitness = self.get_best(population, population_fitness, best_x, best_fitness)
 
         new_nests = self.empty_nests(population, task)
-        new_fitness = np.apply_along_axis(task.eval, 1, new_nests)
+        new_fitness = task.eval_batch(new_nests)
 
         replace = new_fitness < population_fitness
         population[replace] = new_nests[replace]
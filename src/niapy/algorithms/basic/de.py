@@ -4,13 +4,16 @@ import math
 
 import numpy as np
 
-from niapy.algorithms.algorithm import Algorithm, Individual, default_individual_init
+from niapy.algorithms.algorithm import Algorithm, Individual, Population, default_individual_init, default_numpy_init, \
+    evaluate_individuals
 from niapy.util.array import objects_to_array
 
 __all__ = ['DifferentialEvolution', 'DynNpDifferentialEvolution', 'AgingNpDifferentialEvolution',
            'MultiStrategyDifferentialEvolution', 'DynNpMultiStrategyDifferentialEvolution', 'AgingIndividual',
            'cross_rand1', 'cross_rand2', 'cross_best2', 'cross_best1', 'cross_best2', 'cross_curr2rand1',
-           'cross_curr2best1', 'multi_mutations', 'proportional', 'linear', 'bilinear']
+           'cross_curr2best1', 'multi_mutations', 'proportional', 'linear', 'bilinear', 'random_indices',
+           'binomial_crossover', 'cross_rand1_batch', 'cross_best1_batch', 'cross_rand2_batch', 'cross_best2_batch',
+           'cross_curr2rand1_batch', 'cross_curr2best1_batch', 'batch_strategy']
 
 logging.basicConfig()
 logger = logging.getLogger('niapy.algorithms.basic')
@@ -228,6 +231,202 @@ def cross_curr2best1(pop, ic, f, cr, rng, x_b=None, **_kwargs):
     return np.asarray(x)
 
 
+def random_indices(n, k, rng):
+    r"""Draw indexes of random individuals for mutation of every individual in population.
+
+    For populations larger than `k`, indexes in each row are distinct and differ from the row index.
+    Smaller populations are handled the same way as in the per-individual strategies.
+
+    Args:
+        n (int): Population size.
+        k (int): Number of indexes drawn for each individual.
+        rng (numpy.random.Generator): Random generator.
+
+    Returns:
+        numpy.ndarray[int]: Indexes with shape `(n, k)`.
+
+    """
+    if n > k:
+        keys = rng.random((n, n))
+        np.fill_diagonal(keys, np.inf)
+        return np.argsort(keys, axis=1)[:, :k]
+    if n == k:
+        return rng.permuted(np.tile(np.arange(n), (n, 1)), axis=1)
+    return rng.integers(n, size=(n, k))
+
+
+def binomial_crossover(pop, mutants, cr, rng):
+    r"""Binomial crossover of whole population.
+
+    Each component is taken from the mutant with probability `cr`, and at least one random component of every mutant is always taken.
+
+    Args:
+        pop (numpy.ndarray): Current population with shape `(n, d)`.
+        mutants (numpy.ndarray): Mutant vectors with shape `(n, d)`.
+        cr (Union[float, numpy.ndarray[float]]): Crossover probability or crossover probabilities of individuals with shape `(n,)`.
+        rng (numpy.random.Generator): Random generator.
+
+    Returns:
+        numpy.ndarray: Trial vectors with shape `(n, d)`.
+
+    """
+    n, d = pop.shape
+    mask = rng.random((n, d)) < np.asarray(cr)[..., np.newaxis]
+    mask[np.arange(n), rng.integers(d, size=n)] = True
+    return np.where(mask, mutants, pop)
+
+
+def cross_rand1_batch(pop, f, cr, rng, **_kwargs):
+    r"""Population level version of :func:`cross_rand1` (DE/rand/1/bin).
+
+    Args:
+        pop (numpy.ndarray): Current population with shape `(n, d)`.
+        f (Union[float, numpy.ndarray[float]]): Scale factor or scale factors of individuals with shape `(n,)`.
+        cr (Union[float, numpy.ndarray[float]]): Crossover probability or crossover probabilities of individuals with shape `(n,)`.
+        rng (numpy.random.Generator): Random generator.
+
+    Returns:
+        numpy.ndarray: Trial vectors with shape `(n, d)`.
+
+    """
+    r = random_indices(len(pop), 3, rng)
+    f = np.asarray(f)[..., np.newaxis]
+    return binomial_crossover(pop, pop[r[:, 0]] + f * (pop[r[:, 1]] - pop[r[:, 2]]), cr, rng)
+
+
+def cross_best1_batch(pop, f, cr, rng, x_b=None, **_kwargs):
+    r"""Population level version of :func:`cross_best1` (DE/best/1/bin).
+
+    Args:
+        pop (numpy.ndarray): Current population with shape `(n, d)`.
+        f (Union[float, numpy.ndarray[float]]): Scale factor or scale factors of individuals with shape `(n,)`.
+        cr (Union[float, numpy.ndarray[float]]): Crossover probability or crossover probabilities of individuals with shape `(n,)`.
+        rng (numpy.random.Generator): Random generator.
+        x_b (numpy.ndarray): Current global best solution.
+
+    Returns:
+        numpy.ndarray: Trial vectors with shape `(n, d)`.
+
+    """
+    r = random_indices(len(pop), 2, rng)
+    f = np.asarray(f)[..., np.newaxis]
+    return binomial_crossover(pop, x_b + f * (pop[r[:, 0]] - pop[r[:, 1]]), cr, rng)
+
+
+def cross_rand2_batch(pop, f, cr, rng, **_kwargs):
+    r"""Population level version of :func:`cross_rand2` (DE/rand/2/bin).
+
+    Args:
+        pop (numpy.ndarray): Current population with shape `(n, d)`.
+        f (Union[float, numpy.ndarray[float]]): Scale factor or scale factors of individuals with shape `(n,)`.
+        cr (Union[float, numpy.ndarray[float]]): Crossover probability or crossover probabilities of individuals with shape `(n,)`.
+        rng (numpy.random.Generator): Random generator.
+
+    Returns:
+        numpy.ndarray: Trial vectors with shape `(n, d)`.
+
+    """
+    r = random_indices(len(pop), 5, rng)
+    f = np.asarray(f)[..., np.newaxis]
+    mutants = pop[r[:, 0]] + f * (pop[r[:, 1]] - pop[r[:, 2]]) + f * (pop[r[:, 3]] - pop[r[:, 4]])
+    return binomial_crossover(pop, mutants, cr, rng)
+
+
+def cross_best2_batch(pop, f, cr, rng, x_b=None, **_kwargs):
+    r"""Population level version of :func:`cross_best2` (DE/best/2/bin).
+
+    Args:
+        pop (numpy.ndarray): Current population with shape `(n, d)`.
+        f (Union[float, numpy.ndarray[float]]): Scale factor or scale factors of individuals with shape `(n,)`.
+        cr (Union[float, numpy.ndarray[float]]): Crossover probability or crossover probabilities of individuals with shape `(n,)`.
+        rng (numpy.random.Generator): Random generator.
+        x_b (numpy.ndarray): Current global best solution.
+
+    Returns:
+        numpy.ndarray: Trial vectors with shape `(n, d)`.
+
+    """
+    r = random_indices(len(pop), 4, rng)
+    f = np.asarray(f)[..., np.newaxis]
+    mutants = x_b + f * (pop[r[:, 0]] - pop[r[:, 1]]) + f * (pop[r[:, 2]] - pop[r[:, 3]])
+    return binomial_crossover(pop, mutants, cr, rng)
+
+
+def cross_curr2rand1_batch(pop, f, cr, rng, **_kwargs):
+    r"""Population level version of :func:`cross_curr2rand1` (DE/curr-to-rand/1/bin).
+
+    Args:
+        pop (numpy.ndarray): Current population with shape `(n, d)`.
+        f (Union[float, numpy.ndarray[float]]): Scale factor or scale factors of individuals with shape `(n,)`.
+        cr (Union[float, numpy.ndarray[float]]): Crossover probability or crossover probabilities of individuals with shape `(n,)`.
+        rng (numpy.random.Generator): Random generator.
+
+    Returns:
+        numpy.ndarray: Trial vectors with shape `(n, d)`.
+
+    """
+    r = random_indices(len(pop), 4, rng)
+    f = np.asarray(f)[..., np.newaxis]
+    mutants = pop + f * (pop[r[:, 0]] - pop[r[:, 1]]) + f * (pop[r[:, 2]] - pop[r[:, 3]])
+    return binomial_crossover(pop, mutants, cr, rng)
+
+
+def cross_curr2best1_batch(pop, f, cr, rng, x_b=None, **_kwargs):
+    r"""Population level version of :func:`cross_curr2best1` (DE/curr-to-best/1/bin).
+
+    Args:
+        pop (numpy.ndarray): Current population with shape `(n, d)`.
+        f (Union[float, numpy.ndarray[float]]): Scale factor or scale factors of individuals with shape `(n,)`.
+        cr (Union[float, numpy.ndarray[float]]): Crossover probability or crossover probabilities of individuals with shape `(n,)`.
+        rng (numpy.random.Generator): Random generator.
+        x_b (numpy.ndarray): Current global best solution.
+
+    Returns:
+        numpy.ndarray: Trial vectors with shape `(n, d)`.
+
+    """
+    r = random_indices(len(pop), 3, rng)
+    f = np.asarray(f)[..., np.newaxis]
+    mutants = pop + f * (x_b - pop[r[:, 0]]) + f * (pop[r[:, 1]] - pop[r[:, 2]])
+    return binomial_crossover(pop, mutants, cr, rng)
+
+
+def batch_strategy(strategy):
+    r"""Get population level version of mutation strategy.
+
+    Built-in strategies are replaced with their population level versions. Any other callable is treated as a
+    per-individual strategy and is called as ``strategy(pop, i, f, cr, rng, **kwargs)`` for each individual in turn,
+    the same way the sequential mode calls it.
+
+    Args:
+        strategy (Callable[[numpy.ndarray, int, float, float, numpy.random.Generator, Dict[str, Any]], numpy.ndarray]):
+            Per-individual strategy, e.g. :func:`cross_rand1`, or a built-in population level strategy.
+
+    Returns:
+        Callable[[numpy.ndarray, float, float, numpy.random.Generator, Dict[str, Any]], numpy.ndarray]:
+            Population level strategy.
+
+    """
+    strategies = {
+        cross_rand1: cross_rand1_batch,
+        cross_best1: cross_best1_batch,
+        cross_rand2: cross_rand2_batch,
+        cross_best2: cross_best2_batch,
+        cross_curr2rand1: cross_curr2rand1_batch,
+        cross_curr2best1: cross_curr2best1_batch,
+    }
+    if strategy in strategies:
+        return strategies[strategy]
+    if strategy in strategies.values():
+        return strategy
+
+    def apply(pop, f, cr, rng, **kwargs):
+        f, cr = np.broadcast_to(f, len(pop)), np.broadcast_to(cr, len(pop))
+        return np.asarray([strategy(pop, i, f[i], cr[i], rng, **kwargs) for i in range(len(pop))], dtype=float)
+
+    return apply
+
+
 class DifferentialEvolution(Algorithm):
     r"""Implementation of Differential evolution algorithm.
 
@@ -251,6 +450,7 @@ class DifferentialEvolution(Algorithm):
         differential_weight (float): Scale factor.
         crossover_probability (float): Crossover probability.
         strategy (Callable[numpy.ndarray, int, numpy.ndarray, float, float, numpy.random.Generator, Dict[str, Any]]): crossover and mutation strategy.
+        batch (bool): Evolve, repair, evaluate and select the whole generation at once on `(population_size, dimension)` arrays.
 
     See Also:
         * :class:`niapy.algorithms.Algorithm`
@@ -273,7 +473,7 @@ class DifferentialEvolution(Algorithm):
         return r"""Storn, Rainer, and Kenneth Price. "Differential evolution - a simple and efficient heuristic for global optimization over continuous spaces." Journal of global optimization 11.4 (1997): 341-359."""
 
     def __init__(self, population_size=50, differential_weight=1, crossover_probability=0.8, strategy=cross_rand1,
-                 *args, **kwargs):
+                 batch=False, *args, **kwargs):
         """Initialize DifferentialEvolution.
 
         Args:
@@ -282,20 +482,28 @@ class DifferentialEvolution(Algorithm):
             crossover_probability (Optional[float]): Crossover rate.
             strategy (Optional[Callable[[numpy.ndarray, int, numpy.ndarray, float, float, numpy.random.Generator, list], numpy.ndarray]]):
                 Crossover and mutation strategy.
+            batch (Optional[bool]): Evolve the whole generation at once on `(population_size, dimension)` arrays.
+                Built-in strategies are replaced with their population level versions, other strategies are applied
+                to each individual in turn, see :func:`batch_strategy`.
+
+        Raises:
+            ValueError: If batch mode is requested for a variant that does not support it.
 
         See Also:
             * :func:`niapy.algorithms.Algorithm.__init__`
 
         """
         super().__init__(population_size,
-                         initialization_function=kwargs.pop('initialization_function', default_individual_init),
-                         individual_type=kwargs.pop('individual_type', Individual), *args, **kwargs)
+                         initialization_function=kwargs.pop('initialization_function', default_numpy_init if batch else default_individual_init),
+                         individual_type=kwargs.pop('individual_type', None if batch else Individual), *args, **kwargs)
         self.differential_weight = differential_weight
         self.crossover_probability = crossover_probability
         self.strategy = strategy
+        self.batch = batch
+        self._check_batch()
 
     def set_parameters(self, population_size=50, differential_weight=1, crossover_probability=0.8, strategy=cross_rand1,
-                       **kwargs):
+                       batch=False, **kwargs):
         r"""Set the algorithm parameters.
 
         Args:
@@ -304,17 +512,40 @@ class DifferentialEvolution(Algorithm):
             crossover_probability (Optional[float]): Crossover rate.
             strategy (Optional[Callable[[numpy.ndarray, int, numpy.ndarray, float, float, numpy.random.Generator, list], numpy.ndarray]]):
                 Crossover and mutation strategy.
+            batch (Optional[bool]): Evolve the whole generation at once on `(population_size, dimension)` arrays.
+
+        Raises:
+            ValueError: If batch mode is requested for a variant that does not support it.
 
         See Also:
             * :func:`niapy.algorithms.Algorithm.set_parameters`
 
         """
         super().set_parameters(population_size=population_size,
-                               initialization_function=kwargs.pop('initialization_function', default_individual_init),
-                               individual_type=kwargs.pop('individual_type', Individual), **kwargs)
+                               initialization_function=kwargs.pop('initialization_function', default_numpy_init if batch else default_individual_init),
+                               individual_type=kwargs.pop('individual_type', None if batch else Individual), **kwargs)
         self.differential_weight = differential_weight
         self.crossover_probability = crossover_probability
         self.strategy = strategy
+        self.batch = batch
+        self._check_batch()
+
+    def _check_batch(self):
+        r"""Check that every overridden operator of this variant has a batch counterpart if batch mode is used.
+
+        Raises:
+            ValueError: If batch mode is requested for a variant that does not support it.
+
+        """
+        if not self.batch:
+            return
+
+        def owner(name):
+            return next(cls for cls in type(self).__mro__ if name in vars(cls))
+
+        for name in ('evolve', 'selection', 'post_selection', 'run_iteration'):
+            if not issubclass(owner(name + '_batch'), owner(name)):
+                raise ValueError('%s does not support batch mode.' % type(self).__name__)
 
     def get_parameters(self):
         r"""Get parameters values of the algorithm.
@@ -330,7 +561,8 @@ class DifferentialEvolution(Algorithm):
         d.update({
             'differential_weight': self.differential_weight,
             'crossover_probability': self.crossover_probability,
-            'strategy': self.strategy
+            'strategy': self.strategy,
+            'batch': self.batch
         })
         return d
 
@@ -346,27 +578,34 @@ class DifferentialEvolution(Algorithm):
             numpy.ndarray: New evolved populations.
 
         """
-        return objects_to_array(
-            [self.individual_type(x=self.strategy(pop, i, self.differential_weight, self.crossover_probability, self.rng, x_b=xb), task=task, rng=self.rng, e=True) for i
+        new_pop = objects_to_array(
+            [self.individual_type(x=self.strategy(pop, i, self.differential_weight, self.crossover_probability, self.rng, x_b=xb), task=task, rng=self.rng, e=False) for i
              in range(len(pop))])
+        evaluate_individuals(task, new_pop, self.rng)
+        return new_pop
 
     def selection(self, population, new_population, best_x, best_fitness, task, **kwargs):
         r"""Operator for selection.
 
         Args:
-            population (numpy.ndarray): Current population.
-            new_population (numpy.ndarray): New Population.
+            population (Union[numpy.ndarray[Individual], Population]): Current population.
+            new_population (Union[numpy.ndarray[Individual], Population]): New Population.
             best_x (numpy.ndarray): Current global best solution.
             best_fitness (float): Current global best solutions fitness/objective value.
             task (Task): Optimization task.
 
         Returns:
-            Tuple[numpy.ndarray, numpy.ndarray, float]:
+            Tuple[Union[numpy.ndarray[Individual], Population], numpy.ndarray, float]:
                 1. New selected individuals.
                 2. New global best solution.
                 3. New global best solutions fitness/objective value.
 
         """
+        if isinstance(population, Population):
+            improved = new_population.f < population.f
+            population[improved] = new_population[improved]
+            best_x, best_fitness = self.get_best(population, population.f, best_x, best_fitness)
+            return population, best_x, best_fitness
         arr = objects_to_array([e if e.f < population[i].f else population[i] for i, e in enumerate(new_population)])
         best_x, best_fitness = self.get_best(arr, np.asarray([e.f for e in arr]), best_x, best_fitness)
         return arr, best_x, best_fitness
@@ -414,10 +653,111 @@ class DifferentialEvolution(Algorithm):
             * :func:`niapy.algorithms.basic.DifferentialEvolution.post_selection`
 
         """
+        if self.batch:
+            return self.run_iteration_batch(task, population, population_fitness, best_x, best_fitness, **params)
         new_population = self.evolve(population, best_x, task)
         population, best_x, best_fitness = self.selection(population, new_population, best_x, best_fitness, task=task)
         population, best_x, best_fitness = self.post_selection(population, task, best_x, best_fitness)
-        population_fitness = np.asarray([x.f for x in population])
+        population_fitness = population.f if isinstance(population, Population) else np.asarray([x.f for x in population])
+        best_x, best_fitness = self.get_best(population, population_fitness, best_x, best_fitness)
+        return population, population_fitness, best_x, best_fitness, {}
+
+    def evolve_batch(self, pop, xb, task, **kwargs):
+        r"""Create, repair and evaluate trial vectors of the whole population.
+
+        Args:
+            pop (numpy.ndarray): Current population with shape `(n, d)`.
+            xb (numpy.ndarray): Current best solution.
+            task (Task): Optimization task.
+
+        Returns:
+            Tuple[numpy.ndarray, numpy.ndarray[float]]:
+                1. Trial vectors.
+                2. Trial vectors fitness/function values.
+
+        See Also:
+            * :func:`niapy.algorithms.basic.de.batch_strategy`
+
+        """
+        trials = batch_strategy(self.strategy)(pop, self.differential_weight, self.crossover_probability, self.rng, x_b=xb)
+        trials = task.repair_batch(trials, self.rng, out=trials)
+        return trials, task.eval_batch(trials)
+
+    def selection_batch(self, pop, fpop, trials, trials_fitness, xb, fxb, task, **kwargs):
+        r"""Select between individuals and their trial vectors.
+
+        Args:
+            pop (numpy.ndarray): Current population.
+            fpop (numpy.ndarray[float]): Current population fitness/function values.
+            trials (numpy.ndarray): Trial vectors.
+            trials_fitness (numpy.ndarray[float]): Trial vectors fitness/function values.
+            xb (numpy.ndarray): Current global best solution.
+            fxb (float): Current global best solutions fitness/objective value.
+            task (Task): Optimization task.
+
+        Returns:
+            Tuple[numpy.ndarray, numpy.ndarray[float], numpy.ndarray, float]:
+                1. New population.
+                2. New population fitness/function values.
+                3. New global best solution.
+                4. New global best solutions fitness/objective value.
+
+        """
+        improved = trials_fitness < fpop
+        pop = np.where(improved[:, np.newaxis], trials, pop)
+        fpop = np.where(improved, trials_fitness, fpop)
+        xb, fxb = self.get_best(pop, fpop, xb, fxb)
+        return pop, fpop, xb, fxb
+
+    def post_selection_batch(self, pop, fpop, task, xb, fxb, **kwargs):
+        r"""Apply additional operation after selection in batch mode.
+
+        Args:
+            pop (numpy.ndarray): Current population.
+            fpop (numpy.ndarray[float]): Current population fitness/function values.
+            task (Task): Optimization task.
+            xb (numpy.ndarray): Global best solution.
+            fxb (float): Global best fitness.
+
+        Returns:
+            Tuple[numpy.ndarray, numpy.ndarray[float], numpy.ndarray, float]:
+                1. New population.
+                2. New population fitness/function values.
+                3. New global best solution.
+                4. New global best solutions fitness/objective value.
+
+        """
+        return pop, fpop, xb, fxb
+
+    def run_iteration_batch(self, task, population, population_fitness, best_x, best_fitness, **params):
+        r"""Core function of Differential Evolution algorithm in batch mode.
+
+        Args:
+            task (Task): Optimization task.
+            population (numpy.ndarray): Current population with shape `(n, d)`.
+            population_fitness (numpy.ndarray): Current populations fitness/function values.
+            best_x (numpy.ndarray): Current best individual.
+            best_fitness (float): Current best individual function/fitness value.
+            **params (dict): Additional arguments.
+
+        Returns:
+            Tuple[numpy.ndarray, numpy.ndarray, numpy.ndarray, float, Dict[str, Any]]:
+                1. New population.
+                2. New population fitness/function values.
+                3. New global best solution.
+                4. New global best solutions fitness/objective value.
+                5. Additional arguments.
+
+        See Also:
+            * :func:`niapy.algorithms.basic.DifferentialEvolution.evolve_batch`
+            * :func:`niapy.algorithms.basic.DifferentialEvolution.selection_batch`
+            * :func:`niapy.algorithms.basic.DifferentialEvolution.post_selection_batch`
+
+        """
+        trials, trials_fitness = self.evolve_batch(population, best_x, task)
+        population, population_fitness, best_x, best_fitness = self.selection_batch(population, population_fitness, trials, trials_fitness,
+                                                                                     best_x, best_fitness, task)
+        population, population_fitness, best_x, best_fitness = self.post_selection_batch(population, population_fitness, task, best_x, best_fitness)
         best_x, best_fitness = self.get_best(population, population_fitness, best_x, best_fitness)
         return population, population_fitness, best_x, best_fitness, {}
 
@@ -531,6 +871,35 @@ class DynNpDifferentialEvolution(DifferentialEvolution):
             pop = objects_to_array([pop[i] if pop[i].f < pop[i + new_np].f else pop[i + new_np] for i in range(new_np)])
         return pop, xb, fxb
 
+    def post_selection_batch(self, pop, fpop, task, xb, fxb, **kwargs):
+        r"""Post selection operator in batch mode.
+
+        Args:
+            pop (Union[numpy.ndarray, Population]): Current population.
+            fpop (numpy.ndarray[float]): Current population fitness/function values.
+            task (Task): Optimization task.
+            xb (numpy.ndarray): Global best individual coordinates.
+            fxb (float): Global best fitness.
+
+        Returns:
+            Tuple[numpy.ndarray, numpy.ndarray[float], numpy.ndarray, float]:
+                1. Changed current population.
+                2. Changed current population fitness/function values.
+                3. New global best solution.
+                4. New global best solutions fitness/objective value.
+
+        See Also:
+            * :func:`niapy.algorithms.basic.DynNpDifferentialEvolution.post_selection`
+
+        """
+        gr = task.max_evals // (self.p_max * len(pop)) + self.rp
+        new_np = len(pop) // 2
+        if (task.iters + 1) == gr and len(pop) > 3:
+            index = np.arange(new_np)
+            index = np.where(fpop[index] < fpop[index + new_np], index, index + new_np)
+            pop, fpop = pop[index], fpop[index]
+        return pop, fpop, xb, fxb
+
 
 def proportional(min_lifetime, max_lifetime, mu, x_f, avg, **_kwargs):
     r"""Proportional calculation of age of individual.
@@ -956,6 +1325,31 @@ class MultiStrategyDifferentialEvolution(DifferentialEvolution):
             [self.strategy(pop, i, xb, self.differential_weight, self.crossover_probability, self.rng, task, self.individual_type, self.strategies) for i in
              range(len(pop))])
 
+    def evolve_batch(self, pop, xb, task, **kwargs):
+        r"""Evolve population with every mutation strategy and keep the best trial vector of each individual.
+
+        Args:
+            pop (numpy.ndarray): Current population with shape `(n, d)`.
+            xb (numpy.ndarray): Current best solution.
+            task (Task): Optimization task.
+
+        Returns:
+            Tuple[numpy.ndarray, numpy.ndarray[float]]:
+                1. Trial vectors.
+                2. Trial vectors fitness/function values.
+
+        """
+        trials, trials_fitness = [], []
+        for strategy in self.strategies:
+            x = batch_strategy(strategy)(pop, self.differential_weight, self.crossover_probability, self.rng, x_b=xb)
+            x = task.repair_batch(x, self.rng, out=x)
+            trials.append(x)
+            trials_fitness.append(task.eval_batch(x))
+        trials, trials_fitness = np.asarray(trials), np.asarray(trials_fitness)
+        best = np.argmin(trials_fitness, axis=0)
+        index = np.arange(len(pop))
+        return trials[best, index], trials_fitness[best, index]
+
 
 class DynNpMultiStrategyDifferentialEvolution(MultiStrategyDifferentialEvolution, DynNpDifferentialEvolution):
     r"""Implementation of Dynamic population size Differential evolution algorithm with dynamic population size that is defined by the quality of population.
@@ -1032,6 +1426,15 @@ class DynNpMultiStrategyDifferentialEvolution(MultiStrategyDifferentialEvolution
         """
         return MultiStrategyDifferentialEvolution.evolve(self, pop, xb, task, **kwargs)
 
+    def evolve_batch(self, pop, xb, task, **kwargs):
+        r"""Evolve the current population in batch mode.
+
+        See Also:
+            * :func:`niapy.algorithms.basic.MultiStrategyDifferentialEvolution.evolve_batch`
+
+        """
+        return MultiStrategyDifferentialEvolution.evolve_batch(self, pop, xb, task, **kwargs)
+
     def post_selection(self, pop, task, xb, fxb, **kwargs):
         r"""Post selection operator.
 
@@ -1052,3 +1455,12 @@ class DynNpMultiStrategyDifferentialEvolution(MultiStrategyDifferentialEvolution
 
         """
         return DynNpDifferentialEvolution.post_selection(self, pop, task, xb, fxb)
+
+    def post_selection_batch(self, pop, fpop, task, xb, fxb, **kwargs):
+        r"""Post selection operator in batch mode.
+
+        See Also:
+            * :func:`niapy.algorithms.basic.DynNpDifferentialEvolution.post_selection_batch`
+
+        """
+        return DynNpDifferentialEvolution.post_selection_batch(self, pop, fpop, task, xb, fxb)
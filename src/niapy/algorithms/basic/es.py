@@ -1,11 +1,9 @@
 # encoding=utf8
 import logging
-from math import ceil
 
 import numpy as np
 
-from niapy.algorithms.algorithm import Algorithm, Individual, default_individual_init
-from niapy.util import objects_to_array
+from niapy.algorithms.algorithm import Algorithm, Individual, Population, default_numpy_init
 
 logging.basicConfig()
 logger = logging.getLogger('niapy.algorithms.basic')
@@ -99,7 +97,7 @@ class EvolutionStrategy1p1(Algorithm):
 
         """
         kwargs.pop('population_size', None)
-        super().__init__(population_size=mu, individual_type=kwargs.pop('individual_type', IndividualES), *args, **kwargs)
+        super().__init__(population_size=mu, individual_type=kwargs.pop('individual_type', None), *args, **kwargs)
         self.mu = mu
         self.k = k
         self.c_a = c_a
@@ -121,7 +119,7 @@ class EvolutionStrategy1p1(Algorithm):
 
         """
         kwargs.pop('population_size', None)
-        super().set_parameters(population_size=mu, individual_type=kwargs.pop('individual_type', IndividualES), **kwargs)
+        super().set_parameters(population_size=mu, individual_type=kwargs.pop('individual_type', None), **kwargs)
         self.mu = mu
         self.k = k
         self.c_a = c_a
@@ -185,14 +183,15 @@ class EvolutionStrategy1p1(Algorithm):
             task (Task): Optimization task.
 
         Returns:
-            Tuple[Individual, float, Dict[str, Any]]:
-                1. Initialized individual.
+            Tuple[Population, numpy.ndarray[float], Dict[str, Any]]:
+                1. Initialized population with one individual.
                 2. Initialized individual fitness/function value.
                 3. Additional arguments:
                     * ki (int): Number of successful rho update.
 
         """
-        c, ki = IndividualES(task=task, rng=self.rng), 0
+        x, fitness = default_numpy_init(task, 1, self.rng)
+        c, ki = Population(x, fitness, rho=1.0), 0
         return c, c.f, {'ki': ki}
 
     def run_iteration(self, task, c, population_fitness, best_x, best_fitness, **params):
@@ -200,14 +199,14 @@ class EvolutionStrategy1p1(Algorithm):
 
         Args:
             task (Task): Optimization task.
-            c (Individual): Current position.
-            population_fitness (float): Current position function/fitness value.
+            c (Population): Current position.
+            population_fitness (numpy.ndarray[float]): Current position function/fitness value.
             best_x (numpy.ndarray): Global best position.
             best_fitness (float): Global best function/fitness value.
             **params (Dict[str, Any]): Additional arguments.
 
         Returns:
-            Tuple[Individual, float, Individual, float, Dict[str, Any]]:
+            Tuple[Population, numpy.ndarray[float], numpy.ndarray, float, Dict[str, Any]]:
                 1. Initialized individual.
                 2. Initialized individual fitness/function value.
                 3. New global best solution.
@@ -219,12 +218,13 @@ class EvolutionStrategy1p1(Algorithm):
         ki = params.pop('ki')
 
         if (task.iters + 1) % self.k == 0:
-            c.rho, ki = self.update_rho(c.rho, ki), 0
-        cn = objects_to_array([task.repair(self.mutate(c.x, c.rho), self.rng) for _i in range(self.mu)])
-        cn_f = np.asarray([task.eval(cn[i]) for i in range(len(cn))])
+            c.rho[0], ki = self.update_rho(c.rho[0], ki), 0
+        cn = c.x + self.normal(0, c.rho[0], (self.mu, task.dimension))
+        cn = task.repair_batch(cn, self.rng, out=cn)
+        cn_f = task.eval_batch(cn)
         ib = np.argmin(cn_f)
-        if cn_f[ib] < c.f:
-            c.x, c.f, ki = cn[ib], cn_f[ib], ki + 1
+        if cn_f[ib] < c.f[0]:
+            c.x[0], c.f[0], ki = cn[ib], cn_f[ib], ki + 1
             if cn_f[ib] < best_fitness:
                 best_x, best_fitness = self.get_best(cn[ib], cn_f[ib], best_x, best_fitness)
         return c, c.f, best_x, best_fitness, {'ki': ki}
@@ -337,7 +337,7 @@ class EvolutionStrategyMpL(EvolutionStrategy1p1):
             lam (int): Number of new individual generated by mutation.
 
         """
-        super().__init__(initialization_function=default_individual_init, *args, **kwargs)
+        super().__init__(initialization_function=default_numpy_init, *args, **kwargs)
         self.lam = lam
 
     def set_parameters(self, lam=45, **kwargs):
@@ -350,7 +350,7 @@ class EvolutionStrategyMpL(EvolutionStrategy1p1):
             * :func:`niapy.algorithms.basic.es.EvolutionStrategy1p1.set_parameters`
 
         """
-        super().set_parameters(initialization_function=default_individual_init, **kwargs)
+        super().set_parameters(initialization_function=default_numpy_init, **kwargs)
         self.lam = lam
 
     def get_parameters(self):
@@ -368,49 +368,46 @@ class EvolutionStrategyMpL(EvolutionStrategy1p1):
         r"""Update standard deviation for population.
 
         Args:
-            pop (numpy.ndarray[Individual]): Current population.
+            pop (Population): Current population.
             k (int): Number of successful mutations.
 
         """
         phi = k / self.k
         if phi < 0.2:
-            for i in pop:
-                i.rho = self.c_r * i.rho
+            pop.rho *= self.c_r
         elif phi > 0.2:
-            for i in pop:
-                i.rho = self.c_a * i.rho
+            pop.rho *= self.c_a
 
     @staticmethod
     def change_count(c, cn):
         r"""Update number of successful mutations for population.
 
         Args:
-            c (numpy.ndarray[Individual]): Current population.
-            cn (numpy.ndarray[Individual]): New population.
+            c (Population): Current population.
+            cn (Population): New population.
 
         Returns:
             int: Number of successful mutations.
 
         """
-        k = 0
-        for e in cn:
-            if e not in c.tolist():
-                k += 1
-        return k
+        same = np.all(cn.x[:, np.newaxis] == c.x[np.newaxis], axis=2) & (cn.f[:, np.newaxis] == c.f[np.newaxis])
+        return int(np.count_nonzero(~np.any(same, axis=1)))
 
     def mutate_rand(self, pop, task):
-        r"""Mutate random individual form population.
+        r"""Create lambda children by mutating random individuals from population.
 
         Args:
-            pop (numpy.ndarray[Individual]): Current population.
+            pop (Population): Current population.
             task (Task): Optimization task.
 
         Returns:
-            numpy.ndarray: Random individual from population that was mutated.
+            Population: Evaluated children.
 
         """
-        i = self.integers(self.mu)
-        return task.repair(self.mutate(pop[i].x, pop[i].rho), rng=self.rng)
+        i = self.integers(self.mu, size=self.lam)
+        x = pop.x[i] + self.normal(0, 1, (self.lam, task.dimension)) * pop.rho[i, np.newaxis]
+        x = task.repair_batch(x, self.rng, out=x)
+        return Population(x, task.eval_batch(x), rho=1.0)
 
     def init_population(self, task):
         r"""Initialize starting population.
@@ -419,7 +416,7 @@ class EvolutionStrategyMpL(EvolutionStrategy1p1):
             task (Task): Optimization task.
 
         Returns:
-            Tuple[numpy.ndarray[Individual], numpy.ndarray[float], Dict[str, Any]]:
+            Tuple[Population, numpy.ndarray[float], Dict[str, Any]]:
                 1. Initialized population.
                 2. Initialized populations function/fitness values.
                 3. Additional arguments:
@@ -431,21 +428,21 @@ class EvolutionStrategyMpL(EvolutionStrategy1p1):
         """
         c, fc, d = Algorithm.init_population(self, task)
         d.update({'ki': 0})
-        return c, fc, d
+        return Population(c, fc, rho=1.0), fc, d
 
     def run_iteration(self, task, c, population_fitness, best_x, best_fitness, **params):
         r"""Core function of EvolutionStrategyMpL algorithm.
 
         Args:
             task (Task): Optimization task.
-            c (numpy.ndarray): Current population.
+            c (Population): Current population.
             population_fitness (numpy.ndarray): Current populations fitness/function values.
             best_x (numpy.ndarray): Global best individual.
             best_fitness (float): Global best individuals fitness/function value.
             **params (Dict[str, Any]): Additional arguments.
 
         Returns:
-            Tuple[numpy.ndarray, numpy.ndarray, numpy.ndarray, float, Dict[str, Any]]:
+            Tuple[Population, numpy.ndarray, numpy.ndarray, float, Dict[str, Any]]:
                 1. New population.
                 2. New populations function/fitness values.
                 3. New global best solution.
@@ -458,14 +455,11 @@ class EvolutionStrategyMpL(EvolutionStrategy1p1):
 
         if (task.iters + 1) % self.k == 0:
             _, ki = self.update_rho(c, ki), 0
-        cn = objects_to_array(
-            [IndividualES(x=self.mutate_rand(c, task), task=task, rng=self.rng) for _ in range(self.lam)])
-        cn = np.append(cn, c)
-        cn = objects_to_array([cn[i] for i in np.argsort([i.f for i in cn])[:self.mu]])
+        cn = Population.concatenate((self.mutate_rand(c, task), c))
+        cn = cn[np.argsort(cn.f, kind='stable')[:self.mu]]
         ki += self.change_count(c, cn)
-        fcn = np.asarray([x.f for x in cn])
-        best_x, best_fitness = self.get_best(cn, fcn, best_x, best_fitness)
-        return cn, fcn, best_x, best_fitness, {'ki': ki}
+        best_x, best_fitness = self.get_best(cn, cn.f, best_x, best_fitness)
+        return cn, cn.f, best_x, best_fitness, {'ki': ki}
 
 
 class EvolutionStrategyML(EvolutionStrategyMpL):
@@ -514,19 +508,15 @@ class EvolutionStrategyML(EvolutionStrategyMpL):
         r"""Return new population.
 
         Args:
-            pop (numpy.ndarray): Current population.
+            pop (Population): Current population.
 
         Returns:
-            numpy.ndarray: New population.
+            Population: New population.
 
         """
-        pop_s = np.argsort([i.f for i in pop])
         if self.mu < self.lam:
-            return objects_to_array([pop[i] for i in pop_s[:self.mu]])
-        new_population = list()
-        for i in range(int(ceil(float(self.mu) / self.lam))):
-            new_population.extend(pop[:self.lam if (self.mu - i * self.lam) >= self.lam else self.mu - i * self.lam])
-        return objects_to_array(new_population)
+            return pop[np.argsort(pop.f, kind='stable')[:self.mu]]
+        return pop[np.arange(self.mu) % self.lam]
 
     def init_population(self, task):
         r"""Initialize starting population.
@@ -535,7 +525,7 @@ class EvolutionStrategyML(EvolutionStrategyMpL):
             task (Task): Optimization task.
 
         Returns:
-            Tuple[numpy.ndarray[Individual], numpy.ndarray[float], Dict[str, Any]]:
+            Tuple[Population, numpy.ndarray[float], Dict[str, Any]]:
                 1. Initialized population.
                 2. Initialized populations fitness/function values.
                 3. Additional arguments.
@@ -552,14 +542,14 @@ class EvolutionStrategyML(EvolutionStrategyMpL):
 
         Args:
             task (Task): Optimization task.
-            c (numpy.ndarray): Current population.
+            c (Population): Current population.
             population_fitness (numpy.ndarray): Current population fitness/function values.
             best_x (numpy.ndarray): Global best individual.
             best_fitness (float): Global best individuals fitness/function value.
             **params Dict[str, Any]: Additional arguments.
 
         Returns:
-            Tuple[numpy.ndarray, numpy.ndarray, numpy.ndarray, float, Dict[str, Any]]:
+            Tuple[Population, numpy.ndarray, numpy.ndarray, float, Dict[str, Any]]:
                 1. New population.
                 2. New populations fitness/function values.
                 3. New global best solution.
@@ -567,9 +557,6 @@ class EvolutionStrategyML(EvolutionStrategyMpL):
                 5. Additional arguments.
 
         """
-        cn = objects_to_array(
-            [IndividualES(x=self.mutate_rand(c, task), task=task, rand=self.rng) for _ in range(self.lam)])
-        c = self.new_pop(cn)
-        fc = np.asarray([x.f for x in c])
-        best_x, best_fitness = self.get_best(c, fc, best_x, best_fitness)
-        return c, fc, best_x, best_fitness, {}
+        c = self.new_pop(self.mutate_rand(c, task))
+        best_x, best_fitness = self.get_best(c, c.f, best_x, best_fitness)
+        return c, c.f, best_x, best_fitness, {}
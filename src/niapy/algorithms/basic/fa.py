@@ -4,7 +4,7 @@ import logging
 import numpy as np
 
 from niapy.algorithms.algorithm import Algorithm
-from niapy.util.distances import euclidean
+from niapy.util.distances import euclidean, pairwise_distances
 
 __all__ = ['FireflyAlgorithm']
 
@@ -38,6 +38,8 @@ class FireflyAlgorithm(Algorithm):
         beta0 (float): Attractiveness constant.
         gamma (float): Absorption coefficient.
         theta (float): Randomness reduction factor.
+        sequential (bool): Move fireflies one pair at a time, evaluating after every move.
+            Otherwise all fireflies are moved at once with matrix operations and evaluated as a batch.
 
     See Also:
         * :class:`niapy.algorithms.Algorithm`
@@ -59,7 +61,7 @@ class FireflyAlgorithm(Algorithm):
         """
         return r"""Fister, I., Fister Jr, I., Yang, X. S., & Brest, J. (2013). A comprehensive review of firefly algorithms. Swarm and Evolutionary Computation, 13, 34-46."""
 
-    def __init__(self, population_size=20, alpha=1, beta0=1, gamma=0.01, theta=0.97, *args, **kwargs):
+    def __init__(self, population_size=20, alpha=1, beta0=1, gamma=0.01, theta=0.97, sequential=True, *args, **kwargs):
         """Initialize FireflyAlgorithm.
 
         Args:
@@ -68,6 +70,8 @@ class FireflyAlgorithm(Algorithm):
             beta0 (Optional[float]): Attractiveness constant.
             gamma (Optional[float]): Absorption coefficient.
             theta (Optional[float]): Randomness reduction factor.
+            sequential (Optional[bool]): Move fireflies one pair at a time. Set to `False` to move the whole
+                population at once, see :func:`FireflyAlgorithm.move_fireflies`.
 
         See Also:
             * :func:`niapy.algorithms.Algorithm.__init__`
@@ -78,8 +82,9 @@ class FireflyAlgorithm(Algorithm):
         self.beta0 = beta0
         self.gamma = gamma
         self.theta = theta
+        self.sequential = sequential
 
-    def set_parameters(self, population_size=20, alpha=1, beta0=1, gamma=0.01, theta=0.97, **kwargs):
+    def set_parameters(self, population_size=20, alpha=1, beta0=1, gamma=0.01, theta=0.97, sequential=True, **kwargs):
         r"""Set the parameters of the algorithm.
 
         Args:
@@ -88,6 +93,8 @@ class FireflyAlgorithm(Algorithm):
             beta0 (Optional[float]): Attractiveness constant.
             gamma (Optional[float]): Absorption coefficient.
             theta (Optional[float]): Randomness reduction factor.
+            sequential (Optional[bool]): Move fireflies one pair at a time. Set to `False` to move the whole
+                population at once, see :func:`FireflyAlgorithm.move_fireflies`.
 
         See Also:
             * :func:`niapy.algorithms.Algorithm.set_parameters`
@@ -98,6 +105,7 @@ class FireflyAlgorithm(Algorithm):
         self.beta0 = beta0
         self.gamma = gamma
         self.theta = theta
+        self.sequential = sequential
 
     def get_parameters(self):
         r"""Get parameters of the algorithm.
@@ -112,6 +120,7 @@ class FireflyAlgorithm(Algorithm):
             'beta0': self.beta0,
             'gamma': self.gamma,
             'theta': self.theta,
+            'sequential': self.sequential,
         })
         return params
 
@@ -135,6 +144,33 @@ class FireflyAlgorithm(Algorithm):
         fireflies, intensity, _ = super().init_population(task)
         return fireflies, intensity, {'alpha': self.alpha}
 
+    def move_fireflies(self, population, population_fitness, alpha, task):
+        r"""Move all fireflies at once towards brighter fireflies.
+
+        Distances and attractiveness are computed from the positions at the start of the generation.
+        Each firefly moves by the mean attraction of all fireflies that are at least as bright
+        and takes one random step.
+
+        Args:
+            population (numpy.ndarray): Current population.
+            population_fitness (numpy.ndarray): Current population function/fitness values.
+            alpha (float): Randomness strength.
+            task (Task): Optimization task.
+
+        Returns:
+            numpy.ndarray: Moved and repaired fireflies.
+
+        """
+        n = len(population)
+        brighter = population_fitness[:, np.newaxis] >= population_fitness[np.newaxis, :]
+        np.fill_diagonal(brighter, False)
+        beta = np.where(brighter, self.beta0 * np.exp(-self.gamma * pairwise_distances(population, squared=True)), 0)
+        count = np.maximum(np.count_nonzero(brighter, axis=1), 1)[:, np.newaxis]
+        attraction = (beta @ population - np.sum(beta, axis=1)[:, np.newaxis] * population) / count
+        steps = alpha * (self.random((n, task.dimension)) - 0.5) * task.range
+        moved = population + attraction + steps
+        return task.repair_batch(moved, self.rng, out=moved)
+
     def run_iteration(self, task, population, population_fitness, best_x, best_fitness, **params):
         r"""Core function of Firefly Algorithm.
 
@@ -156,10 +192,15 @@ class FireflyAlgorithm(Algorithm):
                     * alpha (float): Randomness strength.
 
         See Also:
-            * :func:`niapy.algorithms.basic.FireflyAlgorithm.move_ffa`
+            * :func:`niapy.algorithms.basic.FireflyAlgorithm.move_fireflies`
 
         """
         alpha = params.pop('alpha') * self.theta
+        if not self.sequential:
+            population = self.move_fireflies(population, population_fitness, alpha, task)
+            population_fitness = task.eval_batch(population)
+            best_x, best_fitness = self.get_best(population, population_fitness, best_x, best_fitness)
+            return population, population_fitness, best_x, best_fitness, {'alpha': alpha}
 
         for i in range(self.population_size):
             for j in range(self.population_size):
@@ -199,7 +199,7 @@ class ForestOptimizationAlgorithm(Algorithm):
                 4. Age of trees
 
         """
-        evaluations = np.apply_along_axis(task.eval, 1, trees)
+        evaluations = task.eval_batch(trees)
         ei = evaluations.argsort()
         candidates = np.append(candidates, trees[ei[self.area_limit:]], axis=0)
         trees = trees[ei[:self.area_limit]]
@@ -262,7 +262,7 @@ class ForestOptimizationAlgorithm(Algorithm):
             global_seeds = self.global_seeding(task, candidate_population, gsn)
             population = np.append(population, global_seeds, axis=0)
             age = np.append(age, np.zeros(len(global_seeds), dtype=np.int32))
-            global_seeds_fitness = np.apply_along_axis(task.eval, 1, global_seeds)
+            global_seeds_fitness = task.eval_batch(global_seeds)
             population_fitness = np.append(population_fitness, global_seeds_fitness)
         ib = np.argmin(population_fitness)
         age[ib] = 0
@@ -1,8 +1,7 @@
 # encoding=utf8
 import numpy as np
 
-from niapy.algorithms.algorithm import Algorithm, Individual
-from niapy.util import objects_to_array
+from niapy.algorithms.algorithm import Algorithm, Individual, Population, default_numpy_init
 
 
 class Fish(Individual):
@@ -164,9 +163,11 @@ class FishSchoolSearch(Algorithm):
         """Initialize fish school with uniform distribution."""
         step_individual = self.step_individual_init * task.range
         step_volitive = self.step_volitive_init * task.range
-        school = [Fish(weight=self.w_scale / 2.0, task=task, e=True, rng=self.rng) for _ in range(self.population_size)]
+        x, fitness = default_numpy_init(task, self.population_size, self.rng)
+        school = Population(x, fitness, weight=self.w_scale / 2.0, delta_pos=np.full(x.shape, np.nan), delta_cost=np.nan,
+                            has_improved=False)
         school_weight = self.population_size * self.w_scale / 2.0
-        return step_individual, step_volitive, school_weight, objects_to_array(school)
+        return step_individual, step_volitive, school_weight, school
 
     def update_steps(self, task):
         r"""Update step length for individual and volatile steps.
@@ -190,99 +191,92 @@ class FishSchoolSearch(Algorithm):
         r"""Feed all fishes.
 
         Args:
-            school (numpy.ndarray): Current school fish population.
+            school (Population): Current school fish population.
 
         Returns:
-            numpy.ndarray: New school fish population.
+            Population: New school fish population.
 
         """
-        max_delta_cost = max(fish.delta_cost for fish in school)
-        for fish in school:
-            if max_delta_cost:
-                fish.weight = fish.weight + (fish.delta_cost / max_delta_cost)
-            fish.weight = np.clip(fish.weight, self.min_w, self.w_scale)
+        max_delta_cost = np.max(school.delta_cost)
+        if max_delta_cost:
+            school.weight = school.weight + school.delta_cost / max_delta_cost
+        school.weight = np.clip(school.weight, self.min_w, self.w_scale)
         return school
 
     def individual_movement(self, school, step_individual, xb, fxb, task):
         r"""Perform individual movement for each fish.
 
         Args:
-            school (numpy.ndarray): School fish population.
+            school (Population): School fish population.
             step_individual (numpy.ndarray): Current individual step.
             xb (numpy.ndarray): Global best solution.
             fxb (float): Global best solutions fitness/objective value.
             task (Task): Optimization task.
 
         Returns:
-            Tuple[numpy.ndarray, numpy.ndarray, float]:
+            Tuple[Population, numpy.ndarray, float]:
                 1. New school of fishes.
                 2. New global best position.
                 3. New global best fitness.
 
         """
-        for fish in school:
-            new_pos = task.repair(fish.x + (step_individual * self.uniform(-1, 1, task.dimension)), rng=self.rng)
-            cost = task.eval(new_pos)
-            if cost < fish.f:
-                xb, fxb = self.get_best(new_pos, cost, xb, fxb)
-                fish.delta_cost = abs(cost - fish.f)
-                fish.f = cost
-                fish.delta_pos = new_pos - fish.x
-                fish.x = new_pos
-            else:
-                fish.delta_pos = np.zeros(task.dimension)
-                fish.delta_cost = 0
+        new_pos = school.x + step_individual * self.uniform(-1, 1, school.x.shape)
+        new_pos = task.repair_batch(new_pos, self.rng, out=new_pos)
+        cost = task.eval_batch(new_pos)
+        improved = cost < school.f
+        xb, fxb = self.get_best(new_pos, cost, xb, fxb)
+        school.delta_cost = np.where(improved, np.abs(cost - school.f), 0)
+        school.delta_pos = np.where(improved[:, np.newaxis], new_pos - school.x, 0)
+        school.x[improved] = new_pos[improved]
+        school.f[improved] = cost[improved]
         return school, xb, fxb
 
     def collective_instinctive_movement(self, school, task):
         r"""Perform collective instinctive movement.
 
         Args:
-            school (numpy.ndarray): Current population.
+            school (Population): Current population.
             task (Task): Optimization task.
 
         Returns:
-            numpy.ndarray: New population
+            Population: New population
 
         """
-        cost_eval_enhanced = sum((fish.delta_cost * fish.delta_pos for fish in school), start=np.zeros(task.dimension))
-        density = sum(f.delta_cost for f in school)
+        cost_eval_enhanced = school.delta_cost @ school.delta_pos
+        density = np.sum(school.delta_cost)
         if density != 0:
             cost_eval_enhanced /= density
-        for fish in school:
-            fish.x = task.repair(fish.x + cost_eval_enhanced, rng=self.rng)
+        x = school.x + cost_eval_enhanced
+        school.x = task.repair_batch(x, self.rng, out=x)
         return school
 
     def collective_volitive_movement(self, school, step_volitive, school_weight, xb, fxb, task):
         r"""Perform collective volitive movement.
 
         Args:
-            school (numpy.ndarray):
-            step_volitive :
-            school_weight:
+            school (Population): Current population.
+            step_volitive (numpy.ndarray): Current volitive step.
+            school_weight (float): Weight of school in previous iteration.
             xb (numpy.ndarray): Global best solution.
             fxb (float): Global best solutions fitness/objective value.
             task (Task): Optimization task.
 
         Returns:
-            Tuple[numpy.ndarray, numpy.ndarray, float]:
+            Tuple[Population, numpy.ndarray, float]:
                 1. New population.
                 2. New global best individual.
                 3. New global best fitness.
 
         """
         prev_weight_school = school_weight
-        school_weight = sum(fish.weight for fish in school)
-
-        barycenter = sum((fish.x * fish.weight for fish in school), start=np.zeros(task.dimension))
-        barycenter /= sum(fish.weight for fish in school)
-        for fish in school:
-            if school_weight > prev_weight_school:
-                fish.x -= (fish.x - barycenter) * step_volitive * self.uniform(0, 1, task.dimension)
-            else:
-                fish.x += (fish.x - barycenter) * step_volitive * self.uniform(0, 1, task.dimension)
-            fish.evaluate(task, rng=self.rng)
-            xb, fxb = self.get_best(fish.x, fish.f, xb, fxb)
+        school_weight = np.sum(school.weight)
+
+        barycenter = school.weight @ school.x / school_weight
+        direction = -1 if school_weight > prev_weight_school else 1
+        x = school.x + direction * (school.x - barycenter) * step_volitive * self.uniform(0, 1, school.x.shape)
+        school.x = task.repair_batch(x, self.rng, out=x)
+        school.f = task.eval_batch(school.x)
+        xb, fxb = self.get_best(school.x, school.f, xb, fxb)
         return school, xb, fxb
 
     def init_population(self, task):
@@ -292,7 +286,7 @@ class FishSchoolSearch(Algorithm):
             task (Task): Optimization task.
 
         Returns:
-            Tuple[numpy.ndarray, numpy.ndarray, dict]:
+            Tuple[Population, numpy.ndarray, dict]:
                 1. Population.
                 2. Population fitness.
                 3. Additional arguments:
@@ -302,23 +296,23 @@ class FishSchoolSearch(Algorithm):
 
         """
         step_individual, step_volitive, school_weight, school = self.init_school(task)
-        return school, np.asarray([f.f for f in school]), {'step_individual': step_individual,
-                                                           'step_volitive': step_volitive,
-                                                           'school_weight': school_weight}
+        return school, school.f, {'step_individual': step_individual,
+                                  'step_volitive': step_volitive,
+                                  'school_weight': school_weight}
 
     def run_iteration(self, task, population, population_fitness, best_x, best_fitness, **params):
         r"""Core function of algorithm.
 
         Args:
             task (Task): Optimization task.
-            population (numpy.ndarray): Current population.
+            population (Population): Current population.
             population_fitness (numpy.ndarray): Current population fitness.
             best_x (numpy.ndarray): Current global best individual.
             best_fitness (float): Current global best fitness.
             **params: Additional parameters.
 
         Returns:
-            Tuple[numpy.ndarray, numpy.ndarray, numpy.ndarray, float, dict]:
+            Tuple[Population, numpy.ndarray, numpy.ndarray, float, dict]:
                 1. New Population.
                 2. New Population fitness.
                 3. New global best individual.
@@ -339,7 +333,6 @@ class FishSchoolSearch(Algorithm):
         population, best_x, best_fitness = self.collective_volitive_movement(population, step_volitive, school_weight,
                                                                              best_x, best_fitness, task)
         step_individual, step_volitive = self.update_steps(task)
-        return population, np.asarray([f.f for f in population]), best_x, best_fitness, {'step_individual': step_individual,
-                                                                                         'step_volitive': step_volitive,
-                                                                                         'school_weight': school_weight
-                                                                                         }
+        return population, population.f, best_x, best_fitness, {'step_individual': step_individual,
+                                                                'step_volitive': step_volitive,
+                                                                'school_weight': school_weight}
@@ -147,8 +147,8 @@ class BareBonesFireworksAlgorithm(Algorithm):
         amplitude = params.pop('amplitude')
 
         sparks = self.uniform(population - amplitude, population + amplitude, (self.num_sparks, task.dimension))
-        sparks = np.apply_along_axis(task.repair, 1, sparks, self.rng)
-        sparks_fitness = np.apply_along_axis(task.eval, 1, sparks)
+        sparks = task.repair_batch(sparks, self.rng, out=sparks)
+        sparks_fitness = task.eval_batch(sparks)
         best_index = np.argmin(sparks_fitness)
         if sparks_fitness[best_index] < population_fitness:
             population = sparks[best_index]
@@ -354,7 +354,7 @@ class FireworksAlgorithm(Algorithm):
                 4. New global best fitness.
 
         """
-        sparks_fitness = np.apply_along_axis(task.eval, 1, sparks)
+        sparks_fitness = task.eval_batch(sparks)
         best_index = np.argmin(sparks_fitness)
         best_x = sparks[best_index].copy()
         best_fitness = sparks_fitness[best_index]
@@ -598,7 +598,7 @@ class EnhancedFireworksAlgorithm(FireworksAlgorithm):
                 4. New global best fitness.
 
         """
-        sparks_fitness = np.apply_along_axis(task.eval, 1, sparks)
+        sparks_fitness = task.eval_batch(sparks)
         ib = np.argmin(sparks_fitness)
         best_x = sparks[ib].copy()
         best_fitness = sparks_fitness[ib]
@@ -718,7 +718,7 @@ class DynamicFireworksAlgorithmGauss(EnhancedFireworksAlgorithm):
                 3. New core firework amplitude.
 
         """
-        xnb_f = np.apply_along_axis(task.eval, 1, xnb)
+        xnb_f = task.eval_batch(xnb)
         ib_f = np.argmin(xnb_f)
         if xnb_f[ib_f] <= xb_f:
             xb, xb_f = xnb[ib_f], xnb_f[ib_f]
@@ -752,7 +752,7 @@ class DynamicFireworksAlgorithmGauss(EnhancedFireworksAlgorithm):
 
     def selection(self, population, population_fitness, sparks, task):
         """Select fireworks for the next generation."""
-        sparks_fitness = np.apply_along_axis(task.eval, 1, sparks)
+        sparks_fitness = task.eval_batch(sparks)
         ib = np.argmin(sparks_fitness)
         for i, f in enumerate(population_fitness):
             r = self.integers(len(sparks))
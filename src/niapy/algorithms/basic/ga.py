@@ -3,7 +3,7 @@ import logging
 
 import numpy as np
 
-from niapy.algorithms.algorithm import Algorithm, Individual, default_individual_init
+from niapy.algorithms.algorithm import Algorithm, Individual
 
 logging.basicConfig()
 logger = logging.getLogger('niapy.algorithms.basic')
@@ -11,7 +11,10 @@ logger.setLevel('INFO')
 
 __all__ = ['GeneticAlgorithm', 'tournament_selection', 'roulette_selection', 'two_point_crossover',
            'multi_point_crossover',
-           'uniform_crossover', 'uniform_mutation', 'creep_mutation', 'crossover_uros', 'mutation_uros']
+           'uniform_crossover', 'uniform_mutation', 'creep_mutation', 'crossover_uros', 'mutation_uros',
+           'tournament_selection_batch', 'roulette_selection_batch', 'two_point_crossover_batch',
+           'multi_point_crossover_batch', 'uniform_crossover_batch', 'crossover_uros_batch', 'uniform_mutation_batch',
+           'creep_mutation_batch', 'mutation_uros_batch', 'adapt_selection', 'adapt_crossover', 'adapt_mutation']
 
 
 def tournament_selection(pop, _ic, ts, _x_b, rng):
@@ -194,6 +197,292 @@ def creep_mutation(pop, _ic, mr, task, rng):
     return np.asarray(nx)
 
 
+def tournament_selection_batch(x, fitness, n, rng, tournament_size=5, **_kwargs):
+    r"""Tournament selection of a whole population.
+
+    Args:
+        x (numpy.ndarray): Current population with shape `(population_size, dimension)`.
+        fitness (numpy.ndarray[float]): Function/fitness values of population.
+        n (int): Number of individuals to select.
+        rng (numpy.random.Generator): Random generator.
+        tournament_size (Optional[int]): Tournament size.
+
+    Returns:
+        numpy.ndarray[int]: Indices of tournament winners with shape `(n,)`.
+
+    """
+    size = min(tournament_size, len(x))
+    if 2 * size > len(x):
+        competitors = rng.random((n, len(x))).argsort(axis=1)[:, :size]
+    else:
+        competitors = np.empty((n, size), dtype=int)
+        repeated = np.ones(n, dtype=bool)
+        while np.any(repeated):
+            competitors[repeated] = rng.integers(len(x), size=(np.count_nonzero(repeated), size))
+            ordered = np.sort(competitors, axis=1)
+            repeated = np.any(ordered[:, 1:] == ordered[:, :-1], axis=1)
+    return competitors[np.arange(n), np.argmin(fitness[competitors], axis=1)]
+
+
+def roulette_selection_batch(x, fitness, n, rng, **_kwargs):
+    r"""Roulette wheel selection of a whole population.
+
+    The probability of selecting an individual is proportional to how much better it is than the worst individual.
+
+    Args:
+        x (numpy.ndarray): Current population with shape `(population_size, dimension)`.
+        fitness (numpy.ndarray[float]): Function/fitness values of population.
+        n (int): Number of individuals to select.
+        rng (numpy.random.Generator): Random generator.
+
+    Returns:
+        numpy.ndarray[int]: Indices of selected individuals with shape `(n,)`.
+
+    """
+    weights = np.max(fitness) - fitness
+    total = np.sum(weights)
+    if not np.isfinite(total) or total <= 0:
+        return rng.integers(len(x), size=n)
+    return rng.choice(len(x), n, p=weights / total)
+
+
+def _mates(parents, rng):
+    r"""Get a random mate of every parent.
+
+    Args:
+        parents (numpy.ndarray): Parents with shape `(n, dimension)`.
+        rng (numpy.random.Generator): Random generator.
+
+    Returns:
+        numpy.ndarray: Mates with shape `(n, dimension)`.
+
+    """
+    return parents[rng.permutation(len(parents))]
+
+
+def _segments(rng, n, dimension, points):
+    r"""Get masks of genes between pairs of random cut points.
+
+    Args:
+        rng (numpy.random.Generator): Random generator.
+        n (int): Number of individuals.
+        dimension (int): Number of genes.
+        points (int): Number of pairs of cut points.
+
+    Returns:
+        numpy.ndarray[bool]: Mask with shape `(n, dimension)`.
+
+    """
+    cuts = np.sort(rng.integers(dimension, size=(n, 2 * points)), axis=1)
+    passed = np.sum(cuts[:, :, np.newaxis] <= np.arange(dimension), axis=1)
+    return passed % 2 == 1
+
+
+def two_point_crossover_batch(parents, rng, **_kwargs):
+    r"""Two point crossover of a whole population.
+
+    Args:
+        parents (numpy.ndarray): Selected parents with shape `(n, dimension)`.
+        rng (numpy.random.Generator): Random generator.
+
+    Returns:
+        numpy.ndarray: Children with shape `(n, dimension)`.
+
+    """
+    return np.where(_segments(rng, *parents.shape, 1), _mates(parents, rng), parents)
+
+
+def multi_point_crossover_batch(parents, rng, n_points=4, **_kwargs):
+    r"""Multi point crossover of a whole population.
+
+    The genetic algorithm does not pass `n_points`, bind it with :func:`functools.partial` to use another number of
+    cut points.
+
+    Args:
+        parents (numpy.ndarray): Selected parents with shape `(n, dimension)`.
+        rng (numpy.random.Generator): Random generator.
+        n_points (Optional[int]): Number of pairs of cut points.
+
+    Returns:
+        numpy.ndarray: Children with shape `(n, dimension)`.
+
+    Raises:
+        ValueError: If `n_points` is less than 1.
+
+    """
+    if n_points < 1:
+        raise ValueError('Multi point crossover needs at least one pair of cut points, got n_points=%s.' % n_points)
+    return np.where(_segments(rng, *parents.shape, int(n_points)), _mates(parents, rng), parents)
+
+
+def uniform_crossover_batch(parents, rng, crossover_rate=0.25, **_kwargs):
+    r"""Uniform crossover of a whole population.
+
+    Args:
+        parents (numpy.ndarray): Selected parents with shape `(n, dimension)`.
+        rng (numpy.random.Generator): Random generator.
+        crossover_rate (Optional[float]): Probability of taking a gene from the mate. At least one gene is always taken.
+
+    Returns:
+        numpy.ndarray: Children with shape `(n, dimension)`.
+
+    """
+    n, dimension = parents.shape
+    mask = rng.random((n, dimension)) < crossover_rate
+    mask[np.arange(n), rng.integers(dimension, size=n)] = True
+    return np.where(mask, _mates(parents, rng), parents)
+
+
+def crossover_uros_batch(parents, rng, crossover_rate=0.25, **_kwargs):
+    r"""Crossover made by Uros Mlakar of a whole population.
+
+    Args:
+        parents (numpy.ndarray): Selected parents with shape `(n, dimension)`.
+        rng (numpy.random.Generator): Random generator.
+        crossover_rate (Optional[float]): Crossover probability.
+
+    Returns:
+        numpy.ndarray: Children with shape `(n, dimension)`.
+
+    """
+    alpha = crossover_rate + (1 + 2 * crossover_rate) * rng.random(parents.shape)
+    return alpha * parents + (1 - alpha) * _mates(parents, rng)
+
+
+def uniform_mutation_batch(x, task, rng, mutation_rate=0.25, **_kwargs):
+    r"""Uniform mutation of a whole population.
+
+    Args:
+        x (numpy.ndarray): Children with shape `(n, dimension)`.
+        task (Task): Optimization task.
+        rng (numpy.random.Generator): Random generator.
+        mutation_rate (Optional[float]): Probability of resetting a gene. At least one gene is always reset.
+
+    Returns:
+        numpy.ndarray: Mutated children with shape `(n, dimension)`.
+
+    """
+    n, dimension = x.shape
+    mask = rng.random((n, dimension)) < mutation_rate
+    mask[np.arange(n), rng.integers(dimension, size=n)] = True
+    return np.where(mask, rng.uniform(task.lower, task.upper, (n, dimension)), x)
+
+
+def creep_mutation_batch(x, task, rng, mutation_rate=0.25, **_kwargs):
+    r"""Creep mutation of a whole population.
+
+    Like :func:`uniform_mutation_batch`, but every child is replaced by a mutated copy of a random child.
+
+    Args:
+        x (numpy.ndarray): Children with shape `(n, dimension)`.
+        task (Task): Optimization task.
+        rng (numpy.random.Generator): Random generator.
+        mutation_rate (Optional[float]): Probability of resetting a gene.
+
+    Returns:
+        numpy.ndarray: Mutated children with shape `(n, dimension)`.
+
+    """
+    return uniform_mutation_batch(x[rng.integers(len(x), size=len(x))], task, rng, mutation_rate)
+
+
+def mutation_uros_batch(x, task, rng, mutation_rate=0.25, **_kwargs):
+    r"""Mutation method made by Uros Mlakar of a whole population.
+
+    Args:
+        x (numpy.ndarray): Children with shape `(n, dimension)`.
+        task (Task): Optimization task.
+        rng (numpy.random.Generator): Random generator.
+        mutation_rate (Optional[float]): Mutation rate.
+
+    Returns:
+        numpy.ndarray: Mutated children with shape `(n, dimension)`.
+
+    """
+    return np.clip(rng.normal(x, mutation_rate * task.range), task.lower, task.upper)
+
+
+def _individuals(x, fitness=None):
+    r"""Wrap rows of an array in individuals for per-individual operators.
+
+    Args:
+        x (numpy.ndarray): Solutions with shape `(n, dimension)`.
+        fitness (Optional[numpy.ndarray[float]]): Function/fitness values of solutions.
+
+    Returns:
+        numpy.ndarray[Individual]: Individuals holding copies of solutions.
+
+    """
+    pop = np.empty(len(x), dtype=object)
+    for i, xi in enumerate(x):
+        pop[i] = Individual(x=xi.copy(), e=False)
+        if fitness is not None:
+            pop[i].f = fitness[i]
+    return pop
+
+
+def adapt_selection(selection):
+    r"""Adapt a per-individual selection operator, e.g. :func:`tournament_selection`, to a whole population.
+
+    Args:
+        selection (Callable[[numpy.ndarray[Individual], int, int, numpy.ndarray, numpy.random.Generator], Union[Individual, numpy.ndarray]]):
+            Selection operator called once per selected individual.
+
+    Returns:
+        Callable[[numpy.ndarray, numpy.ndarray, int, numpy.random.Generator], numpy.ndarray[int]]: Population level selection operator.
+            A selected solution that is not in the population, e.g. the global best, selects the best individual of the population.
+
+    """
+    def population_selection(x, fitness, n, rng, tournament_size=5, best_x=None, **_kwargs):
+        pop = _individuals(x, fitness)
+        indices = np.empty(n, dtype=int)
+        for i in range(n):
+            selected = selection(pop, i % len(pop), tournament_size, best_x, rng)
+            matches = np.flatnonzero([ind is selected for ind in pop])
+            if not len(matches):
+                matches = np.flatnonzero(np.all(x == np.asarray(selected), axis=1))
+            indices[i] = matches[0] if len(matches) else np.argmin(fitness)
+        return indices
+
+    return population_selection
+
+
+def adapt_crossover(crossover):
+    r"""Adapt a per-individual crossover operator, e.g. :func:`uniform_crossover`, to a whole population.
+
+    Args:
+        crossover (Callable[[numpy.ndarray[Individual], int, float, numpy.random.Generator], numpy.ndarray]):
+            Crossover operator called once per child.
+
+    Returns:
+        Callable[[numpy.ndarray, numpy.random.Generator], numpy.ndarray]: Population level crossover operator.
+
+    """
+    def population_crossover(parents, rng, crossover_rate=0.25, **_kwargs):
+        pop = _individuals(parents)
+        return np.asarray([np.asarray(crossover(pop, i, crossover_rate, rng), dtype=float) for i in range(len(pop))])
+
+    return population_crossover
+
+
+def adapt_mutation(mutation):
+    r"""Adapt a per-individual mutation operator, e.g. :func:`uniform_mutation`, to a whole population.
+
+    Args:
+        mutation (Callable[[numpy.ndarray[Individual], int, float, Task, numpy.random.Generator], numpy.ndarray]):
+            Mutation operator called once per child.
+
+    Returns:
+        Callable[[numpy.ndarray, Task, numpy.random.Generator], numpy.ndarray]: Population level mutation operator.
+
+    """
+    def population_mutation(x, task, rng, mutation_rate=0.25, **_kwargs):
+        pop = _individuals(x)
+        return np.asarray([np.asarray(mutation(pop, i, mutation_rate, task, rng), dtype=float) for i in range(len(pop))])
+
+    return population_mutation
+
+
 class GeneticAlgorithm(Algorithm):
     r"""Implementation of Genetic Algorithm.
 
@@ -217,9 +506,9 @@ class GeneticAlgorithm(Algorithm):
         tournament_size (int): Tournament size.
         mutation_rate (float): Mutation rate.
         crossover_rate (float): Crossover rate.
-        selection (Callable[[numpy.ndarray[Individual], int, int, Individual, numpy.random.Generator], Individual]): selection operator.
-        crossover (Callable[[numpy.ndarray[Individual], int, float, numpy.random.Generator], Individual]): Crossover operator.
-        mutation (Callable[[numpy.ndarray[Individual], int, float, Task, numpy.random.Generator], Individual]): Mutation operator.
+        selection (Callable[[numpy.ndarray, numpy.ndarray, int, numpy.random.Generator], numpy.ndarray[int]]): Selection operator.
+        crossover (Callable[[numpy.ndarray, numpy.random.Generator], numpy.ndarray]): Crossover operator.
+        mutation (Callable[[numpy.ndarray, Task, numpy.random.Generator], numpy.ndarray]): Mutation operator.
 
     See Also:
         * :class:`niapy.algorithms.Algorithm`
@@ -242,7 +531,8 @@ class GeneticAlgorithm(Algorithm):
         return r"""On info"""
 
     def __init__(self, population_size=25, tournament_size=5, mutation_rate=0.25, crossover_rate=0.25,
-                 selection=tournament_selection, crossover=uniform_crossover, mutation=uniform_mutation, *args, **kwargs):
+                 selection=tournament_selection_batch, crossover=uniform_crossover_batch, mutation=uniform_mutation_batch,
+                 *args, **kwargs):
         """Initialize GeneticAlgorithm.
 
         Args:
@@ -250,30 +540,32 @@ class GeneticAlgorithm(Algorithm):
             tournament_size (Optional[int]): Tournament selection.
             mutation_rate (Optional[int]): Mutation rate.
             crossover_rate (Optional[float]): Crossover rate.
-            selection (Optional[Callable[[numpy.ndarray[Individual], int, int, Individual, numpy.random.Generator], Individual]]): Selection operator.
-            crossover (Optional[Callable[[numpy.ndarray[Individual], int, float, numpy.random.Generator], Individual]]): Crossover operator.
-            mutation (Optional[Callable[[numpy.ndarray[Individual], int, float, Task, numpy.random.Generator], Individual]]): Mutation operator.
+            selection (Optional[Callable[[numpy.ndarray, numpy.ndarray, int, numpy.random.Generator], numpy.ndarray[int]]]): Selection operator.
+                Gets the population, its fitness values, the number of individuals to select and the random generator, and returns indices of selected individuals.
+            crossover (Optional[Callable[[numpy.ndarray, numpy.random.Generator], numpy.ndarray]]): Crossover operator.
+                Gets the selected parents and the random generator, and returns children.
+            mutation (Optional[Callable[[numpy.ndarray, Task, numpy.random.Generator], numpy.ndarray]]): Mutation operator.
+                Gets the children, the task and the random generator, and returns mutated children.
+                Operators also get `tournament_size`, `best_x`, `crossover_rate` and `mutation_rate` as keyword arguments.
+                Per-individual operators are used through :func:`adapt_selection`, :func:`adapt_crossover` and :func:`adapt_mutation`.
 
         See Also:
             * :func:`niapy.algorithms.Algorithm.set_parameters`
             * selection:
-                * :func:`niapy.algorithms.basic.tournament_selection`
-                * :func:`niapy.algorithms.basic.roulette_selection`
+                * :func:`niapy.algorithms.basic.ga.tournament_selection_batch`
+                * :func:`niapy.algorithms.basic.ga.roulette_selection_batch`
             * Crossover:
-                * :func:`niapy.algorithms.basic.uniform_crossover`
-                * :func:`niapy.algorithms.basic.two_point_crossover`
-                * :func:`niapy.algorithms.basic.multi_point_crossover`
-                * :func:`niapy.algorithms.basic.crossover_uros`
+                * :func:`niapy.algorithms.basic.ga.uniform_crossover_batch`
+                * :func:`niapy.algorithms.basic.ga.two_point_crossover_batch`
+                * :func:`niapy.algorithms.basic.ga.multi_point_crossover_batch`
+                * :func:`niapy.algorithms.basic.ga.crossover_uros_batch`
             * Mutations:
-                * :func:`niapy.algorithms.basic.uniform_mutation`
-                * :func:`niapy.algorithms.basic.creep_mutation`
-                * :func:`niapy.algorithms.basic.mutation_uros`
+                * :func:`niapy.algorithms.basic.ga.uniform_mutation_batch`
+                * :func:`niapy.algorithms.basic.ga.creep_mutation_batch`
+                * :func:`niapy.algorithms.basic.ga.mutation_uros_batch`
 
         """
-        super().__init__(population_size,
-                         individual_type=kwargs.pop('individual_type', Individual),
-                         initialization_function=kwargs.pop('initialization_function', default_individual_init),
-                         *args, **kwargs)
+        super().__init__(population_size, *args, **kwargs)
         self.tournament_size = tournament_size
         self.mutation_rate = mutation_rate
         self.crossover_rate = crossover_rate
@@ -282,7 +574,8 @@ class GeneticAlgorithm(Algorithm):
         self.mutation = mutation
 
     def set_parameters(self, population_size=25, tournament_size=5, mutation_rate=0.25, crossover_rate=0.25,
-                       selection=tournament_selection, crossover=uniform_crossover, mutation=uniform_mutation, **kwargs):
+                       selection=tournament_selection_batch, crossover=uniform_crossover_batch,
+                       mutation=uniform_mutation_batch, **kwargs):
         r"""Set the parameters of the algorithm.
 
         Args:
@@ -290,30 +583,27 @@ class GeneticAlgorithm(Algorithm):
             tournament_size (Optional[int]): Tournament selection.
             mutation_rate (Optional[int]): Mutation rate.
             crossover_rate (Optional[float]): Crossover rate.
-            selection (Optional[Callable[[numpy.ndarray[Individual], int, int, Individual, numpy.random.Generator], Individual]]): selection operator.
-            crossover (Optional[Callable[[numpy.ndarray[Individual], int, float, numpy.random.Generator], Individual]]): Crossover operator.
-            mutation (Optional[Callable[[numpy.ndarray[Individual], int, float, Task, numpy.random.Generator], Individual]]): Mutation operator.
+            selection (Optional[Callable[[numpy.ndarray, numpy.ndarray, int, numpy.random.Generator], numpy.ndarray[int]]]): Selection operator.
+            crossover (Optional[Callable[[numpy.ndarray, numpy.random.Generator], numpy.ndarray]]): Crossover operator.
+            mutation (Optional[Callable[[numpy.ndarray, Task, numpy.random.Generator], numpy.ndarray]]): Mutation operator.
 
         See Also:
             * :func:`niapy.algorithms.Algorithm.set_parameters`
             * selection:
-                * :func:`niapy.algorithms.basic.tournament_selection`
-                * :func:`niapy.algorithms.basic.roulette_selection`
+                * :func:`niapy.algorithms.basic.ga.tournament_selection_batch`
+                * :func:`niapy.algorithms.basic.ga.roulette_selection_batch`
             * Crossover:
-                * :func:`niapy.algorithms.basic.uniform_crossover`
-                * :func:`niapy.algorithms.basic.two_point_crossover`
-                * :func:`niapy.algorithms.basic.multi_point_crossover`
-                * :func:`niapy.algorithms.basic.crossover_uros`
+                * :func:`niapy.algorithms.basic.ga.uniform_crossover_batch`
+                * :func:`niapy.algorithms.basic.ga.two_point_crossover_batch`
+                * :func:`niapy.algorithms.basic.ga.multi_point_crossover_batch`
+                * :func:`niapy.algorithms.basic.ga.crossover_uros_batch`
             * Mutations:
-                * :func:`niapy.algorithms.basic.uniform_mutation`
-                * :func:`niapy.algorithms.basic.creep_mutation`
-                * :func:`niapy.algorithms.basic.mutation_uros`
+                * :func:`niapy.algorithms.basic.ga.uniform_mutation_batch`
+                * :func:`niapy.algorithms.basic.ga.creep_mutation_batch`
+                * :func:`niapy.algorithms.basic.ga.mutation_uros_batch`
 
         """
-        super().set_parameters(population_size=population_size,
-                               individual_type=kwargs.pop('individual_type', Individual),
-                               initialization_function=kwargs.pop('initialization_function', default_individual_init),
-                               **kwargs)
+        super().set_parameters(population_size=population_size, **kwargs)
         self.tournament_size = tournament_size
         self.mutation_rate = mutation_rate
         self.crossover_rate = crossover_rate
@@ -359,13 +649,12 @@ class GeneticAlgorithm(Algorithm):
                 5. Additional arguments.
 
         """
-        new_pop = np.empty(self.population_size, dtype=object)
-        for i in range(self.population_size):
-            ind = self.individual_type(x=self.selection(population, i, self.tournament_size, best_x, self.rng), e=False)
-            ind.x = self.crossover(population, i, self.crossover_rate, self.rng)
-            ind.x = self.mutation(population, i, self.mutation_rate, task, self.rng)
-            ind.evaluate(task, rng=self.rng)
-            new_pop[i] = ind
-            if new_pop[i].f < best_fitness:
-                best_x, best_fitness = self.get_best(new_pop[i], new_pop[i].f, best_x, best_fitness)
-        return new_pop, np.asarray([i.f for i in new_pop]), best_x, best_fitness, {}
+        operator_params = {'tournament_size': self.tournament_size, 'best_x': best_x, 'crossover_rate': self.crossover_rate,
+                           'mutation_rate': self.mutation_rate}
+        parents = population[self.selection(population, population_fitness, self.population_size, self.rng, **operator_params)]
+        children = self.crossover(parents, self.rng, **operator_params)
+        new_pop = np.array(self.mutation(children, task, self.rng, **operator_params), dtype=float)
+        task.repair_batch(new_pop, self.rng, out=new_pop)
+        new_fitness = task.eval_batch(new_pop)
+        best_x, best_fitness = self.get_best(new_pop, new_fitness, best_x, best_fitness)
+        return new_pop, new_fitness, best_x, best_fitness, {}
@@ -4,7 +4,7 @@ import logging
 import numpy as np
 
 from niapy.algorithms.algorithm import Algorithm
-from niapy.util.distances import euclidean
+from niapy.util.distances import pairwise_distances
 
 __all__ = ['GravitationalSearchAlgorithm']
 
@@ -162,12 +162,14 @@ class GravitationalSearchAlgorithm(Algorithm):
         ib, iw = np.argmin(population_fitness), np.argmax(population_fitness)
         m = (population_fitness - population_fitness[iw]) / (population_fitness[ib] - population_fitness[iw])
         m = m / np.sum(m)
-        forces = np.asarray([[self.gravity((task.iters + 1)) * ((m[i] * m[j]) / (euclidean(population[i], population[j]) + self.epsilon)) * (
-                population[j] - population[i]) for j in range(len(m))] for i in range(len(m))])
-        total_force = np.sum(self.random((self.population_size, task.dimension)) * forces, axis=1)
+        weights = m[np.newaxis, :] / (pairwise_distances(population) + self.epsilon)
+        np.fill_diagonal(weights, 0)
+        r = self.random((self.population_size, task.dimension))
+        total_force = self.gravity(task.iters + 1) * m[:, np.newaxis] * (weights @ (r * population) - (weights @ r) * population)
         a = total_force.T / (m + self.epsilon)
         velocities = self.random((self.population_size, task.dimension)) * velocities + a.T
-        population = np.apply_along_axis(task.repair, 1, population + velocities, self.rng)
-        population_fitness = np.apply_along_axis(task.eval, 1, population)
+        population = population + velocities
+        task.repair_batch(population, self.rng, out=population)
+        population_fitness = task.eval_batch(population)
         best_x, best_fitness = self.get_best(population, population_fitness, best_x, best_fitness)
         return population, population_fitness, best_x, best_fitness, {'velocities': velocities}
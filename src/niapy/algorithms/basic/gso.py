@@ -4,7 +4,7 @@ import logging
 import numpy as np
 
 from niapy.algorithms.algorithm import Algorithm
-from niapy.util import euclidean
+from niapy.util import euclidean, DistanceCache
 
 logging.basicConfig()
 logger = logging.getLogger('niapy.algorithms.basic')
@@ -44,6 +44,7 @@ class GlowwormSwarmOptimization(Algorithm):
         beta (float): Constant.
         s (float): Step size.
         distance (Callable[[numpy.ndarray, numpy.ndarray], float]]): Measure distance between two individuals.
+        neighbor_index (Optional[Type[NeighborIndex]]): Spatial index for finding neighbors of all glowworms at once.
 
     See Also:
         * :class:`NiaPy.algorithms.algorithm.Algorithm`
@@ -62,8 +63,8 @@ class GlowwormSwarmOptimization(Algorithm):
         """
         return r"""Kaipa, Krishnanand N., and Debasish Ghose. Glowworm swarm optimization: theory, algorithms, and applications. Vol. 698. Springer, 2017."""
 
-    def __init__(self, population_size=25, l0=5, nt=5, rho=0.4, gamma=0.6, beta=0.08, s=0.03, distance=euclidean, *args,
-                 **kwargs):
+    def __init__(self, population_size=25, l0=5, nt=5, rho=0.4, gamma=0.6, beta=0.08, s=0.03, distance=euclidean,
+                 neighbor_index=None, *args, **kwargs):
         """Initialize GlowwormSwarmOptimization.
 
         Args:
@@ -75,6 +76,9 @@ class GlowwormSwarmOptimization(Algorithm):
             beta (Optional[float]): Constant.
             s (Optional[float]): Step size.
             distance (Optional[Callable[[numpy.ndarray, numpy.ndarray], float]]]): Measure distance between two individuals.
+            neighbor_index (Optional[Type[NeighborIndex]]): Spatial index, e.g. :class:`niapy.util.spatial.KDTree`,
+                that is built over the swarm once per generation to find neighbors of all glowworms at once.
+                The index always measures euclidean distance. By default, neighbors are found with a distance scan per glowworm.
 
         """
         super().__init__(population_size, *args, **kwargs)
@@ -85,9 +89,11 @@ class GlowwormSwarmOptimization(Algorithm):
         self.beta = beta
         self.s = s
         self.distance = distance
+        self.neighbor_index = neighbor_index
+        self._distance_cache = DistanceCache()
 
     def set_parameters(self, population_size=25, l0=5, nt=5, rho=0.4, gamma=0.6, beta=0.08, s=0.03, distance=euclidean,
-                       **kwargs):
+                       neighbor_index=None, **kwargs):
         r"""Set the arguments of an algorithm.
 
         Args:
@@ -99,6 +105,9 @@ class GlowwormSwarmOptimization(Algorithm):
             beta (Optional[float]): Constant.
             s (Optional[float]): Step size.
             distance (Optional[Callable[[numpy.ndarray, numpy.ndarray], float]]]): Measure distance between two individuals.
+            neighbor_index (Optional[Type[NeighborIndex]]): Spatial index, e.g. :class:`niapy.util.spatial.KDTree`,
+                that is built over the swarm once per generation to find neighbors of all glowworms at once.
+                The index always measures euclidean distance. By default, neighbors are found with a distance scan per glowworm.
 
         """
         super().set_parameters(population_size=population_size, **kwargs)
@@ -109,6 +118,7 @@ class GlowwormSwarmOptimization(Algorithm):
         self.beta = beta
         self.s = s
         self.distance = distance
+        self.neighbor_index = neighbor_index
 
     def get_parameters(self):
         r"""Get algorithms parameters values.
@@ -125,10 +135,28 @@ class GlowwormSwarmOptimization(Algorithm):
             'gamma': self.gamma,
             'beta': self.beta,
             's': self.s,
-            'distance': self.distance
+            'distance': self.distance,
+            'neighbor_index': self.neighbor_index
         })
         return d
 
+    def distances(self, i, glowworms):
+        r"""Get distances from glowworm to all glowworms.
+
+        Euclidean distances are looked up in the distance matrix of the swarm, which is computed once per generation.
+
+        Args:
+            i (int): Index of glowworm.
+            glowworms (numpy.ndarray): Current swarm.
+
+        Returns:
+            numpy.ndarray[float]: Distances to all glowworms.
+
+        """
+        if self.distance is euclidean:
+            return self._distance_cache.distances(glowworms)[i]
+        return np.asarray([self.distance(glowworms[i], gw) for gw in glowworms])
+
     def get_neighbors(self, i, r, glowworms, luciferin):
         r"""Get neighbours of glowworm.
 
@@ -142,9 +170,33 @@ class GlowwormSwarmOptimization(Algorithm):
             numpy.ndarray[int]: Indexes of neighborhood glowworms.
 
         """
-        neighbors = np.zeros(self.population_size, dtype=np.int32)
-        for j, gw in enumerate(glowworms):
-            neighbors[j] = 1 if i != j and self.distance(glowworms[i], gw) <= r and luciferin[i] >= luciferin[j] else 0
+        neighbors = ((self.distances(i, glowworms) <= r) & (luciferin[i] >= luciferin)).astype(np.int32)
+        neighbors[i] = 0
+        return neighbors
+
+    def get_all_neighbors(self, ranges, glowworms, luciferin):
+        r"""Get neighbours of all glowworms.
+
+        Args:
+            ranges (numpy.ndarray[float]): Neighborhood distance of each glowworm.
+            glowworms (numpy.ndarray): Current swarm.
+            luciferin (numpy.ndarray[float]): Luciferin value of glowworms.
+
+        Returns:
+            numpy.ndarray[int]: Neighborhood of each glowworm as a row of indicators, with shape `(population_size, population_size)`.
+
+        See Also:
+            * :func:`niapy.algorithms.basic.GlowwormSwarmOptimization.get_neighbors`
+
+        """
+        if self.neighbor_index is None:
+            return np.asarray([self.get_neighbors(i, ranges[i], glowworms, luciferin) for i in range(self.population_size)])
+        candidates = self.neighbor_index(glowworms).query_radius(glowworms, ranges)
+        rows = np.repeat(np.arange(self.population_size), [len(c) for c in candidates])
+        columns = np.concatenate(candidates)
+        keep = (rows != columns) & (luciferin[rows] >= luciferin[columns])
+        neighbors = np.zeros((self.population_size, self.population_size), dtype=np.int32)
+        neighbors[rows[keep], columns[keep]] = 1
         return neighbors
 
     def probabilities(self, i, neighbors, luciferin):
@@ -241,16 +293,18 @@ class GlowwormSwarmOptimization(Algorithm):
 
         old_population, old_ranges = np.copy(population), np.copy(ranges)
         luciferin = self.calculate_luciferin(luciferin, population_fitness)
-        neighbors = [self.get_neighbors(i, old_ranges[i], old_population, luciferin) for i in range(self.population_size)]
+        neighbors = self.get_all_neighbors(old_ranges, old_population, luciferin)
         probabilities = [self.probabilities(i, neighbors[i], luciferin) for i in range(self.population_size)]
-        j = [self.move_select(probabilities[i], i) for i in range(self.population_size)]
-        for i in range(self.population_size):
-            distance = self.distance(old_population[j[i]], old_population[i])
-            new_glowworm = old_population[i] + self.s * ((old_population[j[i]] - old_population[i]) / (distance + 1e-31))
-            population[i] = task.repair(new_glowworm, rng=self.rng)
+        j = np.asarray([self.move_select(probabilities[i], i) for i in range(self.population_size)])
+        if self.distance is euclidean:
+            distance = euclidean(old_population[j], old_population)
+        else:
+            distance = np.asarray([self.distance(old_population[j[i]], old_population[i]) for i in range(self.population_size)])
+        new_glowworms = old_population + self.s * ((old_population[j] - old_population) / (distance[:, np.newaxis] + 1e-31))
+        task.repair_batch(new_glowworms, self.rng, out=population)
         for i in range(self.population_size):
             ranges[i] = max(0.0, min(sensing_range, self.range_update(old_ranges[i], neighbors[i], sensing_range)))
-        population_fitness = np.apply_along_axis(task.eval, 1, population)
+        population_fitness = task.eval_batch(population)
         best_x, best_fitness = self.get_best(population, population_fitness, best_x, best_fitness)
         return population, population_fitness, best_x, best_fitness, {'luciferin': luciferin,
                                                                       'ranges': ranges,
@@ -4,7 +4,8 @@ import logging
 import numpy as np
 
 from niapy.algorithms.algorithm import Algorithm
-from niapy.util import full_array, euclidean
+from niapy.util import full_array, DistanceCache
+from niapy.util.distances import pairwise_distance_blocks
 
 logging.basicConfig()
 logger = logging.getLogger('niapy.algorithms.basic')
@@ -47,6 +48,7 @@ class KrillHerd(Algorithm):
         max_neighbors (Optional[int]): Maximum neighbors for neighbors effect.
         crossover_rate (Optional[float]): Crossover probability.
         mutation_rate (Optional[float]): Mutation probability.
+        neighbor_index (Optional[Type[NeighborIndex]]): Spatial index for finding neighbors of all krill at once.
 
     See Also:
         * :class:`niapy.algorithms.algorithm.Algorithm`
@@ -70,7 +72,7 @@ class KrillHerd(Algorithm):
 
     def __init__(self, population_size=50, n_max=0.01, foraging_speed=0.02, diffusion_speed=0.002, c_t=0.93,
                  w_neighbor=0.42, w_foraging=0.38, d_s=2.63, max_neighbors=5, crossover_rate=0.2, mutation_rate=0.05,
-                 *args, **kwargs):
+                 neighbor_index=None, *args, **kwargs):
         r"""Initialize KrillHerd.
 
         Args:
@@ -85,6 +87,9 @@ class KrillHerd(Algorithm):
             max_neighbors (Optional[int]): Maximum neighbors for neighbors effect.
             cr (Optional[float]): Crossover probability.
             mutation_rate (Optional[float]): Mutation probability.
+            neighbor_index (Optional[Type[NeighborIndex]]): Spatial index, e.g. :class:`niapy.util.spatial.KDTree`,
+                that is built over the herd once per generation to find neighbors of all krill at once.
+                By default, neighbors are found in the distance matrix of the herd.
 
         See Also:
             * :func:`niapy.algorithms.algorithm.Algorithm.__init__`
@@ -102,10 +107,12 @@ class KrillHerd(Algorithm):
         self.cr = crossover_rate
         self.mr = mutation_rate
         self.epsilon = np.finfo(float).eps
+        self.neighbor_index = neighbor_index
+        self._distance_cache = DistanceCache()
 
     def set_parameters(self, population_size=50, n_max=0.01, foraging_speed=0.02, diffusion_speed=0.002, c_t=0.93,
                        w_neighbor=0.42, w_foraging=0.38, d_s=2.63, max_neighbors=5, crossover_rate=0.2,
-                       mutation_rate=0.05, **kwargs):
+                       mutation_rate=0.05, neighbor_index=None, **kwargs):
         r"""Set the arguments of an algorithm.
 
         Args:
@@ -120,6 +127,9 @@ class KrillHerd(Algorithm):
             max_neighbors (Optional[int]): Maximum neighbors for neighbors effect.
             crossover_rate (Optional[float]): Crossover probability.
             mutation_rate (Optional[float]): Mutation probability.
+            neighbor_index (Optional[Type[NeighborIndex]]): Spatial index, e.g. :class:`niapy.util.spatial.KDTree`,
+                that is built over the herd once per generation to find neighbors of all krill at once.
+                By default, neighbors are found in the distance matrix of the herd.
 
         See Also:
             * :func:`niapy.algorithms.algorithm.Algorithm.set_parameters`
@@ -137,6 +147,7 @@ class KrillHerd(Algorithm):
         self.cr = crossover_rate
         self.mr = mutation_rate
         self.epsilon = np.finfo(float).eps
+        self.neighbor_index = neighbor_index
 
     def get_parameters(self):
         r"""Get parameter values for the algorithm.
@@ -156,7 +167,8 @@ class KrillHerd(Algorithm):
             'd_s': self.d_s,
             'max_neighbors': self.max_neighbors,
             'crossover_rate': self.cr,
-            'mutation_rate': self.mr
+            'mutation_rate': self.mr,
+            'neighbor_index': self.neighbor_index
         })
         return d
 
@@ -174,73 +186,92 @@ class KrillHerd(Algorithm):
         """
         return full_array(self.w_neighbor, task.dimension), full_array(self.w_foraging, task.dimension)
 
-    def sense_range(self, ki, population):
-        r"""Calculate sense range for selected individual.
+    def sense_ranges(self, population):
+        r"""Calculate sense ranges of all krill.
 
         Args:
-            ki (int): Selected individual.
             population (numpy.ndarray): Krill heard population.
 
         Returns:
-            float: Sense range for krill.
+            numpy.ndarray[float]: Sense range of each krill.
 
         """
-        return np.sum([euclidean(population[ki], population[i]) for i in range(self.population_size)]) / (self.max_neighbors * self.population_size)
+        if self.neighbor_index is None:
+            distance_sums = np.sum(self._distance_cache.distances(population), axis=1)
+        else:
+            distance_sums = np.concatenate([block.sum(axis=1) for _, block in pairwise_distance_blocks(population)])
+        return distance_sums / (self.max_neighbors * self.population_size)
 
-    def get_neighbours(self, i, ids, population):
-        r"""Get neighbours.
+    def get_neighbours(self, population):
+        r"""Get neighbours of all krill.
+
+        A krill without neighbours gets a random krill as its only neighbour. With a spatial index the sense
+        ranges are summed block by block, so the full distance matrix is never stored.
 
         Args:
-            i (int): Individual looking for neighbours.
-            ids (float): Maximal distance for being a neighbour.
             population (numpy.ndarray): Current population.
 
         Returns:
-            numpy.ndarray: Neighbours of krill heard.
+            Tuple[numpy.ndarray[int], numpy.ndarray[int]]:
+                1. Index of krill of each neighbour pair.
+                2. Index of neighbour of each neighbour pair.
+
+        See Also:
+            * :func:`niapy.algorithms.basic.KrillHerd.sense_ranges`
 
         """
-        neighbors = list()
-        for j in range(self.population_size):
-            if j != i and ids > euclidean(population[i], population[j]):
-                neighbors.append(j)
-        if not neighbors:
-            neighbors.append(self.integers(self.population_size))
-        return np.asarray(neighbors)
+        sense_ranges = self.sense_ranges(population)
+        if self.neighbor_index is None:
+            within = self._distance_cache.distances(population) < sense_ranges[:, np.newaxis]
+            np.fill_diagonal(within, False)
+            krill, neighbors = np.nonzero(within)
+        else:
+            candidates = self.neighbor_index(population).query_radius(population, sense_ranges, strict=True)
+            krill = np.repeat(np.arange(len(population)), [len(c) for c in candidates])
+            neighbors = np.concatenate(candidates).astype(int)
+            krill, neighbors = krill[krill != neighbors], neighbors[krill != neighbors]
+        lonely = np.flatnonzero(np.bincount(krill, minlength=len(population)) == 0)
+        if lonely.size:
+            krill = np.concatenate((krill, lonely))
+            neighbors = np.concatenate((neighbors, self.integers(self.population_size, size=lonely.size)))
+        return krill, neighbors
 
     def get_x(self, x, y):
         r"""Get x values.
 
         Args:
-            x (numpy.ndarray): First krill/individual.
-            y (numpy.ndarray): Second krill/individual.
+            x (numpy.ndarray): First krill/individuals.
+            y (numpy.ndarray): Second krill/individuals.
 
         Returns:
-            numpy.ndarray: --
+            numpy.ndarray: Unit vectors from `x` to `y`, one row per pair of krill.
 
         """
-        return ((y - x) + self.epsilon) / (euclidean(y, x) + self.epsilon)
+        return ((y - x) + self.epsilon) / (np.linalg.norm(y - x, axis=-1, keepdims=True) + self.epsilon)
 
     def get_k(self, x, y, b, w):
         r"""Get k values.
 
         Args:
-            x (float): First krill/individual.
-            y (float): Second krill/individual.
+            x (Union[float, numpy.ndarray[float]]): First krill/individual.
+            y (Union[float, numpy.ndarray[float]]): Second krill/individual.
             b (float): Best krill/individual.
             w (float): Worst krill/individual.
 
         Returns:
-            numpy.ndarray: K.
+            Union[float, numpy.ndarray[float]]: K.
 
         """
         return ((x - y) + self.epsilon) / ((w - b) + self.epsilon)
 
-    def induce_neighbors_motion(self, i, n, weights, population, population_fitness, best_index, worst_index, task):
+    def induce_neighbors_motion(self, n, weights, population, population_fitness, best_index, worst_index, task):
         r"""Induced neighbours motion operator.
 
+        The effect of each neighbour pair is summed over all dimensions, so only row sums of the herd are needed
+        and the pairs never have to be expanded to full vectors.
+
         Args:
-            i (int): Index of individual being applied with operator.
-            n:
+            n (numpy.ndarray): Induced motion of the herd in the previous generation.
             weights (numpy.ndarray[float]): Weights for this operator.
             population (numpy.ndarray): Current heard/population.
             population_fitness (numpy.ndarray[float]): Current populations/heard function/fitness values.
@@ -249,24 +280,29 @@ class KrillHerd(Algorithm):
             task (Task): Optimization task.
 
         Returns:
-            numpy.ndarray: Moved krill.
+            numpy.ndarray: Induced motion of the herd.
+
+        See Also:
+            * :func:`niapy.algorithms.basic.KrillHerd.get_neighbours`
 
         """
-        neighbor_i = self.get_neighbours(i, self.sense_range(i, population), population)
-        neighbor_x, neighbor_f, f_b, f_w = population[neighbor_i], population_fitness[neighbor_i], population_fitness[best_index], population_fitness[worst_index]
-        alpha_l = np.sum(
-            np.asarray([self.get_k(population_fitness[i], j, f_b, f_w) for j in neighbor_f]) * np.asarray([self.get_x(population[i], j) for j in neighbor_x]).T)
-        alpha_t = 2 * (1 + self.random() * (task.iters + 1) / task.max_iters)
-        return self.n_max * (alpha_l + alpha_t) + weights * n
-
-    def induce_foraging_motion(self, i, x, x_f, f, weights, population, population_fitness, best_index, worst_index, task):
+        krill, neighbors = self.get_neighbours(population)
+        f_b, f_w = population_fitness[best_index], population_fitness[worst_index]
+        k = self.get_k(population_fitness[krill], population_fitness[neighbors], f_b, f_w)
+        distances = np.linalg.norm(population[neighbors] - population[krill], axis=1)
+        sums = np.sum(population, axis=1)
+        x = ((sums[neighbors] - sums[krill]) + task.dimension * self.epsilon) / (distances + self.epsilon)
+        alpha_l = np.bincount(krill, weights=k * x, minlength=len(population))
+        alpha_t = 2 * (1 + self.random(len(population)) * (task.iters + 1) / task.max_iters)
+        return self.n_max * (alpha_l + alpha_t)[:, np.newaxis] + weights * n
+
+    def induce_foraging_motion(self, x, x_f, f, weights, population, population_fitness, best_index, worst_index, task):
         r"""Induced foraging motion operator.
 
         Args:
-            i (int): Index of current krill being operated.
             x (numpy.ndarray): Position of food.
             x_f (float): Fitness/function values of food.
-            f:
+            f (numpy.ndarray): Foraging motion of the herd in the previous generation.
             weights (numpy.ndarray[float]): Weights for this operator.
             population (numpy.ndarray):  Current population/heard.
             population_fitness (numpy.ndarray[float]): Current heard/populations function/fitness values.
@@ -275,12 +311,13 @@ class KrillHerd(Algorithm):
             task (Task): Optimization task.
 
         Returns:
-            numpy.ndarray: Moved krill.
+            numpy.ndarray: Foraging motion of the herd.
 
         """
-        beta_f = 2 * (1 - (task.iters + 1) / task.max_iters) * self.get_k(population_fitness[i], x_f, population_fitness[best_index], population_fitness[worst_index]) * self.get_x(
-            population[i], x) if population_fitness[best_index] < population_fitness[i] else 0
-        beta_b = self.get_k(population_fitness[i], population_fitness[best_index], population_fitness[best_index], population_fitness[worst_index]) * self.get_x(population[i], population[best_index])
+        f_b, f_w = population_fitness[best_index], population_fitness[worst_index]
+        beta_f = 2 * (1 - (task.iters + 1) / task.max_iters) * self.get_k(population_fitness, x_f, f_b, f_w)[:, np.newaxis] * self.get_x(population, x)
+        beta_f[population_fitness <= f_b] = 0
+        beta_b = self.get_k(population_fitness, f_b, f_b, f_w)[:, np.newaxis] * self.get_x(population, population[best_index])
         return self.foraging_speed * (beta_f + beta_b) + weights * f
 
     def induce_physical_diffusion(self, task):
@@ -290,10 +327,10 @@ class KrillHerd(Algorithm):
             task (Task): Optimization task.
 
         Returns:
-            numpy.ndarray:
+            numpy.ndarray: Physical diffusion of the herd.
 
         """
-        return self.diffusion_speed * (1 - (task.iters + 1) / task.max_iters) * self.uniform(-1, 1, task.dimension)
+        return self.diffusion_speed * (1 - (task.iters + 1) / task.max_iters) * self.uniform(-1, 1, (self.population_size, task.dimension))
 
     def delta_t(self, task):
         r"""Get new delta for all dimensions.
@@ -311,29 +348,29 @@ class KrillHerd(Algorithm):
         r"""Crossover operator.
 
         Args:
-            x (numpy.ndarray): Krill/individual being applied with operator.
-            xo (numpy.ndarray): Krill/individual being used in conjunction within operator.
-            crossover_rate (float): Crossover probability.
+            x (numpy.ndarray): Krill/individuals being applied with operator.
+            xo (numpy.ndarray): Krill/individuals being used in conjunction within operator.
+            crossover_rate (numpy.ndarray[float]): Crossover probability of each krill.
 
         Returns:
-            numpy.ndarray: New krill/individual.
+            numpy.ndarray: New krill/individuals.
 
         """
-        return [xo[i] if self.random() < crossover_rate else x[i] for i in range(len(x))]
+        return np.where(self.random(x.shape) < crossover_rate[:, np.newaxis], xo, x)
 
     def mutate(self, x, x_b, mutation_rate):
         r"""Mutate operator.
 
         Args:
-            x (numpy.ndarray): Individual being mutated.
+            x (numpy.ndarray): Individuals being mutated.
             x_b (numpy.ndarray): Global best individual.
-            mutation_rate (float): Probability of mutations.
+            mutation_rate (numpy.ndarray[float]): Probability of mutations of each krill.
 
         Returns:
             numpy.ndarray: Mutated krill.
 
         """
-        return [x[i] if self.random() < mutation_rate else (x_b[i] + self.random()) for i in range(len(x))]
+        return np.where(self.random(x.shape) < mutation_rate[:, np.newaxis], x, x_b + self.random(x.shape))
 
     def get_food_location(self, population, population_fitness, task):
         r"""Get food location for krill heard.
@@ -349,8 +386,7 @@ class KrillHerd(Algorithm):
                 2. Foods function/fitness value.
 
         """
-        x_food = task.repair(np.asarray([np.sum(population[:, i] / population_fitness) for i in range(task.dimension)]) / np.sum(1 / population_fitness),
-                             rng=self.rng)
+        x_food = task.repair((1 / population_fitness) @ population / np.sum(1 / population_fitness), rng=self.rng)
         x_food_f = task.eval(x_food)
         return x_food, x_food_f
 
@@ -358,13 +394,13 @@ class KrillHerd(Algorithm):
         r"""Get mutation probability.
 
         Args:
-            xf (float):
+            xf (Union[float, numpy.ndarray[float]]):
             yf (float):
             xf_best (float):
             xf_worst (float):
 
         Returns:
-            float: New mutation probability.
+            Union[float, numpy.ndarray[float]]: New mutation probability.
 
         """
         return self.mr / (self.get_k(xf, yf, xf_best, xf_worst) + 1e-31)
@@ -373,13 +409,13 @@ class KrillHerd(Algorithm):
         r"""Get crossover probability.
 
         Args:
-            xf (float):
+            xf (Union[float, numpy.ndarray[float]]):
             yf (float):
             xf_best (float):
             xf_worst (float):
 
         Returns:
-            float: New crossover probability.
+            Union[float, numpy.ndarray[float]]: New crossover probability.
 
         """
         return self.cr * self.get_k(xf, yf, xf_best, xf_worst)
@@ -406,7 +442,7 @@ class KrillHerd(Algorithm):
         """
         krill_herd, krill_herd_fitness, d = Algorithm.init_population(self, task)
         w_neighbor, w_foraging = self.init_weights(task)
-        induced_speed, foraging_speed = np.zeros(self.population_size), np.zeros(self.population_size)
+        induced_speed, foraging_speed = np.zeros((self.population_size, task.dimension)), np.zeros((self.population_size, task.dimension))
         d.update({'w_neighbor': w_neighbor, 'w_foraging': w_foraging, 'induced_speed': induced_speed, 'foraging_speed': foraging_speed})
         return krill_herd, krill_herd_fitness, d
 
@@ -443,15 +479,13 @@ class KrillHerd(Algorithm):
         x_food, x_food_f = self.get_food_location(population, population_fitness, task)
         if x_food_f < best_fitness:
             best_x, best_fitness = x_food, x_food_f  # noqa: F841
-        induced_speed = np.asarray([self.induce_neighbors_motion(i, induced_speed[i], w_neighbor, population, population_fitness, ikh_b, ikh_w, task) for i in range(self.population_size)])
-        foraging_speed = np.asarray([self.induce_foraging_motion(i, x_food, x_food_f, foraging_speed[i], w_foraging, population, population_fitness, ikh_b, ikh_w, task) for i in range(self.population_size)])
-        diffusion = np.asarray([self.induce_physical_diffusion(task) for _ in range(self.population_size)])
+        induced_speed = self.induce_neighbors_motion(induced_speed, w_neighbor, population, population_fitness, ikh_b, ikh_w, task)
+        foraging_speed = self.induce_foraging_motion(x_food, x_food_f, foraging_speed, w_foraging, population, population_fitness, ikh_b, ikh_w, task)
+        diffusion = self.induce_physical_diffusion(task)
         new_herd = population + (self.delta_t(task) * (induced_speed + foraging_speed + diffusion))
-        crossover_rates = np.asarray([self.crossover_rate(population_fitness[i], population_fitness[ikh_b], population_fitness[ikh_b], population_fitness[ikh_w]) for i in range(self.population_size)])
-        new_herd = np.asarray([self.crossover(new_herd[i], population[i], crossover_rates[i]) for i in range(self.population_size)])
-        mutation_rates = np.asarray([self.mutation_rate(population_fitness[i], population_fitness[ikh_b], population_fitness[ikh_b], population_fitness[ikh_w]) for i in range(self.population_size)])
-        new_herd = np.asarray([self.mutate(new_herd[i], population[ikh_b], mutation_rates[i]) for i in range(self.population_size)])
-        population = np.apply_along_axis(task.repair, 1, new_herd, rng=self.rng)
-        population_fitness = np.apply_along_axis(task.eval, 1, population)
+        new_herd = self.crossover(new_herd, population, self.crossover_rate(population_fitness, population_fitness[ikh_b], population_fitness[ikh_b], population_fitness[ikh_w]))
+        new_herd = self.mutate(new_herd, population[ikh_b], self.mutation_rate(population_fitness, population_fitness[ikh_b], population_fitness[ikh_b], population_fitness[ikh_w]))
+        population = task.repair_batch(new_herd, self.rng, out=new_herd)
+        population_fitness = task.eval_batch(population)
         best_x, best_fitness = self.get_best(population, population_fitness, best_x, best_fitness)
         return population, population_fitness, best_x, best_fitness, {'w_neighbor': w_neighbor, 'w_foraging': w_foraging, 'induced_speed': induced_speed, 'foraging_speed': foraging_speed}
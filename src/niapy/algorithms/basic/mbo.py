@@ -202,7 +202,7 @@ class MonarchButterflyOptimization(Algorithm):
                 3. Butterfly population.
 
         """
-        fitness = np.apply_along_axis(task.eval, 1, butterflies)
+        fitness = task.eval_batch(butterflies)
         indices = np.argsort(fitness)
         butterflies = butterflies[indices]
         fitness = fitness[indices]
@@ -257,11 +257,10 @@ class MonarchButterflyOptimization(Algorithm):
 
         elite = np.copy(population[:self.keep])
         max_t = task.max_iters if not np.isinf(task.max_iters) else task.max_evals / self.population_size
-        population = np.apply_along_axis(task.repair, 1,
-                                         self.migration_operator(task.dimension, self.np1, self.np2, population))
-        population = np.apply_along_axis(task.repair, 1,
-                                         self.adjusting_operator(task.iters, max_t, task.dimension, self.np1, self.np2,
-                                                                 population, current_best))
+        population = self.migration_operator(task.dimension, self.np1, self.np2, population)
+        task.repair_batch(population, out=population)
+        population = self.adjusting_operator(task.iters, max_t, task.dimension, self.np1, self.np2, population, current_best)
+        task.repair_batch(population, out=population)
         population_fitness, population = self.evaluate_and_sort(task, population)
         current_best = population[0]
         population[-self.keep:] = elite
@@ -92,7 +92,7 @@ class MothFlameOptimizer(Algorithm):
                 else:
                     population[i, j] = distance_to_flame * np.exp(b * t) * np.cos(2 * np.pi * t) + sorted_population[
                         flame_no, j]
-        population = np.apply_along_axis(task.repair, 1, population, self.rng)
-        population_fitness = np.apply_along_axis(task.eval, 1, population)
+        population = task.repair_batch(population, self.rng, out=population)
+        population_fitness = task.eval_batch(population)
         best_x, best_fitness = self.get_best(population, population_fitness, best_x, best_fitness)
         return population, population_fitness, best_x, best_fitness, {}
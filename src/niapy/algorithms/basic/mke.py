@@ -227,8 +227,9 @@ class MonkeyKingEvolutionV1(Algorithm):
 
         """
         p.monkey_king = False
-        a = np.apply_along_axis(task.repair, 1, self.move_mk(p.x, task), self.rng)
-        a_f = np.apply_along_axis(task.eval, 1, a)
+        a = self.move_mk(p.x, task)
+        task.repair_batch(a, self.rng, out=a)
+        a_f = task.eval_batch(a)
         ib = np.argmin(a_f)
         p.x, p.f = a[ib], a_f[ib]
 
@@ -517,18 +518,18 @@ class MonkeyKingEvolutionV3(MonkeyKingEvolutionV1):
         k = params.pop('k')
         c = params.pop('c')
 
-        x_gb = np.apply_along_axis(task.repair, 1,
-                                   best_x + self.fc * population[self.rng.choice(len(population), c)] - population[self.rng.choice(len(population), c)],
-                                   self.rng)
-        x_gb_f = np.apply_along_axis(task.eval, 1, x_gb)
+        x_gb = best_x + self.fc * population[self.rng.choice(len(population), c)] - population[self.rng.choice(len(population), c)]
+        task.repair_batch(x_gb, self.rng, out=x_gb)
+        x_gb_f = task.eval_batch(x_gb)
         best_x, best_fitness = self.get_best(x_gb, x_gb_f, best_x, best_fitness)
         m = np.ones((self.population_size, task.dimension))
         for i in range(k):
             m[i * task.dimension:(i + 1) * task.dimension] = np.tril(m[i * task.dimension:(i + 1) * task.dimension])
         for i in range(self.population_size):
             self.rng.shuffle(m[i])
-        population = np.apply_along_axis(task.repair, 1, m * population + np.vectorize(self.neg)(m) * best_x, self.rng)
-        population_fitness = np.apply_along_axis(task.eval, 1, population)
+        population = m * population + np.vectorize(self.neg)(m) * best_x
+        task.repair_batch(population, self.rng, out=population)
+        population_fitness = task.eval_batch(population)
         best_x, best_fitness = self.get_best(population, population_fitness, best_x, best_fitness)
         iw, ib_gb = np.argmax(population_fitness), np.argmin(x_gb_f)
         if x_gb_f[ib_gb] <= population_fitness[iw]:
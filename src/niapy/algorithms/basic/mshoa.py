@@ -294,9 +294,9 @@ class MantisSearchAlgorithm(Algorithm):
             pop = self._normalize_from_real(pop, task.lower, task.upper)
             # Convert back to real space for initial evaluation
             pop_real = self._normalize_to_real(pop, task.lower, task.upper)
-            fpop = np.apply_along_axis(task.eval, 1, pop_real)
+            fpop = task.eval_batch(pop_real)
         else:
-            fpop = np.apply_along_axis(task.eval, 1, pop)
+            fpop = task.eval_batch(pop)
 
         # Initialize PTI vector: round(1 + 2 * rand) gives values {1, 2, 3}
         pti = np.round(1 + 2 * self.random(self.population_size)).astype(int)
@@ -418,7 +418,7 @@ class MantisSearchAlgorithm(Algorithm):
                 pop_new[i] = self._reflect_repair(pop_new[i], lower_work, upper_work)
         else:
             # Standard repair
-            pop_new = np.apply_along_axis(task.repair, 1, pop_new, rng=self.rng)
+            pop_new = task.repair_batch(pop_new, self.rng, out=pop_new)
 
         # Convert to real space for evaluation if normalization is enabled
         if self.normalize_space:
@@ -426,9 +426,9 @@ class MantisSearchAlgorithm(Algorithm):
                 lambda z: self._normalize_to_real(z, task.lower, task.upper),
                 1, pop_new
             )
-            fpop = np.apply_along_axis(task.eval, 1, pop_real)
+            fpop = task.eval_batch(pop_real)
         else:
-            fpop = np.apply_along_axis(task.eval, 1, pop_new)
+            fpop = task.eval_batch(pop_new)
 
         # Update global best if better solution found
         best_idx = np.argmin(fpop)
@@ -46,6 +46,7 @@ class ParticleSwarmAlgorithm(Algorithm):
         min_velocity (Union[float, numpy.ndarray[float]]): Minimal velocity.
         max_velocity (Union[float, numpy.ndarray[float]]): Maximal velocity.
         repair (Callable[[numpy.ndarray, numpy.ndarray, numpy.ndarray, Optional[numpy.random.Generator]], numpy.ndarray]): Repair method for velocity.
+        synchronous (bool): Move the whole swarm at once instead of one particle at a time.
 
     See Also:
         * :class:`niapy.algorithms.Algorithm`
@@ -68,7 +69,7 @@ class ParticleSwarmAlgorithm(Algorithm):
         return r"""Kennedy, J. and Eberhart, R. "Particle Swarm Optimization". Proceedings of IEEE International Conference on Neural Networks. IV. pp. 1942--1948, 1995."""
 
     def __init__(self, population_size=25, c1=2.0, c2=2.0, w=0.7, min_velocity=-1.5, max_velocity=1.5, repair=reflect,
-                 *args, **kwargs):
+                 synchronous=True, *args, **kwargs):
         """Initialize ParticleSwarmAlgorithm.
 
         Args:
@@ -79,6 +80,9 @@ class ParticleSwarmAlgorithm(Algorithm):
             min_velocity (Union[float, numpy.ndarray]): Minimal velocity.
             max_velocity (Union[float, numpy.ndarray]): Maximal velocity.
             repair (Callable[[np.ndarray, np.ndarray, np.ndarray, dict], np.ndarray]): Repair method for velocity.
+            synchronous (bool): Update velocities, positions and best positions of all particles at once and evaluate
+                the swarm as a batch. If `False`, particles are moved one after another and each sees the global best
+                found by the particles before it.
 
         See Also:
             * :func:`niapy.algorithms.Algorithm.__init__`
@@ -91,9 +95,10 @@ class ParticleSwarmAlgorithm(Algorithm):
         self.min_velocity = min_velocity
         self.max_velocity = max_velocity
         self.repair = repair
+        self.synchronous = synchronous
 
     def set_parameters(self, population_size=25, c1=2.0, c2=2.0, w=0.7, min_velocity=-1.5, max_velocity=1.5,
-                       repair=reflect, **kwargs):
+                       repair=reflect, synchronous=True, **kwargs):
         r"""Set Particle Swarm Algorithm main parameters.
 
         Args:
@@ -104,6 +109,7 @@ class ParticleSwarmAlgorithm(Algorithm):
             min_velocity (Union[float, numpy.ndarray]): Minimal velocity.
             max_velocity (Union[float, numpy.ndarray]): Maximal velocity.
             repair (Callable[[np.ndarray, np.ndarray, np.ndarray, dict], np.ndarray]): Repair method for velocity.
+            synchronous (bool): Move the whole swarm at once instead of one particle at a time.
 
         See Also:
             * :func:`niapy.algorithms.Algorithm.set_parameters`
@@ -116,6 +122,7 @@ class ParticleSwarmAlgorithm(Algorithm):
         self.min_velocity = min_velocity
         self.max_velocity = max_velocity
         self.repair = repair
+        self.synchronous = synchronous
 
     def get_parameters(self):
         r"""Get value of parameters for this instance of algorithm.
@@ -134,7 +141,8 @@ class ParticleSwarmAlgorithm(Algorithm):
             'w': self.w,
             'min_velocity': self.min_velocity,
             'max_velocity': self.max_velocity,
-            'repair': self.repair
+            'repair': self.repair,
+            'synchronous': self.synchronous
         })
         return d
 
@@ -191,9 +199,9 @@ class ParticleSwarmAlgorithm(Algorithm):
         r"""Update particle velocity.
 
         Args:
-            v (numpy.ndarray): Current velocity of particle.
-            p (numpy.ndarray): Current position of particle.
-            pb (numpy.ndarray): Personal best position of particle.
+            v (numpy.ndarray): Current velocity of particle, or velocities of all particles.
+            p (numpy.ndarray): Current position of particle, or positions of all particles.
+            pb (numpy.ndarray): Personal best position of particle, or personal best positions of all particles.
             gb (numpy.ndarray): Global best position of particle.
             w (Union[float, numpy.ndarray]): Weights for velocity adjustment.
             min_velocity (numpy.ndarray): Minimal velocity allowed.
@@ -202,13 +210,44 @@ class ParticleSwarmAlgorithm(Algorithm):
             kwargs: Additional arguments.
 
         Returns:
-            numpy.ndarray: Updated velocity of particle.
+            numpy.ndarray: Updated velocity of particle, or velocities of all particles.
 
         """
         return self.repair(
-            w * v + self.c1 * self.random(task.dimension) * (pb - p) + self.c2 * self.random(task.dimension) * (gb - p),
+            w * v + self.c1 * self.random(p.shape) * (pb - p) + self.c2 * self.random(p.shape) * (gb - p),
             min_velocity, max_velocity)
 
+    def move_swarm(self, task, pop, v, personal_best, personal_best_fitness, xb, fxb):
+        r"""Move all particles by their velocities, evaluate them as a batch and update best positions.
+
+        Args:
+            task (Task): Optimization task.
+            pop (numpy.ndarray): Current positions of particles.
+            v (numpy.ndarray): Velocities of particles.
+            personal_best (numpy.ndarray): Personal best positions of particles.
+            personal_best_fitness (numpy.ndarray[float]): Function/fitness values of personal best positions.
+            xb (numpy.ndarray): Current global best position.
+            fxb (float): Current global best positions function/fitness value.
+
+        Returns:
+            Tuple[numpy.ndarray, numpy.ndarray, numpy.ndarray, numpy.ndarray, numpy.ndarray, float]:
+                1. New positions of particles.
+                2. New function/fitness values of particles.
+                3. New personal best positions.
+                4. New personal best positions function/fitness values.
+                5. New global best position.
+                6. New global best positions function/fitness value.
+
+        """
+        pop = pop + v
+        task.repair_batch(pop, self.rng, out=pop)
+        fpop = task.eval_batch(pop)
+        improved = fpop < personal_best_fitness
+        personal_best = np.where(improved[:, np.newaxis], pop, personal_best)
+        personal_best_fitness = np.where(improved, fpop, personal_best_fitness)
+        xb, fxb = self.get_best(pop, fpop, xb, fxb)
+        return pop, fpop, personal_best, personal_best_fitness, xb, fxb
+
     def run_iteration(self, task, pop, fpop, xb, fxb, **params):
         r"""Core function of Particle Swarm Optimization algorithm.
 
@@ -246,14 +285,18 @@ class ParticleSwarmAlgorithm(Algorithm):
         max_velocity = params.pop('max_velocity')
         v = params.pop('v')
 
-        for i in range(len(pop)):
-            v[i] = self.update_velocity(v[i], pop[i], personal_best[i], xb, w, min_velocity, max_velocity, task)
-            pop[i] = task.repair(pop[i] + v[i], rng=self.rng)
-            fpop[i] = task.eval(pop[i])
-            if fpop[i] < personal_best_fitness[i]:
-                personal_best[i], personal_best_fitness[i] = pop[i].copy(), fpop[i]
-            if fpop[i] < fxb:
-                xb, fxb = pop[i].copy(), fpop[i]
+        if self.synchronous:
+            v = self.update_velocity(v, pop, personal_best, xb, w, min_velocity, max_velocity, task)
+            pop, fpop, personal_best, personal_best_fitness, xb, fxb = self.move_swarm(task, pop, v, personal_best, personal_best_fitness, xb, fxb)
+        else:
+            for i in range(len(pop)):
+                v[i] = self.update_velocity(v[i], pop[i], personal_best[i], xb, w, min_velocity, max_velocity, task)
+                pop[i] = task.repair(pop[i] + v[i], rng=self.rng)
+                fpop[i] = task.eval(pop[i])
+                if fpop[i] < personal_best_fitness[i]:
+                    personal_best[i], personal_best_fitness[i] = pop[i].copy(), fpop[i]
+                if fpop[i] < fxb:
+                    xb, fxb = pop[i].copy(), fpop[i]
         return pop, fpop, xb, fxb, {'personal_best': personal_best, 'personal_best_fitness': personal_best_fitness,
                                     'w': w, 'min_velocity': min_velocity, 'max_velocity': max_velocity, 'v': v}
 
@@ -454,9 +497,8 @@ class OppositionVelocityClampingParticleSwarmOptimization(ParticleSwarmAlgorithm
                 4. new best function/fitness value of opposite learning phase
 
         """
-        s_r = s_l + s_h
-        s = np.asarray([s_r - e for e in pop])
-        s_f = np.asarray([task.eval(e) for e in s])
+        s = s_l + s_h - pop
+        s_f = task.eval_batch(s)
         s, s_f = np.concatenate([pop, s]), np.concatenate([fpop, s_f])
         sorted_indices = np.argsort(s_f)
         return s[sorted_indices[:len(pop)]], s_f[sorted_indices[:len(pop)]], s[sorted_indices[0]], s_f[
@@ -536,14 +578,18 @@ class OppositionVelocityClampingParticleSwarmOptimization(ParticleSwarmAlgorithm
                 xb, fxb = nb.copy(), fnb
         else:
             w = self.w_max - ((self.w_max - self.w_min) / task.max_iters) * (task.iters + 1)
-            for i in range(len(pop)):
-                v[i] = self.update_velocity(v[i], pop[i], personal_best[i], xb, w, min_velocity, max_velocity, task)
-                pop[i] = task.repair(pop[i] + v[i], rng=self.rng)
-                fpop[i] = task.eval(pop[i])
-                if fpop[i] < personal_best_fitness[i]:
-                    personal_best[i], personal_best_fitness[i] = pop[i].copy(), fpop[i]
-                    if fpop[i] < fxb:
-                        xb, fxb = pop[i].copy(), fpop[i]
+            if self.synchronous:
+                v = self.update_velocity(v, pop, personal_best, xb, w, min_velocity, max_velocity, task)
+                pop, fpop, personal_best, personal_best_fitness, xb, fxb = self.move_swarm(task, pop, v, personal_best, personal_best_fitness, xb, fxb)
+            else:
+                for i in range(len(pop)):
+                    v[i] = self.update_velocity(v[i], pop[i], personal_best[i], xb, w, min_velocity, max_velocity, task)
+                    pop[i] = task.repair(pop[i] + v[i], rng=self.rng)
+                    fpop[i] = task.eval(pop[i])
+                    if fpop[i] < personal_best_fitness[i]:
+                        personal_best[i], personal_best_fitness[i] = pop[i].copy(), fpop[i]
+                        if fpop[i] < fxb:
+                            xb, fxb = pop[i].copy(), fpop[i]
             min_velocity, max_velocity = self.sigma * np.min(pop, axis=0), self.sigma * np.max(pop, axis=0)
         return pop, fpop, xb, fxb, {'personal_best': personal_best, 'personal_best_fitness': personal_best_fitness,
                                     'min_velocity': min_velocity,
@@ -933,9 +979,9 @@ class MutatedCenterUnifiedParticleSwarmOptimization(MutatedCenterParticleSwarmOp
             numpy.ndarray: Updated velocity of particle.
 
         """
-        r3 = self.random(task.dimension)
+        r3 = self.random(p.shape)
         return self.repair(
-            w * v + self.c1 * self.random(task.dimension) * (pb - p) * r3 + self.c2 * self.random(task.dimension) * (
+            w * v + self.c1 * self.random(p.shape) * (pb - p) * r3 + self.c2 * self.random(p.shape) * (
                         gb - p) * (1 - r3),
             min_velocity, max_velocity)
 
@@ -1080,6 +1126,27 @@ class ComprehensiveLearningParticleSwarmOptimizer(ParticleSwarmAlgorithm):
                     pbest.append(personal_best[r2, j])
         return np.asarray(pbest)
 
+    def generate_exemplars(self, pc, personal_best, personal_best_fitness):
+        r"""Generate personal bests for learning of all particles at once.
+
+        Each dimension of a particle is, with its learning probability, learned from the better of two random
+        particles instead of from its own personal best.
+
+        Args:
+            pc (numpy.ndarray[float]): Learning probabilities of particles.
+            personal_best (numpy.ndarray): Personal best positions for population.
+            personal_best_fitness (numpy.ndarray): Personal best positions function/fitness values for personal best position.
+
+        Returns:
+            numpy.ndarray: Personal bests for learning of all particles.
+
+        """
+        n, dimension = personal_best.shape
+        learn = self.random((n, dimension)) <= pc[:, np.newaxis]
+        r1, r2 = self.integers(n, size=(2, n, dimension))
+        winner = np.where(personal_best_fitness[r1] < personal_best_fitness[r2], r1, r2)
+        return np.where(learn, personal_best[winner, np.arange(dimension)], personal_best)
+
     def update_velocity_cl(self, v, p, pb, w, min_velocity, max_velocity, task, **_kwargs):
         r"""Update particle velocity.
 
@@ -1096,7 +1163,7 @@ class ComprehensiveLearningParticleSwarmOptimizer(ParticleSwarmAlgorithm):
             numpy.ndarray: Updated velocity of particle.
 
         """
-        return self.repair(w * v + self.c * self.random(task.dimension) * (pb - p), min_velocity, max_velocity)
+        return self.repair(w * v + self.c * self.random(p.shape) * (pb - p), min_velocity, max_velocity)
 
     def run_iteration(self, task, pop, fpop, xb, fxb, **params):
         r"""Core function of algorithm.
@@ -1138,6 +1205,25 @@ class ComprehensiveLearningParticleSwarmOptimizer(ParticleSwarmAlgorithm):
         pc = params.pop('pc')
 
         w = self.w0 * (self.w0 - self.w1) * (task.iters + 1) / task.max_iters
+        if self.synchronous:
+            refresh = flag >= self.m
+            if np.any(refresh):
+                v[refresh] = self.update_velocity(v[refresh], pop[refresh], personal_best[refresh], xb, 1, min_velocity, max_velocity, task)
+                pop[refresh], fpop[refresh], personal_best[refresh], personal_best_fitness[refresh], xb, fxb = self.move_swarm(
+                    task, pop[refresh], v[refresh], personal_best[refresh], personal_best_fitness[refresh], xb, fxb)
+                flag[refresh] = 0
+            pbest = self.generate_exemplars(pc, personal_best, personal_best_fitness)
+            v = self.update_velocity_cl(v, pop, pbest, w, min_velocity, max_velocity, task)
+            pop = pop + v
+            feasible = np.all((pop >= task.lower) & (pop <= task.upper), axis=1)
+            fpop[feasible] = task.eval_batch(pop[feasible])
+            improved = feasible & (fpop < personal_best_fitness)
+            personal_best = np.where(improved[:, np.newaxis], pop, personal_best)
+            personal_best_fitness = np.where(improved, fpop, personal_best_fitness)
+            xb, fxb = self.get_best(personal_best, personal_best_fitness, xb, fxb)
+            return pop, fpop, xb, fxb, {'personal_best': personal_best, 'personal_best_fitness': personal_best_fitness,
+                                        'min_velocity': min_velocity,
+                                        'max_velocity': max_velocity, 'v': v, 'flag': flag, 'pc': pc}
         for i in range(len(pop)):
             if flag[i] >= self.m:
                 v[i] = self.update_velocity(v[i], pop[i], personal_best[i], xb, 1, min_velocity, max_velocity, task)
@@ -156,6 +156,6 @@ class SineCosineAlgorithm(Algorithm):
         r3 = self.uniform(self.r_min, self.r_max)
         r4 = self.random()
         population = np.apply_along_axis(self.next_position, 1, population, best_x, r1, r2, r3, r4, task)
-        population_fitness = np.apply_along_axis(task.eval, 1, population)
+        population_fitness = task.eval_batch(population)
         best_x, best_fitness = self.get_best(population, population_fitness, best_x, best_fitness)
         return population, population_fitness, best_x, best_fitness, {}
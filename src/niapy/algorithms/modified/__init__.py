@@ -1,32 +1,7 @@
 # encoding=utf8
 """Implementation of modified nature-inspired algorithms."""
 
-from niapy.algorithms.modified.hba import HybridBatAlgorithm
-from niapy.algorithms.modified.hde import (
-    DifferentialEvolutionMTS,
-    DifferentialEvolutionMTSv1,
-    DynNpDifferentialEvolutionMTS,
-    DynNpDifferentialEvolutionMTSv1,
-    MultiStrategyDifferentialEvolutionMTS,
-    DynNpMultiStrategyDifferentialEvolutionMTS,
-    DynNpMultiStrategyDifferentialEvolutionMTSv1,
-    MultiStrategyDifferentialEvolutionMTSv1
-)
-from niapy.algorithms.modified.hsaba import HybridSelfAdaptiveBatAlgorithm
-from niapy.algorithms.modified.jde import (
-    SelfAdaptiveDifferentialEvolution,
-    MultiStrategySelfAdaptiveDifferentialEvolution,
-)
-from niapy.algorithms.modified.plba import ParameterFreeBatAlgorithm
-from niapy.algorithms.modified.saba import (
-    AdaptiveBatAlgorithm,
-    SelfAdaptiveBatAlgorithm
-)
-from niapy.algorithms.modified.shade import (
-    SuccessHistoryAdaptiveDifferentialEvolution,
-    LpsrSuccessHistoryAdaptiveDifferentialEvolution
-)
-from niapy.algorithms.modified.ilshade import ImprovedLpsrSuccessHistoryAdaptiveDifferentialEvolution
+from niapy.util.lazy import lazy_exports
 
 __all__ = [
     'HybridBatAlgorithm',
@@ -48,3 +23,24 @@ __all__ = [
     'LpsrSuccessHistoryAdaptiveDifferentialEvolution',
     'ImprovedLpsrSuccessHistoryAdaptiveDifferentialEvolution'
 ]
+
+__getattr__, __dir__ = lazy_exports(__name__, {
+    'HybridBatAlgorithm': 'hba',
+    'DifferentialEvolutionMTS': 'hde',
+    'DifferentialEvolutionMTSv1': 'hde',
+    'DynNpDifferentialEvolutionMTS': 'hde',
+    'DynNpDifferentialEvolutionMTSv1': 'hde',
+    'MultiStrategyDifferentialEvolutionMTS': 'hde',
+    'DynNpMultiStrategyDifferentialEvolutionMTS': 'hde',
+    'DynNpMultiStrategyDifferentialEvolutionMTSv1': 'hde',
+    'MultiStrategyDifferentialEvolutionMTSv1': 'hde',
+    'HybridSelfAdaptiveBatAlgorithm': 'hsaba',
+    'SelfAdaptiveDifferentialEvolution': 'jde',
+    'MultiStrategySelfAdaptiveDifferentialEvolution': 'jde',
+    'ParameterFreeBatAlgorithm': 'plba',
+    'AdaptiveBatAlgorithm': 'saba',
+    'SelfAdaptiveBatAlgorithm': 'saba',
+    'SuccessHistoryAdaptiveDifferentialEvolution': 'shade',
+    'LpsrSuccessHistoryAdaptiveDifferentialEvolution': 'shade',
+    'ImprovedLpsrSuccessHistoryAdaptiveDifferentialEvolution': 'ilshade'
+})
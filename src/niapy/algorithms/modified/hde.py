@@ -3,7 +3,7 @@ import logging
 
 import numpy as np
 
-from niapy.algorithms.algorithm import Individual
+from niapy.algorithms.algorithm import Algorithm, Individual, Population, default_numpy_init
 from niapy.algorithms.basic.de import MultiStrategyDifferentialEvolution, DynNpDifferentialEvolution, DifferentialEvolution
 from niapy.algorithms.other.mts import mts_ls1v1, mts_ls2, mts_ls3v1, MultipleTrajectorySearch
 
@@ -93,7 +93,8 @@ class DifferentialEvolutionMTS(DifferentialEvolution, MultipleTrajectorySearch):
 
     def __init__(self, population_size=40, *args, **kwargs):
         """Initialize DifferentialEvolutionMTS."""
-        super().__init__(population_size, individual_type=kwargs.pop('individual_type', MtsIndividual), *args, **kwargs)
+        super().__init__(population_size, initialization_function=kwargs.pop('initialization_function', default_numpy_init),
+                         individual_type=kwargs.pop('individual_type', None), *args, **kwargs)
 
     def set_parameters(self, **kwargs):
         r"""Set the algorithm parameters.
@@ -103,8 +104,8 @@ class DifferentialEvolutionMTS(DifferentialEvolution, MultipleTrajectorySearch):
 
         """
         MultipleTrajectorySearch.set_parameters(self, **kwargs)
-        DifferentialEvolution.set_parameters(self, individual_type=kwargs.pop('individual_type', MtsIndividual),
-                                             **kwargs)
+        DifferentialEvolution.set_parameters(self, initialization_function=kwargs.pop('initialization_function', default_numpy_init),
+                                             individual_type=kwargs.pop('individual_type', None), **kwargs)
 
     def get_parameters(self):
         """Get algorithm parameters."""
@@ -112,27 +113,82 @@ class DifferentialEvolutionMTS(DifferentialEvolution, MultipleTrajectorySearch):
         d.update(MultipleTrajectorySearch.get_parameters(self))
         return d
 
+    def mts_population(self, x, fitness, task):
+        r"""Create population with initial state of MTS local searches.
+
+        Args:
+            x (numpy.ndarray): Solutions with shape `(n, dimension)`.
+            fitness (numpy.ndarray[float]): Function/fitness values of solutions.
+            task (Task): Optimization task.
+
+        Returns:
+            Population: Population with `search_range`, `grade`, `enable` and `improved` columns.
+
+        """
+        return Population(x, fitness, search_range=np.tile(task.range / 4, (len(x), 1)), grade=0.0, enable=True, improved=False)
+
+    def init_population(self, task):
+        r"""Initialize starting population.
+
+        Args:
+            task (Task): Optimization task.
+
+        Returns:
+            Tuple[Population, numpy.ndarray[float], Dict[str, Any]]:
+                1. Initialized population.
+                2. Initialized population function/fitness values.
+                3. Additional arguments.
+
+        See Also:
+            * :func:`niapy.algorithms.Algorithm.init_population`
+
+        """
+        population, fitness, d = Algorithm.init_population(self, task)
+        return self.mts_population(population, fitness, task), fitness, d
+
+    def evolve(self, pop, xb, task, **kwargs):
+        r"""Evolve population.
+
+        Args:
+            pop (Population): Current population.
+            xb (numpy.ndarray): Current best individual.
+            task (Task): Optimization task.
+
+        Returns:
+            Population: Trial individuals with initial state of MTS local searches.
+
+        See Also:
+            * :func:`niapy.algorithms.basic.DifferentialEvolution.evolve_batch`
+
+        """
+        trials, trials_fitness = self.evolve_batch(pop.x, xb, task)
+        return self.mts_population(trials, trials_fitness, task)
+
     def post_selection(self, population, task, xb, fxb, **kwargs):
         r"""Post selection operator.
 
         Args:
-            population (numpy.ndarray): Current population.
+            population (Population): Current population.
             task (Task): Optimization task.
             xb (numpy.ndarray): Global best individual.
             fxb (float): Global best fitness.
 
         Returns:
-            Tuple[numpy.ndarray, numpy.ndarray, float]: New population.
+            Tuple[Population, numpy.ndarray, float]:
+                1. New population.
+                2. New global best solution.
+                3. New global best solutions fitness/objective value.
 
         """
-        for x in population:
-            if not x.enable:
-                continue
-            x.enable, x.grades = False, 0
-            x.x, x.f, xb, fxb, k = self.grading_run(x.x, x.f, xb, fxb, x.improved, x.search_range, task)
-            x.x, x.f, xb, fxb, x.improved, x.search_range, x.grades = self.run_local_search(k, x.x, x.f, xb, fxb, x.improved, x.search_range, 0, task)
-        for i in population[np.argsort([x.grade for x in population])[:self.num_enabled:]]:
-            i.enable = True
+        for i in np.flatnonzero(population.enable):
+            population.enable[i], population.grade[i] = False, 0
+            x, x_f, xb, fxb, k = self.grading_run(population.x[i], population.f[i], xb, fxb, population.improved[i],
+                                                  population.search_range[i], task)
+            x, x_f, xb, fxb, improved, search_range, grade = self.run_local_search(k, x, x_f, xb, fxb, population.improved[i],
+                                                                                   population.search_range[i], 0, task)
+            population.x[i], population.f[i], population.improved[i], population.search_range[i], population.grade[i] = \
+                x, x_f, improved, search_range, grade
+        population.enable[np.argsort(population.grade)[:self.num_enabled]] = True
         return population, xb, fxb
 
 
@@ -258,9 +314,29 @@ class DynNpDifferentialEvolutionMTS(DifferentialEvolutionMTS, DynNpDifferentialE
         return params
 
     def post_selection(self, population, task, xb, fxb, **kwargs):
-        new_x, xb, fxb = DynNpDifferentialEvolution.post_selection(self, population, task, xb, fxb)
-        new_x, xb, fxb = DifferentialEvolutionMTS.post_selection(self, new_x, task, xb, fxb)
-        return new_x, xb, fxb
+        r"""Post selection operator.
+
+        Reduces the population size and then runs the MTS local searches.
+
+        Args:
+            population (Population): Current population.
+            task (Task): Optimization task.
+            xb (numpy.ndarray): Global best individual.
+            fxb (float): Global best fitness.
+
+        Returns:
+            Tuple[Population, numpy.ndarray, float]:
+                1. New population.
+                2. New global best solution.
+                3. New global best solutions fitness/objective value.
+
+        See Also:
+            * :func:`niapy.algorithms.basic.DynNpDifferentialEvolution.post_selection_batch`
+            * :func:`niapy.algorithms.modified.DifferentialEvolutionMTS.post_selection`
+
+        """
+        population, _, xb, fxb = DynNpDifferentialEvolution.post_selection_batch(self, population, population.f, task, xb, fxb)
+        return DifferentialEvolutionMTS.post_selection(self, population, task, xb, fxb)
 
 
 class DynNpDifferentialEvolutionMTSv1(DynNpDifferentialEvolutionMTS):
@@ -356,7 +432,7 @@ class MultiStrategyDifferentialEvolutionMTS(DifferentialEvolutionMTS, MultiStrat
 
     def __init__(self, *args, **kwargs):
         """Initialize MultiStrategyDifferentialEvolutionMTS."""
-        super().__init__(individual_type=kwargs.pop('individual_type', MtsIndividual), *args, **kwargs)
+        super().__init__(*args, **kwargs)
 
     def set_parameters(self, **kwargs):
         r"""Set algorithm parameters.
@@ -367,7 +443,8 @@ class MultiStrategyDifferentialEvolutionMTS(DifferentialEvolutionMTS, MultiStrat
 
         """
         DifferentialEvolutionMTS.set_parameters(self, **kwargs)
-        MultiStrategyDifferentialEvolution.set_parameters(self, individual_type=kwargs.pop('individual_type', MtsIndividual), **kwargs)
+        MultiStrategyDifferentialEvolution.set_parameters(self, initialization_function=kwargs.pop('initialization_function', default_numpy_init),
+                                                          individual_type=kwargs.pop('individual_type', None), **kwargs)
 
     def get_parameters(self):
         r"""Get parameters of the algorithm.
@@ -380,20 +457,6 @@ class MultiStrategyDifferentialEvolutionMTS(DifferentialEvolutionMTS, MultiStrat
         params.update(MultiStrategyDifferentialEvolution.get_parameters(self))
         return params
 
-    def evolve(self, pop, xb, task, **kwargs):
-        r"""Evolve population.
-
-        Args:
-            pop (numpy.ndarray[Individual]): Current population of individuals.
-            xb (numpy.ndarray): Global best individual.
-            task (Task): Optimization task.
-
-        Returns:
-            numpy.ndarray[Individual]: Evolved population.
-
-        """
-        return MultiStrategyDifferentialEvolution.evolve(self, pop, xb, task, **kwargs)
-
 
 class MultiStrategyDifferentialEvolutionMTSv1(MultiStrategyDifferentialEvolutionMTS):
     r"""Implementation of Differential Evolution with MTSv1 local searches and multiple mutation strategies.
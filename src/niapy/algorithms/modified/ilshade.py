@@ -2,11 +2,10 @@
 import logging
 import numpy as np
 
-from niapy.algorithms.algorithm import Individual
+from niapy.algorithms.algorithm import Individual, Population, default_numpy_init
 from niapy.algorithms.basic.de import DifferentialEvolution
 from niapy.algorithms.modified.shade import SuccessHistoryAdaptiveDifferentialEvolution
-from niapy.algorithms.modified.shade import cross_curr2pbest1
-from niapy.util import objects_to_array
+from niapy.algorithms.modified.shade import cross_curr2pbest1_batch
 
 logging.basicConfig()
 logger = logging.getLogger('niapy.algorithms.modified')
@@ -102,7 +101,8 @@ class ImprovedLpsrSuccessHistoryAdaptiveDifferentialEvolution(SuccessHistoryAdap
             * :func:`niapy.algorithms.basic.DifferentialEvolution.__init__`
 
         """
-        super(SuccessHistoryAdaptiveDifferentialEvolution, self).__init__(population_size, individual_type=kwargs.pop('individual_type', SolutionILSHADE), *args, **kwargs)
+        super(SuccessHistoryAdaptiveDifferentialEvolution, self).__init__(population_size, initialization_function=kwargs.pop('initialization_function', default_numpy_init),
+                                                                          individual_type=kwargs.pop('individual_type', None), *args, **kwargs)
         self.extern_arc_rate = extern_arc_rate
         self.pbest_start = pbest_start
         self.pbest_end = pbest_end
@@ -123,7 +123,8 @@ class ImprovedLpsrSuccessHistoryAdaptiveDifferentialEvolution(SuccessHistoryAdap
 
         """
         super(SuccessHistoryAdaptiveDifferentialEvolution, self).set_parameters(population_size=population_size,
-                               individual_type=kwargs.pop('individual_type', SolutionILSHADE), **kwargs)
+                               initialization_function=kwargs.pop('initialization_function', default_numpy_init),
+                               individual_type=kwargs.pop('individual_type', None), **kwargs)
         self.extern_arc_rate = extern_arc_rate
         self.pbest_start = pbest_start
         self.pbest_end = pbest_end
@@ -145,52 +146,49 @@ class ImprovedLpsrSuccessHistoryAdaptiveDifferentialEvolution(SuccessHistoryAdap
         })
         return d
     
-    def gen_ind_params(self, nfe, max_nfe, x, hist_cr, hist_f):
-        r"""Generate new individual with new scale factor and crossover probability.
+    def gen_ind_params(self, nfe, max_nfe, pop, hist_cr, hist_f):
+        r"""Generate new scale factors and crossover probabilities for population.
 
         Args:
             nfe (int): Current number of fitness function calls.
             max_nfe (int): Maximum number of fitness function calls.
-            x (IndividualSHADE): Individual to apply function on.
+            pop (Population): Population to apply function on.
             hist_cr (numpy.ndarray[float]): Historic values of crossover probability.
             hist_f (numpy.ndarray[float]): Historic values of scale factor.
 
         Returns:
-            Individual: New individual with new parameters
+            Population: Copy of population with new parameters.
 
         """
-        mi = self.integers(self.hist_mem_size)  # a random pair of f cr is selected form historical memory
+        mi = self.integers(self.hist_mem_size, size=len(pop))  # a random pair of f cr is selected form historical memory
         #ilshade
-        if(mi == self.hist_mem_size - 1):
-            m_cr = 0.9
-            m_f = 0.9
-        else:
-            m_cr = hist_cr[mi]
-            m_f = hist_f[mi]
-        
+        last = mi == self.hist_mem_size - 1
+        m_cr = np.where(last, 0.9, hist_cr[mi])
+        m_f = np.where(last, 0.9, hist_f[mi])
         #ilshade
-        cr = self.normal(m_cr, 0.1) if m_cr >= 0 else 0 
-
+        cr = np.where(m_cr >= 0, self.normal(m_cr, 0.1), 0)
         cr = np.clip(cr, 0, 1)
         #ilshade
-        if((nfe < 0.25*max_nfe) and cr < 0.5): cr = 0.5
-        elif((nfe < 0.5*max_nfe) and cr < 0.25): cr = 0.25
-        
-
+        if nfe < 0.25 * max_nfe:
+            cr = np.maximum(cr, 0.5)
+        elif nfe < 0.5 * max_nfe:
+            cr = np.maximum(cr, 0.25)
         f = self.cauchy(m_f, 0.1)
         f = np.clip(f, 0, 1)
         #ilshade
-        if((nfe < 0.25*max_nfe) and f > 0.7): f = 0.7
-        elif((nfe < 0.5*max_nfe) and f > 0.8): f = 0.8
-        elif((nfe < 0.75*max_nfe) and f > 0.9): f = 0.9
-        
-        return self.individual_type(x=x.x, differential_weight=f, crossover_probability=cr, e=False)
+        if nfe < 0.25 * max_nfe:
+            f = np.minimum(f, 0.7)
+        elif nfe < 0.5 * max_nfe:
+            f = np.minimum(f, 0.8)
+        elif nfe < 0.75 * max_nfe:
+            f = np.minimum(f, 0.9)
+        return Population(pop.x.copy(), pop.f.copy(), differential_weight=f, crossover_probability=cr)
 
     def evolve(self, pop, hist_cr, hist_f, archive, arc_ind_cnt, pbest_factor, task, **_kwargs):
         r"""Evolve current population.
 
         Args:
-            pop (numpy.ndarray[IndividualSHADE]): Current population.
+            pop (Population): Current population.
             hist_cr (numpy.ndarray[float]): Historic values of crossover probability.
             hist_f (numpy.ndarray[float]): Historic values of scale factor.
             archive (numpy.ndarray): External archive.
@@ -199,29 +197,26 @@ class ImprovedLpsrSuccessHistoryAdaptiveDifferentialEvolution(SuccessHistoryAdap
             task (Task): Optimization task.
 
         Returns:
-            numpy.ndarray: New population.
+            Population: New population.
 
         """
         max_nfe = task.max_evals
         nfe = task.evals
-        new_pop = objects_to_array([self.gen_ind_params(nfe, max_nfe, xi, hist_cr, hist_f) for xi in pop])
+        new_pop = self.gen_ind_params(nfe, max_nfe, pop, hist_cr, hist_f)
         p_num = np.int_(np.around(len(pop) * pbest_factor))
         if p_num < 2:
             p_num = 2
         # cr and f for mutation are computed
-        for i, xi in enumerate(new_pop):
-            new_pop[i].x = cross_curr2pbest1(pop, i, xi.differential_weight, xi.crossover_probability, self.rng,
-                                             p_num, archive, arc_ind_cnt, task)  # trial vectors are created
-        for xi in new_pop:
-            xi.evaluate(task, rng=self.random)
-
+        new_pop.x = cross_curr2pbest1_batch(pop.x, new_pop.differential_weight, new_pop.crossover_probability, self.rng,
+                                            p_num, archive, arc_ind_cnt, task)  # trial vectors are created
+        new_pop.f = task.eval_batch(new_pop.x)
         return new_pop
 
     def post_selection(self, pop, arc, arc_ind_cnt, task, xb, fxb, pbest_factor, **kwargs):
         r"""Post selection operator.
 
         Args:
-            pop (numpy.ndarray): Current population.
+            pop (Population): Current population.
             arc (numpy.ndarray): External archive.
             arc_ind_cnt (int): Number of individuals in the archive.
             task (Task): Optimization task.
@@ -253,11 +248,8 @@ class ImprovedLpsrSuccessHistoryAdaptiveDifferentialEvolution(SuccessHistoryAdap
         # the worst pop_size - new_pop_size individuals are deleted
         if next_pop_size < pop_size:
             reduction = pop_size - next_pop_size
-            for i in range(reduction):
-                worst = 0
-                for j, e in enumerate(pop):
-                    worst = j if e.f > pop[worst].f else worst
-                pop = np.delete(pop, worst)
+            worst = np.argsort(-pop.f, kind='stable')[:reduction]
+            pop = pop[np.setdiff1d(np.arange(pop_size), worst)]
 
             next_arc_size = np.int_(next_pop_size * self.extern_arc_rate)  # the size of the new archive
             if arc_ind_cnt > next_arc_size:
@@ -291,6 +283,7 @@ class ImprovedLpsrSuccessHistoryAdaptiveDifferentialEvolution(SuccessHistoryAdap
 
         """
         pop, fitness, _ = DifferentialEvolution.init_population(self, task)  # pop vectors are initialized randomly
+        pop = Population(pop, fitness, differential_weight=0.5, crossover_probability=0.8)
         h_mem_cr = np.full(self.hist_mem_size, 0.8) #ilshade
         h_mem_f = np.full(self.hist_mem_size, 0.5)
         # all values in the historical memory for parameters f and cr are initialized to 0.5
@@ -310,7 +303,7 @@ class ImprovedLpsrSuccessHistoryAdaptiveDifferentialEvolution(SuccessHistoryAdap
 
         Args:
             task (Task): Optimization task.
-            population (numpy.ndarray): Current population.
+            population (Population): Current population.
             population_fitness (numpy.ndarray[float]): Current population function/fitness values.
             best_x (numpy.ndarray): Global best individual.
             best_fitness (float): Global best individual fitness/function value.
@@ -353,20 +346,11 @@ class ImprovedLpsrSuccessHistoryAdaptiveDifferentialEvolution(SuccessHistoryAdap
             old_cr = h_mem_cr[k]
             
             # if children better than their parents were created the historical memory is updated
-            m_sf_k = 0
-            m_cr_k = 0
-            sum_sf = 0
-            sum_cr = 0
-            diff_sum = np.sum(fit_diff)
-            for i in range(num_of_success_params):
-                weight = fit_diff[i] / diff_sum
-
-                m_sf_k += weight * s_f[i] * s_f[i]
-                sum_sf += weight * s_f[i]
-
-                m_cr_k += weight * s_cr[i] * s_cr[i]
-                sum_cr += weight * s_cr[i]
-
+            weight = fit_diff / np.sum(fit_diff)
+            m_sf_k = np.sum(weight * s_f * s_f)
+            sum_sf = np.sum(weight * s_f)
+            m_cr_k = np.sum(weight * s_cr * s_cr)
+            sum_cr = np.sum(weight * s_cr)
             h_mem_f[k] = m_sf_k / sum_sf
             # f and cr that are stored into the historic memory are calculated with the use of weighted Lehmer mean
             h_mem_cr[k] = -1 if sum_cr == 0 or h_mem_cr[k] == -1 else m_cr_k / sum_cr
@@ -381,7 +365,7 @@ class ImprovedLpsrSuccessHistoryAdaptiveDifferentialEvolution(SuccessHistoryAdap
 
         population, archive, arc_ind_cnt, best_x, best_fitness, pbest_factor = self.post_selection(population, archive, arc_ind_cnt,
                                                                                      task, best_x, best_fitness, pbest_factor)
-        population_fitness = np.asarray([x.f for x in population])
+        population_fitness = population.f
         best_x, best_fitness = self.get_best(population, population_fitness, best_x, best_fitness)
 
         return population, population_fitness, best_x, best_fitness, {'h_mem_cr': h_mem_cr, 'h_mem_f': h_mem_f, 'k': k,
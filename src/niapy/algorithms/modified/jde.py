@@ -1,10 +1,11 @@
 # encoding=utf8
 import logging
 
-from niapy.algorithms.algorithm import Individual
+import numpy as np
+
+from niapy.algorithms.algorithm import Individual, Population, default_numpy_init
 from niapy.algorithms.basic.de import DifferentialEvolution, cross_best1, cross_rand1, cross_curr2best1, cross_best2, \
-    cross_curr2rand1, multi_mutations
-from niapy.util import objects_to_array
+    cross_curr2rand1, multi_mutations, batch_strategy
 
 logging.basicConfig()
 logger = logging.getLogger('niapy.algorithms.modified')
@@ -103,7 +104,8 @@ class SelfAdaptiveDifferentialEvolution(DifferentialEvolution):
             * :func:`niapy.algorithms.basic.DifferentialEvolution.__init__`
 
         """
-        super().__init__(individual_type=kwargs.pop('individual_type', SolutionJDE), *args, **kwargs)
+        super().__init__(initialization_function=kwargs.pop('initialization_function', default_numpy_init),
+                         individual_type=kwargs.pop('individual_type', None), *args, **kwargs)
         self.f_lower = f_lower
         self.f_upper = f_upper
         self.tao1 = tao1
@@ -122,7 +124,8 @@ class SelfAdaptiveDifferentialEvolution(DifferentialEvolution):
             * :func:`niapy.algorithms.basic.DifferentialEvolution.set_parameters`
 
         """
-        super().set_parameters(individual_type=kwargs.pop('individual_type', SolutionJDE), **kwargs)
+        super().set_parameters(initialization_function=kwargs.pop('initialization_function', default_numpy_init),
+                               individual_type=kwargs.pop('individual_type', None), **kwargs)
         self.f_lower = f_lower
         self.f_upper = f_upper
         self.tao1 = tao1
@@ -144,39 +147,59 @@ class SelfAdaptiveDifferentialEvolution(DifferentialEvolution):
         })
         return d
 
-    def adaptive_gen(self, x):
+    def adaptive_gen(self, pop):
         r"""Adaptive update scale factor in crossover probability.
 
         Args:
-            x (IndividualJDE): Individual to apply function on.
+            pop (Population): Population to apply function on.
 
         Returns:
-            Individual: New individual with new parameters
+            Population: Copy of population with new parameters.
 
         """
-        f = self.f_lower + self.random() * (self.f_upper - self.f_lower) if self.random() < self.tao1 else x.differential_weight
-        cr = self.random() if self.random() < self.tao2 else x.crossover_probability
-        return self.individual_type(x=x.x, differential_weight=f, crossover_probability=cr, e=False)
+        n = len(pop)
+        f = np.where(self.random(n) < self.tao1, self.f_lower + self.random(n) * (self.f_upper - self.f_lower), pop.differential_weight)
+        cr = np.where(self.random(n) < self.tao2, self.random(n), pop.crossover_probability)
+        return Population(pop.x.copy(), pop.f.copy(), differential_weight=f, crossover_probability=cr)
 
     def evolve(self, pop, xb, task, **_kwargs):
         r"""Evolve current population.
 
         Args:
-            pop (numpy.ndarray[Individual]): Current population.
-            xb (Individual): Global best individual.
+            pop (Population): Current population.
+            xb (numpy.ndarray): Global best individual.
             task (Task): Optimization task.
 
         Returns:
-            numpy.ndarray: New population.
+            Population: New population.
 
         """
-        new_pop = objects_to_array([self.adaptive_gen(e) for e in pop])
-        for i, e in enumerate(new_pop):
-            new_pop[i].x = self.strategy(new_pop, i, e.differential_weight, e.crossover_probability, rng=self.rng, x_b=xb)
-        for e in new_pop:
-            e.evaluate(task, rng=self.random)
+        new_pop = self.adaptive_gen(pop)
+        new_pop.x = batch_strategy(self.strategy)(pop.x, new_pop.differential_weight, new_pop.crossover_probability, self.rng, x_b=xb)
+        task.repair_batch(new_pop.x, self.rng, out=new_pop.x)
+        new_pop.f = task.eval_batch(new_pop.x)
         return new_pop
 
+    def init_population(self, task):
+        r"""Initialize starting population.
+
+        Args:
+            task (Task): Optimization task.
+
+        Returns:
+            Tuple[Population, numpy.ndarray[float], Dict[str, Any]]:
+                1. Initialized population with scale factor and crossover probability columns, starting from the
+                   defaults of :class:`SolutionJDE`.
+                2. Initialized population function/fitness values.
+                3. Additional arguments.
+
+        See Also:
+            * :func:`niapy.algorithms.Algorithm.init_population`
+
+        """
+        pop, fpop, d = super().init_population(task)
+        return Population(pop, fpop, differential_weight=2.0, crossover_probability=0.5), fpop, d
+
 
 class MultiStrategySelfAdaptiveDifferentialEvolution(SelfAdaptiveDifferentialEvolution):
     r"""Implementation of self-adaptive differential evolution algorithm with multiple mutation strategies.
@@ -245,15 +268,24 @@ class MultiStrategySelfAdaptiveDifferentialEvolution(SelfAdaptiveDifferentialEvo
     def evolve(self, pop, xb, task, **kwargs):
         r"""Evolve population with the help multiple mutation strategies.
 
+        Every strategy creates a trial vector for each individual and the best trial vector of each individual is kept.
+
         Args:
-            pop (numpy.ndarray[Individual]): Current population.
-            xb (Individual): Current best individual.
+            pop (Population): Current population.
+            xb (numpy.ndarray): Current best individual.
             task (Task): Optimization task.
 
         Returns:
-            numpy.ndarray[Individual]: New population of individuals.
+            Population: New population of individuals.
 
         """
-        return objects_to_array(
-            [self.strategy(pop, i, xb, self.differential_weight, self.crossover_probability, self.rng, task, self.individual_type, self.strategies) for i in
-             range(len(pop))])
+        trials, trials_fitness = [], []
+        for strategy in self.strategies:
+            x = batch_strategy(strategy)(pop.x, self.differential_weight, self.crossover_probability, self.rng, x_b=xb)
+            x = task.repair_batch(x, self.rng, out=x)
+            trials.append(x)
+            trials_fitness.append(task.eval_batch(x))
+        trials, trials_fitness = np.asarray(trials), np.asarray(trials_fitness)
+        best, index = np.argmin(trials_fitness, axis=0), np.arange(len(pop))
+        return Population(trials[best, index], trials_fitness[best, index], differential_weight=pop.differential_weight.copy(),
+                          crossover_probability=pop.crossover_probability.copy())
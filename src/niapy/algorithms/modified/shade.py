@@ -3,9 +3,8 @@ import logging
 
 import numpy as np
 
-from niapy.algorithms.algorithm import Individual
-from niapy.algorithms.basic.de import DifferentialEvolution
-from niapy.util import objects_to_array
+from niapy.algorithms.algorithm import Individual, Population, default_numpy_init
+from niapy.algorithms.basic.de import DifferentialEvolution, binomial_crossover
 
 logging.basicConfig()
 logger = logging.getLogger('niapy.algorithms.modified')
@@ -14,6 +13,7 @@ logger.setLevel('INFO')
 __all__ = [
     'parent_medium',
     'cross_curr2pbest1',
+    'cross_curr2pbest1_batch',
     'SolutionSHADE',
     'SuccessHistoryAdaptiveDifferentialEvolution',
     'LpsrSuccessHistoryAdaptiveDifferentialEvolution'
@@ -94,6 +94,42 @@ def cross_curr2pbest1(pop, ic, f, cr, rng, p_num, archive, arc_ind_cnt, task, **
         # the mutant vector is repaired if needed
 
 
+def cross_curr2pbest1_batch(pop, f, cr, rng, p_num, archive, arc_ind_cnt, task, **_kwargs):
+    r"""Population level version of :func:`cross_curr2pbest1` (current-to-pbest/1/bin).
+
+    Mutant vectors that fall out of the search space are repaired with the same rule as in :func:`parent_medium`.
+
+    Args:
+        pop (numpy.ndarray): Current population with shape `(n, d)` sorted by fitness.
+        f (Union[float, numpy.ndarray[float]]): Scale factor or scale factors of individuals with shape `(n,)`.
+        cr (Union[float, numpy.ndarray[float]]): Crossover probability or crossover probabilities of individuals with shape `(n,)`.
+        rng (numpy.random.Generator): Random generator.
+        p_num (int): Number of best individuals to select :math:`\mathbf{x}_{pbest, G}` from.
+        archive (numpy.ndarray): External archive.
+        arc_ind_cnt (int): Number of individuals in the archive.
+        task (Task): Optimization task.
+
+    Returns:
+        numpy.ndarray: Trial vectors with shape `(n, d)`.
+
+    """
+    n = len(pop)
+    index = np.arange(n)
+    pbest = rng.integers(p_num, size=n)
+    r1 = rng.integers(n - 1, size=n)
+    r1 += r1 >= index  # r1 != i
+    r2 = rng.integers(n + arc_ind_cnt - 2, size=n)
+    low, high = np.minimum(index, r1), np.maximum(index, r1)
+    r2 += r2 >= low
+    r2 += r2 >= high  # r2 != i and r2 != r1
+    union = np.concatenate((pop, archive[:arc_ind_cnt]))
+    f = np.asarray(f)[..., np.newaxis]
+    mutants = pop + f * (pop[pbest] - pop) + f * (pop[r1] - union[r2])
+    trials = binomial_crossover(pop, mutants, cr, rng)
+    trials = np.where(trials < task.lower, (task.lower + pop) / 2.0, trials)
+    return np.where(trials > task.upper, (task.upper + pop) / 2.0, trials)
+
+
 class SolutionSHADE(Individual):
     r"""Individual for SHADE algorithm.
 
@@ -179,7 +215,8 @@ class SuccessHistoryAdaptiveDifferentialEvolution(DifferentialEvolution):
             * :func:`niapy.algorithms.basic.DifferentialEvolution.__init__`
 
         """
-        super().__init__(population_size, individual_type=kwargs.pop('individual_type', SolutionSHADE), *args, **kwargs)
+        super().__init__(population_size, initialization_function=kwargs.pop('initialization_function', default_numpy_init),
+                         individual_type=kwargs.pop('individual_type', None), *args, **kwargs)
         self.extern_arc_rate = extern_arc_rate
         self.pbest_factor = pbest_factor
         self.hist_mem_size = hist_mem_size
@@ -198,7 +235,8 @@ class SuccessHistoryAdaptiveDifferentialEvolution(DifferentialEvolution):
 
         """
         super().set_parameters(population_size=population_size,
-                               individual_type=kwargs.pop('individual_type', SolutionSHADE), **kwargs)
+                               initialization_function=kwargs.pop('initialization_function', default_numpy_init),
+                               individual_type=kwargs.pop('individual_type', None), **kwargs)
         self.extern_arc_rate = extern_arc_rate
         self.pbest_factor = pbest_factor
         self.hist_mem_size = hist_mem_size
@@ -221,45 +259,52 @@ class SuccessHistoryAdaptiveDifferentialEvolution(DifferentialEvolution):
     def cauchy(self, loc, gamma):
         r"""Get cauchy random distribution with mean "loc" and standard deviation "gamma".
 
+        Values that are not positive are drawn again.
+
         Args:
-            loc (float): Mean of the cauchy random distribution.
+            loc (Union[float, numpy.ndarray[float]]): Mean or means of the cauchy random distribution.
             gamma (float): Standard deviation of the cauchy random distribution.
 
         Returns:
-            Union[numpy.ndarray[float], float]: Array of numbers.
+            Union[numpy.ndarray[float], float]: Array of numbers with the shape of `loc`.
 
         """
-        c = loc + gamma * np.tan(np.pi * (self.random() - 0.5))
-        return c if c > 0 else self.cauchy(loc, gamma)
+        loc = np.asarray(loc, dtype=float)
+        c = np.atleast_1d(loc + gamma * np.tan(np.pi * (self.random(loc.shape) - 0.5)))
+        redraw = c <= 0
+        while np.any(redraw):
+            c[redraw] = np.atleast_1d(loc)[redraw] + gamma * np.tan(np.pi * (self.random(np.count_nonzero(redraw)) - 0.5))
+            redraw = c <= 0
+        return c if loc.ndim else c[0]
 
-    def gen_ind_params(self, x, hist_cr, hist_f):
-        r"""Generate new individual with new scale factor and crossover probability.
+    def gen_ind_params(self, pop, hist_cr, hist_f):
+        r"""Generate new scale factors and crossover probabilities for population.
 
         Args:
-            x (IndividualSHADE): Individual to apply function on.
+            pop (Population): Population to apply function on.
             hist_cr (numpy.ndarray[float]): Historic values of crossover probability.
             hist_f (numpy.ndarray[float]): Historic values of scale factor.
 
         Returns:
-            Individual: New individual with new parameters
+            Population: Copy of population with new parameters.
 
         """
-        mi = self.integers(self.hist_mem_size)  # a random pair of f cr is selected form historical memory
+        mi = self.integers(self.hist_mem_size, size=len(pop))  # a random pair of f cr is selected form historical memory
         m_cr = hist_cr[mi]
         m_f = hist_f[mi]
-        cr = self.normal(m_cr, 0.1) if m_cr != -1 else 0
+        cr = np.where(m_cr != -1, self.normal(m_cr, 0.1), 0)
         # cr is randomised from normal distribution and then repaired if needed
         cr = np.clip(cr, 0, 1)
         f = self.cauchy(m_f, 0.1)
         # f is randomised from cauchy distribution until the value is >0 and then repaired if needed
         f = np.clip(f, 0, 1)
-        return self.individual_type(x=x.x, differential_weight=f, crossover_probability=cr, e=False)
+        return Population(pop.x.copy(), pop.f.copy(), differential_weight=f, crossover_probability=cr)
 
     def evolve(self, pop, hist_cr, hist_f, archive, arc_ind_cnt, task, **_kwargs):
         r"""Evolve current population.
 
         Args:
-            pop (numpy.ndarray[IndividualSHADE]): Current population.
+            pop (Population): Current population.
             hist_cr (numpy.ndarray[float]): Historic values of crossover probability.
             hist_f (numpy.ndarray[float]): Historic values of scale factor.
             archive (numpy.ndarray): External archive.
@@ -267,28 +312,25 @@ class SuccessHistoryAdaptiveDifferentialEvolution(DifferentialEvolution):
             task (Task): Optimization task.
 
         Returns:
-            numpy.ndarray: New population.
+            Population: New population.
 
         """
-        new_pop = objects_to_array([self.gen_ind_params(xi, hist_cr, hist_f) for xi in pop])
+        new_pop = self.gen_ind_params(pop, hist_cr, hist_f)
         p_num = round(len(pop) * self.pbest_factor)
         if p_num < 2:
             p_num = 2
         # cr and f for mutation are computed
-        for i, xi in enumerate(new_pop):
-            new_pop[i].x = cross_curr2pbest1(pop, i, xi.differential_weight, xi.crossover_probability, self.rng,
-                                             p_num, archive, arc_ind_cnt, task)  # trial vectors are created
-        for xi in new_pop:
-            xi.evaluate(task, rng=self.random)
-
+        new_pop.x = cross_curr2pbest1_batch(pop.x, new_pop.differential_weight, new_pop.crossover_probability, self.rng,
+                                            p_num, archive, arc_ind_cnt, task)  # trial vectors are created
+        new_pop.f = task.eval_batch(new_pop.x)
         return new_pop
 
     def selection(self, pop, new_pop, archive, arc_ind_cnt, best_x, best_fitness, task, **kwargs):
         r"""Operator for selection.
 
         Args:
-            pop (numpy.ndarray): Current population.
-            new_pop (numpy.ndarray): New Population.
+            pop (Population): Current population.
+            new_pop (Population): New Population.
             archive (numpy.ndarray): External archive.
             arc_ind_cnt (int): Number of individuals in the archive.
             best_x (numpy.ndarray): Current global best solution.
@@ -296,47 +338,43 @@ class SuccessHistoryAdaptiveDifferentialEvolution(DifferentialEvolution):
             task (Task): Optimization task.
 
         Returns:
-            Tuple[numpy.ndarray, numpy.ndarray, numpy.ndarray, numpy.ndarray, int, numpy.ndarray, float]:
+            Tuple[Population, numpy.ndarray, numpy.ndarray, numpy.ndarray, numpy.ndarray, int, numpy.ndarray, float]:
                 1. New selected individuals.
                 2. Scale factor values of successful new individuals.
                 3. Crossover probability values of successful new individuals.
-                4. Updated external archive.
-                5. Updated number of individuals in the archive.
-                6. New global best solution.
-                7. New global best solutions fitness/objective value.
+                4. Difference of fitness values of successful new individuals and their parents.
+                5. Updated external archive.
+                6. Updated number of individuals in the archive.
+                7. New global best solution.
+                8. New global best solutions fitness/objective value.
 
         """
-        success_f = np.asarray([])  # array for storing successful f values
-        success_cr = np.asarray([])  # array for storing successful cr values
-        fitness_diff = np.asarray([])  # array for storing the difference of fitness of new individuals
         archive_size = round(len(pop) * self.extern_arc_rate)
-        arr = np.copy(pop)
-        for i, vi in enumerate(new_pop):
-            if vi.f == pop[i].f:
-                arr[i] = vi
-            elif vi.f < pop[i].f:
-                # trial vectors that have a better or equal fitness value are selected for the next generation
-                if archive_size > 1:
-                    if arc_ind_cnt < archive_size:
-                        archive[arc_ind_cnt] = pop[i].x
-                        # parents that have worse fitness then their trial vector are stored into the external archive
-                        arc_ind_cnt += 1
-                    else:
-                        rand_ind = self.integers(archive_size)
-                        # if the archive is full random archive members are replaced
-                        archive[rand_ind] = pop[i].x
-                fitness_diff = np.append(fitness_diff, np.absolute(pop[i].f - vi.f))
-                success_f = np.append(success_f, vi.differential_weight)
-                success_cr = np.append(success_cr, vi.crossover_probability)
-                arr[i] = vi
-        best_x, best_fitness = self.get_best(arr, np.asarray([ui.f for ui in arr]), best_x, best_fitness)
+        success = np.flatnonzero(new_pop.f < pop.f)
+        if archive_size > 1 and success.size:
+            # parents that have worse fitness then their trial vector are stored into the external archive
+            parents = pop.x[success]
+            free = min(max(archive_size - arc_ind_cnt, 0), len(parents))
+            archive[arc_ind_cnt:arc_ind_cnt + free] = parents[:free]
+            arc_ind_cnt += free
+            if free < len(parents):
+                # if the archive is full random archive members are replaced
+                archive[self.integers(archive_size, size=len(parents) - free)] = parents[free:]
+        fitness_diff = np.absolute(pop.f[success] - new_pop.f[success])
+        success_f = new_pop.differential_weight[success]
+        success_cr = new_pop.crossover_probability[success]
+        # trial vectors that have a better or equal fitness value are selected for the next generation
+        replace = new_pop.f <= pop.f
+        arr = pop.copy()
+        arr[replace] = new_pop[replace]
+        best_x, best_fitness = self.get_best(arr, arr.f, best_x, best_fitness)
         return arr, success_f, success_cr, fitness_diff, archive, arc_ind_cnt, best_x, best_fitness
 
     def post_selection(self, pop, arc, arc_ind_cnt, task, xb, fxb, **kwargs):
         r"""Post selection operator.
 
         Args:
-            pop (numpy.ndarray): Current population.
+            pop (Population): Current population.
             arc (numpy.ndarray): External archive.
             arc_ind_cnt (int): Number of individuals in the archive.
             task (Task): Optimization task.
@@ -344,7 +382,7 @@ class SuccessHistoryAdaptiveDifferentialEvolution(DifferentialEvolution):
             fxb (float): Global best fitness.
 
         Returns:
-            Tuple[numpy.ndarray, numpy.ndarray, int, numpy.ndarray, float]:
+            Tuple[Population, numpy.ndarray, int, numpy.ndarray, float]:
                 1. Changed current population.
                 2. Updated external archive.
                 3. Updated number of individuals in the archive.
@@ -361,7 +399,7 @@ class SuccessHistoryAdaptiveDifferentialEvolution(DifferentialEvolution):
             task (Task): Optimization task.
 
         Returns:
-            Tuple[numpy.ndarray, numpy.ndarray, Dict[str, Any]]:
+            Tuple[Population, numpy.ndarray, Dict[str, Any]]:
                 1. New population.
                 2. New population fitness values.
                 3. Additional arguments:
@@ -376,6 +414,7 @@ class SuccessHistoryAdaptiveDifferentialEvolution(DifferentialEvolution):
 
         """
         pop, fitness, _ = DifferentialEvolution.init_population(self, task)  # pop vectors are initialized randomly
+        pop = Population(pop, fitness, differential_weight=0.5, crossover_probability=0.5)
         h_mem_cr = np.full(self.hist_mem_size, 0.5)
         h_mem_f = np.full(self.hist_mem_size, 0.5)
         # all values in the historical memory for parameters f and cr are initialized to 0.5
@@ -393,14 +432,14 @@ class SuccessHistoryAdaptiveDifferentialEvolution(DifferentialEvolution):
 
         Args:
             task (Task): Optimization task.
-            population (numpy.ndarray): Current population.
+            population (Population): Current population.
             population_fitness (numpy.ndarray[float]): Current population function/fitness values.
             best_x (numpy.ndarray): Global best individual.
             best_fitness (float): Global best individual fitness/function value.
             **params (Dict[str, Any]): Additional arguments.
 
         Returns:
-            Tuple[numpy.ndarray, numpy.ndarray[float], Dict[str, Any]]:
+            Tuple[Population, numpy.ndarray[float], Dict[str, Any]]:
                 1. New population.
                 2. New population fitness/function values.
                 3. Additional arguments:
@@ -429,19 +468,11 @@ class SuccessHistoryAdaptiveDifferentialEvolution(DifferentialEvolution):
         num_of_success_params = len(s_f)
         if num_of_success_params > 0:
             # if children better than their parents were created the historical memory is updated
-            m_sf_k = 0
-            m_cr_k = 0
-            sum_sf = 0
-            sum_cr = 0
-            diff_sum = np.sum(fit_diff)
-            for i in range(num_of_success_params):
-                weight = fit_diff[i] / diff_sum
-
-                m_sf_k += weight * s_f[i] * s_f[i]
-                sum_sf += weight * s_f[i]
-
-                m_cr_k += weight * s_cr[i] * s_cr[i]
-                sum_cr += weight * s_cr[i]
+            weight = fit_diff / np.sum(fit_diff)
+            m_sf_k = np.sum(weight * s_f * s_f)
+            sum_sf = np.sum(weight * s_f)
+            m_cr_k = np.sum(weight * s_cr * s_cr)
+            sum_cr = np.sum(weight * s_cr)
 
             h_mem_f[k] = m_sf_k / sum_sf
             # f and cr that are stored into the historic memory are calculated with the use of weighted Lehmer mean
@@ -453,7 +484,7 @@ class SuccessHistoryAdaptiveDifferentialEvolution(DifferentialEvolution):
 
         population, archive, arc_ind_cnt, best_x, best_fitness = self.post_selection(population, archive, arc_ind_cnt,
                                                                                      task, best_x, best_fitness)
-        population_fitness = np.asarray([x.f for x in population])
+        population_fitness = population.f
         best_x, best_fitness = self.get_best(population, population_fitness, best_x, best_fitness)
 
         return population, population_fitness, best_x, best_fitness, {'h_mem_cr': h_mem_cr, 'h_mem_f': h_mem_f, 'k': k,
@@ -494,7 +525,7 @@ class LpsrSuccessHistoryAdaptiveDifferentialEvolution(SuccessHistoryAdaptiveDiff
         In this algorithm the post selection operator linearly reduces the population size. The size of external archive is also updated.
 
         Args:
-            pop (numpy.ndarray): Current population.
+            pop (Population): Current population.
             arc (numpy.ndarray): External archive.
             arc_ind_cnt (int): Number of individuals in the archive.
             task (Task): Optimization task.
@@ -502,7 +533,7 @@ class LpsrSuccessHistoryAdaptiveDifferentialEvolution(SuccessHistoryAdaptiveDiff
             fxb (float): Global best fitness.
 
         Returns:
-            Tuple[numpy.ndarray, numpy.ndarray, int, numpy.ndarray, float]:
+            Tuple[Population, numpy.ndarray, int, numpy.ndarray, float]:
                 1. Changed current population.
                 2. Updated external archive.
                 3. Updated number of individuals in the archive.
@@ -523,11 +554,8 @@ class LpsrSuccessHistoryAdaptiveDifferentialEvolution(SuccessHistoryAdaptiveDiff
         # the worst pop_size - new_pop_size individuals are deleted
         if next_pop_size < pop_size:
             reduction = pop_size - next_pop_size
-            for i in range(reduction):
-                worst = 0
-                for j, e in enumerate(pop):
-                    worst = j if e.f > pop[worst].f else worst
-                pop = np.delete(pop, worst)
+            worst = np.argsort(-pop.f, kind='stable')[:reduction]
+            pop = pop[np.setdiff1d(np.arange(pop_size), worst)]
 
             next_arc_size = int(next_pop_size * self.extern_arc_rate)  # the size of the new archive
             if arc_ind_cnt > next_arc_size:
@@ -1,12 +1,6 @@
 """Implementation of other algorithms."""
 
-from niapy.algorithms.other.aso import AnarchicSocietyOptimization
-from niapy.algorithms.other.hc import HillClimbAlgorithm
-from niapy.algorithms.other.mts import MultipleTrajectorySearch, MultipleTrajectorySearchV1, mts_ls1, mts_ls2, mts_ls3, \
-    mts_ls1v1, mts_ls3v1
-from niapy.algorithms.other.nmm import NelderMeadMethod
-from niapy.algorithms.other.rs import RandomSearch
-from niapy.algorithms.other.sa import SimulatedAnnealing
+from niapy.util.lazy import lazy_exports
 
 __all__ = [
     'NelderMeadMethod',
@@ -20,5 +14,22 @@ __all__ = [
     'mts_ls1v1',
     'mts_ls3v1',
     'AnarchicSocietyOptimization',
-    'RandomSearch'
+    'RandomSearch',
+    'IslandModel'
 ]
+
+__getattr__, __dir__ = lazy_exports(__name__, {
+    'AnarchicSocietyOptimization': 'aso',
+    'HillClimbAlgorithm': 'hc',
+    'IslandModel': 'island',
+    'MultipleTrajectorySearch': 'mts',
+    'MultipleTrajectorySearchV1': 'mts',
+    'mts_ls1': 'mts',
+    'mts_ls2': 'mts',
+    'mts_ls3': 'mts',
+    'mts_ls1v1': 'mts',
+    'mts_ls3v1': 'mts',
+    'NelderMeadMethod': 'nmm',
+    'RandomSearch': 'rs',
+    'SimulatedAnnealing': 'sa'
+})
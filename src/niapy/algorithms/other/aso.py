@@ -5,24 +5,7 @@ import numpy as np
 
 from niapy.algorithms.algorithm import Algorithm
 from niapy.util.array import full_array
-
-
-def euclidean(u, v):
-    r"""
-    Calculate Euclidean distance between two vectors.
-
-    Implemented with numpy only, since scipy is not a NiaPy dependency.
-
-    Args:
-        u (numpy.ndarray): First vector.
-        v (numpy.ndarray): Second vector.
-
-    Returns
-    -------
-        float: Euclidean distance between u and v.
-
-    """
-    return np.sqrt(np.sum((np.asarray(u) - np.asarray(v)) ** 2))
+from niapy.util.distances import euclidean, DistanceCache
 
 
 __all__ = [
@@ -146,7 +129,7 @@ def elitism(x, xpb, xb, xr, mp_c, mp_s, mp_p, f, cr, task, rng):
         task.repair(_mp_s(x, xr, xb, cr, mp_s, rng), rng=rng),
         task.repair(_mp_p(x, xpb, cr, mp_p, rng), rng=rng),
     ]
-    fitnesses = np.apply_along_axis(task.eval, 1, candidates)
+    fitnesses = task.eval_batch(candidates)
     best_idx = np.argmin(fitnesses)
     return candidates[best_idx], fitnesses[best_idx]
 
@@ -250,6 +233,7 @@ class AnarchicSocietyOptimization(Algorithm):
         d (Callable): Distance function for fitness values.
         dn (Callable): Distance function for positions in search space.
         nl (float): Normalized neighbourhood range :math:`\in (0, 1]`.
+        neighbor_index (Optional[Type[NeighborIndex]]): Spatial index for finding neighbourhoods of all individuals at once.
         f (float): Mutation scale factor.
         cr (float): Crossover probability :math:`\in [0, 1]`.
         combination (Callable): Strategy for combining movement operators.
@@ -274,12 +258,13 @@ class AnarchicSocietyOptimization(Algorithm):
 
     def __init__(self, population_size=43, alpha=(1, 0.83), gamma=(1.17, 0.56),
                  theta=(0.932, 0.832), d=euclidean, dn=euclidean, nl=1.0,
-                 f=1.2, cr=0.25, combination=elitism, *args, **kwargs):
+                 f=1.2, cr=0.25, combination=elitism, neighbor_index=None, *args, **kwargs):
         r"""Initialize AnarchicSocietyOptimization algorithm."""
         super().__init__(*args, population_size=population_size, **kwargs)
         self.set_parameters(population_size=population_size, alpha=alpha, gamma=gamma,
                             theta=theta, d=d, dn=dn, nl=nl, f=f, cr=cr,
-                            combination=combination, **kwargs)
+                            combination=combination, neighbor_index=neighbor_index, **kwargs)
+        self._distance_cache = DistanceCache()
 
     @staticmethod
     def info():
@@ -323,7 +308,7 @@ class AnarchicSocietyOptimization(Algorithm):
 
     def set_parameters(self, population_size=43, alpha=(1, 0.83), gamma=(1.17, 0.56),
                        theta=(0.932, 0.832), d=euclidean, dn=euclidean, nl=1.0,
-                       f=1.2, cr=0.25, combination=elitism, *args, **kwargs):
+                       f=1.2, cr=0.25, combination=elitism, neighbor_index=None, *args, **kwargs):
         r"""
         Set algorithm parameters.
 
@@ -339,6 +324,9 @@ class AnarchicSocietyOptimization(Algorithm):
             cr (Optional[float]): Crossover probability :math:`\in [0, 1]`.
             combination (Optional[Callable]): Movement strategy combination function.
                 Choose from :func:`elitism`, :func:`sequential`, :func:`crossover`.
+            neighbor_index (Optional[Type[NeighborIndex]]): Spatial index, e.g. :class:`niapy.util.spatial.KDTree`,
+                that is built over the population once per generation to find neighbourhoods of all individuals at once.
+                The index always measures euclidean distance.
 
         See Also
         --------
@@ -355,6 +343,7 @@ class AnarchicSocietyOptimization(Algorithm):
         self.f = f
         self.cr = cr
         self.combination = combination
+        self.neighbor_index = neighbor_index
 
     def get_parameters(self):
         r"""
@@ -374,6 +363,7 @@ class AnarchicSocietyOptimization(Algorithm):
             'f': self.f,
             'cr': self.cr,
             'combination': self.combination,
+            'neighbor_index': self.neighbor_index,
         })
         return params
 
@@ -473,13 +463,35 @@ class AnarchicSocietyOptimization(Algorithm):
             int: Index of the best neighbour within the neighbourhood.
 
         """
-        distances = np.array([
-            self.dn(population[i], population[j]) / rs
-            for j in range(len(population))
-        ])
+        if self.dn is euclidean:
+            distances = self._distance_cache.distances(population)[i] / rs
+        else:
+            distances = np.array([
+                self.dn(population[i], population[j]) / rs
+                for j in range(len(population))
+            ])
         neighbor_indices = np.where(distances <= self.nl)[0]
         return neighbor_indices[np.argmin(population_fitness[neighbor_indices])]
 
+    def _get_best_neighbors(self, population, population_fitness, rs):
+        r"""
+        Find the best neighbour of every individual.
+
+        Args:
+            population (numpy.ndarray): Current population positions.
+            population_fitness (numpy.ndarray): Current population fitness values.
+            rs (float): Search-space diameter used for normalisation.
+
+        Returns
+        -------
+            List[int]: Index of the best neighbour of each individual.
+
+        """
+        if self.neighbor_index is None:
+            return [self._get_best_neighbor(i, population, population_fitness, rs) for i in range(len(population))]
+        neighborhoods = self.neighbor_index(population).query_radius(population, self.nl * rs)
+        return [neighbors[np.argmin(population_fitness[neighbors])] for neighbors in neighborhoods]
+
     def _update_personal_best(self, population, population_fitness, personal_best, personal_best_fitness):
         r"""
         Update personal best positions for all individuals.
@@ -575,10 +587,7 @@ class AnarchicSocietyOptimization(Algorithm):
         n = len(population)
 
         # Find best neighbour index for each individual
-        neighbor_indices = [
-            self._get_best_neighbor(i, population, population_fitness, rs)
-            for i in range(n)
-        ]
+        neighbor_indices = self._get_best_neighbors(population, population_fitness, rs)
 
         # Compute movement probability indices
         mp_c = np.array([
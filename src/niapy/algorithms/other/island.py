@@ -0,0 +1,538 @@
+# encoding=utf8
+import copy
+import logging
+import multiprocessing
+
+import numpy as np
+from numpy.random import default_rng
+
+from niapy.algorithms.algorithm import Algorithm, Individual, Population
+from niapy.task import Task
+from niapy.util.factory import get_algorithm
+
+logging.basicConfig()
+logger = logging.getLogger('niapy.algorithms.other')
+logger.setLevel('INFO')
+
+__all__ = ['IslandModel']
+
+
+def _solutions(population):
+    r"""Get coordinates of all individuals of a population.
+
+    Args:
+        population (Union[numpy.ndarray, Population]): Population of arrays, individuals or a structure of arrays.
+
+    Returns:
+        numpy.ndarray: Solutions with shape `(n, dimension)`.
+
+    """
+    if isinstance(population, Population):
+        return population.x
+    if population.dtype == object:
+        return np.asarray([individual.x for individual in population])
+    return population
+
+
+class _Island:
+    r"""Sub-population of the island model evolved by its own copy of an algorithm on its own task.
+
+    Attributes:
+        algorithm (Algorithm): Algorithm evolving the island.
+        task (Task): Task of the island.
+
+    """
+
+    def __init__(self, algorithm, task):
+        r"""Initialize island.
+
+        Args:
+            algorithm (Algorithm): Algorithm evolving the island.
+            task (Task): Task of the island.
+
+        """
+        self.algorithm = algorithm
+        self.task = task
+        self.state = None
+
+    def _report(self, evals, migration_size):
+        population, fitness, best_x, best_fitness, _ = self.state
+        order = np.argsort(fitness)[:migration_size]
+        return (self.task.evals - evals, best_x, best_fitness * self.task.optimization_type.value,
+                _solutions(population)[order].copy(), np.asarray(fitness)[order].copy())
+
+    def init(self, budget, migration_size):
+        r"""Initialize the population of the island.
+
+        Args:
+            budget (float): Number of function evaluations the island may use.
+            migration_size (int): Number of emigrants to return.
+
+        Returns:
+            Tuple[int, numpy.ndarray, float, numpy.ndarray, numpy.ndarray]:
+                1. Number of function evaluations used.
+                2. Best solution of the island.
+                3. Best function value of the island.
+                4. Best solutions of the island.
+                5. Function values of best solutions.
+
+        """
+        self.task.max_evals = budget
+        population, fitness, params = self.algorithm.init_population(self.task)
+        best_x, best_fitness = self.algorithm.get_best(population, fitness)
+        self.state = population, fitness, best_x, best_fitness, params
+        return self._report(0, migration_size)
+
+    def immigrate(self, x, f):
+        r"""Replace the worst individuals of the island with immigrants.
+
+        Args:
+            x (numpy.ndarray): Solutions of immigrants.
+            f (numpy.ndarray): Function values of immigrants.
+
+        """
+        population, fitness, best_x, best_fitness, params = self.state
+        worst = np.argsort(fitness)[::-1][:len(x)]
+        x, f = x[:len(worst)], f[:len(worst)]
+        if isinstance(population, Population):
+            population.x[worst] = x
+            population.f[worst] = f
+        elif population.dtype == object:
+            for i, xi, fi in zip(worst, x, f):
+                population[i] = copy.copy(population[i])
+                population[i].x, population[i].f = xi.copy(), fi
+        else:
+            population[worst] = x
+        fitness[worst] = f
+        best_x, best_fitness = self.algorithm.get_best(x, f, best_x, best_fitness)
+        self.state = population, fitness, best_x, best_fitness, params
+
+    def step(self, budget, iterations, migration_size, immigrants=None):
+        r"""Evolve the island for a number of generations.
+
+        Args:
+            budget (float): Number of function evaluations the island may use.
+            iterations (int): Number of generations.
+            migration_size (int): Number of emigrants to return.
+            immigrants (Optional[Tuple[numpy.ndarray, numpy.ndarray]]): Solutions and function values of immigrants.
+
+        Returns:
+            Tuple[int, numpy.ndarray, float, numpy.ndarray, numpy.ndarray]:
+                1. Number of function evaluations used.
+                2. Best solution of the island.
+                3. Best function value of the island.
+                4. Best solutions of the island.
+                5. Function values of best solutions.
+
+        """
+        if immigrants is not None:
+            self.immigrate(*immigrants)
+        evals = self.task.evals
+        self.task.max_evals = evals + budget
+        population, fitness, best_x, best_fitness, params = self.state
+        for _ in range(iterations):
+            if self.task.stopping_condition():
+                break
+            population, fitness, best_x, best_fitness, params = self.algorithm.run_iteration(self.task, population, fitness, best_x, best_fitness, **params)
+            self.task.next_iter()
+        self.state = population, fitness, best_x, best_fitness, params
+        return self._report(evals, migration_size)
+
+    def snapshot(self):
+        r"""Get the island, pickled when it lives in a worker process.
+
+        Returns:
+            _Island: The island.
+
+        """
+        return self
+
+
+def _island_worker(connection, island):
+    r"""Serve calls to an island living in a worker process.
+
+    Args:
+        connection (multiprocessing.connection.Connection): Connection to the process of the island model.
+        island (_Island): Island.
+
+    """
+    while True:
+        message = connection.recv()
+        if message is None:
+            break
+        method, args = message
+        try:
+            connection.send((True, getattr(island, method)(*args)))
+        except BaseException as e:
+            connection.send((False, e))
+    connection.close()
+
+
+class IslandModel(Algorithm):
+    r"""Implementation of the island model.
+
+    Algorithm:
+        Island model
+
+    Date:
+        2026
+
+    License:
+        MIT
+
+    Reference paper:
+        Whitley, D., Rana, S., Heckendorn, R. B. (1998). The island model genetic algorithm: On separability, population size and convergence.
+        Journal of Computing and Information Technology, 7, 33-47.
+
+    The population is split into islands, each evolved by its own copy of an algorithm on its own task,
+    optionally in its own process. Islands only exchange their best individuals every `migration_interval` generations,
+    so only emigrants cross process boundaries. The evaluation budget of the task is shared by all islands:
+    before each epoch, the remaining evaluations are split evenly among the islands, so results do not depend
+    on the number of processes. One iteration of the island model is `migration_interval` generations of every island.
+
+    Attributes:
+        Name (List[str]): List of strings representing algorithm name.
+        algorithm (Algorithm): Algorithm evolving each island.
+        n_islands (int): Number of islands.
+        migration_interval (int): Number of generations between migrations.
+        migration_size (int): Number of individuals migrating from an island.
+        topology (str): Migration topology, one of `ring`, `star` or `random`.
+        n_jobs (int): Number of processes islands run in.
+
+    See Also:
+        * :class:`niapy.algorithms.Algorithm`
+
+    """
+
+    Name = ['IslandModel', 'IM']
+
+    @staticmethod
+    def info():
+        r"""Get basic information of algorithm.
+
+        Returns:
+            str: Basic information of algorithm.
+
+        See Also:
+            * :func:`niapy.algorithms.Algorithm.info`
+
+        """
+        return r"""Whitley, D., Rana, S., Heckendorn, R. B. (1998). The island model genetic algorithm: On separability, population size and convergence. Journal of Computing and Information Technology, 7, 33-47."""
+
+    def __init__(self, algorithm='DifferentialEvolution', n_islands=4, migration_interval=10, migration_size=1, topology='ring',
+                 n_jobs=1, *args, **kwargs):
+        """Initialize IslandModel.
+
+        Args:
+            algorithm (Optional[Union[str, Algorithm]]): Algorithm evolving each island, or its name.
+                The population size of an island is the population size of the algorithm.
+            n_islands (Optional[int]): Number of islands.
+            migration_interval (Optional[int]): Number of generations between migrations.
+            migration_size (Optional[int]): Number of best individuals migrating from an island, replacing the worst ones of the destination.
+            topology (Optional[str]): Migration topology. In a `ring`, island `i` sends emigrants to island `i + 1`.
+                In a `star`, the first island receives the best emigrants of all others and sends its own to all of them.
+                With `random`, each island receives emigrants from another random island.
+            n_jobs (Optional[int]): Number of processes islands run in. Islands run in the current process if `1`
+                and each in its own process otherwise. The algorithm and problem must be picklable.
+
+        See Also:
+            * :func:`niapy.algorithms.Algorithm.__init__`
+
+        """
+        kwargs.pop('population_size', None)
+        super().__init__(n_islands, *args, **kwargs)
+        self.algorithm = get_algorithm(algorithm) if isinstance(algorithm, str) else algorithm
+        self.n_islands = n_islands
+        self.migration_interval = migration_interval
+        self.migration_size = migration_size
+        self.topology = topology
+        self.n_jobs = n_jobs
+        self._islands = None
+        self._workers = None
+
+    def set_parameters(self, algorithm='DifferentialEvolution', n_islands=4, migration_interval=10, migration_size=1,
+                       topology='ring', n_jobs=1, **kwargs):
+        r"""Set the parameters of the algorithm.
+
+        Args:
+            algorithm (Optional[Union[str, Algorithm]]): Algorithm evolving each island, or its name.
+            n_islands (Optional[int]): Number of islands.
+            migration_interval (Optional[int]): Number of generations between migrations.
+            migration_size (Optional[int]): Number of best individuals migrating from an island.
+            topology (Optional[str]): Migration topology, one of `ring`, `star` or `random`.
+            n_jobs (Optional[int]): Number of processes islands run in.
+
+        See Also:
+            * :func:`niapy.algorithms.Algorithm.set_parameters`
+
+        """
+        kwargs.pop('population_size', None)
+        super().set_parameters(population_size=n_islands, **kwargs)
+        self.algorithm = get_algorithm(algorithm) if isinstance(algorithm, str) else algorithm
+        self.n_islands = n_islands
+        self.migration_interval = migration_interval
+        self.migration_size = migration_size
+        self.topology = topology
+        self.n_jobs = n_jobs
+
+    def get_parameters(self):
+        r"""Get parameters of the algorithm.
+
+        Returns:
+            Dict[str, Any]: Algorithm parameters.
+
+        """
+        params = super().get_parameters()
+        params.update({
+            'algorithm': self.algorithm,
+            'n_islands': self.n_islands,
+            'migration_interval': self.migration_interval,
+            'migration_size': self.migration_size,
+            'topology': self.topology,
+            'n_jobs': self.n_jobs
+        })
+        return params
+
+    def _budgets(self, task):
+        r"""Split the remaining evaluations of the task evenly among islands.
+
+        Args:
+            task (Task): Optimization task.
+
+        Returns:
+            List[float]: Number of function evaluations each island may use.
+
+        """
+        remaining = task.max_evals - task.evals
+        if np.isinf(remaining):
+            return [np.inf] * self.n_islands
+        share, extra = divmod(int(remaining), self.n_islands)
+        return [share + (i < extra) for i in range(self.n_islands)]
+
+    def _call(self, method, args):
+        r"""Call a method of every island, in parallel if islands run in worker processes.
+
+        Args:
+            method (str): Name of method.
+            args (List[Tuple[Any, ...]]): Arguments of each island.
+
+        Returns:
+            List[Any]: Results of each island.
+
+        """
+        if self._workers is None:
+            return [getattr(island, method)(*a) for island, a in zip(self._islands, args)]
+        for (connection, _), a in zip(self._workers, args):
+            connection.send((method, a))
+        results = [connection.recv() for connection, _ in self._workers]
+        for ok, result in results:
+            if not ok:
+                raise result
+        return [result for _, result in results]
+
+    def _start(self, task):
+        r"""Create islands and start their processes.
+
+        Args:
+            task (Task): Optimization task.
+
+        """
+        islands = []
+        for seed in self.rng.integers(np.iinfo(np.int64).max, size=self.n_islands):
+            algorithm = copy.deepcopy(self.algorithm)
+            algorithm.rng = default_rng(seed)
+            island_task = Task(problem=task.problem, optimization_type=task.optimization_type, repair_function=task.repair_function,
+                               cutoff_value=task.cutoff_value, evaluator=task.evaluator)
+            islands.append(_Island(algorithm, island_task))
+        self._spawn(islands)
+
+    def _spawn(self, islands):
+        r"""Start a process for each island unless islands run in the current process.
+
+        Args:
+            islands (List[_Island]): Islands.
+
+        """
+        self.close()
+        if self.n_jobs == 1:
+            self._islands = islands
+            return
+        self._workers = []
+        for island in islands:
+            parent, child = multiprocessing.Pipe()
+            process = multiprocessing.Process(target=_island_worker, args=(child, island), daemon=True)
+            process.start()
+            child.close()
+            self._workers.append((parent, process))
+
+    def close(self):
+        r"""Stop the processes of islands."""
+        if self._workers is not None:
+            for connection, process in self._workers:
+                connection.send(None)
+                connection.close()
+                process.join()
+        self._workers = None
+        self._islands = None
+
+    def _gather(self, task, results):
+        r"""Count evaluations of islands on the task and collect their best individuals.
+
+        Args:
+            task (Task): Optimization task.
+            results (List[Tuple[int, numpy.ndarray, float, numpy.ndarray, numpy.ndarray]]): Reports of islands.
+
+        Returns:
+            Tuple[numpy.ndarray, numpy.ndarray, List[Tuple[numpy.ndarray, numpy.ndarray]]]:
+                1. Best solution of each island.
+                2. Best function value of each island.
+                3. Emigrants of each island.
+
+        """
+        best_x = np.asarray([r[1].x if isinstance(r[1], Individual) else r[1] for r in results])
+        best_fitness = np.asarray([r[2] for r in results])
+        ib = np.argmin(best_fitness * task.optimization_type.value)
+        task.add_evals(sum(r[0] for r in results), best_fitness[ib])
+        return best_x, best_fitness * task.optimization_type.value, [(r[3], r[4]) for r in results]
+
+    def _migrate(self, emigrants):
+        r"""Send emigrants to their destinations according to the topology.
+
+        Args:
+            emigrants (List[Tuple[numpy.ndarray, numpy.ndarray]]): Best solutions and function values of each island.
+
+        Returns:
+            List[Tuple[numpy.ndarray, numpy.ndarray]]: Immigrants of each island.
+
+        """
+        k = self.n_islands
+        if k < 2:
+            return [None] * k
+        if self.topology == 'ring':
+            return [emigrants[(i - 1) % k] for i in range(k)]
+        if self.topology == 'star':
+            x = np.concatenate([e[0] for e in emigrants[1:]])
+            f = np.concatenate([e[1] for e in emigrants[1:]])
+            best = np.argsort(f)[:self.migration_size]
+            return [(x[best], f[best])] + [emigrants[0]] * (k - 1)
+        if self.topology == 'random':
+            sources = (np.arange(k) + self.integers(1, k, k)) % k
+            return [emigrants[s] for s in sources]
+        raise ValueError('Unknown migration topology %s.' % self.topology)
+
+    def _run(self, task, checkpoint, checkpointer):
+        r"""Run the optimization and stop the processes of islands when it ends.
+
+        Args:
+            task (Task): Optimization task.
+            checkpoint (Optional[Dict[str, Any]]): State to continue from.
+            checkpointer (Optional[Checkpointer]): Periodically saves the state of the run.
+
+        Returns:
+            Tuple[numpy.ndarray, float]:
+                1. Best individuals components found in optimization process.
+                2. Best fitness value found in optimization process.
+
+        See Also:
+            * :func:`niapy.algorithms.Algorithm.run`
+
+        """
+        try:
+            return super()._run(task, checkpoint, checkpointer)
+        finally:
+            self.close()
+
+    def get_state(self, task, population, population_fitness, best_x, best_fitness, params):
+        r"""Get the state of an optimization run, including the state of every island.
+
+        Args:
+            task (Task): Optimization task.
+            population (numpy.ndarray): Best solution of each island.
+            population_fitness (numpy.ndarray): Best function value of each island.
+            best_x (numpy.ndarray): Global best individual.
+            best_fitness (float): Global best individuals function/fitness value.
+            params (Dict[str, Any]): Additional arguments of the algorithm.
+
+        Returns:
+            Dict[str, Any]: State of the optimization run.
+
+        See Also:
+            * :func:`niapy.algorithms.Algorithm.get_state`
+
+        """
+        state = super().get_state(task, population, population_fitness, best_x, best_fitness, params)
+        state['attributes'] = {name: value for name, value in state['attributes'].items() if name not in ('_islands', '_workers')}
+        state['islands'] = self._call('snapshot', [()] * self.n_islands)
+        return state
+
+    def set_state(self, state, task):
+        r"""Restore the state of an optimization run and restart the islands.
+
+        Args:
+            state (Dict[str, Any]): State returned by :func:`niapy.algorithms.other.IslandModel.get_state`.
+            task (Task): Optimization task to restore counters and convergence history to.
+
+        Returns:
+            Tuple[numpy.ndarray, numpy.ndarray, numpy.ndarray, float, Dict[str, Any]]:
+                1. Best solution of each island.
+                2. Best function value of each island.
+                3. Global best individual.
+                4. Global best individuals function/fitness value.
+                5. Additional arguments of the algorithm.
+
+        See Also:
+            * :func:`niapy.algorithms.Algorithm.set_state`
+
+        """
+        state = dict(state)
+        islands = copy.deepcopy(state.pop('islands'))
+        result = super().set_state(state, task)
+        self._spawn(islands)
+        return result
+
+    def init_population(self, task):
+        r"""Initialize the islands.
+
+        Args:
+            task (Task): Optimization task.
+
+        Returns:
+            Tuple[numpy.ndarray, numpy.ndarray[float], Dict[str, Any]]:
+                1. Best solution of each island.
+                2. Best function value of each island.
+                3. Additional arguments:
+                    * immigrants (List[Tuple[numpy.ndarray, numpy.ndarray]]): Immigrants of each island.
+
+        """
+        self._start(task)
+        budgets = self._budgets(task)
+        best_x, best_fitness, emigrants = self._gather(task, self._call('init', [(b, self.migration_size) for b in budgets]))
+        return best_x, best_fitness, {'immigrants': self._migrate(emigrants)}
+
+    def run_iteration(self, task, population, population_fitness, best_x, best_fitness, **params):
+        r"""Evolve every island for `migration_interval` generations and migrate the best individuals.
+
+        Args:
+            task (Task): Optimization task.
+            population (numpy.ndarray): Best solution of each island.
+            population_fitness (numpy.ndarray): Best function value of each island.
+            best_x (numpy.ndarray): Global best individual.
+            best_fitness (float): Global best individuals fitness/function value.
+            **params (Dict[str, Any]): Additional arguments.
+
+        Returns:
+            Tuple[numpy.ndarray, numpy.ndarray[float], numpy.ndarray, float, Dict[str, Any]]:
+                1. Best solution of each island.
+                2. Best function value of each island.
+                3. New global best solution.
+                4. New global best solutions fitness/objective value.
+                5. Additional arguments:
+                    * immigrants (List[Tuple[numpy.ndarray, numpy.ndarray]]): Immigrants of each island.
+
+        """
+        immigrants = params.pop('immigrants')
+        budgets = self._budgets(task)
+        results = self._call('step', [(b, self.migration_interval, self.migration_size, m) for b, m in zip(budgets, immigrants)])
+        population, population_fitness, emigrants = self._gather(task, results)
+        best_x, best_fitness = self.get_best(population, population_fitness, best_x, best_fitness)
+        return population, population_fitness, best_x, best_fitness, {'immigrants': self._migrate(emigrants)}
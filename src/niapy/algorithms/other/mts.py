@@ -14,8 +14,88 @@ __all__ = ['MultipleTrajectorySearch', 'MultipleTrajectorySearchV1', 'mts_ls1',
            'mts_ls3v1']
 
 
+def _count_best_improvements(fitness, best_fitness):
+    r"""Count how many times the global best would improve if the solutions were evaluated one after another.
+
+    Args:
+        fitness (numpy.ndarray[float]): Function/fitness values in order of evaluation.
+        best_fitness (float): Global best solutions fitness/function value before the evaluations.
+
+    Returns:
+        int: Number of improvements of global best solution.
+
+    """
+    return np.count_nonzero(fitness < np.minimum.accumulate(np.append(best_fitness, fitness))[:-1])
+
+
+def _ls1_blocks(current_x, current_fitness, best_x, best_fitness, search_range, task, rng, minus, plus, block_size,
+                bonus1, bonus2):
+    r"""Block-coordinate version of the first local search.
+
+    Each coordinate of a block is moved down by `minus` from the same starting solution and all moves of the block
+    are evaluated in one batch. Coordinates whose move got worse are moved up by `plus` in a second batch. All improving
+    coordinates of the block are then combined, and the combination is kept if it is better than the best single move.
+
+    Args:
+        current_x (numpy.ndarray): Current solution.
+        current_fitness (float): Current solutions fitness/function value.
+        best_x (numpy.ndarray): Global best solution.
+        best_fitness (float): Global best solutions fitness/function value.
+        search_range (numpy.ndarray): Search range.
+        task (Task): Optimization task.
+        rng (numpy.random.Generator): Random number generator.
+        minus (numpy.ndarray): Size of first move for each coordinate.
+        plus (numpy.ndarray): Size of second move for each coordinate.
+        block_size (int): Number of coordinates searched simultaneously.
+        bonus1 (int): Bonus reward for improving global best solution.
+        bonus2 (int): Bonus reward for improving solution.
+
+    Returns:
+        Tuple[numpy.ndarray, float, numpy.ndarray, float, bool, float, numpy.ndarray]:
+            1. New solution.
+            2. New solutions fitness/function value.
+            3. Global best if found else old global best.
+            4. Global bests function/fitness value.
+            5. If solution has improved.
+            6. Grade.
+            7. Search range.
+
+    """
+    improve, grade, dimension = False, 0.0, len(current_x)
+    for start in range(0, dimension, block_size):
+        i = np.arange(start, min(start + block_size, dimension))
+        candidates = np.tile(current_x, (len(i), 1))
+        candidates[np.arange(len(i)), i] -= minus[i]
+        task.repair_batch(candidates, rng, out=candidates)
+        fitness = task.eval_batch(candidates)
+        worse = np.flatnonzero(fitness > current_fitness)
+        if len(worse):
+            retry = np.tile(current_x, (len(worse), 1))
+            retry[np.arange(len(worse)), i[worse]] += plus[i[worse]]
+            task.repair_batch(retry, rng, out=retry)
+            candidates[worse], fitness[worse] = retry, task.eval_batch(retry)
+        grade += _count_best_improvements(fitness, best_fitness) * bonus1
+        ib = np.argmin(fitness)
+        if fitness[ib] < best_fitness:
+            best_x, best_fitness = candidates[ib].copy(), fitness[ib]
+        better = np.flatnonzero(fitness < current_fitness)
+        if not len(better):
+            continue
+        grade, improve = grade + len(better) * bonus2, True
+        merged = current_x.copy()
+        merged[i[better]] = candidates[better, i[better]]
+        current_x, current_fitness = candidates[ib].copy(), fitness[ib]
+        if len(better) > 1:
+            merged_fitness = task.eval(merged)
+            if merged_fitness < current_fitness:
+                current_x, current_fitness = merged, merged_fitness
+                if merged_fitness < best_fitness:
+                    grade, best_x, best_fitness = grade + bonus1, merged.copy(), merged_fitness
+    return current_x, current_fitness, best_x, best_fitness, improve, grade, search_range
+
+
 def mts_ls1(current_x, current_fitness, best_x, best_fitness, improve, search_range, task, rng, bonus1=10, bonus2=1,
-            sr_fix=0.4, **_kwargs):
+            sr_fix=0.4, block_size=1, **_kwargs):
     r"""Multiple trajectory local search one.
 
     Args:
@@ -30,6 +110,7 @@ def mts_ls1(current_x, current_fitness, best_x, best_fitness, improve, search_ra
         bonus1 (int): Bonus reward for improving global best solution.
         bonus2 (int): Bonus reward for improving solution.
         sr_fix (numpy.ndarray): Fix when search range is to small.
+        block_size (int): Number of coordinates searched simultaneously and evaluated in one batch.
 
     Returns:
         Tuple[numpy.ndarray, float, numpy.ndarray, float, bool, numpy.ndarray]:
@@ -45,6 +126,9 @@ def mts_ls1(current_x, current_fitness, best_x, best_fitness, improve, search_ra
         search_range /= 2
         i_fix = np.argwhere(search_range < 1e-15)
         search_range[i_fix] = task.range[i_fix] * sr_fix
+    if block_size > 1:
+        return _ls1_blocks(current_x, current_fitness, best_x, best_fitness, search_range, task, rng, search_range,
+                           0.5 * search_range, block_size, bonus1, bonus2)
     improve = False
     grade = 0.0
     for i in range(len(current_x)):
@@ -80,7 +164,7 @@ def mts_ls1(current_x, current_fitness, best_x, best_fitness, improve, search_ra
 
 
 def mts_ls1v1(current_x, current_fitness, best_x, best_fitness, improve, search_range, task, rng, bonus1=10, bonus2=1,
-              sr_fix=0.4, **_kwargs):
+              sr_fix=0.4, block_size=1, **_kwargs):
     r"""Multiple trajectory local search one version two.
 
     Args:
@@ -95,6 +179,7 @@ def mts_ls1v1(current_x, current_fitness, best_x, best_fitness, improve, search_
         bonus1 (int): Bonus reward for improving global best solution.
         bonus2 (int): Bonus reward for improving solution.
         sr_fix (numpy.ndarray): Fix when search range is to small.
+        block_size (int): Number of coordinates searched simultaneously and evaluated in one batch.
 
     Returns:
         Tuple[numpy.ndarray, float, numpy.ndarray, float, bool, numpy.ndarray]:
@@ -111,6 +196,9 @@ def mts_ls1v1(current_x, current_fitness, best_x, best_fitness, improve, search_
         i_fix = np.argwhere(search_range < 1e-15)
         search_range[i_fix] = task.range[i_fix] * sr_fix
     improve, d, grade = False, rng.uniform(-1, 1, task.dimension), 0.0
+    if block_size > 1:
+        return _ls1_blocks(current_x, current_fitness, best_x, best_fitness, search_range, task, rng, search_range * d,
+                           0.5 * search_range, block_size, bonus1, bonus2)
     for i in range(len(current_x)):
         x_old = current_x[i]
         current_x[i] = x_old - search_range[i] * d[i]
@@ -152,8 +240,57 @@ def move_x(x, r, d, search_range, op):
     return op(x, search_range * d) if r == 0 else x
 
 
+def _ls2_blocks(current_x, current_fitness, best_x, best_fitness, search_range, task, rng, block_size, bonus1, bonus2):
+    r"""Block version of the second local search.
+
+    A block of random moves is generated from the same starting solution and evaluated in one batch. Moves that got
+    worse are reversed and evaluated in a second batch. The best improving move of the block is kept.
+
+    Args:
+        current_x (numpy.ndarray): Current solution.
+        current_fitness (float): Current solutions fitness/function value.
+        best_x (numpy.ndarray): Global best solution.
+        best_fitness (float): Global best solutions fitness/function value.
+        search_range (numpy.ndarray): Search range.
+        task (Task): Optimization task.
+        rng (numpy.random.Generator): Random number generator.
+        block_size (int): Number of moves evaluated in one batch.
+        bonus1 (int): Bonus reward for improving global best solution.
+        bonus2 (int): Bonus reward for improving solution.
+
+    Returns:
+        Tuple[numpy.ndarray, float, numpy.ndarray, float, bool, float, numpy.ndarray]:
+            1. New solution.
+            2. New solutions fitness/function value.
+            3. Global best if found else old global best.
+            4. Global bests function/fitness value.
+            5. If solution has improved.
+            6. Grade.
+            7. Search range.
+
+    """
+    improve, grade, dimension = False, 0.0, len(current_x)
+    for start in range(0, dimension, block_size):
+        n = min(block_size, dimension - start)
+        steps = np.where(rng.choice(4, (n, dimension)) == 0, search_range * rng.uniform(-1, 1, (n, dimension)), 0)
+        candidates = task.repair_batch(current_x - steps, rng)
+        fitness = task.eval_batch(candidates)
+        worse = fitness > current_fitness
+        if np.any(worse):
+            retry = task.repair_batch(current_x + steps[worse], rng)
+            candidates[worse], fitness[worse] = retry, task.eval_batch(retry)
+        new_best = _count_best_improvements(fitness, best_fitness)
+        grade += new_best * bonus1 + max(np.count_nonzero(fitness < current_fitness) - new_best, 0) * bonus2
+        ib = np.argmin(fitness)
+        if fitness[ib] < best_fitness:
+            best_x, best_fitness = candidates[ib].copy(), fitness[ib]
+        if fitness[ib] < current_fitness:
+            current_x, current_fitness, improve = candidates[ib].copy(), fitness[ib], True
+    return current_x, current_fitness, best_x, best_fitness, improve, grade, search_range
+
+
 def mts_ls2(current_x, current_fitness, best_x, best_fitness, improve, search_range, task, rng, bonus1=10, bonus2=1,
-            sr_fix=0.4, **_kwargs):
+            sr_fix=0.4, block_size=1, **_kwargs):
     r"""Multiple trajectory local search two.
 
     Args:
@@ -168,6 +305,7 @@ def mts_ls2(current_x, current_fitness, best_x, best_fitness, improve, search_ra
         bonus1 (int): Bonus reward for improving global best solution.
         bonus2 (int): Bonus reward for improving solution.
         sr_fix (numpy.ndarray): Fix when search range is to small.
+        block_size (int): Number of moves evaluated in one batch.
 
     Returns:
         Tuple[numpy.ndarray, float, numpy.ndarray, float, bool, numpy.ndarray]:
@@ -186,6 +324,9 @@ def mts_ls2(current_x, current_fitness, best_x, best_fitness, improve, search_ra
         search_range /= 2
         i_fix = np.argwhere(search_range < 1e-15)
         search_range[i_fix] = task.range[i_fix] * sr_fix
+    if block_size > 1:
+        return _ls2_blocks(current_x, current_fitness, best_x, best_fitness, search_range, task, rng, block_size, bonus1,
+                           bonus2)
     improve, grade = False, 0.0
     for _ in range(len(current_x)):
         d = -1 + rng.random(len(current_x)) * 2
@@ -207,8 +348,68 @@ def mts_ls2(current_x, current_fitness, best_x, best_fitness, improve, search_ra
     return current_x, current_fitness, best_x, best_fitness, improve, grade, search_range
 
 
+def _ls3_blocks(current_x, current_fitness, best_x, best_fitness, improve, search_range, task, rng, block_size, bonus1,
+                bonus2):
+    r"""Block-coordinate version of the third local search.
+
+    The three probing moves of every coordinate in a block are evaluated in one batch, after which all coordinates of
+    the block are moved together and the moved solution is evaluated once.
+
+    Args:
+        current_x (numpy.ndarray): Current solution.
+        current_fitness (float): Current solutions fitness/function value.
+        best_x (numpy.ndarray): Global best solution.
+        best_fitness (float): Global best solutions fitness/function value.
+        improve (bool): Has the solution been improved.
+        search_range (numpy.ndarray): Search range.
+        task (Task): Optimization task.
+        rng (numpy.random.Generator): Random number generator.
+        block_size (int): Number of coordinates searched simultaneously.
+        bonus1 (int): Bonus reward for improving global best solution.
+        bonus2 (int): Bonus reward for improving solution.
+
+    Returns:
+        Tuple[numpy.ndarray, float, numpy.ndarray, float, bool, float, numpy.ndarray]:
+            1. New solution.
+            2. New solutions fitness/function value.
+            3. Global best if found else old global best.
+            4. Global bests function/fitness value.
+            5. If solution has improved.
+            6. Grade.
+            7. Search range.
+
+    """
+    x_new, grade, dimension = np.copy(current_x), 0.0, len(current_x)
+    for start in range(0, dimension, block_size):
+        i = np.arange(start, min(start + block_size, dimension))
+        n = len(i)
+        probes = np.tile(x_new, (3 * n, 1))
+        probes[np.arange(3 * n), np.repeat(i, 3)] += np.tile([0.1, -0.1, 0.2], n)
+        task.repair_batch(probes, rng, out=probes)
+        fitness = task.eval_batch(probes)
+        new_best = _count_best_improvements(fitness, best_fitness)
+        if new_best:
+            ib = np.argmin(fitness)
+            grade, best_x, best_fitness, improve = grade + new_best * bonus1, probes[ib].copy(), fitness[ib], True
+        d1, d2, d3 = np.where(np.isinf(fitness), 0, current_fitness - fitness).reshape(n, 3).T
+        improved = np.count_nonzero(d1 > 0) + np.count_nonzero(d2 > 0) + np.count_nonzero(d3 > 0)
+        if improved:
+            grade, improve = grade + improved * bonus2, True
+        a, b, c = 0.4 + rng.random(n) * 0.1, 0.1 + rng.random(n) * 0.2, rng.random(n)
+        x_new[i] += a * (d1 - d2) + b * (d3 - 2 * d1) + c
+        x_new = task.repair(x_new, rng)
+        x_new_fitness = task.eval(x_new)
+        if x_new_fitness < current_fitness:
+            if x_new_fitness < best_fitness:
+                best_x, best_fitness, grade = x_new.copy(), x_new_fitness, grade + bonus1
+            else:
+                grade += bonus2
+            current_x, current_fitness, improve = x_new.copy(), x_new_fitness, True
+    return current_x, current_fitness, best_x, best_fitness, improve, grade, search_range
+
+
 def mts_ls3(current_x, current_fitness, best_x, best_fitness, improve, search_range, task, rng, bonus1=10, bonus2=1,
-            **_kwargs):
+            block_size=1, **_kwargs):
     r"""Multiple trajectory local search three.
 
     Args:
@@ -222,6 +423,7 @@ def mts_ls3(current_x, current_fitness, best_x, best_fitness, improve, search_ra
         rng (numpy.random.Generator): Random number generator.
         bonus1 (int): Bonus reward for improving global best solution.
         bonus2 (int): Bonus reward for improving solution.
+        block_size (int): Number of coordinates searched simultaneously and evaluated in one batch.
 
     Returns:
         Tuple[numpy.ndarray, float, numpy.ndarray, float, bool, numpy.ndarray]:
@@ -233,6 +435,9 @@ def mts_ls3(current_x, current_fitness, best_x, best_fitness, improve, search_ra
             6. Search range.
 
     """
+    if block_size > 1:
+        return _ls3_blocks(current_x, current_fitness, best_x, best_fitness, improve, search_range, task, rng, block_size,
+                           bonus1, bonus2)
     x_new, grade = np.copy(current_x), 0.0
     for i in range(len(current_x)):
         x1, x2, x3 = np.copy(x_new), np.copy(x_new), np.copy(x_new)
@@ -295,9 +500,9 @@ def mts_ls3v1(current_x, current_fitness, best_x, best_fitness, improve, search_
     """
     grade, disp = 0.0, task.range / 10
     while True in (disp > 1e-3):
-        new_x = np.apply_along_axis(task.repair, 1, np.asarray(
-            [rng.permutation(current_x) + disp * rng.uniform(-1, 1, len(current_x)) for _ in range(phi)]), rng)
-        new_fitness = np.apply_along_axis(task.eval, 1, new_x)
+        new_x = np.asarray([rng.permutation(current_x) + disp * rng.uniform(-1, 1, len(current_x)) for _ in range(phi)])
+        task.repair_batch(new_x, rng, out=new_x)
+        new_fitness = task.eval_batch(new_x)
         i_better, i_better_best = np.argwhere(new_fitness < current_fitness), np.argwhere(new_fitness < best_fitness)
         grade += len(i_better_best) * bonus1 + (len(i_better) - len(i_better_best)) * bonus2
         if len(new_fitness[i_better_best]) > 0:
@@ -342,6 +547,7 @@ class MultipleTrajectorySearch(Algorithm):
         num_searches (int): Number of local search algorithm runs.
         num_searches_best (int): Number of locals search algorithm runs on best solution.
         num_enabled (int): Number of best solution for testing.
+        block_size (int): Number of coordinates local searches evaluate in one batch.
 
     See Also:
         * :class:`niapy.algorithms.Algorithm`
@@ -364,7 +570,8 @@ class MultipleTrajectorySearch(Algorithm):
         return r"""Lin-Yu Tseng and Chun Chen, "Multiple trajectory search for Large Scale Global Optimization," 2008 IEEE Congress on Evolutionary Computation (IEEE World Congress on Computational Intelligence), Hong Kong, 2008, pp. 3052-3059. doi: 10.1109/CEC.2008.4631210"""
 
     def __init__(self, population_size=40, num_tests=5, num_searches=5, num_searches_best=5, num_enabled=17, bonus1=10,
-                 bonus2=1, local_searches=(mts_ls1, mts_ls2, mts_ls3), *args, **kwargs):
+                 bonus2=1, local_searches=(mts_ls1, mts_ls2, mts_ls3),
+                 block_size=1, *args, **kwargs):
         """Initialize MultipleTrajectorySearch.
 
         Args:
@@ -376,6 +583,7 @@ class MultipleTrajectorySearch(Algorithm):
             bonus1 (int): Bonus for improving global best solution.
             bonus2 (int): Bonus for improving self.
             local_searches (Iterable[Callable[[numpy.ndarray, float, numpy.ndarray, float, bool, numpy.ndarray, Task, Dict[str, Any]], Tuple[numpy.ndarray, float, numpy.ndarray, float, bool, int, numpy.ndarray]]]): Local searches to use.
+            block_size (int): Number of coordinates local searches evaluate in one batch.
 
         See Also:
             * :func:`niapy.algorithms.Algorithm.__init__`
@@ -389,9 +597,11 @@ class MultipleTrajectorySearch(Algorithm):
         self.bonus1 = bonus1
         self.bonus2 = bonus2
         self.local_searches = local_searches
+        self.block_size = block_size
 
     def set_parameters(self, population_size=40, num_tests=5, num_searches=5, num_searches_best=5, num_enabled=17,
-                       bonus1=10, bonus2=1, local_searches=(mts_ls1, mts_ls2, mts_ls3), **kwargs):
+                       bonus1=10, bonus2=1, local_searches=(mts_ls1, mts_ls2, mts_ls3),
+                       block_size=1, **kwargs):
         r"""Set the arguments of the algorithm.
 
         Args:
@@ -403,6 +613,7 @@ class MultipleTrajectorySearch(Algorithm):
             bonus1 (int): Bonus for improving global best solution.
             bonus2 (int): Bonus for improving self.
             local_searches (Iterable[Callable[[numpy.ndarray, float, numpy.ndarray, float, bool, numpy.ndarray, Task, Dict[str, Any]], Tuple[numpy.ndarray, float, numpy.ndarray, float, bool, int, numpy.ndarray]]]): Local searches to use.
+            block_size (int): Number of coordinates local searches evaluate in one batch.
 
         See Also:
             * :func:`niapy.algorithms.Algorithm.set_parameters`
@@ -416,6 +627,7 @@ class MultipleTrajectorySearch(Algorithm):
         self.bonus1 = bonus1
         self.bonus2 = bonus2
         self.local_searches = local_searches
+        self.block_size = block_size
 
     def get_parameters(self):
         r"""Get parameters values for the algorithm.
@@ -433,7 +645,8 @@ class MultipleTrajectorySearch(Algorithm):
             'bonus1': self.bonus1,
             'bonus2': self.bonus2,
             'num_enabled': self.num_enabled,
-            'local_searches': self.local_searches
+            'local_searches': self.local_searches,
+            'block_size': self.block_size
         })
         return d
 
@@ -463,7 +676,7 @@ class MultipleTrajectorySearch(Algorithm):
             for _ in range(self.num_tests):
                 new_x[k][0], new_x[k][1], xb, fxb, improve, g, search_range = self.local_searches[k](new_x[k][0], new_x[k][1], xb, fxb, improve, search_range,
                                                                                                      task, BONUS1=self.bonus1, BONUS2=self.bonus2,
-                                                                                                     rng=self.rng)
+                                                                                                     rng=self.rng, block_size=self.block_size)
                 ls_grades[k] += g
         xn, xn_f = min(new_x, key=lambda val: val[1])
         return xn, xn_f, xb, fxb, k
@@ -494,7 +707,7 @@ class MultipleTrajectorySearch(Algorithm):
         """
         for _ in range(self.num_searches):
             x, x_f, xb, fxb, improve, grade, search_range = self.local_searches[k](x, x_f, xb, fxb, improve, search_range, task, bonus1=self.bonus1,
-                                                                                   bonus2=self.bonus2, rng=self.rng)
+                                                                                   bonus2=self.bonus2, rng=self.rng, block_size=self.block_size)
             g += grade
         return x, x_f, xb, fxb, improve, search_range, g
 
@@ -566,7 +779,7 @@ class MultipleTrajectorySearch(Algorithm):
                                                                                                                                        search_range[i], grades[i], task)
         for _ in range(self.num_searches_best):
             _, _, best_x, best_fitness, _, _, _ = mts_ls1(best_x, best_fitness, best_x, best_fitness, False, task.range.copy() / 10, task,
-                                                          rng=self.rng)
+                                                          rng=self.rng, block_size=self.block_size)
         enable[np.argsort(grades)[:self.num_enabled]] = True
         return population, population_fitness, best_x, best_fitness, {'enable': enable, 'improve': improve, 'search_range': search_range, 'grades': grades}
 
@@ -122,7 +122,7 @@ class NelderMeadMethod(Algorithm):
         """
         population_size = task.dimension if population_size is None or population_size < task.dimension else population_size
         population = self.uniform(task.lower, task.upper, (population_size, task.dimension))
-        population_fitness = np.apply_along_axis(task.eval, 1, population)
+        population_fitness = task.eval_batch(population)
         return population, population_fitness
 
     def method(self, population, population_fitness, task):
@@ -159,7 +159,7 @@ class NelderMeadMethod(Algorithm):
             population[-1], population_fitness[-1] = xc, rc
             return population, population_fitness
         new_population = population[0] + self.sigma * (population[1:] - population[0])
-        new_population_fitness = np.apply_along_axis(task.eval, 1, new_population)
+        new_population_fitness = task.eval_batch(new_population)
         population[1:], population_fitness[1:] = new_population, new_population_fitness
         return population, population_fitness
 
@@ -0,0 +1,132 @@
+# encoding=utf8
+
+"""Implementation of the evaluation cache."""
+
+from collections import OrderedDict
+
+import numpy as np
+
+__all__ = ['EvaluationCache']
+
+
+class EvaluationCache:
+    r"""Least recently used cache of function values.
+
+    Solutions are keyed on the exact bytes of their coordinates, optionally rounded to a number of decimals first,
+    so that solutions that differ only by rounding noise share an entry. When the cache is full, the least recently
+    used entry is evicted. A cache can be shared by several tasks on the same problem.
+
+    Attributes:
+        max_size (Optional[int]): Maximum number of cached solutions. Unbounded if `None`.
+        decimals (Optional[int]): Number of decimals coordinates are rounded to before hashing. Exact if `None`.
+        count_hits (bool): Whether cache hits consume the evaluation budget of a task.
+            If `True`, runs are the same as without a cache, only faster.
+            If `False`, only cache misses are counted as function evaluations, so an algorithm that keeps revisiting
+            the same solutions should also be limited by `max_iters`.
+        hits (int): Number of cache hits.
+        misses (int): Number of cache misses.
+
+    See Also:
+        * :class:`niapy.task.Task`
+
+    """
+
+    def __init__(self, max_size=10000, decimals=None, count_hits=True):
+        r"""Initialize evaluation cache.
+
+        Args:
+            max_size (Optional[int]): Maximum number of cached solutions. Unbounded if `None`.
+            decimals (Optional[int]): Number of decimals coordinates are rounded to before hashing. Exact if `None`.
+            count_hits (Optional[bool]): Whether cache hits consume the evaluation budget of a task.
+
+        """
+        self.max_size = max_size
+        self.decimals = decimals
+        self.count_hits = count_hits
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+
+    def key(self, x):
+        r"""Get cache key of solution.
+
+        Args:
+            x (numpy.ndarray): Solution.
+
+        Returns:
+            bytes: Cache key.
+
+        """
+        x = np.asarray(x, dtype=float)
+        if self.decimals is not None:
+            x = np.round(x, self.decimals) + 0.0
+        return x.tobytes()
+
+    def get(self, key):
+        r"""Get cached function value and count the lookup as a hit or a miss.
+
+        Args:
+            key (bytes): Cache key.
+
+        Returns:
+            Optional[float]: Cached function value or `None` if the key is not cached.
+
+        """
+        value = self._entries.get(key)
+        if value is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self._entries.move_to_end(key)
+        return value
+
+    def put(self, key, value):
+        r"""Store function value, evicting the least recently used entry if the cache is full.
+
+        Args:
+            key (bytes): Cache key.
+            value (float): Function value.
+
+        """
+        self._entries[key] = float(value)
+        self._entries.move_to_end(key)
+        if self.max_size is not None and len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    @property
+    def hit_rate(self):
+        r"""Get the fraction of lookups that were cache hits.
+
+        Returns:
+            float: Hit rate, `0.0` if nothing was looked up yet.
+
+        """
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def clear(self):
+        r"""Remove all entries and reset counters."""
+        self._entries.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self):
+        r"""Get the number of cached solutions.
+
+        Returns:
+            int: Number of cached solutions.
+
+        """
+        return len(self._entries)
+
+    def __contains__(self, key):
+        r"""Check if key is cached without counting a lookup.
+
+        Args:
+            key (bytes): Cache key.
+
+        Returns:
+            bool: `True` if key is cached.
+
+        """
+        return key in self._entries
@@ -1,3 +1,13 @@
+import logging
+import time
+
+from niapy.profiling import Profiler
+
+logger = logging.getLogger('niapy.callbacks')
+
+__all__ = ['Callback', 'CallbackList', 'ProfilingCallback']
+
+
 class Callback:
     """Base class for callbacks.
 
@@ -128,3 +138,77 @@ class CallbackList(Callback):
             self.callbacks.append(callback)
         else:
             raise ValueError('Callback must be an instance of `Callback`')
+
+
+class ProfilingCallback(Callback):
+    """Callback that times population initialization and iterations of an algorithm.
+
+    Pass the same profiler to the task to also time problem evaluations and repairs,
+    so the breakdown shows how much time is algorithm overhead.
+
+    Attributes:
+        profiler (Profiler): Timing counters.
+        verbose (bool): Log the breakdown after each run.
+        runs (List[Dict[str, Dict[str, float]]]): Breakdown of each finished run.
+
+    """
+
+    def __init__(self, profiler=None, verbose=False):
+        """Initialize ProfilingCallback.
+
+        Args:
+            profiler (Optional[Profiler]): Timing counters, shared with the task. A new profiler by default.
+            verbose (Optional[bool]): Log the breakdown after each run.
+
+        """
+        super().__init__()
+        self.profiler = profiler if profiler is not None else Profiler()
+        self.verbose = verbose
+        self.runs = []
+        self._start = None
+        self._initializing = False
+
+    def before_run(self):
+        """Start timing population initialization."""
+        self.profiler.reset()
+        self._start = time.perf_counter()
+        self._initializing = True
+
+    def _end_initialization(self):
+        if self._initializing:
+            self.profiler.add('init_population', time.perf_counter() - self._start)
+            self._initializing = False
+
+    def before_iteration(self, population, fitness, best_x, best_fitness, **params):
+        """Start timing an iteration.
+
+        Args:
+            population (numpy.ndarray): The current population of individuals.
+            fitness (numpy.ndarray): The fitness values corresponding to the individuals.
+            best_x (numpy.ndarray): The best solution found so far.
+            best_fitness (float): The fitness value of the best solution found.
+            **params: Additional algorithm parameters.
+
+        """
+        self._end_initialization()
+        self._start = time.perf_counter()
+
+    def after_iteration(self, population, fitness, best_x, best_fitness, **params):
+        """Stop timing an iteration.
+
+        Args:
+            population (numpy.ndarray): The current population of individuals.
+            fitness (numpy.ndarray): The fitness values corresponding to the individuals.
+            best_x (numpy.ndarray): The best solution found so far.
+            best_fitness (float): The fitness value of the best solution found.
+            **params: Additional algorithm parameters.
+
+        """
+        self.profiler.add('run_iteration', time.perf_counter() - self._start)
+
+    def after_run(self):
+        """Store and optionally log the breakdown of the run."""
+        self._end_initialization()
+        self.runs.append(self.profiler.breakdown())
+        if self.verbose:
+            logger.info('Time breakdown of %s:\n%s', type(self.algorithm).__name__, self.profiler.report())
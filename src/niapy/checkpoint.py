@@ -0,0 +1,112 @@
+# encoding=utf8
+
+"""Implementation of checkpointing of optimization runs."""
+
+import os
+import pickle
+import time
+
+__all__ = ['Checkpointer', 'save_checkpoint', 'load_checkpoint']
+
+
+def save_checkpoint(path, state):
+    r"""Write checkpoint to file.
+
+    The checkpoint is pickled with the highest protocol, so arrays are stored as raw bytes.
+    It is first written to a temporary file that then replaces `path`, so a crash while saving
+    does not corrupt the previous checkpoint.
+
+    Args:
+        path (str): Path of checkpoint file.
+        state (Dict[str, Any]): State of the optimization run.
+
+    """
+    tmp_path = '%s.tmp' % path
+    with open(tmp_path, 'wb') as file:
+        pickle.dump(state, file, protocol=pickle.HIGHEST_PROTOCOL)
+    os.replace(tmp_path, path)
+
+
+def load_checkpoint(path):
+    r"""Read checkpoint from file.
+
+    Args:
+        path (str): Path of checkpoint file.
+
+    Returns:
+        Dict[str, Any]: State of the optimization run.
+
+    """
+    with open(path, 'rb') as file:
+        return pickle.load(file)
+
+
+class Checkpointer:
+    r"""Periodically save the state of an optimization run.
+
+    A checkpoint is written after every `every_iters` iterations and after every `every_seconds` seconds,
+    whichever comes first. If neither is set, a checkpoint is written after each iteration.
+
+    Attributes:
+        path (str): Path of checkpoint file, overwritten by each checkpoint.
+        every_iters (Optional[int]): Number of iterations between checkpoints.
+        every_seconds (Optional[float]): Number of seconds between checkpoints.
+        saved (int): Number of checkpoints written.
+
+    See Also:
+        * :func:`niapy.algorithms.Algorithm.run`
+        * :func:`niapy.algorithms.Algorithm.resume`
+
+    """
+
+    def __init__(self, path, every_iters=None, every_seconds=None):
+        r"""Initialize checkpointer.
+
+        Args:
+            path (str): Path of checkpoint file.
+            every_iters (Optional[int]): Number of iterations between checkpoints.
+            every_seconds (Optional[float]): Number of seconds between checkpoints.
+
+        """
+        self.path = path
+        self.every_iters = every_iters
+        self.every_seconds = every_seconds
+        self.saved = 0
+        self._last_iter = 0
+        self._last_time = time.monotonic()
+
+    def start(self, task):
+        r"""Start counting iterations and time to the next checkpoint.
+
+        Args:
+            task (Task): Optimization task.
+
+        """
+        self._last_iter, self._last_time = task.iters, time.monotonic()
+
+    def due(self, task):
+        r"""Check if a checkpoint should be written.
+
+        Args:
+            task (Task): Optimization task.
+
+        Returns:
+            bool: `True` if a checkpoint should be written.
+
+        """
+        if self.every_iters is None and self.every_seconds is None:
+            return True
+        return ((self.every_iters is not None and task.iters - self._last_iter >= self.every_iters)
+                or (self.every_seconds is not None and time.monotonic() - self._last_time >= self.every_seconds))
+
+    def save(self, state, task):
+        r"""Write checkpoint.
+
+        Args:
+            state (Dict[str, Any]): State of the optimization run.
+            task (Task): Optimization task.
+
+        """
+        save_checkpoint(self.path, state)
+        self.start(task)
+        self.saved += 1
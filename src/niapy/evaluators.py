@@ -0,0 +1,391 @@
+# encoding=utf8
+
+"""Implementation of fitness evaluation backends."""
+
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+import numpy as np
+
+from niapy.shared import SharedPopulation
+
+__all__ = ['Evaluator', 'PoolEvaluator', 'ThreadPoolEvaluator', 'ProcessPoolEvaluator', 'SharedMemoryEvaluator',
+           'AsyncEvaluator']
+
+_attached = {}
+
+
+def _evaluate_shared(spec, problem, start, stop):
+    r"""Evaluate rows of a shared population in place.
+
+    The worker attaches to the block of shared memory once and keeps it attached for later calls.
+
+    Args:
+        spec (Tuple[str, int, int]): Handle of the shared population.
+        problem (Problem): Optimization problem.
+        start (int): First row to evaluate.
+        stop (int): End of rows to evaluate.
+
+    """
+    shared = _attached.get(spec)
+    if shared is None:
+        for old in _attached.values():
+            old.close()
+        _attached.clear()
+        shared = _attached[spec] = SharedPopulation.attach(spec)
+    shared.f[start:stop] = problem.evaluate_batch(shared.x[start:stop])
+
+
+class Evaluator:
+    r"""Evaluator that evaluates populations serially in the calling process.
+
+    Evaluators are used by :meth:`niapy.task.Task.eval_batch` for computing the function values
+    of whole populations. This is the default evaluator of every task.
+
+    """
+
+    def evaluate(self, problem, population):
+        r"""Evaluate population of solutions.
+
+        Args:
+            problem (Problem): Optimization problem.
+            population (numpy.ndarray): Solutions with shape `(n, dimension)`.
+
+        Returns:
+            numpy.ndarray: Function values of solutions with shape `(n,)`.
+
+        """
+        return problem.evaluate_batch(population)
+
+    def evaluate_single(self, problem, x):
+        r"""Evaluate a single solution.
+
+        Args:
+            problem (Problem): Optimization problem.
+            x (numpy.ndarray): Solution.
+
+        Returns:
+            float: Function value of `x`.
+
+        """
+        return problem.evaluate(x)
+
+    def close(self):
+        r"""Release resources held by the evaluator."""
+        pass
+
+    def __enter__(self):
+        r"""Enter the runtime context of the evaluator."""
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        r"""Exit the runtime context and release resources held by the evaluator."""
+        self.close()
+
+
+class PoolEvaluator(Evaluator):
+    r"""Base class for evaluators that split populations across a pool of workers.
+
+    The population is split into contiguous chunks, each chunk is evaluated with
+    :meth:`niapy.problems.Problem.evaluate_batch` on a worker and the results are joined
+    in the original order, so the function values do not depend on scheduling.
+    The pool is created on first use and can be reused by many tasks until :meth:`close` is called.
+
+    Attributes:
+        executor_class (Type[concurrent.futures.Executor]): Type of executor used for the pool.
+        max_workers (int): Number of workers in the pool.
+        chunk_size (Optional[int]): Number of solutions sent to a worker at once.
+
+    """
+
+    executor_class = None
+
+    def __init__(self, max_workers=None, chunk_size=None):
+        r"""Initialize pool evaluator.
+
+        Args:
+            max_workers (Optional[int]): Number of workers in the pool. Defaults to the number of CPUs.
+            chunk_size (Optional[int]): Number of solutions sent to a worker at once.
+                By default, the population is split evenly among the workers.
+
+        """
+        self.max_workers = max_workers if max_workers is not None else os.cpu_count() or 1
+        self.chunk_size = chunk_size
+        self._executor = None
+        self._lock = threading.Lock()
+
+    @property
+    def executor(self):
+        r"""Get the executor of the pool, creating it if needed.
+
+        Returns:
+            concurrent.futures.Executor: Executor of the pool.
+
+        """
+        with self._lock:
+            if self._executor is None:
+                self._executor = self.executor_class(max_workers=self.max_workers)
+            return self._executor
+
+    def evaluate(self, problem, population):
+        r"""Evaluate population of solutions on the workers of the pool.
+
+        Args:
+            problem (Problem): Optimization problem.
+            population (numpy.ndarray): Solutions with shape `(n, dimension)`.
+
+        Returns:
+            numpy.ndarray: Function values of solutions with shape `(n,)`.
+
+        """
+        if len(population) < 2:
+            return problem.evaluate_batch(population)
+        if self.chunk_size is None:
+            n_chunks = min(len(population), self.max_workers)
+        else:
+            n_chunks = int(np.ceil(len(population) / self.chunk_size))
+        chunks = np.array_split(population, n_chunks)
+        return np.concatenate(list(self.executor.map(problem.evaluate_batch, chunks)))
+
+    def __getstate__(self):
+        r"""Get state for pickling without the pool, so a copy of the evaluator creates its own pool.
+
+        Returns:
+            Dict[str, Any]: State of the evaluator.
+
+        """
+        return dict(vars(self), _executor=None, _lock=None)
+
+    def __setstate__(self, state):
+        r"""Restore pickled state.
+
+        Args:
+            state (Dict[str, Any]): State of the evaluator.
+
+        """
+        vars(self).update(state)
+        self._lock = threading.Lock()
+
+    def close(self):
+        r"""Shut down the workers of the pool."""
+        with self._lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=True)
+                self._executor = None
+
+
+class ThreadPoolEvaluator(PoolEvaluator):
+    r"""Evaluator that evaluates populations on a pool of threads.
+
+    Useful for problems that release the GIL, e.g. ones that call into compiled code or wait on I/O.
+
+    See Also:
+        * :class:`niapy.evaluators.PoolEvaluator`
+
+    """
+
+    executor_class = ThreadPoolExecutor
+
+
+class ProcessPoolEvaluator(PoolEvaluator):
+    r"""Evaluator that evaluates populations on a pool of processes.
+
+    Useful for expensive problems written in Python. The problem must be picklable.
+
+    See Also:
+        * :class:`niapy.evaluators.PoolEvaluator`
+
+    """
+
+    executor_class = ProcessPoolExecutor
+
+
+class SharedMemoryEvaluator(PoolEvaluator):
+    r"""Evaluator that evaluates populations on a pool of processes through shared memory.
+
+    Solutions are placed in a :class:`niapy.shared.SharedPopulation` and workers only receive the name of
+    the shared block and the rows to evaluate, so populations are never pickled. Workers write function
+    values back into the shared block. Populations built directly in :attr:`shared` are not copied at all.
+    The problem must be picklable.
+
+    Attributes:
+        shared (Optional[SharedPopulation]): Shared population, created on first use and grown when needed.
+
+    See Also:
+        * :class:`niapy.evaluators.PoolEvaluator`
+        * :class:`niapy.shared.SharedPopulation`
+
+    """
+
+    executor_class = ProcessPoolExecutor
+
+    def __init__(self, max_workers=None, chunk_size=None):
+        r"""Initialize shared memory evaluator.
+
+        Args:
+            max_workers (Optional[int]): Number of workers in the pool. Defaults to the number of CPUs.
+            chunk_size (Optional[int]): Number of solutions evaluated by a worker at once.
+                By default, the population is split evenly among the workers.
+
+        """
+        super().__init__(max_workers, chunk_size)
+        self.shared = None
+
+    def buffer(self, size, dimension):
+        r"""Get shared population with room for size solutions.
+
+        Solutions written to the rows of the returned population are evaluated without copying.
+
+        Args:
+            size (int): Number of solutions.
+            dimension (int): Dimension of solutions.
+
+        Returns:
+            SharedPopulation: Shared population.
+
+        """
+        if self.shared is None or self.shared.size < size or self.shared.dimension != dimension:
+            self._release()
+            self.shared = SharedPopulation(size, dimension)
+        return self.shared
+
+    def evaluate(self, problem, population):
+        r"""Evaluate population of solutions on the workers of the pool.
+
+        Args:
+            problem (Problem): Optimization problem.
+            population (numpy.ndarray): Solutions with shape `(n, dimension)`.
+
+        Returns:
+            numpy.ndarray: Function values of solutions with shape `(n,)`.
+
+        """
+        population = np.asarray(population, dtype=float)
+        n = len(population)
+        if n < 2:
+            return problem.evaluate_batch(population)
+        if self.shared is None or not self.shared.holds(population):
+            self.buffer(n, population.shape[1]).x[:n] = population
+        if self.chunk_size is None:
+            bounds = np.linspace(0, n, min(n, self.max_workers) + 1).astype(int)
+        else:
+            bounds = np.append(np.arange(0, n, self.chunk_size), n)
+        futures = [self.executor.submit(_evaluate_shared, self.shared.spec, problem, start, stop)
+                   for start, stop in zip(bounds[:-1], bounds[1:])]
+        for future in futures:
+            future.result()
+        return self.shared.f[:n].copy()
+
+    def _release(self):
+        if self.shared is not None:
+            try:
+                self.shared.close()
+            except BufferError:
+                pass
+            self.shared.unlink()
+            self.shared = None
+
+    def __getstate__(self):
+        r"""Get state for pickling without the pool and the shared population.
+
+        Returns:
+            Dict[str, Any]: State of the evaluator.
+
+        """
+        return dict(super().__getstate__(), shared=None)
+
+    def close(self):
+        r"""Shut down the workers of the pool and free the shared population."""
+        super().close()
+        self._release()
+
+
+class AsyncEvaluator(Evaluator):
+    r"""Evaluator that evaluates populations concurrently on an asyncio event loop.
+
+    Solutions are evaluated with :meth:`niapy.problems.Problem.evaluate_async` and gathered
+    with :func:`asyncio.gather`, so problems whose evaluation waits on I/O can have many
+    evaluations in flight. The synchronous methods may be called from any thread other than the one
+    running the event loop; they submit the evaluation to the loop and wait for the result.
+
+    Attributes:
+        loop (Optional[asyncio.AbstractEventLoop]): Event loop used by the synchronous methods.
+        max_concurrency (Optional[int]): Maximum number of evaluations in flight.
+
+    See Also:
+        * :func:`niapy.algorithms.Algorithm.run_async`
+
+    """
+
+    def __init__(self, loop=None, max_concurrency=None):
+        r"""Initialize async evaluator.
+
+        Args:
+            loop (Optional[asyncio.AbstractEventLoop]): Event loop used by the synchronous methods.
+            max_concurrency (Optional[int]): Maximum number of evaluations in flight. Unlimited by default.
+
+        """
+        self.loop = loop
+        self.max_concurrency = max_concurrency
+
+    async def evaluate_async(self, problem, population):
+        r"""Evaluate population of solutions concurrently.
+
+        Args:
+            problem (Problem): Optimization problem.
+            population (numpy.ndarray): Solutions with shape `(n, dimension)`.
+
+        Returns:
+            numpy.ndarray: Function values of solutions with shape `(n,)`.
+
+        """
+        import asyncio
+
+        semaphore = asyncio.Semaphore(self.max_concurrency) if self.max_concurrency else None
+
+        async def evaluate(x):
+            if semaphore is None:
+                return await problem.evaluate_async(x)
+            async with semaphore:
+                return await problem.evaluate_async(x)
+
+        return np.asarray(await asyncio.gather(*(evaluate(x) for x in population)), dtype=float).reshape(len(population))
+
+    def _run(self, coroutine):
+        import asyncio
+
+        try:
+            running = asyncio.get_running_loop()
+        except RuntimeError:
+            running = None
+        if self.loop is None or running is self.loop:
+            coroutine.close()
+            raise RuntimeError('AsyncEvaluator needs an event loop running in another thread.')
+        return asyncio.run_coroutine_threadsafe(coroutine, self.loop).result()
+
+    def evaluate(self, problem, population):
+        r"""Evaluate population of solutions concurrently on the event loop.
+
+        Args:
+            problem (Problem): Optimization problem.
+            population (numpy.ndarray): Solutions with shape `(n, dimension)`.
+
+        Returns:
+            numpy.ndarray: Function values of solutions with shape `(n,)`.
+
+        """
+        return self._run(self.evaluate_async(problem, population))
+
+    def evaluate_single(self, problem, x):
+        r"""Evaluate a single solution on the event loop.
+
+        Args:
+            problem (Problem): Optimization problem.
+            x (numpy.ndarray): Solution.
+
+        Returns:
+            float: Function value of `x`.
+
+        """
+        return self._run(problem.evaluate_async(x))
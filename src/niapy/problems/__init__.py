@@ -1,42 +1,6 @@
 """Module with implementations of optimization problems."""
 
-from niapy.problems.ackley import Ackley
-from niapy.problems.alpine import Alpine1, Alpine2
-from niapy.problems.problem import Problem
-from niapy.problems.bent_cigar import BentCigar
-from niapy.problems.chung_reynolds import ChungReynolds
-from niapy.problems.cosine_mixture import CosineMixture
-from niapy.problems.csendes import Csendes
-from niapy.problems.discus import Discus
-from niapy.problems.dixon_price import DixonPrice
-from niapy.problems.elliptic import Elliptic
-from niapy.problems.griewank import Griewank, ExpandedGriewankPlusRosenbrock
-from niapy.problems.happy_cat import HappyCat
-from niapy.problems.hgbat import HGBat
-from niapy.problems.katsuura import Katsuura
-from niapy.problems.levy import Levy
-from niapy.problems.michalewicz import Michalewicz
-from niapy.problems.perm import Perm
-from niapy.problems.pinter import Pinter
-from niapy.problems.powell import Powell
-from niapy.problems.qing import Qing
-from niapy.problems.quintic import Quintic
-from niapy.problems.rastrigin import Rastrigin
-from niapy.problems.ridge import Ridge
-from niapy.problems.rosenbrock import Rosenbrock
-from niapy.problems.salomon import Salomon
-from niapy.problems.schaffer import SchafferN2, SchafferN4, ExpandedSchaffer
-from niapy.problems.schumer_steiglitz import SchumerSteiglitz
-from niapy.problems.schwefel import Schwefel, Schwefel221, Schwefel222, ModifiedSchwefel
-from niapy.problems.sphere import Sphere, Sphere2, Sphere3
-from niapy.problems.step import Step, Step2, Step3
-from niapy.problems.stepint import Stepint
-from niapy.problems.styblinski_tang import StyblinskiTang
-from niapy.problems.sum_squares import SumSquares
-from niapy.problems.trid import Trid
-from niapy.problems.weierstrass import Weierstrass
-from niapy.problems.whitley import Whitley
-from niapy.problems.zakharov import Zakharov
+from niapy.util.lazy import lazy_exports
 
 __all__ = [
     'Problem',
@@ -88,3 +52,54 @@ __all__ = [
     'SchafferN2',
     'SchafferN4'
 ]
+
+__getattr__, __dir__ = lazy_exports(__name__, {
+    'Ackley': 'ackley',
+    'Alpine1': 'alpine',
+    'Alpine2': 'alpine',
+    'Problem': 'problem',
+    'BentCigar': 'bent_cigar',
+    'ChungReynolds': 'chung_reynolds',
+    'CosineMixture': 'cosine_mixture',
+    'Csendes': 'csendes',
+    'Discus': 'discus',
+    'DixonPrice': 'dixon_price',
+    'Elliptic': 'elliptic',
+    'Griewank': 'griewank',
+    'ExpandedGriewankPlusRosenbrock': 'griewank',
+    'HappyCat': 'happy_cat',
+    'HGBat': 'hgbat',
+    'Katsuura': 'katsuura',
+    'Levy': 'levy',
+    'Michalewicz': 'michalewicz',
+    'Perm': 'perm',
+    'Pinter': 'pinter',
+    'Powell': 'powell',
+    'Qing': 'qing',
+    'Quintic': 'quintic',
+    'Rastrigin': 'rastrigin',
+    'Ridge': 'ridge',
+    'Rosenbrock': 'rosenbrock',
+    'Salomon': 'salomon',
+    'SchafferN2': 'schaffer',
+    'SchafferN4': 'schaffer',
+    'ExpandedSchaffer': 'schaffer',
+    'SchumerSteiglitz': 'schumer_steiglitz',
+    'Schwefel': 'schwefel',
+    'Schwefel221': 'schwefel',
+    'Schwefel222': 'schwefel',
+    'ModifiedSchwefel': 'schwefel',
+    'Sphere': 'sphere',
+    'Sphere2': 'sphere',
+    'Sphere3': 'sphere',
+    'Step': 'step',
+    'Step2': 'step',
+    'Step3': 'step',
+    'Stepint': 'stepint',
+    'StyblinskiTang': 'styblinski_tang',
+    'SumSquares': 'sum_squares',
+    'Trid': 'trid',
+    'Weierstrass': 'weierstrass',
+    'Whitley': 'whitley',
+    'Zakharov': 'zakharov'
+})
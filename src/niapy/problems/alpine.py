@@ -72,6 +72,9 @@ class Alpine1(Problem):
     def _evaluate(self, x):
         return np.sum(np.abs(np.sin(x) + 0.1 * x))
 
+    def _evaluate_batch(self, x):
+        return np.sum(np.abs(np.sin(x) + 0.1 * x), axis=1)
+
 
 class Alpine2(Problem):
     r"""Implementation of Alpine2 function.
@@ -137,3 +140,6 @@ class Alpine2(Problem):
 
     def _evaluate(self, x):
         return np.prod(np.sqrt(x) * np.sin(x))
+
+    def _evaluate_batch(self, x):
+        return np.prod(np.sqrt(x) * np.sin(x), axis=1)
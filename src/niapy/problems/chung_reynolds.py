@@ -71,3 +71,6 @@ class ChungReynolds(Problem):
 
     def _evaluate(self, x):
         return np.sum(x ** 2) ** 2
+
+    def _evaluate_batch(self, x):
+        return np.sum(x ** 2, axis=1) ** 2
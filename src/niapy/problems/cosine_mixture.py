@@ -70,3 +70,6 @@ class CosineMixture(Problem):
 
     def _evaluate(self, x):
         return -0.1 * np.sum(np.cos(5 * np.pi * x)) - np.sum(x ** 2)
+
+    def _evaluate_batch(self, x):
+        return -0.1 * np.sum(np.cos(5 * np.pi * x), axis=1) - np.sum(x ** 2, axis=1)
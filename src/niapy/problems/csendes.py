@@ -73,3 +73,8 @@ class Csendes(Problem):
     def _evaluate(self, x):
         mask = x != 0
         return np.sum(np.power(x[mask], 6.0) * (2.0 + np.sin(1.0 / x[mask])))
+
+    def _evaluate_batch(self, x):
+        mask = x != 0
+        xm = np.where(mask, x, 1.0)
+        return np.sum(np.where(mask, np.power(xm, 6.0) * (2.0 + np.sin(1.0 / xm)), 0.0), axis=1)
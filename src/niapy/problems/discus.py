@@ -70,3 +70,6 @@ class Discus(Problem):
 
     def _evaluate(self, x):
         return x[0] * 1000000 + np.sum(np.square(x[1:]))
+
+    def _evaluate_batch(self, x):
+        return x[:, 0] * 1000000 + np.sum(np.square(x[:, 1:]), axis=1)
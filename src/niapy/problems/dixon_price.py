@@ -72,3 +72,8 @@ class DixonPrice(Problem):
         indices = np.arange(2, self.dimension)
         val = np.sum(indices * (2 * x[2:] ** 2 - x[1:self.dimension - 1]) ** 2)
         return (x[0] - 1) ** 2 + val
+
+    def _evaluate_batch(self, x):
+        indices = np.arange(2, self.dimension)
+        val = np.sum(indices * (2 * x[:, 2:] ** 2 - x[:, 1:self.dimension - 1]) ** 2, axis=1)
+        return (x[:, 0] - 1) ** 2 + val
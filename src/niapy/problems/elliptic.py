@@ -71,3 +71,7 @@ class Elliptic(Problem):
     def _evaluate(self, x):
         indices = np.arange(self.dimension)
         return np.sum(1000000.0 ** (indices / (self.dimension - 1)) * x ** 2)
+
+    def _evaluate_batch(self, x):
+        indices = np.arange(self.dimension)
+        return np.sum(1000000.0 ** (indices / (self.dimension - 1)) * x ** 2, axis=1)
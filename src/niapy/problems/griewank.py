@@ -77,6 +77,12 @@ class Griewank(Problem):
         val2 = np.prod(np.cos(x / np.sqrt(i)))
         return val1 - val2 + 1.0
 
+    def _evaluate_batch(self, x):
+        val1 = np.sum(x * x / 4000.0, axis=1)
+        i = np.arange(1, self.dimension + 1)
+        val2 = np.prod(np.cos(x / np.sqrt(i)), axis=1)
+        return val1 - val2 + 1.0
+
 
 class ExpandedGriewankPlusRosenbrock(Problem):
     r"""Implementation of Expanded Griewank's plus Rosenbrock function.
@@ -141,3 +147,8 @@ class ExpandedGriewankPlusRosenbrock(Problem):
         x1 = 100.0 * (x[1:] - x[:-1] ** 2.0) ** 2.0 + (1 - x[:-1]) ** 2.0
         x2 = x1 * x1 / 4000.0 - np.cos(x1 / np.sqrt(np.arange(1, self.dimension)))
         return np.sum(x2)
+
+    def _evaluate_batch(self, x):
+        x1 = 100.0 * (x[:, 1:] - x[:, :-1] ** 2.0) ** 2.0 + (1 - x[:, :-1]) ** 2.0
+        x2 = x1 * x1 / 4000.0 - np.cos(x1 / np.sqrt(np.arange(1, self.dimension)))
+        return np.sum(x2, axis=1)
@@ -71,3 +71,8 @@ class HGBat(Problem):
         val1 = np.sum(x ** 2)
         val2 = np.sum(x)
         return np.sqrt(np.abs(val1 * val1 - val2 ** 2)) + (0.5 * val1 + val2) / self.dimension + 0.5
+
+    def _evaluate_batch(self, x):
+        val1 = np.sum(x ** 2, axis=1)
+        val2 = np.sum(x, axis=1)
+        return np.sqrt(np.abs(val1 * val1 - val2 ** 2)) + (0.5 * val1 + val2) / self.dimension + 0.5
@@ -71,3 +71,9 @@ class Katsuura(Problem):
         i = np.arange(1, self.dimension + 1)
         inner = np.round(2 ** k * x) * (2.0 ** (-k))
         return np.prod(np.sum(inner, axis=0) * i + 1)
+
+    def _evaluate_batch(self, x):
+        k = np.arange(1, 33)[:, np.newaxis, np.newaxis]
+        i = np.arange(1, self.dimension + 1)
+        inner = np.round(2 ** k * x) * (2.0 ** (-k))
+        return np.prod(np.sum(inner, axis=0) * i + 1, axis=1)
@@ -74,3 +74,6 @@ class Michalewicz(Problem):
 
     def _evaluate(self, x):
         return -np.sum(np.sin(x) * np.sin((np.arange(1, self.dimension + 1) * x ** 2.0) / np.pi) ** (2.0 * self.m))
+
+    def _evaluate_batch(self, x):
+        return -np.sum(np.sin(x) * np.sin((np.arange(1, self.dimension + 1) * x ** 2.0) / np.pi) ** (2.0 * self.m), axis=1)
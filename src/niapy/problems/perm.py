@@ -75,3 +75,8 @@ class Perm(Problem):
         x_matrix = np.tile(x, (self.dimension, 1))
         inner = np.sum((jj + self.beta) * (np.power(x_matrix, ii) - np.power(1.0 / jj, ii)), axis=0)
         return np.sum(inner ** 2)
+
+    def _evaluate_batch(self, x):
+        ii = np.arange(1, self.dimension + 1)
+        inner = self.dimension * (ii + self.beta) * (np.power(x, ii) - np.power(1.0 / ii, ii))
+        return np.sum(inner ** 2, axis=1)
@@ -97,3 +97,17 @@ class Pinter(Problem):
         val3 = np.sum(indices * np.log10(1.0 + indices * np.power(b, 2.0)))
 
         return val1 + val2 + val3
+
+    def _evaluate_batch(self, x):
+        sub = np.roll(x, 1, axis=1)
+        add = np.roll(x, -1, axis=1)
+        indices = np.arange(1, self.dimension + 1)
+
+        a = (sub * np.sin(x) + np.sin(add))
+        b = ((sub * sub) - 2.0 * x + 3.0 * add - np.cos(x) + 1.0)
+
+        val1 = np.sum(indices * x * x, axis=1)
+        val2 = np.sum(20.0 * indices * np.power(np.sin(a), 2.0), axis=1)
+        val3 = np.sum(indices * np.log10(1.0 + indices * np.power(b, 2.0)), axis=1)
+
+        return val1 + val2 + val3
@@ -79,3 +79,15 @@ class Powell(Problem):
         term3 = (x2 - 2 * x3) ** 4.0
         term4 = 10 * (x1 - x4) ** 4.0
         return np.sum(term1 + term2 + term3 + term4)
+
+    def _evaluate_batch(self, x):
+        x1 = x[:, 0::4]
+        x2 = x[:, 1::4]
+        x3 = x[:, 2::4]
+        x4 = x[:, 3::4]
+
+        term1 = (x1 + 10 * x2) ** 2.0
+        term2 = 5 * (x3 - x4) ** 2.0
+        term3 = (x2 - 2 * x3) ** 4.0
+        term4 = 10 * (x1 - x4) ** 4.0
+        return np.sum(term1 + term2 + term3 + term4, axis=1)
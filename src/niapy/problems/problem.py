@@ -4,6 +4,9 @@
 
 from abc import ABC, abstractmethod
 import logging
+
+import numpy as np
+
 from niapy.util.array import full_array
 
 logging.basicConfig()
@@ -56,6 +59,53 @@ class Problem(ABC):
 
         return self._evaluate(x)
 
+    def _evaluate_batch(self, x):
+        """Evaluate population of solutions.
+
+        Problems that can be expressed with array operations along `axis=1` should override this method.
+        By default, solutions are evaluated one by one with :meth:`Problem._evaluate`.
+
+        """
+        return np.asarray([self._evaluate(xi) for xi in x], dtype=float)
+
+    def evaluate_batch(self, x):
+        """Evaluate population of solutions.
+
+        Args:
+            x (numpy.ndarray): Solutions with shape `(n, dimension)`.
+
+        Returns:
+            numpy.ndarray: Function values of solutions with shape `(n,)`.
+
+        """
+        if x.ndim != 2 or x.shape[1] != self.dimension:
+            raise ValueError('Dimensions do not match. {} != {}'.format(x.shape[-1], self.dimension))
+
+        return self._evaluate_batch(x)
+
+    async def _evaluate_async(self, x):
+        """Evaluate solution asynchronously.
+
+        Problems whose evaluation waits on I/O should override this method. By default, :meth:`Problem._evaluate` is called.
+
+        """
+        return self._evaluate(x)
+
+    async def evaluate_async(self, x):
+        """Evaluate solution asynchronously.
+
+        Args:
+            x (numpy.ndarray): Solution.
+
+        Returns:
+            float: Function value of `x`.
+
+        """
+        if x.shape[0] != self.dimension:
+            raise ValueError('Dimensions do not match. {} != {}'.format(x.shape[0], self.dimension))
+
+        return await self._evaluate_async(x)
+
     def __call__(self, x):
         r"""Evaluate solution.
 
@@ -73,3 +73,6 @@ class Qing(Problem):
 
     def _evaluate(self, x):
         return np.sum(np.power(x ** 2.0 - np.arange(1, self.dimension + 1), 2.0))
+
+    def _evaluate_batch(self, x):
+        return np.sum(np.power(x ** 2.0 - np.arange(1, self.dimension + 1), 2.0), axis=1)
@@ -76,3 +76,6 @@ class Quintic(Problem):
 
     def _evaluate(self, x):
         return np.sum(np.abs(x ** 5 - 3.0 * x ** 4 + 4.0 * x ** 3 + 2.0 * x ** 2 - 10.0 * x - 4.0))
+
+    def _evaluate_batch(self, x):
+        return np.sum(np.abs(x ** 5 - 3.0 * x ** 4 + 4.0 * x ** 3 + 2.0 * x ** 2 - 10.0 * x - 4.0), axis=1)
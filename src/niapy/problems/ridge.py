@@ -70,3 +70,7 @@ class Ridge(Problem):
     def _evaluate(self, x):
         inner = np.array([np.sum(x[:i]) for i in range(1, self.dimension + 1)])
         return np.sum(inner ** 2)
+
+    def _evaluate_batch(self, x):
+        inner = np.cumsum(x, axis=1)
+        return np.sum(inner ** 2, axis=1)
@@ -73,3 +73,6 @@ class Rosenbrock(Problem):
 
     def _evaluate(self, x):
         return np.sum(100.0 * (x[1:] - x[:-1] ** 2.0) ** 2.0 + (1 - x[:-1]) ** 2.0, axis=0)
+
+    def _evaluate_batch(self, x):
+        return np.sum(100.0 * (x[:, 1:] - x[:, :-1] ** 2.0) ** 2.0 + (1 - x[:, :-1]) ** 2.0, axis=1)
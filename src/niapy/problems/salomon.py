@@ -77,3 +77,7 @@ class Salomon(Problem):
     def _evaluate(self, x):
         val = np.sqrt(np.sum(x ** 2.0))
         return 1.0 - np.cos(2.0 * np.pi * val) + 0.1 * val
+
+    def _evaluate_batch(self, x):
+        val = np.sqrt(np.sum(x ** 2.0, axis=1))
+        return 1.0 - np.cos(2.0 * np.pi * val) + 0.1 * val
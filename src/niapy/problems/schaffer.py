@@ -69,6 +69,10 @@ class SchafferN2(Problem):
     def _evaluate(self, x):
         return 0.5 + (np.sin(x[0] ** 2 - x[1] ** 2) ** 2 - 0.5) / (1 + 0.001 * (x[0] ** 2 + x[1] ** 2)) ** 2
 
+    def _evaluate_batch(self, x):
+        x0, x1 = x[:, 0], x[:, 1]
+        return 0.5 + (np.sin(x0 ** 2 - x1 ** 2) ** 2 - 0.5) / (1 + 0.001 * (x0 ** 2 + x1 ** 2)) ** 2
+
 
 class SchafferN4(Problem):
     r"""Implementations of Schaffer N. 2 functions.
@@ -131,6 +135,10 @@ class SchafferN4(Problem):
     def _evaluate(self, x):
         return 0.5 + (np.cos(np.sin(x[0] ** 2 - x[1] ** 2)) ** 2 - 0.5) / (1 + 0.001 * (x[0] ** 2 + x[1] ** 2)) ** 2
 
+    def _evaluate_batch(self, x):
+        x0, x1 = x[:, 0], x[:, 1]
+        return 0.5 + (np.cos(np.sin(x0 ** 2 - x1 ** 2)) ** 2 - 0.5) / (1 + 0.001 * (x0 ** 2 + x1 ** 2)) ** 2
+
 
 class ExpandedSchaffer(Problem):
     r"""Implementations of Expanded Schaffer functions.
@@ -200,3 +208,9 @@ class ExpandedSchaffer(Problem):
         tmp = x ** 2 + x_next ** 2
         val = 0.5 + (np.sin(np.sqrt(tmp)) ** 2 - 0.5) / (1 + 0.001 * tmp) ** 2
         return np.sum(val)
+
+    def _evaluate_batch(self, x):
+        x_next = np.roll(x, -1, axis=1)
+        tmp = x ** 2 + x_next ** 2
+        val = 0.5 + (np.sin(np.sqrt(tmp)) ** 2 - 0.5) / (1 + 0.001 * tmp) ** 2
+        return np.sum(val, axis=1)
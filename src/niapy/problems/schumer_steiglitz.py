@@ -71,3 +71,6 @@ class SchumerSteiglitz(Problem):
 
     def _evaluate(self, x):
         return np.sum(x ** 4)
+
+    def _evaluate_batch(self, x):
+        return np.sum(x ** 4, axis=1)
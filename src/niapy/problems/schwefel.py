@@ -70,6 +70,9 @@ class Schwefel(Problem):
     def _evaluate(self, x):
         return 418.982887272433799807913601398 * self.dimension - np.sum(x * np.sin(np.sqrt(np.abs(x))))
 
+    def _evaluate_batch(self, x):
+        return 418.982887272433799807913601398 * self.dimension - np.sum(x * np.sin(np.sqrt(np.abs(x))), axis=1)
+
 
 class Schwefel221(Problem):
     r"""Schwefel 2.21 function implementation.
@@ -135,6 +138,9 @@ class Schwefel221(Problem):
     def _evaluate(self, x):
         return np.amax(np.abs(x))
 
+    def _evaluate_batch(self, x):
+        return np.amax(np.abs(x), axis=1)
+
 
 class Schwefel222(Problem):
     r"""Schwefel 2.22 function implementation.
@@ -200,6 +206,9 @@ class Schwefel222(Problem):
     def _evaluate(self, x):
         return np.sum(np.abs(x)) + np.prod(np.abs(x))
 
+    def _evaluate_batch(self, x):
+        return np.sum(np.abs(x), axis=1) + np.prod(np.abs(x), axis=1)
+
 
 class ModifiedSchwefel(Problem):
     r"""Implementations of Modified Schwefel functions.
@@ -269,3 +278,13 @@ class ModifiedSchwefel(Problem):
         default = xx * np.sin(np.sqrt(np.abs(xx)))
         val = np.sum(np.select(conditions, choices, default=default))
         return 418.9829 * self.dimension - val
+
+    def _evaluate_batch(self, x):
+        xx = x + 420.9687462275036
+        conditions = [x > 500.0, x < -500.0]
+        xx_mod = np.fmod(xx, 500.0)
+        choices = [(500.0 - xx_mod) * np.sin(np.sqrt(np.abs(500.0 - xx_mod))) - (xx - 500.0) ** 2 / (10000 * self.dimension),
+                   (xx_mod - 500.0) * np.sin(np.sqrt(np.abs(xx_mod - 500.0))) + (xx - 500.0) ** 2 / (10000 * self.dimension)]
+        default = xx * np.sin(np.sqrt(np.abs(xx)))
+        val = np.sum(np.select(conditions, choices, default=default), axis=1)
+        return 418.9829 * self.dimension - val
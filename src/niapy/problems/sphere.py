@@ -72,6 +72,9 @@ class Sphere(Problem):
     def _evaluate(self, x):
         return np.sum(x ** 2)
 
+    def _evaluate_batch(self, x):
+        return np.sum(x ** 2, axis=1)
+
 
 class Sphere2(Problem):
     r"""Implementation of Sphere with different powers function.
@@ -135,6 +138,10 @@ class Sphere2(Problem):
         indices = np.arange(2, self.dimension + 2)
         return np.sum(np.power(np.abs(x), indices))
 
+    def _evaluate_batch(self, x):
+        indices = np.arange(2, self.dimension + 2)
+        return np.sum(np.power(np.abs(x), indices), axis=1)
+
 
 class Sphere3(Problem):
     r"""Implementation of rotated hyper-ellipsoid function.
@@ -198,3 +205,7 @@ class Sphere3(Problem):
         x_matrix = np.tile(x, (self.dimension, 1))
         val = np.sum(np.tril(x_matrix) ** 2.0, axis=0)
         return np.sum(val)
+
+    def _evaluate_batch(self, x):
+        counts = np.arange(self.dimension, 0, -1)
+        return np.sum(counts * x ** 2.0, axis=1)
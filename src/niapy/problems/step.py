@@ -75,6 +75,9 @@ class Step(Problem):
     def _evaluate(self, x):
         return np.sum(np.floor(np.abs(x)))
 
+    def _evaluate_batch(self, x):
+        return np.sum(np.floor(np.abs(x)), axis=1)
+
 
 class Step2(Problem):
     r"""Step2 function implementation.
@@ -141,6 +144,9 @@ class Step2(Problem):
     def _evaluate(self, x):
         return np.sum(np.floor(x + 0.5) ** 2)
 
+    def _evaluate_batch(self, x):
+        return np.sum(np.floor(x + 0.5) ** 2, axis=1)
+
 
 class Step3(Problem):
     r"""Step3 function implementation.
@@ -206,3 +212,6 @@ class Step3(Problem):
 
     def _evaluate(self, x):
         return np.sum(np.floor(x ** 2))
+
+    def _evaluate_batch(self, x):
+        return np.sum(np.floor(x ** 2), axis=1)
@@ -71,3 +71,6 @@ class Stepint(Problem):
 
     def _evaluate(self, x):
         return 25.0 + np.sum(np.floor(x))
+
+    def _evaluate_batch(self, x):
+        return 25.0 + np.sum(np.floor(x), axis=1)
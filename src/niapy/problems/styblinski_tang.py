@@ -75,3 +75,6 @@ class StyblinskiTang(Problem):
 
     def _evaluate(self, x):
         return 0.5 * np.sum(x ** 4 - 16.0 * x ** 2 + 5.0 * x)
+
+    def _evaluate_batch(self, x):
+        return 0.5 * np.sum(x ** 4 - 16.0 * x ** 2 + 5.0 * x, axis=1)
@@ -70,3 +70,6 @@ class SumSquares(Problem):
 
     def _evaluate(self, x):
         return np.sum(np.arange(1, self.dimension + 1) * x ** 2)
+
+    def _evaluate_batch(self, x):
+        return np.sum(np.arange(1, self.dimension + 1) * x ** 2, axis=1)
@@ -72,3 +72,8 @@ class Trid(Problem):
         sum1 = np.sum((x - 1) ** 2)
         sum2 = np.sum(x[1:] * x[:-1])
         return sum1 - sum2
+
+    def _evaluate_batch(self, x):
+        sum1 = np.sum((x - 1) ** 2, axis=1)
+        sum2 = np.sum(x[:, 1:] * x[:, :-1], axis=1)
+        return sum1 - sum2
@@ -79,3 +79,10 @@ class Weierstrass(Problem):
         t2 = self.dimension * np.sum(self.a ** k.T * np.cos(np.pi * self.b ** k.T))
 
         return np.sum(np.sum(t1, axis=0)) - t2
+
+    def _evaluate_batch(self, x):
+        k = np.arange(self.k_max + 1)
+        t1 = self.a ** k[:, np.newaxis, np.newaxis] * np.cos(2 * np.pi * self.b ** k[:, np.newaxis, np.newaxis] * (x + 0.5))
+        t2 = self.dimension * np.sum(self.a ** k * np.cos(np.pi * self.b ** k))
+
+        return np.sum(t1, axis=(0, 2)) - t2
@@ -83,3 +83,9 @@ class Whitley(Problem):
         xj = np.tile(x, (self.dimension, 1))
         tmp = 100.0 * (xi ** 2 - xj) ** 2 + (1 - xj) ** 2
         return np.sum((tmp ** 2) / 4000.0 - np.cos(tmp) + 1.0)
+
+    def _evaluate_batch(self, x):
+        xi = x[:, :, np.newaxis]
+        xj = x[:, np.newaxis, :]
+        tmp = 100.0 * (xi ** 2 - xj) ** 2 + (1 - xj) ** 2
+        return np.sum((tmp ** 2) / 4000.0 - np.cos(tmp) + 1.0, axis=(1, 2))
@@ -71,3 +71,8 @@ class Zakharov(Problem):
         sum1 = np.sum(x * x)
         sum2 = np.sum(0.5 * np.arange(1, self.dimension + 1) * x)
         return sum1 + sum2 ** 2 + sum2 ** 4
+
+    def _evaluate_batch(self, x):
+        sum1 = np.sum(x * x, axis=1)
+        sum2 = np.sum(0.5 * np.arange(1, self.dimension + 1) * x, axis=1)
+        return sum1 + sum2 ** 2 + sum2 ** 4
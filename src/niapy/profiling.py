@@ -0,0 +1,98 @@
+# encoding=utf8
+
+"""Implementation of timing counters for profiling optimization runs."""
+
+import time
+from contextlib import contextmanager
+
+__all__ = ['Profiler']
+
+
+class Profiler:
+    r"""Cumulative wall time and call counts of the phases of optimization runs.
+
+    A profiler is shared by a :class:`niapy.task.Task`, which times evaluations of the problem and repairs of solutions,
+    and a :class:`niapy.callbacks.ProfilingCallback`, which times population initialization and algorithm iterations.
+    Time spent in iterations and initialization that is not spent evaluating or repairing is algorithm overhead,
+    e.g. selection, sorting and bookkeeping.
+
+    Attributes:
+        timings (Dict[str, List[float]]): Total seconds and number of calls of each phase.
+
+    """
+
+    PHASES = ('init_population', 'run_iteration', 'evaluate', 'repair')
+
+    def __init__(self):
+        r"""Initialize profiler."""
+        self.timings = {}
+
+    def add(self, phase, seconds, calls=1):
+        r"""Add time spent in phase.
+
+        Args:
+            phase (str): Name of phase.
+            seconds (float): Wall time in seconds.
+            calls (Optional[int]): Number of calls.
+
+        """
+        timing = self.timings.setdefault(phase, [0.0, 0])
+        timing[0] += seconds
+        timing[1] += calls
+
+    @contextmanager
+    def measure(self, phase, calls=1):
+        r"""Measure time spent in a block of code.
+
+        Args:
+            phase (str): Name of phase.
+            calls (Optional[int]): Number of calls the block counts as.
+
+        """
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add(phase, time.perf_counter() - start, calls)
+
+    def merge(self, other):
+        r"""Add timings of another profiler.
+
+        Args:
+            other (Union[Profiler, Dict[str, List[float]]]): Profiler or its timings.
+
+        """
+        for phase, (seconds, calls) in getattr(other, 'timings', other).items():
+            self.add(phase, seconds, calls)
+
+    def reset(self):
+        r"""Remove all timings."""
+        self.timings = {}
+
+    def breakdown(self):
+        r"""Get time spent in each phase and algorithm overhead.
+
+        Returns:
+            Dict[str, Dict[str, float]]: Total seconds, number of calls and share of total time of each phase.
+                The total is the time spent in initialization and iterations.
+
+        """
+        seconds = {phase: timing[0] for phase, timing in self.timings.items()}
+        total = seconds.get('init_population', 0.0) + seconds.get('run_iteration', 0.0)
+        overhead = total - seconds.get('evaluate', 0.0) - seconds.get('repair', 0.0)
+        result = {phase: {'seconds': s, 'calls': self.timings[phase][1], 'share': s / total if total else 0.0} for phase, s in seconds.items()}
+        if total:
+            result['overhead'] = {'seconds': overhead, 'calls': 0, 'share': overhead / total}
+        return result
+
+    def report(self):
+        r"""Format time breakdown as a table.
+
+        Returns:
+            str: One line per phase with total seconds, number of calls and share of total time.
+
+        """
+        lines = ['%-16s %12s %10s %7s' % ('phase', 'seconds', 'calls', 'share')]
+        for phase, row in self.breakdown().items():
+            lines.append('%-16s %12.6f %10d %6.1f%%' % (phase, row['seconds'], row['calls'], 100 * row['share']))
+        return '\n'.join(lines)
@@ -2,13 +2,20 @@
 
 """Implementation of Runner utility class."""
 
+import copy
 import datetime
 import logging
 import os
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from itertools import product
 
-import pandas as pd
+import numpy as np
+from numpy.random import default_rng
 
 from niapy.algorithms.algorithm import Algorithm
+from niapy.callbacks import ProfilingCallback
+from niapy.profiling import Profiler
 from niapy.task import Task
 from niapy.util.factory import get_algorithm
 
@@ -19,6 +26,48 @@ logger.setLevel('INFO')
 __all__ = ["Runner"]
 
 
+def _run_cell(algorithm, task, seed, profile=False):
+    r"""Run an algorithm once on a task with its own random generator.
+
+    Args:
+        algorithm (Union[str, Algorithm]): Algorithm name or instance. Instances are copied, so runs do not share state.
+        task (Task): Optimization task.
+        seed (int): Seed of the run.
+        profile (Optional[bool]): Time the phases of the run.
+
+    Returns:
+        Tuple[numpy.ndarray, float, int, int, float, Optional[Dict[str, List[float]]]]:
+            1. Best individuals components found in optimization process.
+            2. Best fitness value found in optimization process.
+            3. Number of function evaluations.
+            4. Number of iterations.
+            5. Wall time of the run in seconds.
+            6. Timings of the phases of the run if profiling.
+
+    Raises:
+        BaseException: The exception that stopped the algorithm, also when the run is executed in a worker process.
+
+    """
+    if isinstance(algorithm, Algorithm):
+        algorithm = copy.deepcopy(algorithm)
+        algorithm.rng = default_rng(seed)
+        algorithm.exception = None
+    else:
+        algorithm = get_algorithm(algorithm, seed=seed)
+    profiler = None
+    if profile:
+        profiler = task.profiler = Profiler()
+        callback = ProfilingCallback(profiler)
+        callback.set_algorithm(algorithm)
+        algorithm.callbacks.append(callback)
+    start = time.perf_counter()
+    best_x, best_fitness = algorithm.run(task)
+    if algorithm.bad_run():
+        raise algorithm.exception
+    timings = profiler.timings if profiler is not None else None
+    return best_x, best_fitness, task.evals, task.iters, time.perf_counter() - start, timings
+
+
 class Runner:
     r"""Runner utility feature.
 
@@ -31,11 +80,17 @@ class Runner:
         runs (int): Number of repetitions
         algorithms (Union[List[str], List[Algorithm]]): List of algorithms to run
         problems (List[Union[str, Problem]]): List of problems to run
+        evaluator (Optional[Evaluator]): Evaluator shared by the tasks of all runs
+        n_jobs (Optional[int]): Number of worker processes
+        seed (Optional[int]): Master seed the seeds of all runs are derived from
+        sink (Optional[ResultSink]): Sink the result of each run is appended to as soon as it finishes
+        profile (bool): Time the phases of each run
+        profiler (Profiler): Timings of the phases of all runs of the last call of :func:`Runner.run`, if profiling
 
     """
 
     def __init__(self, dimension=10, max_evals=1000000, runs=1, algorithms='ArtificialBeeColonyAlgorithm',
-                 problems='Ackley'):
+                 problems='Ackley', evaluator=None, n_jobs=1, seed=None, sink=None, profile=False):
         r"""Initialize Runner.
 
         Args:
@@ -44,6 +99,19 @@ class Runner:
             runs (int): Number of repetitions
             algorithms (List[Algorithm]): List of algorithms to run
             problems (List[Union[str, Problem]]): List of problems to run
+            evaluator (Optional[Evaluator]): Evaluator shared by the tasks of all runs, e.g. a
+                :class:`niapy.evaluators.ProcessPoolEvaluator`. The runner does not close it.
+            n_jobs (Optional[int]): Number of worker processes each run is scheduled on. Runs are executed in
+                the current process if `1` and on all CPUs if `None` or `-1`. With more than one job, algorithms,
+                problems and the evaluator must be picklable.
+            seed (Optional[int]): Master seed. Each run gets its own seed spawned from it, so results do not
+                depend on `n_jobs` or on the order in which runs finish.
+            sink (Optional[ResultSink]): Sink the result of each run is appended to as soon as it finishes, e.g. a
+                :class:`niapy.sinks.JSONLinesSink`. Runs that are already in the sink with the same seed, dimension and
+                maximum number of evaluations are not run again, so an interrupted sweep can be resumed by running it
+                again with the same sink.
+            profile (Optional[bool]): Time problem evaluations, repairs, population initialization and iterations
+                of each run and add them up in :attr:`profiler`.
 
         """
         self.dimension = dimension
@@ -51,6 +119,12 @@ class Runner:
         self.runs = runs
         self.algorithms = algorithms
         self.problems = problems
+        self.evaluator = evaluator
+        self.n_jobs = n_jobs
+        self.seed = seed
+        self.sink = sink
+        self.profile = profile
+        self.profiler = Profiler()
         self.results = {}
 
     def task_factory(self, name):
@@ -63,7 +137,7 @@ class Runner:
             Task: Optimization task to use.
 
         """
-        return Task(max_evals=self.max_evals, dimension=self.dimension, problem=name)
+        return Task(max_evals=self.max_evals, dimension=self.dimension, problem=name, evaluator=self.evaluator)
 
     @classmethod
     def __create_export_dir(cls):
@@ -75,66 +149,131 @@ class Runner:
         Runner.__create_export_dir()
         return "export/" + str(datetime.datetime.now()).replace(":", ".") + "." + extension
 
+    def __dataframe(self):
+        import pandas as pd
+
+        return pd.DataFrame.from_dict(self.results)
+
     def __export_to_dataframe_pickle(self):
-        dataframe = pd.DataFrame.from_dict(self.results)
+        dataframe = self.__dataframe()
         dataframe.to_pickle(self.__generate_export_name("pkl"))
         logger.info("Export to Pandas DataFrame pickle (pkl) completed!")
 
     def __export_to_json(self):
-        dataframe = pd.DataFrame.from_dict(self.results)
+        dataframe = self.__dataframe()
         dataframe.to_json(self.__generate_export_name("json"))
         logger.info("Export to JSON file completed!")
 
     def __export_to_xlsx(self):
-        dataframe = pd.DataFrame.from_dict(self.results)
+        dataframe = self.__dataframe()
         dataframe.to_excel(self.__generate_export_name("xlsx"))
         logger.info("Export to XLSX file completed!")
 
-    def run(self, export="dataframe", verbose=False):
+    @staticmethod
+    def __name(item):
+        return item if isinstance(item, str) else str(type(item).__name__)
+
+    def __cells(self):
+        r"""Get all runs with their seeds.
+
+        The seed of a run only depends on the master seed and the indices of the run, so adding runs to a sweep
+        keeps the seeds of the existing ones.
+
+        Returns:
+            List[Tuple[int, int, int, int]]: Algorithm index, problem index, run index and seed of each run.
+
+        """
+        entropy = np.random.SeedSequence(self.seed).entropy
+        cells = product(range(len(self.algorithms)), range(len(self.problems)), range(self.runs))
+        return [(a, p, r, int(np.random.SeedSequence(entropy, spawn_key=(a, p, r)).generate_state(1, np.uint64)[0])) for a, p, r in cells]
+
+    def __execute(self, cells, pending, report):
+        r"""Execute runs, in the current process or on a process pool.
+
+        Args:
+            cells (List[Tuple[int, int, int, int]]): All runs.
+            pending (List[int]): Indices of runs to execute.
+            report (Callable[[int, Tuple[numpy.ndarray, float, int, int, float, Optional[Dict[str, List[float]]]]], None]): Called with the index and
+                result of each finished run.
+
+        """
+        if self.n_jobs == 1:
+            for i in pending:
+                a, p, _, seed = cells[i]
+                report(i, _run_cell(self.algorithms[a], self.task_factory(self.problems[p]), seed, self.profile))
+            return
+        executor = ProcessPoolExecutor(max_workers=None if self.n_jobs == -1 else self.n_jobs)
+        try:
+            futures = {}
+            for i in pending:
+                a, p, _, seed = cells[i]
+                futures[executor.submit(_run_cell, self.algorithms[a], self.task_factory(self.problems[p]), seed, self.profile)] = i
+            for future in as_completed(futures):
+                report(futures[future], future.result())
+        finally:
+            executor.shutdown(cancel_futures=True)
+
+    def run(self, export="dataframe", verbose=False, progress=None):
         """Execute runner.
 
         Args:
-            export (str): Takes export type (e.g. dataframe, json, excel) (default: "dataframe")
+            export (Optional[str]): Takes export type (e.g. dataframe, json, excel), `None` for no export (default: "dataframe")
             verbose (bool): Switch for verbose logging (default: {False})
+            progress (Optional[Callable[[int, int], None]]): Called with the number of finished and all runs each time a run finishes
 
         Returns:
             dict: Returns dictionary of results
 
         Raises:
             TypeError: Raises TypeError if export type is not supported
+            BaseException: Exception that stopped a run, also when runs are executed on worker processes. Failed runs
+                are not written to the sink, so they are run again when the sweep is resumed.
 
         """
-        for alg in self.algorithms:
-            if not isinstance(alg, "".__class__):
-                alg_name = str(type(alg).__name__)
-            else:
-                alg_name = alg
-
-            self.results[alg_name] = {}
-
-            if verbose:
-                logger.info("Running %s...", alg_name)
-
-            for problem in self.problems:
-                if not isinstance(problem, "".__class__):
-                    problem_name = str(type(problem).__name__)
-                else:
-                    problem_name = problem
-
-                if verbose:
-                    logger.info("Running %s algorithm on %s problem...", alg_name, problem_name)
-
-                self.results[alg_name][problem_name] = []
-                for _ in range(self.runs):
-                    if isinstance(alg, Algorithm):
-                        algorithm = alg
-                    else:
-                        algorithm = get_algorithm(alg)
-                    task = self.task_factory(problem)
-                    self.results[alg_name][problem_name].append(algorithm.run(task))
+        alg_names = [self.__name(alg) for alg in self.algorithms]
+        problem_names = [self.__name(problem) for problem in self.problems]
+        cells = self.__cells()
+        results = [None] * len(cells)
+        if self.sink is not None:
+            stored = {(row['algorithm'], row['problem'], row['run'], row.get('seed'), row.get('dimension'), row.get('max_evals')):
+                      (row['best_x'], row['best_fitness']) for row in self.sink.read() if row['best_fitness'] is not None}
+            for i, (a, p, r, seed) in enumerate(cells):
+                results[i] = stored.get((alg_names[a], problem_names[p], r, seed, self.dimension, self.max_evals))
+        pending = [i for i, result in enumerate(results) if result is None]
+        finished = 0
+        self.profiler.reset()
+
+        def report(i, result):
+            nonlocal finished
+            finished += 1
+            a, p, r, seed = cells[i]
+            best_x, best_fitness, evals, iters, elapsed, timings = result
+            results[i] = best_x, best_fitness
+            if timings is not None:
+                self.profiler.merge(timings)
+            if self.sink is not None:
+                self.sink.write({'algorithm': alg_names[a], 'problem': problem_names[p], 'run': r, 'seed': seed,
+                                 'dimension': self.dimension, 'max_evals': self.max_evals, 'best_fitness': best_fitness, 'evals': evals, 'iters': iters, 'time': elapsed,
+                                 'best_x': best_x})
             if verbose:
-                logger.info("---------------------------------------------------")
-        if export == "dataframe":
+                logger.info("Finished %s algorithm on %s problem (%d/%d)", alg_names[a], problem_names[p], finished, len(pending))
+            if progress is not None:
+                progress(finished, len(pending))
+
+        if verbose:
+            logger.info("Running %d of %d runs with n_jobs=%s...", len(pending), len(cells), self.n_jobs)
+        self.__execute(cells, pending, report)
+        for alg_name in alg_names:
+            self.results[alg_name] = {problem_name: [] for problem_name in problem_names}
+        for (a, p, _, _), result in zip(cells, results):
+            self.results[alg_names[a]][problem_names[p]].append(result)
+        if verbose and self.profile:
+            logger.info("Time breakdown of all runs:\n%s", self.profiler.report())
+        if verbose:
+            logger.info("---------------------------------------------------")
+        if export is None:
+            pass
+        elif export == "dataframe":
             self.__export_to_dataframe_pickle()
         elif export == "json":
             self.__export_to_json()
@@ -0,0 +1,134 @@
+# encoding=utf8
+
+"""Implementation of populations stored in shared memory."""
+
+from multiprocessing import shared_memory
+
+import numpy as np
+
+__all__ = ['SharedPopulation']
+
+
+class SharedPopulation:
+    r"""Solutions and function values stored in one block of shared memory.
+
+    The block holds a `(size,)` array of function values followed by a `(size, dimension)` array of solutions.
+    Other processes attach to the block by name with :meth:`attach`, so they can read solutions and write
+    function values in place, without pickling the population. The process that created the block must
+    :meth:`unlink` it when it is no longer needed.
+
+    Attributes:
+        size (int): Number of solutions the block holds.
+        dimension (int): Dimension of solutions.
+        x (numpy.ndarray): Solutions with shape `(size, dimension)`, a view of shared memory.
+        f (numpy.ndarray[float]): Function values with shape `(size,)`, a view of shared memory.
+
+    See Also:
+        * :class:`niapy.evaluators.SharedMemoryEvaluator`
+
+    """
+
+    def __init__(self, size, dimension, name=None):
+        r"""Create a new block of shared memory or attach to an existing one.
+
+        Args:
+            size (int): Number of solutions.
+            dimension (int): Dimension of solutions.
+            name (Optional[str]): Name of an existing block to attach to. A new block is created by default.
+
+        """
+        self.size = size
+        self.dimension = dimension
+        nbytes = max(size * (dimension + 1) * np.dtype(float).itemsize, 1)
+        if name is None:
+            self._shm = shared_memory.SharedMemory(create=True, size=nbytes)
+        else:
+            self._shm = shared_memory.SharedMemory(name=name)
+        self.f = np.ndarray((size,), dtype=float, buffer=self._shm.buf)
+        self.x = np.ndarray((size, dimension), dtype=float, buffer=self._shm.buf, offset=self.f.nbytes)
+
+    @property
+    def name(self):
+        r"""Get name of the block of shared memory.
+
+        Returns:
+            str: Name of the block.
+
+        """
+        return self._shm.name
+
+    @property
+    def spec(self):
+        r"""Get the handle other processes attach with.
+
+        Returns:
+            Tuple[str, int, int]: Name of the block, number of solutions and dimension.
+
+        """
+        return self.name, self.size, self.dimension
+
+    @classmethod
+    def attach(cls, spec):
+        r"""Attach to a block of shared memory created by another process.
+
+        Args:
+            spec (Tuple[str, int, int]): Handle returned by :attr:`spec`.
+
+        Returns:
+            SharedPopulation: Population stored in the block.
+
+        """
+        name, size, dimension = spec
+        return cls(size, dimension, name=name)
+
+    def population(self, n=None, **columns):
+        r"""Get the solutions as a population.
+
+        Args:
+            n (Optional[int]): Number of leading solutions. All solutions by default.
+            **columns (Dict[str, Union[float, numpy.ndarray]]): Per-individual parameters of the population.
+
+        Returns:
+            Population: Population whose solutions and function values are views of shared memory.
+
+        """
+        from niapy.algorithms.algorithm import Population
+
+        n = self.size if n is None else n
+        return Population(self.x[:n], self.f[:n], **columns)
+
+    def holds(self, population):
+        r"""Check if population is the leading rows of the shared solutions.
+
+        Args:
+            population (numpy.ndarray): Solutions.
+
+        Returns:
+            bool: `True` if population is stored in shared memory and needs no copying.
+
+        """
+        return (population.ndim == 2 and population.shape[1] == self.dimension and len(population) <= self.size
+                and population.flags.c_contiguous and population.dtype == self.x.dtype
+                and population.ctypes.data == self.x.ctypes.data)
+
+    def close(self):
+        r"""Detach from the block of shared memory.
+
+        Views of the block, e.g. populations returned by :meth:`population`, must be released first.
+
+        """
+        self.f = self.x = None
+        self._shm.close()
+
+    def unlink(self):
+        r"""Free the block of shared memory. Only called by the process that created it."""
+        self._shm.unlink()
+
+    def __enter__(self):
+        r"""Enter the runtime context of the population."""
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        r"""Detach from and free the block of shared memory."""
+        self.close()
+        self.unlink()
@@ -0,0 +1,197 @@
+# encoding=utf8
+
+"""Implementation of sinks that store results of runs as they finish."""
+
+from abc import ABC, abstractmethod
+import csv
+import json
+import os
+
+import numpy as np
+
+__all__ = ['ResultSink', 'JSONLinesSink', 'CSVSink']
+
+
+class ResultSink(ABC):
+    r"""Base class for sinks that append the result of each finished run to a file.
+
+    Each run is one row, so the results of finished runs are kept even if a sweep crashes.
+    A row has the fields in :attr:`fields`.
+    The file is opened for each row, so rows are on disk as soon as a run finishes.
+
+    Attributes:
+        path (str): Path of the results file.
+        fields (Tuple[str, ...]): Fields of a row.
+
+    See Also:
+        * :class:`niapy.runner.Runner`
+
+    """
+
+    fields = ('algorithm', 'problem', 'run', 'seed', 'dimension', 'max_evals', 'best_fitness', 'evals', 'iters', 'time', 'best_x')
+
+    def __init__(self, path):
+        r"""Initialize sink.
+
+        Args:
+            path (str): Path of the results file. Rows are appended if the file exists.
+
+        """
+        self.path = path
+
+    @abstractmethod
+    def write(self, row):
+        r"""Append row to the results file.
+
+        Args:
+            row (Dict[str, Any]): Result of a run.
+
+        """
+        pass
+
+    @abstractmethod
+    def read(self):
+        r"""Read all rows from the results file.
+
+        Returns:
+            List[Dict[str, Any]]: Results of runs, `best_x` as an array.
+
+        """
+        pass
+
+    def completed(self):
+        r"""Get runs that are already in the results file.
+
+        Returns:
+            Set[Tuple[str, str, int]]: Algorithm name, problem name and run index of each stored run.
+                Rows of failed runs, without a best fitness, are not counted.
+
+        """
+        return {(row['algorithm'], row['problem'], row['run']) for row in self.read() if row['best_fitness'] is not None}
+
+    def _exists(self):
+        return os.path.exists(self.path) and os.path.getsize(self.path) > 0
+
+    def _truncate_partial_line(self):
+        r"""Remove a line that was only partially written when the process died.
+
+        Without this, the next row would be glued onto the partial line and lost when reading.
+
+        """
+        if not self._exists():
+            return
+        with open(self.path, 'rb+') as file:
+            end = file.seek(0, os.SEEK_END)
+            position = end
+            while position > 0:
+                start = max(position - 4096, 0)
+                file.seek(start)
+                newline = file.read(position - start).rfind(b'\n')
+                if newline != -1:
+                    position = start + newline + 1
+                    break
+                position = start
+            if position != end:
+                file.truncate(position)
+
+
+class JSONLinesSink(ResultSink):
+    r"""Sink that stores each run as a JSON object on its own line.
+
+    A line that was only partially written when the process died is ignored when reading and removed before
+    the next row is appended.
+
+    See Also:
+        * :class:`niapy.sinks.ResultSink`
+
+    """
+
+    def write(self, row):
+        r"""Append row to the results file.
+
+        Args:
+            row (Dict[str, Any]): Result of a run.
+
+        """
+        row = dict(row, best_x=None if row['best_x'] is None else np.asarray(row['best_x']).tolist())
+        self._truncate_partial_line()
+        with open(self.path, 'a') as file:
+            file.write(json.dumps(row) + '\n')
+
+    def read(self):
+        r"""Read all rows from the results file.
+
+        Returns:
+            List[Dict[str, Any]]: Results of runs, `best_x` as an array.
+
+        """
+        if not self._exists():
+            return []
+        rows = []
+        with open(self.path) as file:
+            for line in file:
+                try:
+                    row = json.loads(line)
+                except json.JSONDecodeError:
+                    continue
+                row['best_x'] = None if row['best_x'] is None else np.asarray(row['best_x'])
+                rows.append(row)
+        return rows
+
+
+class CSVSink(ResultSink):
+    r"""Sink that stores each run as a row of a CSV file with a header.
+
+    The components of `best_x` are stored as a JSON list in one column. A row that was only partially
+    written when the process died is ignored when reading and removed before the next row is appended.
+
+    See Also:
+        * :class:`niapy.sinks.ResultSink`
+
+    """
+
+    def write(self, row):
+        r"""Append row to the results file.
+
+        Args:
+            row (Dict[str, Any]): Result of a run.
+
+        """
+        self._truncate_partial_line()
+        header = not self._exists()
+        row = dict(row, best_x='' if row['best_x'] is None else json.dumps(np.asarray(row['best_x']).tolist()))
+        with open(self.path, 'a', newline='') as file:
+            writer = csv.DictWriter(file, self.fields)
+            if header:
+                writer.writeheader()
+            writer.writerow(row)
+
+    def read(self):
+        r"""Read all rows from the results file.
+
+        Returns:
+            List[Dict[str, Any]]: Results of runs, `best_x` as an array.
+
+        """
+        if not self._exists():
+            return []
+        rows = []
+        with open(self.path, newline='') as file:
+            for row in csv.DictReader(file):
+                try:
+                    rows.append({
+                        'algorithm': row['algorithm'],
+                        'problem': row['problem'],
+                        'run': int(row['run']),
+                        'seed': int(row['seed']),
+                        'dimension': int(row['dimension']),
+                        'max_evals': float(row['max_evals']),
+                        'best_fitness': float(row['best_fitness']) if row['best_fitness'] else None,
+                        'evals': int(row['evals']),
+                        'iters': int(row['iters']),
+                        'time': float(row['time']),
+                        'best_x': np.asarray(json.loads(row['best_x'])) if row['best_x'] else None
+                    })
+                except (TypeError, ValueError):
+                    continue
+        return rows
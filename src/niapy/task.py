@@ -6,10 +6,10 @@ import logging
 from enum import Enum
 
 import numpy as np
-from matplotlib import pyplot as plt
-import matplotlib.ticker as ticker
+from niapy.evaluators import Evaluator, AsyncEvaluator
 from niapy.problems import Problem
-from niapy.util.repair import limit
+from niapy.util.array import GrowableArray
+from niapy.util.repair import limit, limit_inverse, wang, rand, reflect
 from niapy.util.factory import get_problem
 
 logging.basicConfig()
@@ -17,6 +17,9 @@ logger = logging.getLogger("niapy.task.Task")
 logger.setLevel("INFO")
 
 
+_BATCH_REPAIRS = (limit, limit_inverse, wang, rand, reflect)
+
+
 class OptimizationType(Enum):
     r"""Enum representing type of optimization.
 
@@ -52,12 +55,20 @@ class Task:
         max_evals (int): Maximum number of function evaluations.
         cutoff_value (float): Reference function/fitness values to reach in optimization.
         x_f (float): Best found individual function/fitness value.
+        evaluator (Evaluator): Backend used for evaluating populations.
+        cache (Optional[EvaluationCache]): Cache of function values of already evaluated solutions.
+        record_evals (Optional[numpy.ndarray[int]]): Numbers of function evaluations at which the best function value is recorded.
+        profiler (Optional[Profiler]): Timing counters of evaluations and repairs.
+        n_evals (numpy.ndarray[int]): Numbers of function evaluations at which the convergence history was recorded.
+        fitness_evals (numpy.ndarray[float]): Best function values at `n_evals` evaluations.
+        fitness_iters (numpy.ndarray[float]): Best function values at each iteration.
 
     """
 
     def __init__(self, problem=None, dimension=None, lower=None, upper=None,
                  optimization_type=OptimizationType.MINIMIZATION, repair_function=limit, max_evals=np.inf,
-                 max_iters=np.inf, cutoff_value=None, enable_logging=False):
+                 max_iters=np.inf, cutoff_value=None, enable_logging=False, evaluator=None, cache=None,
+                 record_evals=None, profiler=None):
         r"""Initialize task class for optimization.
 
         Args:
@@ -67,10 +78,20 @@ class Task:
             upper (Optional[Union[float, Iterable[float]]]): Upper bounds of the problem. Will be ignored if problem is instance of the `Problem` class.
             optimization_type (Optional[OptimizationType]): Set the type of optimization. Default is minimization.
             repair_function (Optional[Callable[[numpy.ndarray, numpy.ndarray, numpy.ndarray, Dict[str, Any]], numpy.ndarray]]): Function for repairing individuals components to desired limits.
+                It is called with single solutions and with populations of one solution per row, and should repair them in place.
             max_evals (Optional[int]): Number of function evaluations.
             max_iters (Optional[int]): Number of generations or iterations.
             cutoff_value (Optional[float]): Reference value of function/fitness function.
             enable_logging (Optional[bool]): Enable/disable logging of improvements.
+            evaluator (Optional[Evaluator]): Backend used for evaluating populations. Default is serial evaluation.
+                The task does not close the evaluator, so one evaluator can be shared by many tasks.
+            cache (Optional[EvaluationCache]): Cache of function values. Solutions found in the cache are not passed
+                to the problem again. Whether cache hits count as function evaluations is set by the cache. No caching by default.
+            record_evals (Optional[Iterable[int]]): Numbers of function evaluations at which the best function value is recorded,
+                e.g. ``np.array([0.01, 0.1, 0.2, 0.5, 1.0]) * max_evals`` as in the CEC competitions. Keeps the convergence
+                history small for long runs. By default, every improvement of the best function value is recorded.
+            profiler (Optional[Profiler]): Timing counters that wall time and number of calls of problem evaluations
+                and repairs are added to. No profiling by default.
 
         """
         if isinstance(problem, str):
@@ -90,6 +111,10 @@ class Task:
         self.upper = self.problem.upper
         self.range = self.upper - self.lower
         self.repair_function = repair_function
+        self._repair_scratch = {}
+        self.evaluator = evaluator if evaluator is not None else Evaluator()
+        self.cache = cache
+        self.profiler = profiler
 
         self.iters = 0
         self.evals = 0
@@ -99,9 +124,41 @@ class Task:
         self.x_f = np.inf * optimization_type.value
         self.max_evals = max_evals
         self.max_iters = max_iters
-        self.n_evals = []
-        self.fitness_evals = []  # fitness improvements at self.n_evals evaluations
-        self.fitness_iters = []  # best fitness at each iteration
+        self.record_evals = None if record_evals is None else np.unique(np.ceil(np.asarray(record_evals, dtype=float)).astype(np.int64))
+        self._n_evals = GrowableArray(dtype=np.int64)
+        self._fitness_evals = GrowableArray()  # fitness improvements at self.n_evals evaluations
+        self._fitness_iters = GrowableArray()  # best fitness at each iteration
+        self._next_record = self._record_at(0)
+
+    @property
+    def n_evals(self):
+        r"""Get numbers of function evaluations at which the convergence history was recorded.
+
+        Returns:
+            numpy.ndarray[int]: Numbers of function evaluations.
+
+        """
+        return self._n_evals.values
+
+    @property
+    def fitness_evals(self):
+        r"""Get best function values at `n_evals` evaluations.
+
+        Returns:
+            numpy.ndarray[float]: Best function values.
+
+        """
+        return self._fitness_evals.values
+
+    @property
+    def fitness_iters(self):
+        r"""Get best function values at each iteration.
+
+        Returns:
+            numpy.ndarray[float]: Best function values.
+
+        """
+        return self._fitness_iters.values
 
     def repair(self, x, rng=None):
         r"""Repair solution and put the solution in the random position inside of the bounds of problem.
@@ -121,13 +178,134 @@ class Task:
             * :func:`niapy.util.repair.reflect`
 
         """
-        return self.repair_function(x, self.lower, self.upper, rng=rng)
+        if self.profiler is None:
+            return self.repair_function(x, self.lower, self.upper, rng=rng)
+        with self.profiler.measure('repair'):
+            return self.repair_function(x, self.lower, self.upper, rng=rng)
+
+    def repair_batch(self, population, rng=None, out=None):
+        r"""Repair all solutions of a population at once.
+
+        The built-in repair functions are applied to the whole `(n, dimension)` array with the bounds broadcast
+        over rows, reusing preallocated scratch arrays between calls. Any other repair function is called once per
+        solution, like in :func:`Task.repair`. Pass ``out=population`` to repair in place.
+
+        Args:
+            population (numpy.ndarray): Solutions to repair with shape `(n, dimension)`.
+            rng (Optional[numpy.random.Generator]): Random number generator.
+            out (Optional[numpy.ndarray]): Array to store repaired solutions in. A new array by default.
+
+        Returns:
+            numpy.ndarray: Repaired solutions.
+
+        See Also:
+            * :func:`niapy.task.Task.repair`
+
+        """
+        population = np.asarray(population, dtype=float)
+        if out is None:
+            out = population.copy()
+        elif out is not population:
+            np.copyto(out, population)
+        if self.profiler is None:
+            self._repair_rows(out, rng)
+        else:
+            with self.profiler.measure('repair', len(out)):
+                self._repair_rows(out, rng)
+        return out
+
+    def _repair_rows(self, population, rng):
+        r"""Repair solutions in place with the repair function.
+
+        Args:
+            population (numpy.ndarray): Solutions to repair with shape `(n, dimension)`.
+            rng (Optional[numpy.random.Generator]): Random number generator.
+
+        """
+        if self.repair_function in _BATCH_REPAIRS:
+            repaired = self.repair_function(population, self.lower, self.upper, rng=rng, scratch=self._repair_scratch)
+            if repaired is not population:
+                population[...] = repaired
+            return
+        for i in range(len(population)):
+            population[i] = self.repair_function(population[i], self.lower, self.upper, rng=rng)
 
     def next_iter(self):
         r"""Increments the number of algorithm iterations."""
-        self.fitness_iters.append(self.x_f)
+        self._fitness_iters.append(self.x_f)
         self.iters += 1
 
+    def _record_at(self, i):
+        r"""Get number of function evaluations of a recording point.
+
+        Args:
+            i (int): Index of recording point.
+
+        Returns:
+            float: Number of function evaluations, `numpy.inf` if all points are recorded or every improvement is recorded.
+
+        """
+        return self.record_evals[i] if self.record_evals is not None and i < len(self.record_evals) else np.inf
+
+    def _record(self, previous, evals, x_f):
+        r"""Add improvements of the best function value to the convergence history.
+
+        Args:
+            previous (float): Best function value before the improvements.
+            evals (numpy.ndarray[int]): Numbers of function evaluations at which improvements were found.
+            x_f (numpy.ndarray[float]): Improved function values.
+
+        """
+        if self.record_evals is None:
+            self._n_evals.extend(evals)
+            self._fitness_evals.extend(x_f)
+            return
+        if self.evals < self._next_record:
+            return
+        points = self.record_evals[len(self._n_evals):np.searchsorted(self.record_evals, self.evals, side='right')]
+        found = np.searchsorted(evals, points, side='right') - 1
+        values = np.full(len(points), previous)
+        values[found >= 0] = np.asarray(x_f)[found[found >= 0]]
+        self._n_evals.extend(points)
+        self._fitness_evals.extend(values)
+        self._next_record = self._record_at(len(self._n_evals))
+
+    def get_state(self):
+        r"""Get counters and convergence history of the task.
+
+        The problem, evaluator and cache are not part of the state.
+
+        Returns:
+            Dict[str, Any]: State of the task.
+
+        See Also:
+            * :func:`niapy.task.Task.set_state`
+
+        """
+        return {
+            'iters': self.iters,
+            'evals': self.evals,
+            'x_f': self.x_f,
+            'n_evals': np.array(self.n_evals),
+            'fitness_evals': np.array(self.fitness_evals),
+            'fitness_iters': np.array(self.fitness_iters)
+        }
+
+    def set_state(self, state):
+        r"""Restore counters and convergence history of the task.
+
+        Args:
+            state (Dict[str, Any]): State returned by :func:`niapy.task.Task.get_state`.
+
+        """
+        self.iters = state['iters']
+        self.evals = state['evals']
+        self.x_f = state['x_f']
+        self._n_evals = GrowableArray(state['n_evals'], dtype=np.int64)
+        self._fitness_evals = GrowableArray(state['fitness_evals'])
+        self._fitness_iters = GrowableArray(state['fitness_iters'])
+        self._next_record = self._record_at(len(self._n_evals))
+
     def eval(self, x):
         r"""Evaluate the solution A.
 
@@ -141,17 +319,260 @@ class Task:
         if self.stopping_condition():
             return np.inf
 
-        self.evals += 1
-        x_f = self.problem.evaluate(x) * self.optimization_type.value
-
-        if x_f < self.x_f * self.optimization_type.value:
+        if self.cache is None:
+            self.evals += 1
+            x_f = self._evaluate_single(x)
+        else:
+            key = self.cache.key(x)
+            x_f = self.cache.get(key)
+            if x_f is None:
+                x_f = self._evaluate_single(x)
+                self.cache.put(key, x_f)
+                self.evals += 1
+            elif self.cache.count_hits:
+                self.evals += 1
+        x_f = x_f * self.optimization_type.value
+
+        previous = self.x_f * self.optimization_type.value
+        if x_f < previous:
             self.x_f = x_f * self.optimization_type.value
-            self.n_evals.append(self.evals)
-            self.fitness_evals.append(x_f)
+            self._record(previous, (self.evals,), (x_f,))
             if self.enable_logging:
                 logger.info('evals:%d => %s' % (self.evals, self.x_f))
+        elif self.evals >= self._next_record:
+            self._record(previous, (), ())
         return x_f
 
+    def add_evals(self, evals, x_f=np.inf):
+        r"""Count function evaluations made on other tasks, e.g. by sub-populations in other processes.
+
+        Args:
+            evals (int): Number of function evaluations.
+            x_f (Optional[float]): Best function value found by those evaluations.
+
+        """
+        if evals <= 0 or self.stopping_condition():
+            return
+        self.evals += int(evals)
+        x_f = x_f * self.optimization_type.value
+        previous = self.x_f * self.optimization_type.value
+        if x_f < previous:
+            self.x_f = x_f * self.optimization_type.value
+            self._record(previous, (self.evals,), (x_f,))
+            if self.enable_logging:
+                logger.info('evals:%d => %s' % (self.evals, self.x_f))
+        elif self.evals >= self._next_record:
+            self._record(previous, (), ())
+
+    def eval_batch(self, population):
+        r"""Evaluate a population of solutions.
+
+        Produces the same fitness values, evaluation counters and convergence data as calling
+        :meth:`Task.eval` on each row in turn. Solutions past the remaining evaluation budget,
+        or past the point where the cutoff value is reached, are not counted and get fitness ``np.inf``.
+
+        Args:
+            population (numpy.ndarray): Solutions to evaluate with shape `(n, dimension)`.
+
+        Returns:
+            numpy.ndarray: Fitness/function values of solutions with shape `(n,)`.
+
+        See Also:
+            * :func:`niapy.task.Task.eval`
+            * :class:`niapy.evaluators.Evaluator`
+
+        """
+        population = np.asarray(population)
+        if self.cache is not None:
+            x_f, counted, pending = self._cache_lookup(population)
+            if pending:
+                rows = [rows[0] for rows in pending.values()]
+                self._cache_fill(x_f, pending, self._evaluate(population[rows]))
+            return self._update_batch(x_f, len(population), counted)
+        n = self._batch_budget(population)
+        x_f = self._evaluate(population[:n]) if n else np.empty(0)
+        return self._update_batch(x_f, len(population))
+
+    async def eval_batch_async(self, population, max_concurrency=None):
+        r"""Evaluate a population of solutions concurrently with :meth:`niapy.problems.Problem.evaluate_async`.
+
+        Bookkeeping is the same as in :meth:`Task.eval_batch`.
+
+        Args:
+            population (numpy.ndarray): Solutions to evaluate with shape `(n, dimension)`.
+            max_concurrency (Optional[int]): Maximum number of evaluations in flight. Unlimited by default.
+
+        Returns:
+            numpy.ndarray: Fitness/function values of solutions with shape `(n,)`.
+
+        See Also:
+            * :func:`niapy.task.Task.eval_batch`
+            * :class:`niapy.evaluators.AsyncEvaluator`
+
+        """
+        population = np.asarray(population)
+        evaluator = AsyncEvaluator(max_concurrency=max_concurrency)
+        if self.cache is not None:
+            x_f, counted, pending = self._cache_lookup(population)
+            if pending:
+                rows = [rows[0] for rows in pending.values()]
+                self._cache_fill(x_f, pending, await self._evaluate_async(evaluator, population[rows]))
+            return self._update_batch(x_f, len(population), counted)
+        n = self._batch_budget(population)
+        x_f = await self._evaluate_async(evaluator, population[:n]) if n else np.empty(0)
+        return self._update_batch(x_f, len(population))
+
+    def _evaluate_single(self, x):
+        r"""Evaluate solution with the evaluator, timing it if profiling.
+
+        Args:
+            x (numpy.ndarray): Solution.
+
+        Returns:
+            float: Function value of solution.
+
+        """
+        if self.profiler is None:
+            return self.evaluator.evaluate_single(self.problem, x)
+        with self.profiler.measure('evaluate'):
+            return self.evaluator.evaluate_single(self.problem, x)
+
+    def _evaluate(self, population):
+        r"""Evaluate solutions with the evaluator, timing them if profiling.
+
+        Args:
+            population (numpy.ndarray): Solutions.
+
+        Returns:
+            numpy.ndarray: Function values of solutions.
+
+        """
+        if self.profiler is None:
+            return self.evaluator.evaluate(self.problem, population)
+        with self.profiler.measure('evaluate', len(population)):
+            return self.evaluator.evaluate(self.problem, population)
+
+    async def _evaluate_async(self, evaluator, population):
+        r"""Evaluate solutions concurrently, timing them if profiling.
+
+        Args:
+            evaluator (AsyncEvaluator): Evaluator.
+            population (numpy.ndarray): Solutions.
+
+        Returns:
+            numpy.ndarray: Function values of solutions.
+
+        """
+        if self.profiler is None:
+            return await evaluator.evaluate_async(self.problem, population)
+        with self.profiler.measure('evaluate', len(population)):
+            return await evaluator.evaluate_async(self.problem, population)
+
+    def _batch_budget(self, population):
+        r"""Get the number of solutions from population that can still be evaluated.
+
+        Args:
+            population (numpy.ndarray): Solutions to evaluate.
+
+        Returns:
+            int: Number of leading solutions to evaluate.
+
+        """
+        if len(population) == 0 or self.stopping_condition():
+            return 0
+        return int(min(len(population), self.max_evals - self.evals))
+
+    def _cache_lookup(self, population):
+        r"""Look up the leading solutions of population that can still be evaluated in the evaluation cache.
+
+        Solutions are taken in order until the evaluation budget runs out. A solution that appears
+        again later in the population is a cache hit. If hits are free, cached solutions are taken even after the budget runs out.
+
+        Args:
+            population (numpy.ndarray): Solutions to evaluate.
+
+        Returns:
+            Tuple[numpy.ndarray, numpy.ndarray[bool], Dict[bytes, List[int]]]:
+                1. Function values of leading solutions, `nan` where not cached.
+                2. Whether each leading solution counts as a function evaluation.
+                3. Rows of uncached solutions grouped by cache key.
+
+        """
+        x_f, counted, pending = [], [], {}
+        if len(population) == 0 or self.stopping_condition():
+            return np.empty(0), np.empty(0, dtype=bool), pending
+        remaining = self.max_evals - self.evals
+        for x in population:
+            if self.cache.count_hits and len(x_f) >= remaining:
+                break
+            key = self.cache.key(x)
+            if len(pending) >= remaining and key not in pending and key not in self.cache:
+                break
+            if key in pending:
+                self.cache.hits += 1
+                pending[key].append(len(x_f))
+                value = None
+            else:
+                value = self.cache.get(key)
+                if value is None:
+                    pending[key] = [len(x_f)]
+            x_f.append(np.nan if value is None else value)
+            counted.append(self.cache.count_hits or (value is None and len(pending[key]) == 1))
+        return np.asarray(x_f, dtype=float), np.asarray(counted, dtype=bool), pending
+
+    def _cache_fill(self, x_f, pending, values):
+        r"""Store function values of uncached solutions in the evaluation cache.
+
+        Args:
+            x_f (numpy.ndarray): Function values of leading solutions to fill in.
+            pending (Dict[bytes, List[int]]): Rows of uncached solutions grouped by cache key.
+            values (numpy.ndarray): Function values of the first row of each key.
+
+        """
+        for (key, rows), value in zip(pending.items(), values):
+            self.cache.put(key, value)
+            x_f[rows] = value
+
+    def _update_batch(self, x_f, size, counted=None):
+        r"""Update counters and convergence data with function values of evaluated solutions.
+
+        Args:
+            x_f (numpy.ndarray): Function values of the evaluated leading solutions.
+            size (int): Number of solutions in the population.
+            counted (Optional[numpy.ndarray[bool]]): Whether each leading solution counts as a function evaluation.
+                All solutions count by default.
+
+        Returns:
+            numpy.ndarray: Fitness/function values of the population with shape `(size,)`.
+
+        """
+        fitness = np.full(size, np.inf)
+        if len(x_f) == 0:
+            return fitness
+
+        x_f = np.asarray(x_f, dtype=float) * self.optimization_type.value
+        n = len(x_f)
+        steps = np.arange(1, n + 1) if counted is None else np.cumsum(counted)
+        best = np.fmin.accumulate(np.concatenate(([self.x_f * self.optimization_type.value], x_f)))
+        reached = np.flatnonzero(best[1:] <= self.cutoff_value * self.optimization_type.value)
+        if reached.size:
+            n = reached[0] + 1
+            x_f = x_f[:n]
+            best = best[:n + 1]
+
+        improved = np.flatnonzero(x_f < best[:-1])
+        evals = self.evals + steps[improved]
+        self.evals += int(steps[n - 1])
+        fitness[:n] = x_f
+        if improved.size or self.evals >= self._next_record:
+            self._record(best[0], evals, x_f[improved])
+        if improved.size:
+            self.x_f = x_f[improved[-1]] * self.optimization_type.value
+            if self.enable_logging:
+                for e, f in zip(evals, x_f[improved]):
+                    logger.info('evals:%d => %s' % (e, f * self.optimization_type.value))
+        return fitness
+
     def is_feasible(self, x):
         r"""Check if the solution is feasible.
 
@@ -198,20 +619,12 @@ class Task:
         """
         if x_axis == 'iters':
             return np.arange(self.iters), np.array(self.fitness_iters)
-        else:  # x_axis == 'evals'
-            r1, r2 = [], []
-            for i, v in enumerate(self.n_evals):
-                r1.append(v)
-                r2.append(self.fitness_evals[i])
-                if i >= len(self.n_evals) - 1:
-                    break
-                diff = self.n_evals[i + 1] - v
-                if diff <= 1:
-                    continue
-                for j in range(diff - 1):
-                    r1.append(v + j + 1)
-                    r2.append(self.fitness_evals[i])
-            return np.array(r1), np.array(r2)
+        # x_axis == 'evals'
+        n_evals, fitness_evals = self.n_evals, self.fitness_evals
+        if self.record_evals is not None or len(n_evals) == 0:
+            return np.array(n_evals), np.array(fitness_evals)
+        evals = np.arange(n_evals[0], n_evals[-1] + 1)
+        return evals, fitness_evals[np.searchsorted(n_evals, evals, side='right') - 1]
 
     def plot_convergence(self, x_axis='iters', title='Convergence Graph'):
         """Plot a simple convergence graph.
@@ -221,6 +634,9 @@ class Task:
             title (str): Title of the graph.
 
         """
+        import matplotlib.ticker as ticker
+        from matplotlib import pyplot as plt
+
         x, fitness = self.convergence_data(x_axis)
         _, ax = plt.subplots()
         ax.plot(x, fitness)
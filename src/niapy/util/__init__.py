@@ -1,10 +1,6 @@
 """Module with implementation of utility classes and functions."""
 
-from niapy.util.argparser import get_argparser, get_args, get_args_dict
-from niapy.util.array import full_array, objects_to_array
-from niapy.util.distances import euclidean
-from niapy.util.random import levy_flight
-from niapy.util.repair import limit, limit_inverse, wang, rand, reflect
+from niapy.util.lazy import lazy_exports
 
 __all__ = [
     'get_argparser',
@@ -12,11 +8,44 @@ __all__ = [
     'get_args_dict',
     'full_array',
     'objects_to_array',
+    'GrowableArray',
     'levy_flight',
     'euclidean',
+    'pairwise_distances',
+    'condensed_distances',
+    'radius_neighbors',
+    'DistanceCache',
+    'NeighborIndex',
+    'BruteForceIndex',
+    'KDTree',
+    'GridIndex',
     'limit',
     'limit_inverse',
     'wang',
     'rand',
     'reflect'
 ]
+
+__getattr__, __dir__ = lazy_exports(__name__, {
+    'get_argparser': 'argparser',
+    'get_args': 'argparser',
+    'get_args_dict': 'argparser',
+    'full_array': 'array',
+    'objects_to_array': 'array',
+    'GrowableArray': 'array',
+    'euclidean': 'distances',
+    'pairwise_distances': 'distances',
+    'condensed_distances': 'distances',
+    'radius_neighbors': 'distances',
+    'DistanceCache': 'distances',
+    'levy_flight': 'random',
+    'NeighborIndex': 'spatial',
+    'BruteForceIndex': 'spatial',
+    'KDTree': 'spatial',
+    'GridIndex': 'spatial',
+    'limit': 'repair',
+    'limit_inverse': 'repair',
+    'wang': 'repair',
+    'rand': 'repair',
+    'reflect': 'repair'
+})
@@ -1,6 +1,6 @@
 import numpy as np
 
-__all__ = ['full_array', 'objects_to_array']
+__all__ = ['full_array', 'objects_to_array', 'GrowableArray']
 
 
 def full_array(a, dimension):
@@ -42,3 +42,84 @@ def objects_to_array(objs):
     for i, e in enumerate(objs):
         a[i] = e
     return a
+
+
+class GrowableArray:
+    r"""One dimensional array with amortized constant time appends.
+
+    Values are stored in a NumPy array whose capacity doubles when it is full,
+    so appending `n` values copies at most `2n` values in total.
+
+    Attributes:
+        dtype (numpy.dtype): Type of values.
+
+    """
+
+    def __init__(self, values=(), dtype=float, capacity=16):
+        r"""Initialize array.
+
+        Args:
+            values (Optional[Iterable[Any]]): Initial values.
+            dtype (Optional[numpy.dtype]): Type of values.
+            capacity (Optional[int]): Initial capacity.
+
+        """
+        self.dtype = np.dtype(dtype)
+        self._data = np.empty(capacity, dtype=self.dtype)
+        self._size = 0
+        self.extend(values)
+
+    def _reserve(self, size):
+        if size > len(self._data):
+            data = np.empty(max(size, 2 * len(self._data)), dtype=self.dtype)
+            data[:self._size] = self._data[:self._size]
+            self._data = data
+
+    def append(self, value):
+        r"""Append value.
+
+        Args:
+            value (Any): Value to append.
+
+        """
+        self._reserve(self._size + 1)
+        self._data[self._size] = value
+        self._size += 1
+
+    def extend(self, values):
+        r"""Append values.
+
+        Args:
+            values (Iterable[Any]): Values to append.
+
+        """
+        values = np.asarray(values, dtype=self.dtype).ravel()
+        self._reserve(self._size + len(values))
+        self._data[self._size:self._size + len(values)] = values
+        self._size += len(values)
+
+    @property
+    def values(self):
+        r"""Get read-only view of stored values.
+
+        Values are only ever appended, so the view stays valid after further appends.
+
+        Returns:
+            numpy.ndarray: Stored values.
+
+        """
+        view = self._data[:self._size]
+        view.flags.writeable = False
+        return view
+
+    def __len__(self):
+        r"""Get number of stored values.
+
+        Returns:
+            int: Number of stored values.
+
+        """
+        return self._size
+
+    def __array__(self, dtype=None, copy=None):
+        return np.array(self.values, dtype=dtype, copy=True) if copy else np.asarray(self.values, dtype=dtype)
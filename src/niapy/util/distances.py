@@ -1,6 +1,9 @@
 import numpy as np
 
-__all__ = ['euclidean']
+__all__ = ['euclidean', 'pairwise_distance_blocks', 'pairwise_distances', 'condensed_distances', 'radius_neighbors',
+           'DistanceCache']
+
+_BLOCK_ELEMENTS = 2 ** 20
 
 
 def euclidean(u, v):
@@ -15,3 +18,158 @@ def euclidean(u, v):
 
     """
     return np.sqrt(np.sum(np.square(u - v), axis=-1))
+
+
+def pairwise_distance_blocks(x, y=None, squared=False, block_size=None):
+    r"""Compute euclidean distances between rows of two arrays block by block.
+
+    Distances are computed with the Gram matrix trick :math:`\lVert x - y \rVert^2 = \lVert x \rVert^2 + \lVert y \rVert^2 - 2 x \cdot y`,
+    so each block costs one matrix product. Only one block of rows of `x` is held in memory at once.
+
+    Args:
+        x (numpy.ndarray): Points with shape `(n, dimension)`.
+        y (Optional[numpy.ndarray]): Points with shape `(m, dimension)`. Defaults to `x`.
+        squared (Optional[bool]): Return squared distances.
+        block_size (Optional[int]): Number of rows of `x` in a block. By default, blocks have about a million elements.
+
+    Yields:
+        Tuple[slice, numpy.ndarray]:
+            1. Rows of `x` in the block.
+            2. Distances between those rows and all rows of `y` with shape `(block, m)`.
+
+    """
+    x = np.asarray(x, dtype=float)
+    symmetric = y is None
+    y = x if symmetric else np.asarray(y, dtype=float)
+    x_norms = np.einsum('ij,ij->i', x, x)
+    y_norms = x_norms if symmetric else np.einsum('ij,ij->i', y, y)
+    if block_size is None:
+        block_size = max(1, _BLOCK_ELEMENTS // max(len(y), 1))
+    for start in range(0, len(x), block_size):
+        rows = slice(start, min(start + block_size, len(x)))
+        block = x_norms[rows, np.newaxis] + y_norms[np.newaxis, :] - 2 * (x[rows] @ y.T)
+        np.maximum(block, 0, out=block)
+        if symmetric:
+            block[np.arange(rows.stop - rows.start), np.arange(rows.start, rows.stop)] = 0
+        yield rows, block if squared else np.sqrt(block, out=block)
+
+
+def pairwise_distances(x, y=None, squared=False, block_size=None):
+    r"""Compute the matrix of euclidean distances between rows of two arrays.
+
+    Args:
+        x (numpy.ndarray): Points with shape `(n, dimension)`.
+        y (Optional[numpy.ndarray]): Points with shape `(m, dimension)`. Defaults to `x`.
+        squared (Optional[bool]): Return squared distances.
+        block_size (Optional[int]): Number of rows of `x` computed at once.
+
+    Returns:
+        numpy.ndarray: Distances with shape `(n, m)`.
+
+    See Also:
+        * :func:`niapy.util.distances.pairwise_distance_blocks`
+
+    """
+    x = np.asarray(x, dtype=float)
+    distances = np.empty((len(x), len(x) if y is None else len(y)))
+    for rows, block in pairwise_distance_blocks(x, y, squared, block_size):
+        distances[rows] = block
+    return distances
+
+
+def condensed_distances(x, squared=False, block_size=None):
+    r"""Compute the condensed matrix of euclidean distances between rows of an array.
+
+    The condensed matrix holds the upper triangle of the distance matrix row by row,
+    which is the same layout as :func:`scipy.spatial.distance.pdist` uses.
+
+    Args:
+        x (numpy.ndarray): Points with shape `(n, dimension)`.
+        squared (Optional[bool]): Return squared distances.
+        block_size (Optional[int]): Number of rows of `x` computed at once.
+
+    Returns:
+        numpy.ndarray: Distances with shape `(n * (n - 1) / 2,)`.
+
+    """
+    x = np.asarray(x, dtype=float)
+    n = len(x)
+    distances = np.empty(n * (n - 1) // 2)
+    offset = 0
+    for rows, block in pairwise_distance_blocks(x, squared=squared, block_size=block_size):
+        for i, row in zip(range(rows.start, rows.stop), block):
+            distances[offset:offset + n - i - 1] = row[i + 1:]
+            offset += n - i - 1
+    return distances
+
+
+def radius_neighbors(x, radius, y=None, include_self=False, block_size=None):
+    r"""Find the rows of `y` that are within radius of each row of `x`.
+
+    Args:
+        x (numpy.ndarray): Query points with shape `(n, dimension)`.
+        radius (Union[float, numpy.ndarray]): Radius of the neighborhood, either one for all points or one per point of `x`.
+        y (Optional[numpy.ndarray]): Points with shape `(m, dimension)`. Defaults to `x`.
+        include_self (Optional[bool]): Count a point of `x` as its own neighbor when `y` is not given.
+        block_size (Optional[int]): Number of rows of `x` computed at once.
+
+    Returns:
+        List[numpy.ndarray[int]]: Sorted indices of the rows of `y` at distance at most `radius` from each row of `x`.
+
+    """
+    x = np.asarray(x, dtype=float)
+    radius_sq = np.square(np.broadcast_to(np.asarray(radius, dtype=float), len(x)))
+    neighbors = []
+    for rows, block in pairwise_distance_blocks(x, y, squared=True, block_size=block_size):
+        within = block <= radius_sq[rows, np.newaxis]
+        if y is None and not include_self:
+            within[np.arange(rows.stop - rows.start), np.arange(rows.start, rows.stop)] = False
+        neighbors.extend(np.flatnonzero(row) for row in within)
+    return neighbors
+
+
+class DistanceCache:
+    r"""Cache of the pairwise distance matrix of a population.
+
+    The matrix is recomputed only when a different population array is passed in, so operators that query
+    distances of single individuals can share one matrix per generation. The cache is keyed on the identity of
+    the population array, so a population must not be modified in place while its distances are in use.
+
+    Attributes:
+        block_size (Optional[int]): Number of rows computed at once.
+
+    See Also:
+        * :func:`niapy.util.distances.pairwise_distances`
+
+    """
+
+    def __init__(self, block_size=None):
+        r"""Initialize distance cache.
+
+        Args:
+            block_size (Optional[int]): Number of rows computed at once.
+
+        """
+        self.block_size = block_size
+        self._population = None
+        self._distances = None
+
+    def distances(self, population):
+        r"""Get the pairwise distance matrix of population.
+
+        Args:
+            population (numpy.ndarray): Population with shape `(n, dimension)`.
+
+        Returns:
+            numpy.ndarray: Distances with shape `(n, n)`.
+
+        """
+        if population is not self._population:
+            self._distances = pairwise_distances(population, block_size=self.block_size)
+            self._population = population
+        return self._distances
+
+    def clear(self):
+        r"""Drop the cached population and its distances."""
+        self._population = None
+        self._distances = None
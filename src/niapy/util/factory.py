@@ -1,13 +1,317 @@
 """Factory functions for getting algorithms and problems by name."""
 
-__all__ = ['get_algorithm', 'get_problem']
+import importlib
+from importlib.metadata import entry_points
+
+__all__ = ['get_algorithm', 'get_problem', 'register_algorithm', 'register_problem']
+
+
+class _Registry:
+    r"""Classes registered under case-insensitive names.
+
+    A class may be registered by its import path, so it is only imported when it is first requested.
+    Classes of other packages are discovered through entry points of :attr:`group` the first time a name
+    is not found, so plugins register without editing the factory.
+
+    Attributes:
+        group (str): Entry point group of plugins.
+
+    """
+
+    def __init__(self, group, classes):
+        r"""Initialize registry.
+
+        Args:
+            group (str): Entry point group of plugins.
+            classes (Dict[str, str]): Import path of each built-in class by name.
+
+        """
+        self.group = group
+        self._classes = {name.lower(): path for name, path in classes.items()}
+        self._discovered = False
+
+    def register(self, cls, *names):
+        r"""Register class under its name and aliases.
+
+        Args:
+            cls (type): Class.
+            *names (str): Names of the class. Defaults to the class name and the names in its `Name` attribute.
+
+        Returns:
+            type: The class.
+
+        """
+        if not names:
+            names = [cls.__name__, *getattr(cls, 'Name', ())]
+        for name in names:
+            self._classes[name.lower()] = cls
+        return cls
+
+    def get(self, name):
+        r"""Get class by name, importing it if needed.
+
+        Args:
+            name (str): Name of the class.
+
+        Returns:
+            type: The class.
+
+        Raises:
+            KeyError: If no class is registered under the name.
+
+        """
+        key = name.lower()
+        if key not in self._classes and not self._discovered:
+            self.discover()
+        cls = self._classes[key]
+        if isinstance(cls, str):
+            package, class_name = cls.rsplit('.', 1)
+            cls = self._classes[key] = getattr(importlib.import_module(package), class_name)
+        elif not isinstance(cls, type):
+            cls = self._classes[key] = cls.load()
+        return cls
+
+    def discover(self):
+        r"""Register classes of installed plugins, without overriding registered names."""
+        self._discovered = True
+        for entry_point in entry_points(group=self.group):
+            self._classes.setdefault(entry_point.name.lower(), entry_point)
+
+    def names(self):
+        r"""Get registered names, including those of installed plugins.
+
+        Returns:
+            List[str]: Lower case names.
+
+        """
+        if not self._discovered:
+            self.discover()
+        return sorted(self._classes)
+
+
+_problems = _Registry('niapy.problems', {
+    'ackley': 'niapy.problems.Ackley',
+    'alpine1': 'niapy.problems.Alpine1',
+    'alpine2': 'niapy.problems.Alpine2',
+    'bent_cigar': 'niapy.problems.BentCigar',
+    'chung_reynolds': 'niapy.problems.ChungReynolds',
+    'cosine_mixture': 'niapy.problems.CosineMixture',
+    'csendes': 'niapy.problems.Csendes',
+    'discus': 'niapy.problems.Discus',
+    'dixon_price': 'niapy.problems.DixonPrice',
+    'elliptic': 'niapy.problems.Elliptic',
+    'conditioned_elliptic': 'niapy.problems.Elliptic',
+    'expanded_griewank_plus_rosenbrock': 'niapy.problems.ExpandedGriewankPlusRosenbrock',
+    'expanded_schaffer': 'niapy.problems.ExpandedSchaffer',
+    'griewank': 'niapy.problems.Griewank',
+    'happy_cat': 'niapy.problems.HappyCat',
+    'hgbat': 'niapy.problems.HGBat',
+    'katsuura': 'niapy.problems.Katsuura',
+    'levy': 'niapy.problems.Levy',
+    'michalewicz': 'niapy.problems.Michalewicz',
+    'modified_schwefel': 'niapy.problems.ModifiedSchwefel',
+    'perm': 'niapy.problems.Perm',
+    'pinter': 'niapy.problems.Pinter',
+    'powell': 'niapy.problems.Powell',
+    'qing': 'niapy.problems.Qing',
+    'quintic': 'niapy.problems.Quintic',
+    'rastrigin': 'niapy.problems.Rastrigin',
+    'ridge': 'niapy.problems.Ridge',
+    'rosenbrock': 'niapy.problems.Rosenbrock',
+    'salomon': 'niapy.problems.Salomon',
+    'schaffer2': 'niapy.problems.SchafferN2',
+    'schaffer4': 'niapy.problems.SchafferN4',
+    'schumer_steiglitz': 'niapy.problems.SchumerSteiglitz',
+    'schwefel': 'niapy.problems.Schwefel',
+    'schwefel221': 'niapy.problems.Schwefel221',
+    'schwefel222': 'niapy.problems.Schwefel222',
+    'sphere': 'niapy.problems.Sphere',
+    'sphere2': 'niapy.problems.Sphere2',
+    'sphere3': 'niapy.problems.Sphere3',
+    'step': 'niapy.problems.Step',
+    'step2': 'niapy.problems.Step2',
+    'step3': 'niapy.problems.Step3',
+    'stepint': 'niapy.problems.Stepint',
+    'styblinski_tang': 'niapy.problems.StyblinskiTang',
+    'sum_squares': 'niapy.problems.SumSquares',
+    'trid': 'niapy.problems.Trid',
+    'weierstrass': 'niapy.problems.Weierstrass',
+    'whitley': 'niapy.problems.Whitley',
+    'zakharov': 'niapy.problems.Zakharov',
+})
+
+_algorithms = _Registry('niapy.algorithms', {
+    'BatAlgorithm': 'niapy.algorithms.basic.BatAlgorithm',
+    'BA': 'niapy.algorithms.basic.BatAlgorithm',
+    'FireflyAlgorithm': 'niapy.algorithms.basic.FireflyAlgorithm',
+    'FA': 'niapy.algorithms.basic.FireflyAlgorithm',
+    'DifferentialEvolution': 'niapy.algorithms.basic.DifferentialEvolution',
+    'DE': 'niapy.algorithms.basic.DifferentialEvolution',
+    'AgingNpDifferentialEvolution': 'niapy.algorithms.basic.AgingNpDifferentialEvolution',
+    'ANpDE': 'niapy.algorithms.basic.AgingNpDifferentialEvolution',
+    'DynNpDifferentialEvolution': 'niapy.algorithms.basic.DynNpDifferentialEvolution',
+    'dynNpDE': 'niapy.algorithms.basic.DynNpDifferentialEvolution',
+    'MultiStrategyDifferentialEvolution': 'niapy.algorithms.basic.MultiStrategyDifferentialEvolution',
+    'MsDE': 'niapy.algorithms.basic.MultiStrategyDifferentialEvolution',
+    'DynNpMultiStrategyDifferentialEvolution': 'niapy.algorithms.basic.DynNpMultiStrategyDifferentialEvolution',
+    'dynNpMsDE': 'niapy.algorithms.basic.DynNpMultiStrategyDifferentialEvolution',
+    'FlowerPollinationAlgorithm': 'niapy.algorithms.basic.FlowerPollinationAlgorithm',
+    'FPA': 'niapy.algorithms.basic.FlowerPollinationAlgorithm',
+    'GreyWolfOptimizer': 'niapy.algorithms.basic.GreyWolfOptimizer',
+    'GWO': 'niapy.algorithms.basic.GreyWolfOptimizer',
+    'GeneticAlgorithm': 'niapy.algorithms.basic.GeneticAlgorithm',
+    'GA': 'niapy.algorithms.basic.GeneticAlgorithm',
+    'ArtificialBeeColonyAlgorithm': 'niapy.algorithms.basic.ArtificialBeeColonyAlgorithm',
+    'ABC': 'niapy.algorithms.basic.ArtificialBeeColonyAlgorithm',
+    'ParticleSwarmAlgorithm': 'niapy.algorithms.basic.ParticleSwarmAlgorithm',
+    'WeightedVelocityClampingParticleSwarmAlgorithm': 'niapy.algorithms.basic.ParticleSwarmAlgorithm',
+    'WVCPSO': 'niapy.algorithms.basic.ParticleSwarmAlgorithm',
+    'ParticleSwarmOptimization': 'niapy.algorithms.basic.ParticleSwarmOptimization',
+    'ParticleSwarmAlgorithm': 'niapy.algorithms.basic.ParticleSwarmOptimization',
+    'PSO': 'niapy.algorithms.basic.ParticleSwarmOptimization',
+    'CenterParticleSwarmOptimization': 'niapy.algorithms.basic.CenterParticleSwarmOptimization',
+    'CPSO': 'niapy.algorithms.basic.CenterParticleSwarmOptimization',
+    'MutatedParticleSwarmOptimization': 'niapy.algorithms.basic.MutatedParticleSwarmOptimization',
+    'MPSO': 'niapy.algorithms.basic.MutatedParticleSwarmOptimization',
+    'MutatedCenterParticleSwarmOptimization': 'niapy.algorithms.basic.MutatedCenterParticleSwarmOptimization',
+    'MCPSO': 'niapy.algorithms.basic.MutatedCenterParticleSwarmOptimization',
+    'ComprehensiveLearningParticleSwarmOptimizer': 'niapy.algorithms.basic.ComprehensiveLearningParticleSwarmOptimizer',
+    'CLPSO': 'niapy.algorithms.basic.ComprehensiveLearningParticleSwarmOptimizer',
+    'MutatedCenterUnifiedParticleSwarmOptimization': 'niapy.algorithms.basic.MutatedCenterUnifiedParticleSwarmOptimization',
+    'MCUPSO': 'niapy.algorithms.basic.MutatedCenterUnifiedParticleSwarmOptimization',
+    'OppositionVelocityClampingParticleSwarmOptimization': 'niapy.algorithms.basic.OppositionVelocityClampingParticleSwarmOptimization',
+    'OVCPSO': 'niapy.algorithms.basic.OppositionVelocityClampingParticleSwarmOptimization',
+    'BareBonesFireworksAlgorithm': 'niapy.algorithms.basic.BareBonesFireworksAlgorithm',
+    'BBFWA': 'niapy.algorithms.basic.BareBonesFireworksAlgorithm',
+    'CamelAlgorithm': 'niapy.algorithms.basic.CamelAlgorithm',
+    'CA': 'niapy.algorithms.basic.CamelAlgorithm',
+    'MonkeyKingEvolutionV1': 'niapy.algorithms.basic.MonkeyKingEvolutionV1',
+    'MKEv1': 'niapy.algorithms.basic.MonkeyKingEvolutionV1',
+    'MonkeyKingEvolutionV2': 'niapy.algorithms.basic.MonkeyKingEvolutionV2',
+    'MKEv2': 'niapy.algorithms.basic.MonkeyKingEvolutionV2',
+    'MonkeyKingEvolutionV3': 'niapy.algorithms.basic.MonkeyKingEvolutionV3',
+    'MKEv3': 'niapy.algorithms.basic.MonkeyKingEvolutionV3',
+    'EvolutionStrategy1p1': 'niapy.algorithms.basic.EvolutionStrategy1p1',
+    'EvolutionStrategy(1+1)': 'niapy.algorithms.basic.EvolutionStrategy1p1',
+    'ES(1+1)': 'niapy.algorithms.basic.EvolutionStrategy1p1',
+    'EvolutionStrategyMp1': 'niapy.algorithms.basic.EvolutionStrategyMp1',
+    'EvolutionStrategy(mu+1)': 'niapy.algorithms.basic.EvolutionStrategyMp1',
+    'ES(m+1)': 'niapy.algorithms.basic.EvolutionStrategyMp1',
+    'EvolutionStrategyMpL': 'niapy.algorithms.basic.EvolutionStrategyMpL',
+    'EvolutionStrategy(mu+lambda)': 'niapy.algorithms.basic.EvolutionStrategyMpL',
+    'ES(m+l)': 'niapy.algorithms.basic.EvolutionStrategyMpL',
+    'EvolutionStrategyML': 'niapy.algorithms.basic.EvolutionStrategyML',
+    'EvolutionStrategy(mu,lambda)': 'niapy.algorithms.basic.EvolutionStrategyML',
+    'ES(m,l)': 'niapy.algorithms.basic.EvolutionStrategyML',
+    'SineCosineAlgorithm': 'niapy.algorithms.basic.SineCosineAlgorithm',
+    'SCA': 'niapy.algorithms.basic.SineCosineAlgorithm',
+    'GlowwormSwarmOptimization': 'niapy.algorithms.basic.GlowwormSwarmOptimization',
+    'GSO': 'niapy.algorithms.basic.GlowwormSwarmOptimization',
+    'GlowwormSwarmOptimizationV1': 'niapy.algorithms.basic.GlowwormSwarmOptimizationV1',
+    'GSOv1': 'niapy.algorithms.basic.GlowwormSwarmOptimizationV1',
+    'GlowwormSwarmOptimizationV2': 'niapy.algorithms.basic.GlowwormSwarmOptimizationV2',
+    'GSOv2': 'niapy.algorithms.basic.GlowwormSwarmOptimizationV2',
+    'GlowwormSwarmOptimizationV3': 'niapy.algorithms.basic.GlowwormSwarmOptimizationV3',
+    'GSOv3': 'niapy.algorithms.basic.GlowwormSwarmOptimizationV3',
+    'HarmonySearch': 'niapy.algorithms.basic.HarmonySearch',
+    'HS': 'niapy.algorithms.basic.HarmonySearch',
+    'HarmonySearchV1': 'niapy.algorithms.basic.HarmonySearchV1',
+    'HSv1': 'niapy.algorithms.basic.HarmonySearchV1',
+    'KrillHerd': 'niapy.algorithms.basic.KrillHerd',
+    'KH': 'niapy.algorithms.basic.KrillHerd',
+    'FireworksAlgorithm': 'niapy.algorithms.basic.FireworksAlgorithm',
+    'FWA': 'niapy.algorithms.basic.FireworksAlgorithm',
+    'EnhancedFireworksAlgorithm': 'niapy.algorithms.basic.EnhancedFireworksAlgorithm',
+    'EFWA': 'niapy.algorithms.basic.EnhancedFireworksAlgorithm',
+    'DynamicFireworksAlgorithm': 'niapy.algorithms.basic.DynamicFireworksAlgorithm',
+    'dynFWA': 'niapy.algorithms.basic.DynamicFireworksAlgorithm',
+    'DynamicFireworksAlgorithmGauss': 'niapy.algorithms.basic.DynamicFireworksAlgorithmGauss',
+    'dynFWAG': 'niapy.algorithms.basic.DynamicFireworksAlgorithmGauss',
+    'GravitationalSearchAlgorithm': 'niapy.algorithms.basic.GravitationalSearchAlgorithm',
+    'GSA': 'niapy.algorithms.basic.GravitationalSearchAlgorithm',
+    'MothFlameOptimizer': 'niapy.algorithms.basic.MothFlameOptimizer',
+    'MFO': 'niapy.algorithms.basic.MothFlameOptimizer',
+    'FishSchoolSearch': 'niapy.algorithms.basic.FishSchoolSearch',
+    'FSS': 'niapy.algorithms.basic.FishSchoolSearch',
+    'CuckooSearch': 'niapy.algorithms.basic.CuckooSearch',
+    'CS': 'niapy.algorithms.basic.CuckooSearch',
+    'CoralReefsOptimization': 'niapy.algorithms.basic.CoralReefsOptimization',
+    'CRO': 'niapy.algorithms.basic.CoralReefsOptimization',
+    'ForestOptimizationAlgorithm': 'niapy.algorithms.basic.ForestOptimizationAlgorithm',
+    'FOA': 'niapy.algorithms.basic.ForestOptimizationAlgorithm',
+    'MonarchButterflyOptimization': 'niapy.algorithms.basic.MonarchButterflyOptimization',
+    'MBO': 'niapy.algorithms.basic.MonarchButterflyOptimization',
+    'BacterialForagingOptimization': 'niapy.algorithms.basic.BacterialForagingOptimization',
+    'BFO': 'niapy.algorithms.basic.BacterialForagingOptimization',
+    'BFOA': 'niapy.algorithms.basic.BacterialForagingOptimization',
+    'BeesAlgorithm': 'niapy.algorithms.basic.BeesAlgorithm',
+    'BEA': 'niapy.algorithms.basic.BeesAlgorithm',
+    'CatSwarmOptimization': 'niapy.algorithms.basic.CatSwarmOptimization',
+    'CSO': 'niapy.algorithms.basic.CatSwarmOptimization',
+    'HarrisHawksOptimization': 'niapy.algorithms.basic.HarrisHawksOptimization',
+    'HHO': 'niapy.algorithms.basic.HarrisHawksOptimization',
+    'ClonalSelectionAlgorithm': 'niapy.algorithms.basic.ClonalSelectionAlgorithm',
+    'CLONALG': 'niapy.algorithms.basic.ClonalSelectionAlgorithm',
+    'LionOptimizationAlgorithm': 'niapy.algorithms.basic.LionOptimizationAlgorithm',
+    'LOA': 'niapy.algorithms.basic.LionOptimizationAlgorithm',
+    'HybridBatAlgorithm': 'niapy.algorithms.modified.HybridBatAlgorithm',
+    'HBA': 'niapy.algorithms.modified.HybridBatAlgorithm',
+    'AdaptiveBatAlgorithm': 'niapy.algorithms.modified.AdaptiveBatAlgorithm',
+    'ABA': 'niapy.algorithms.modified.AdaptiveBatAlgorithm',
+    'SelfAdaptiveBatAlgorithm': 'niapy.algorithms.modified.SelfAdaptiveBatAlgorithm',
+    'SABA': 'niapy.algorithms.modified.SelfAdaptiveBatAlgorithm',
+    'HybridSelfAdaptiveBatAlgorithm': 'niapy.algorithms.modified.HybridSelfAdaptiveBatAlgorithm',
+    'HSABA': 'niapy.algorithms.modified.HybridSelfAdaptiveBatAlgorithm',
+    'ParameterFreeBatAlgorithm': 'niapy.algorithms.modified.ParameterFreeBatAlgorithm',
+    'PLBA': 'niapy.algorithms.modified.ParameterFreeBatAlgorithm',
+    'DifferentialEvolutionMTS': 'niapy.algorithms.modified.DifferentialEvolutionMTS',
+    'DEMTS': 'niapy.algorithms.modified.DifferentialEvolutionMTS',
+    'DifferentialEvolutionMTSv1': 'niapy.algorithms.modified.DifferentialEvolutionMTSv1',
+    'DEMTSv1': 'niapy.algorithms.modified.DifferentialEvolutionMTSv1',
+    'DynNpDifferentialEvolutionMTS': 'niapy.algorithms.modified.DynNpDifferentialEvolutionMTS',
+    'dynNpDEMTS': 'niapy.algorithms.modified.DynNpDifferentialEvolutionMTS',
+    'DynNpDifferentialEvolutionMTSv1': 'niapy.algorithms.modified.DynNpDifferentialEvolutionMTSv1',
+    'dynNpDEMTSv1': 'niapy.algorithms.modified.DynNpDifferentialEvolutionMTSv1',
+    'MultiStrategyDifferentialEvolutionMTS': 'niapy.algorithms.modified.MultiStrategyDifferentialEvolutionMTS',
+    'MSDEMTS': 'niapy.algorithms.modified.MultiStrategyDifferentialEvolutionMTS',
+    'MultiStrategyDifferentialEvolutionMTSv1': 'niapy.algorithms.modified.MultiStrategyDifferentialEvolutionMTSv1',
+    'MSDEMTSv1': 'niapy.algorithms.modified.MultiStrategyDifferentialEvolutionMTSv1',
+    'DynNpMultiStrategyDifferentialEvolutionMTS': 'niapy.algorithms.modified.DynNpMultiStrategyDifferentialEvolutionMTS',
+    'dynNpMSDEMTS': 'niapy.algorithms.modified.DynNpMultiStrategyDifferentialEvolutionMTS',
+    'DynNpMultiStrategyDifferentialEvolutionMTSv1': 'niapy.algorithms.modified.DynNpMultiStrategyDifferentialEvolutionMTSv1',
+    'dynNpMSDEMTSv1': 'niapy.algorithms.modified.DynNpMultiStrategyDifferentialEvolutionMTSv1',
+    'SelfAdaptiveDifferentialEvolution': 'niapy.algorithms.modified.SelfAdaptiveDifferentialEvolution',
+    'jDE': 'niapy.algorithms.modified.SelfAdaptiveDifferentialEvolution',
+    'MultiStrategySelfAdaptiveDifferentialEvolution': 'niapy.algorithms.modified.MultiStrategySelfAdaptiveDifferentialEvolution',
+    'MsjDE': 'niapy.algorithms.modified.MultiStrategySelfAdaptiveDifferentialEvolution',
+    'SuccessHistoryAdaptiveDifferentialEvolution': 'niapy.algorithms.modified.SuccessHistoryAdaptiveDifferentialEvolution',
+    'SHADE': 'niapy.algorithms.modified.SuccessHistoryAdaptiveDifferentialEvolution',
+    'LpsrSuccessHistoryAdaptiveDifferentialEvolution': 'niapy.algorithms.modified.LpsrSuccessHistoryAdaptiveDifferentialEvolution',
+    'L-SHADE': 'niapy.algorithms.modified.LpsrSuccessHistoryAdaptiveDifferentialEvolution',
+    'NelderMeadMethod': 'niapy.algorithms.other.NelderMeadMethod',
+    'NMM': 'niapy.algorithms.other.NelderMeadMethod',
+    'HillClimbAlgorithm': 'niapy.algorithms.other.HillClimbAlgorithm',
+    'HC': 'niapy.algorithms.other.HillClimbAlgorithm',
+    'SimulatedAnnealing': 'niapy.algorithms.other.SimulatedAnnealing',
+    'SA': 'niapy.algorithms.other.SimulatedAnnealing',
+    'MultipleTrajectorySearch': 'niapy.algorithms.other.MultipleTrajectorySearch',
+    'MTS': 'niapy.algorithms.other.MultipleTrajectorySearch',
+    'MultipleTrajectorySearchV1': 'niapy.algorithms.other.MultipleTrajectorySearchV1',
+    'MTSv1': 'niapy.algorithms.other.MultipleTrajectorySearchV1',
+    'AnarchicSocietyOptimization': 'niapy.algorithms.other.AnarchicSocietyOptimization',
+    'ASO': 'niapy.algorithms.other.AnarchicSocietyOptimization',
+    'RandomSearch': 'niapy.algorithms.other.RandomSearch',
+    'RS': 'niapy.algorithms.other.RandomSearch',
+    'IslandModel': 'niapy.algorithms.other.IslandModel',
+    'IM': 'niapy.algorithms.other.IslandModel',
+})
 
 
 def get_problem(name, *args, **kwargs):
     r"""Get problem by name.
 
     Args:
-        name (str): Name of the problem.
+        name (str): Name of the problem. Case-insensitive.
 
     Returns:
         Problem: An instance of Problem, instantiated with \*args and \*\*kwargs.
@@ -16,15 +320,14 @@ def get_problem(name, *args, **kwargs):
         KeyError: If an invalid name is provided.
 
     """
-    problem = _problem_options().pop(name.lower())
-    return problem(*args, **kwargs)
+    return _problems.get(name)(*args, **kwargs)
 
 
 def get_algorithm(name, *args, **kwargs):
     r"""Get algorithm by name.
 
     Args:
-        name (str): Name of the algorithm.
+        name (str): Name of the algorithm. Case-insensitive.
 
     Returns:
         Algorithm: An instance of the algorithm instantiated \*args and \*\*kwargs.
@@ -33,148 +336,50 @@ def get_algorithm(name, *args, **kwargs):
         KeyError: If an invalid name is provided.
 
     """
-    algorithm = _algorithm_options().pop(name)
-    return algorithm(*args, **kwargs)
-
-
-def _problem_options():
-    import niapy.problems as problems
-
-    problems_dict = {
-        'ackley': problems.Ackley,
-        'alpine1': problems.Alpine1,
-        'alpine2': problems.Alpine2,
-        'bent_cigar': problems.BentCigar,
-        'chung_reynolds': problems.ChungReynolds,
-        'cosine_mixture': problems.CosineMixture,
-        'csendes': problems.Csendes,
-        'discus': problems.Discus,
-        "dixon_price": problems.DixonPrice,
-        "elliptic": problems.Elliptic,
-        "conditioned_elliptic": problems.Elliptic,
-        "expanded_griewank_plus_rosenbrock": problems.ExpandedGriewankPlusRosenbrock,
-        "expanded_schaffer": problems.ExpandedSchaffer,
-        "griewank": problems.Griewank,
-        "happy_cat": problems.HappyCat,
-        "hgbat": problems.HGBat,
-        "katsuura": problems.Katsuura,
-        "levy": problems.Levy,
-        "michalewicz": problems.Michalewicz,
-        "modified_schwefel": problems.ModifiedSchwefel,
-        "perm": problems.Perm,
-        "pinter": problems.Pinter,
-        "powell": problems.Powell,
-        "qing": problems.Qing,
-        "quintic": problems.Quintic,
-        "rastrigin": problems.Rastrigin,
-        "ridge": problems.Ridge,
-        "rosenbrock": problems.Rosenbrock,
-        "salomon": problems.Salomon,
-        "schaffer2": problems.SchafferN2,
-        "schaffer4": problems.SchafferN4,
-        "schumer_steiglitz": problems.SchumerSteiglitz,
-        "schwefel": problems.Schwefel,
-        "schwefel221": problems.Schwefel221,
-        "schwefel222": problems.Schwefel222,
-        "sphere": problems.Sphere,
-        "sphere2": problems.Sphere2,
-        "sphere3": problems.Sphere3,
-        "step": problems.Step,
-        "step2": problems.Step2,
-        "step3": problems.Step3,
-        "stepint": problems.Stepint,
-        "styblinski_tang": problems.StyblinskiTang,
-        "sum_squares": problems.SumSquares,
-        "trid": problems.Trid,
-        "weierstrass": problems.Weierstrass,
-        "whitley": problems.Whitley,
-        "zakharov": problems.Zakharov,
-    }
-    return problems_dict
-
-
-def _algorithm_options():
-    import niapy.algorithms.basic as basic_algorithms
-    import niapy.algorithms.modified as modified_algorithms
-    import niapy.algorithms.other as other_algorithms
-
-    algorithms = {
-        "BatAlgorithm": basic_algorithms.BatAlgorithm,
-        "FireflyAlgorithm": basic_algorithms.FireflyAlgorithm,
-        "DifferentialEvolution": basic_algorithms.DifferentialEvolution,
-        "AgingNpDifferentialEvolution": basic_algorithms.AgingNpDifferentialEvolution,
-        "DynNpDifferentialEvolution": basic_algorithms.DynNpDifferentialEvolution,
-        "MultiStrategyDifferentialEvolution": basic_algorithms.MultiStrategyDifferentialEvolution,
-        "DynNpMultiStrategyDifferentialEvolution": basic_algorithms.DynNpMultiStrategyDifferentialEvolution,
-        "FlowerPollinationAlgorithm": basic_algorithms.FlowerPollinationAlgorithm,
-        "GreyWolfOptimizer": basic_algorithms.GreyWolfOptimizer,
-        "GeneticAlgorithm": basic_algorithms.GeneticAlgorithm,
-        "ArtificialBeeColonyAlgorithm": basic_algorithms.ArtificialBeeColonyAlgorithm,
-        "ParticleSwarmAlgorithm": basic_algorithms.ParticleSwarmAlgorithm,
-        "ParticleSwarmOptimization": basic_algorithms.ParticleSwarmOptimization,
-        "CenterParticleSwarmOptimization": basic_algorithms.CenterParticleSwarmOptimization,
-        "MutatedParticleSwarmOptimization": basic_algorithms.MutatedParticleSwarmOptimization,
-        "MutatedCenterParticleSwarmOptimization": basic_algorithms.MutatedCenterParticleSwarmOptimization,
-        "ComprehensiveLearningParticleSwarmOptimizer": basic_algorithms.ComprehensiveLearningParticleSwarmOptimizer,
-        "MutatedCenterUnifiedParticleSwarmOptimization": basic_algorithms.MutatedCenterUnifiedParticleSwarmOptimization,
-        "OppositionVelocityClampingParticleSwarmOptimization": basic_algorithms.OppositionVelocityClampingParticleSwarmOptimization,
-        "BareBonesFireworksAlgorithm": basic_algorithms.BareBonesFireworksAlgorithm,
-        "CamelAlgorithm": basic_algorithms.CamelAlgorithm,
-        "MonkeyKingEvolutionV1": basic_algorithms.MonkeyKingEvolutionV1,
-        "MonkeyKingEvolutionV2": basic_algorithms.MonkeyKingEvolutionV2,
-        "MonkeyKingEvolutionV3": basic_algorithms.MonkeyKingEvolutionV3,
-        "EvolutionStrategy1p1": basic_algorithms.EvolutionStrategy1p1,
-        "EvolutionStrategyMp1": basic_algorithms.EvolutionStrategyMp1,
-        "EvolutionStrategyMpL": basic_algorithms.EvolutionStrategyMpL,
-        "EvolutionStrategyML": basic_algorithms.EvolutionStrategyML,
-        "SineCosineAlgorithm": basic_algorithms.SineCosineAlgorithm,
-        "GlowwormSwarmOptimization": basic_algorithms.GlowwormSwarmOptimization,
-        "GlowwormSwarmOptimizationV1": basic_algorithms.GlowwormSwarmOptimizationV1,
-        "GlowwormSwarmOptimizationV2": basic_algorithms.GlowwormSwarmOptimizationV2,
-        "GlowwormSwarmOptimizationV3": basic_algorithms.GlowwormSwarmOptimizationV3,
-        "HarmonySearch": basic_algorithms.HarmonySearch,
-        "HarmonySearchV1": basic_algorithms.HarmonySearchV1,
-        "KrillHerd": basic_algorithms.KrillHerd,
-        "FireworksAlgorithm": basic_algorithms.FireworksAlgorithm,
-        "EnhancedFireworksAlgorithm": basic_algorithms.EnhancedFireworksAlgorithm,
-        "DynamicFireworksAlgorithm": basic_algorithms.DynamicFireworksAlgorithm,
-        "DynamicFireworksAlgorithmGauss": basic_algorithms.DynamicFireworksAlgorithmGauss,
-        "GravitationalSearchAlgorithm": basic_algorithms.GravitationalSearchAlgorithm,
-        "MothFlameOptimizer": basic_algorithms.MothFlameOptimizer,
-        "FishSchoolSearch": basic_algorithms.FishSchoolSearch,
-        "CuckooSearch": basic_algorithms.CuckooSearch,
-        "CoralReefsOptimization": basic_algorithms.CoralReefsOptimization,
-        "ForestOptimizationAlgorithm": basic_algorithms.ForestOptimizationAlgorithm,
-        "MonarchButterflyOptimization": basic_algorithms.MonarchButterflyOptimization,
-        "BacterialForagingOptimization": basic_algorithms.BacterialForagingOptimization,
-        "BeesAlgorithm": basic_algorithms.BeesAlgorithm,
-        "CatSwarmOptimization": basic_algorithms.CatSwarmOptimization,
-        "HarrisHawksOptimization": basic_algorithms.HarrisHawksOptimization,
-        "ClonalSelectionAlgorithm": basic_algorithms.ClonalSelectionAlgorithm,
-        "LionOptimizationAlgorithm": basic_algorithms.LionOptimizationAlgorithm,
-        "HybridBatAlgorithm": modified_algorithms.HybridBatAlgorithm,
-        "AdaptiveBatAlgorithm": modified_algorithms.AdaptiveBatAlgorithm,
-        "SelfAdaptiveBatAlgorithm": modified_algorithms.SelfAdaptiveBatAlgorithm,
-        "HybridSelfAdaptiveBatAlgorithm": modified_algorithms.HybridSelfAdaptiveBatAlgorithm,
-        "ParameterFreeBatAlgorithm": modified_algorithms.ParameterFreeBatAlgorithm,
-        "DifferentialEvolutionMTS": modified_algorithms.DifferentialEvolutionMTS,
-        "DifferentialEvolutionMTSv1": modified_algorithms.DifferentialEvolutionMTSv1,
-        "DynNpDifferentialEvolutionMTS": modified_algorithms.DynNpDifferentialEvolutionMTS,
-        "DynNpDifferentialEvolutionMTSv1": modified_algorithms.DynNpDifferentialEvolutionMTSv1,
-        "MultiStrategyDifferentialEvolutionMTS": modified_algorithms.MultiStrategyDifferentialEvolutionMTS,
-        "MultiStrategyDifferentialEvolutionMTSv1": modified_algorithms.MultiStrategyDifferentialEvolutionMTSv1,
-        "DynNpMultiStrategyDifferentialEvolutionMTS": modified_algorithms.DynNpMultiStrategyDifferentialEvolutionMTS,
-        "DynNpMultiStrategyDifferentialEvolutionMTSv1": modified_algorithms.DynNpMultiStrategyDifferentialEvolutionMTSv1,
-        "SelfAdaptiveDifferentialEvolution": modified_algorithms.SelfAdaptiveDifferentialEvolution,
-        "MultiStrategySelfAdaptiveDifferentialEvolution": modified_algorithms.MultiStrategySelfAdaptiveDifferentialEvolution,
-        "SuccessHistoryAdaptiveDifferentialEvolution": modified_algorithms.SuccessHistoryAdaptiveDifferentialEvolution,
-        "LpsrSuccessHistoryAdaptiveDifferentialEvolution": modified_algorithms.LpsrSuccessHistoryAdaptiveDifferentialEvolution,
-        "NelderMeadMethod": other_algorithms.NelderMeadMethod,
-        "HillClimbAlgorithm": other_algorithms.HillClimbAlgorithm,
-        "SimulatedAnnealing": other_algorithms.SimulatedAnnealing,
-        "MultipleTrajectorySearch": other_algorithms.MultipleTrajectorySearch,
-        "MultipleTrajectorySearchV1": other_algorithms.MultipleTrajectorySearchV1,
-        "AnarchicSocietyOptimization": other_algorithms.AnarchicSocietyOptimization,
-        "RandomSearch": other_algorithms.RandomSearch,
-    }
-    return algorithms
+    return _algorithms.get(name)(*args, **kwargs)
+
+
+def register_problem(*names):
+    r"""Register a problem class, so it can be created by name with :func:`get_problem`.
+
+    Can be used as a class decorator, with or without names::
+
+        @register_problem('my_problem', 'mp')
+        class MyProblem(Problem):
+            ...
+
+    Packages can also register problems through entry points in the `niapy.problems` group.
+
+    Args:
+        *names (Union[str, type]): Case-insensitive names of the problem. Defaults to the class name.
+
+    Returns:
+        Union[type, Callable[[type], type]]: The class if it is passed directly, a class decorator otherwise.
+
+    """
+    if len(names) == 1 and isinstance(names[0], type):
+        return _problems.register(names[0])
+    return lambda cls: _problems.register(cls, *names)
+
+
+def register_algorithm(*names):
+    r"""Register an algorithm class, so it can be created by name with :func:`get_algorithm`.
+
+    Can be used as a class decorator, with or without names::
+
+        @register_algorithm
+        class MyAlgorithm(Algorithm):
+            Name = ['MyAlgorithm', 'MA']
+
+    Packages can also register algorithms through entry points in the `niapy.algorithms` group.
+
+    Args:
+        *names (Union[str, type]): Case-insensitive names of the algorithm. Defaults to the class name and the names in its `Name` attribute.
+
+    Returns:
+        Union[type, Callable[[type], type]]: The class if it is passed directly, a class decorator otherwise.
+
+    """
+    if len(names) == 1 and isinstance(names[0], type):
+        return _algorithms.register(names[0])
+    return lambda cls: _algorithms.register(cls, *names)
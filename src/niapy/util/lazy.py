@@ -0,0 +1,40 @@
+# encoding=utf8
+
+"""Implementation of packages that import their submodules on first access."""
+
+import importlib
+import sys
+
+__all__ = ['lazy_exports']
+
+
+def lazy_exports(package, modules):
+    r"""Create module level `__getattr__` and `__dir__` functions that import exports of a package on first access.
+
+    Importing a package then only costs importing its `__init__` module, so short-lived processes
+    do not pay for submodules and dependencies they never use.
+
+    Args:
+        package (str): Name of the package.
+        modules (Dict[str, str]): Name of submodule defining each exported name. A name mapped to itself is the submodule.
+
+    Returns:
+        Tuple[Callable[[str], Any], Callable[[], List[str]]]:
+            1. Module level `__getattr__` of the package.
+            2. Module level `__dir__` of the package.
+
+    """
+    namespace = vars(sys.modules[package])
+
+    def __getattr__(name):
+        if name not in modules:
+            raise AttributeError('module %r has no attribute %r' % (package, name))
+        module = importlib.import_module('%s.%s' % (package, modules[name]))
+        value = module if modules[name] == name else getattr(module, name)
+        namespace[name] = value
+        return value
+
+    def __dir__():
+        return sorted(set(namespace) | set(modules))
+
+    return __getattr__, __dir__
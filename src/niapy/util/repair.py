@@ -4,11 +4,49 @@ from numpy.random import default_rng
 __all__ = ['limit', 'limit_inverse', 'wang', 'rand', 'reflect']
 
 
+def _buffer(scratch, name, shape, dtype=float):
+    r"""Get scratch array, reusing a preallocated one if possible.
+
+    Args:
+        scratch (Optional[Dict[Tuple[str, Tuple[int, ...], numpy.dtype], numpy.ndarray]]): Preallocated arrays.
+        name (str): Name of array.
+        shape (Tuple[int, ...]): Shape of array.
+        dtype (Optional[numpy.dtype]): Type of array.
+
+    Returns:
+        numpy.ndarray: Uninitialized array.
+
+    """
+    if scratch is None:
+        return np.empty(shape, dtype=dtype)
+    key = name, shape, np.dtype(dtype)
+    if key not in scratch:
+        scratch[key] = np.empty(shape, dtype=dtype)
+    return scratch[key]
+
+
+def _violations(x, bound, compare, scratch, name):
+    r"""Get mask of components of x that violate a bound.
+
+    Args:
+        x (numpy.ndarray): Solution or population.
+        bound (numpy.ndarray): Lower or upper bounds, broadcast against `x`.
+        compare (numpy.ufunc): `numpy.less` for the lower and `numpy.greater` for the upper bound.
+        scratch (Optional[Dict[Tuple[str, Tuple[int, ...], numpy.dtype], numpy.ndarray]]): Preallocated arrays.
+        name (str): Name of mask array.
+
+    Returns:
+        numpy.ndarray[bool]: Violations.
+
+    """
+    return compare(x, bound, out=_buffer(scratch, name, x.shape, bool))
+
+
 def limit(x, lower, upper, **_kwargs):
     r"""Repair solution and put the solution in the random position inside of the bounds of problem.
 
     Args:
-        x (numpy.ndarray): Solution to check and repair if needed.
+        x (numpy.ndarray): Solution to check and repair if needed, or population with one solution per row. Repaired in place.
         lower (numpy.ndarray): Lower bounds of search space.
         upper (numpy.ndarray): Upper bounds of search space.
 
@@ -19,79 +57,86 @@ def limit(x, lower, upper, **_kwargs):
     return np.clip(x, lower, upper, out=x)
 
 
-def limit_inverse(x, lower, upper, **_kwargs):
+def limit_inverse(x, lower, upper, scratch=None, **_kwargs):
     r"""Repair solution and put the solution in the random position inside of the bounds of problem.
 
     Args:
-        x (numpy.ndarray): Solution to check and repair if needed.
+        x (numpy.ndarray): Solution to check and repair if needed, or population with one solution per row. Repaired in place.
         lower (numpy.ndarray): Lower bounds of search space.
         upper (numpy.ndarray): Upper bounds of search space.
+        scratch (Optional[Dict[Tuple[str, Tuple[int, ...], numpy.dtype], numpy.ndarray]]): Preallocated arrays to reuse.
 
     Returns:
         numpy.ndarray: Solution in search space.
 
     """
-    ir = np.where(x < lower)
-    x[ir] = upper[ir]
-    ir = np.where(x > upper)
-    x[ir] = lower[ir]
+    np.copyto(x, upper, where=_violations(x, lower, np.less, scratch, 'mask'))
+    np.copyto(x, lower, where=_violations(x, upper, np.greater, scratch, 'mask'))
     return x
 
 
-def wang(x, lower, upper, **_kwargs):
+def wang(x, lower, upper, scratch=None, **_kwargs):
     r"""Repair solution and put the solution in the random position inside of the bounds of problem.
 
     Args:
-        x (numpy.ndarray): Solution to check and repair if needed.
+        x (numpy.ndarray): Solution to check and repair if needed, or population with one solution per row. Repaired in place.
         lower (numpy.ndarray): Lower bounds of search space.
         upper (numpy.ndarray): Upper bounds of search space.
+        scratch (Optional[Dict[Tuple[str, Tuple[int, ...], numpy.dtype], numpy.ndarray]]): Preallocated arrays to reuse.
 
     Returns:
         numpy.ndarray: Solution in search space.
 
     """
-    ir = np.where(x < lower)
-    x[ir] = np.amin([upper[ir], 2 * lower[ir] - x[ir]], axis=0)
-    ir = np.where(x > upper)
-    x[ir] = np.amax([lower[ir], 2 * upper[ir] - x[ir]], axis=0)
+    reflected = _buffer(scratch, 'reflected', x.shape)
+    mask = _violations(x, lower, np.less, scratch, 'mask')
+    np.subtract(2 * lower, x, out=reflected)
+    np.minimum(reflected, upper, out=reflected)
+    np.copyto(x, reflected, where=mask)
+    mask = _violations(x, upper, np.greater, scratch, 'mask')
+    np.subtract(2 * upper, x, out=reflected)
+    np.maximum(reflected, lower, out=reflected)
+    np.copyto(x, reflected, where=mask)
     return x
 
 
-def rand(x, lower, upper, rng=None, **_kwargs):
+def rand(x, lower, upper, rng=None, scratch=None, **_kwargs):
     r"""Repair solution and put the solution in the random position inside of the bounds of problem.
 
     Args:
-        x (numpy.ndarray): Solution to check and repair if needed.
+        x (numpy.ndarray): Solution to check and repair if needed, or population with one solution per row. Repaired in place.
         lower (numpy.ndarray): Lower bounds of search space.
         upper (numpy.ndarray): Upper bounds of search space.
         rng (numpy.random.Generator): Random generator.
+        scratch (Optional[Dict[Tuple[str, Tuple[int, ...], numpy.dtype], numpy.ndarray]]): Preallocated arrays to reuse.
 
     Returns:
         numpy.ndarray: Fixed solution.
 
     """
     rng = default_rng(rng)
-    ir = np.where(x < lower)
-    x[ir] = rng.uniform(lower[ir], upper[ir])
-    ir = np.where(x > upper)
-    x[ir] = rng.uniform(lower[ir], upper[ir])
+    lower, upper = np.broadcast_to(lower, x.shape), np.broadcast_to(upper, x.shape)
+    for bound, compare in ((lower, np.less), (upper, np.greater)):
+        mask = _violations(x, bound, compare, scratch, 'mask')
+        x[mask] = rng.uniform(lower[mask], upper[mask])
     return x
 
 
-def reflect(x, lower, upper, **_kwargs):
+def reflect(x, lower, upper, scratch=None, **_kwargs):
     r"""Repair solution and put the solution in search space with reflection of how much the solution violates a bound.
 
     Args:
-        x (numpy.ndarray): Solution to be fixed.
+        x (numpy.ndarray): Solution to be fixed, or population with one solution per row. Repaired in place.
         lower (numpy.ndarray): Lower bounds of search space.
         upper (numpy.ndarray): Upper bounds of search space.
+        scratch (Optional[Dict[Tuple[str, Tuple[int, ...], numpy.dtype], numpy.ndarray]]): Preallocated arrays to reuse.
 
     Returns:
         numpy.ndarray: Fix solution.
 
     """
-    ir = np.where(x > upper)
-    x[ir] = lower[ir] + x[ir] % (upper[ir] - lower[ir])
-    ir = np.where(x < lower)
-    x[ir] = lower[ir] + x[ir] % (upper[ir] - lower[ir])
+    lower, upper = np.broadcast_to(lower, x.shape), np.broadcast_to(upper, x.shape)
+    for bound, compare in ((upper, np.greater), (lower, np.less)):
+        mask = _violations(x, bound, compare, scratch, 'mask')
+        x[mask] = lower[mask] + x[mask] % (upper[mask] - lower[mask])
     return x
@@ -0,0 +1,302 @@
+"""Spatial indexes for radius neighbor queries."""
+
+from abc import ABC, abstractmethod
+from itertools import product
+
+import numpy as np
+
+from niapy.util.distances import pairwise_distance_blocks
+
+__all__ = ['NeighborIndex', 'BruteForceIndex', 'KDTree', 'GridIndex']
+
+_CHUNK_PAIRS = 2 ** 20
+
+
+def _within(d2, r2, strict):
+    return d2 < r2 if strict else d2 <= r2
+
+
+def _group(queries, points, n_queries):
+    r"""Group neighbor pairs by query.
+
+    Args:
+        queries (numpy.ndarray[int]): Query index of each pair.
+        points (numpy.ndarray[int]): Point index of each pair.
+        n_queries (int): Number of queries.
+
+    Returns:
+        List[numpy.ndarray[int]]: Sorted point indices for each query.
+
+    """
+    order = np.lexsort((points, queries))
+    queries, points = queries[order], points[order]
+    bounds = np.searchsorted(queries, np.arange(n_queries + 1))
+    return [points[bounds[i]:bounds[i + 1]] for i in range(n_queries)]
+
+
+def _expand(starts, counts):
+    r"""Get flat positions of contiguous ranges.
+
+    Args:
+        starts (numpy.ndarray[int]): First position of each range.
+        counts (numpy.ndarray[int]): Length of each range.
+
+    Returns:
+        numpy.ndarray[int]: Positions of all ranges joined together.
+
+    """
+    offsets = np.arange(np.sum(counts)) - np.repeat(np.cumsum(counts) - counts, counts)
+    return np.repeat(starts, counts) + offsets
+
+
+class NeighborIndex(ABC):
+    r"""Base class for indexes answering radius neighbor queries on a set of points.
+
+    An index is built over the population of the current generation and answers the queries of all individuals at once.
+    Distances are euclidean.
+
+    Attributes:
+        points (numpy.ndarray): Indexed points with shape `(n, dimension)`.
+
+    """
+
+    def __init__(self, points):
+        r"""Build index over points.
+
+        Args:
+            points (numpy.ndarray): Points with shape `(n, dimension)`.
+
+        """
+        self.points = np.asarray(points, dtype=float)
+
+    @abstractmethod
+    def query_radius(self, x, radius, strict=False):
+        r"""Find indexed points within radius of query points.
+
+        Args:
+            x (numpy.ndarray): Query points with shape `(m, dimension)`.
+            radius (Union[float, numpy.ndarray]): Radius of the neighborhood, either one for all queries or one per query.
+            strict (Optional[bool]): Only count points that are closer than radius.
+
+        Returns:
+            List[numpy.ndarray[int]]: Sorted indices of indexed points in the neighborhood of each query point.
+
+        """
+        pass
+
+    def _check_pairs(self, x, r2, queries, points, strict):
+        r"""Keep candidate pairs whose points are in the neighborhood of their query.
+
+        Args:
+            x (numpy.ndarray): Query points.
+            r2 (numpy.ndarray[float]): Squared radius of each query.
+            queries (numpy.ndarray[int]): Query index of each pair.
+            points (numpy.ndarray[int]): Point index of each pair.
+            strict (bool): Only keep points that are closer than radius.
+
+        Returns:
+            Tuple[numpy.ndarray[int], numpy.ndarray[int]]: Query and point indices of kept pairs.
+
+        """
+        diff = x[queries] - self.points[points]
+        keep = _within(np.einsum('ij,ij->i', diff, diff), r2[queries], strict)
+        return queries[keep], points[keep]
+
+
+class BruteForceIndex(NeighborIndex):
+    r"""Index that compares each query point with all indexed points.
+
+    Works in any dimension and is the fastest choice for small populations.
+
+    See Also:
+        * :func:`niapy.util.distances.pairwise_distance_blocks`
+
+    """
+
+    def query_radius(self, x, radius, strict=False):
+        r"""Find indexed points within radius of query points.
+
+        Args:
+            x (numpy.ndarray): Query points with shape `(m, dimension)`.
+            radius (Union[float, numpy.ndarray]): Radius of the neighborhood, either one for all queries or one per query.
+            strict (Optional[bool]): Only count points that are closer than radius.
+
+        Returns:
+            List[numpy.ndarray[int]]: Sorted indices of indexed points in the neighborhood of each query point.
+
+        """
+        x = np.asarray(x, dtype=float)
+        r2 = np.square(np.broadcast_to(np.asarray(radius, dtype=float), len(x)))
+        neighbors = []
+        for rows, block in pairwise_distance_blocks(x, self.points, squared=True):
+            neighbors.extend(np.flatnonzero(row) for row in _within(block, r2[rows, np.newaxis], strict))
+        return neighbors
+
+
+class KDTree(NeighborIndex):
+    r"""Pure NumPy k-d tree.
+
+    Nodes are split at the median of their widest dimension until they hold at most `leaf_size` points.
+    Queries descend the tree level by level for all query points at once, pruning nodes whose bounding box is out of reach.
+    Best suited for large populations in low to moderate dimension.
+
+    Attributes:
+        leaf_size (int): Maximum number of points in a leaf.
+
+    See Also:
+        * :class:`niapy.util.spatial.NeighborIndex`
+
+    """
+
+    def __init__(self, points, leaf_size=32):
+        r"""Build k-d tree over points.
+
+        Args:
+            points (numpy.ndarray): Points with shape `(n, dimension)`.
+            leaf_size (Optional[int]): Maximum number of points in a leaf.
+
+        """
+        super().__init__(points)
+        self.leaf_size = leaf_size
+        self.index = np.arange(len(self.points))
+        starts, stops, children, mins, maxs = [], [], [], [], []
+        stack = [(0, len(self.points), -1, 0)]
+        while stack:
+            start, stop, parent, side = stack.pop()
+            node = len(starts)
+            if parent >= 0:
+                children[parent][side] = node
+            segment = self.points[self.index[start:stop]]
+            starts.append(start)
+            stops.append(stop)
+            children.append([-1, -1])
+            mins.append(segment.min(axis=0) if len(segment) else np.zeros(self.points.shape[1]))
+            maxs.append(segment.max(axis=0) if len(segment) else np.zeros(self.points.shape[1]))
+            if stop - start <= leaf_size:
+                continue
+            dim = np.argmax(maxs[-1] - mins[-1])
+            mid = (stop - start) // 2
+            order = np.argpartition(segment[:, dim], mid)
+            self.index[start:stop] = self.index[start:stop][order]
+            stack.append((start + mid, stop, node, 1))
+            stack.append((start, start + mid, node, 0))
+        self._starts, self._stops = np.asarray(starts), np.asarray(stops)
+        self._left, self._right = np.asarray(children).T
+        self._mins, self._maxs = np.asarray(mins), np.asarray(maxs)
+
+    def query_radius(self, x, radius, strict=False):
+        r"""Find indexed points within radius of query points.
+
+        Args:
+            x (numpy.ndarray): Query points with shape `(m, dimension)`.
+            radius (Union[float, numpy.ndarray]): Radius of the neighborhood, either one for all queries or one per query.
+            strict (Optional[bool]): Only count points that are closer than radius.
+
+        Returns:
+            List[numpy.ndarray[int]]: Sorted indices of indexed points in the neighborhood of each query point.
+
+        """
+        x = np.asarray(x, dtype=float)
+        r2 = np.square(np.broadcast_to(np.asarray(radius, dtype=float), len(x)))
+        found_queries, found_points = [np.empty(0, dtype=int)], [np.empty(0, dtype=int)]
+        queries, nodes = np.arange(len(x)), np.zeros(len(x), dtype=int)
+        while queries.size:
+            lo, hi, xq = self._mins[nodes], self._maxs[nodes], x[queries]
+            gap = np.maximum(lo - xq, 0) + np.maximum(xq - hi, 0)
+            far = np.maximum(np.abs(xq - lo), np.abs(xq - hi))
+            reach = _within(np.einsum('ij,ij->i', gap, gap), r2[queries], strict)
+            inside = _within(np.einsum('ij,ij->i', far, far), r2[queries], strict) & reach
+            leaf = (self._left[nodes] < 0) & reach & ~inside
+            for mask, check in ((inside, False), (leaf, True)):
+                q, n = queries[mask], nodes[mask]
+                counts = self._stops[n] - self._starts[n]
+                bounds = np.searchsorted(np.cumsum(counts), np.arange(_CHUNK_PAIRS, np.sum(counts), _CHUNK_PAIRS), side='right')
+                for cq, cn, cc in zip(np.split(q, bounds), np.split(n, bounds), np.split(counts, bounds)):
+                    pair_queries, pair_points = np.repeat(cq, cc), self.index[_expand(self._starts[cn], cc)]
+                    if check:
+                        pair_queries, pair_points = self._check_pairs(x, r2, pair_queries, pair_points, strict)
+                    found_queries.append(pair_queries)
+                    found_points.append(pair_points)
+            split = reach & ~inside & ~leaf
+            queries = np.concatenate((queries[split], queries[split]))
+            nodes = np.concatenate((self._left[nodes[split]], self._right[nodes[split]]))
+        return _group(np.concatenate(found_queries), np.concatenate(found_points), len(x))
+
+
+class GridIndex(NeighborIndex):
+    r"""Uniform grid index.
+
+    Points are bucketed into cubic cells. A query only checks points in cells that overlap the bounding box of its neighborhood.
+    The number of cells checked grows exponentially with dimension, so the grid is only suited for low dimensional problems.
+
+    Attributes:
+        cell_size (Optional[float]): Edge length of cells. By default, the largest query radius is used.
+
+    See Also:
+        * :class:`niapy.util.spatial.NeighborIndex`
+
+    """
+
+    def __init__(self, points, cell_size=None):
+        r"""Build grid index over points.
+
+        Args:
+            points (numpy.ndarray): Points with shape `(n, dimension)`.
+            cell_size (Optional[float]): Edge length of cells. By default, the largest radius of the first query is used.
+
+        """
+        super().__init__(points)
+        self.cell_size = cell_size
+        self._keys = None
+
+    def _bucket(self, cell_size):
+        r"""Sort points into cells.
+
+        Args:
+            cell_size (float): Edge length of cells.
+
+        """
+        self.cell_size = cell_size
+        self._origin = self.points.min(axis=0) if len(self.points) else np.zeros(self.points.shape[1])
+        cells = np.floor((self.points - self._origin) / cell_size).astype(np.int64)
+        self._shape = cells.max(axis=0) + 1 if len(cells) else np.ones(self.points.shape[1], dtype=np.int64)
+        keys = np.ravel_multi_index(cells.T, self._shape)
+        self._order = np.argsort(keys, kind='stable')
+        self._keys, self._starts, self._counts = np.unique(keys[self._order], return_index=True, return_counts=True)
+
+    def query_radius(self, x, radius, strict=False):
+        r"""Find indexed points within radius of query points.
+
+        Args:
+            x (numpy.ndarray): Query points with shape `(m, dimension)`.
+            radius (Union[float, numpy.ndarray]): Radius of the neighborhood, either one for all queries or one per query.
+            strict (Optional[bool]): Only count points that are closer than radius.
+
+        Returns:
+            List[numpy.ndarray[int]]: Sorted indices of indexed points in the neighborhood of each query point.
+
+        """
+        x = np.asarray(x, dtype=float)
+        r = np.broadcast_to(np.asarray(radius, dtype=float), len(x))
+        if len(self.points) == 0:
+            return [np.empty(0, dtype=int) for _ in range(len(x))]
+        if self._keys is None:
+            self._bucket(self.cell_size if self.cell_size is not None else (np.max(r, initial=0) or 1.0))
+        r2 = np.square(r)
+        found_queries, found_points = [np.empty(0, dtype=int)], [np.empty(0, dtype=int)]
+        cells = np.floor((x - self._origin) / self.cell_size).astype(np.int64)
+        reach = int(np.ceil(np.max(r, initial=0) / self.cell_size))
+        for offset in product(range(-reach, reach + 1), repeat=self.points.shape[1]):
+            neighbor_cells = cells + offset
+            valid = np.all((neighbor_cells >= 0) & (neighbor_cells < self._shape), axis=1)
+            queries = np.flatnonzero(valid)
+            keys = np.ravel_multi_index(neighbor_cells[valid].T, self._shape)
+            pos = np.minimum(np.searchsorted(self._keys, keys), len(self._keys) - 1)
+            hit = self._keys[pos] == keys
+            queries, pos = queries[hit], pos[hit]
+            counts = self._counts[pos]
+            pair_queries, pair_points = np.repeat(queries, counts), self._order[_expand(self._starts[pos], counts)]
+            pair_queries, pair_points = self._check_pairs(x, r2, pair_queries, pair_points, strict)
+            found_queries.append(pair_queries)
+            found_points.append(pair_points)
+        return _group(np.concatenate(found_queries), np.concatenate(found_points), len(x))
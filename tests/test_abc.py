@@ -1,5 +1,11 @@
 # encoding=utf8
+from unittest import mock
+
+import numpy as np
+
 from niapy.algorithms.basic import ArtificialBeeColonyAlgorithm
+from niapy.algorithms import Individual
+from niapy.task import Task
 from tests.test_algorithm import AlgorithmTestCase, MyProblem
 
 
@@ -17,3 +23,39 @@ class ABCTestCase(AlgorithmTestCase):
         abc_griewank = self.algo(population_size=10, seed=self.seed)
         abc_griewankc = self.algo(population_size=10, seed=self.seed)
         AlgorithmTestCase.test_algorithm_run(self, abc_griewank, abc_griewankc)
+
+    def test_probabilities(self):
+        algo = self.algo(population_size=8, seed=self.seed)
+        probabilities = algo.calculate_probabilities(np.asarray([-3.0, 0.0, 1.0, 4.0]))
+        self.assertAlmostEqual(1.0, np.sum(probabilities))
+        self.assertTrue(np.all(probabilities > 0))
+        self.assertTrue(np.all(np.diff(probabilities) < 0))
+        foods = [Individual(x=np.zeros(2), e=False) for _ in range(4)]
+        for food, f in zip(foods, (-3.0, 0.0, 1.0, 4.0)):
+            food.f = f
+        self.assertTrue(np.array_equal(probabilities, algo.calculate_probabilities(foods)))
+
+    def test_scouts(self):
+        task = Task(problem='sphere', dimension=5, max_iters=1)
+        algo = self.algo(population_size=20, limit=1, seed=self.seed)
+        pop, fpop, params = algo.init_population(task)
+        self.assertEqual((10, 5), pop.shape)
+        pop, fpop, _, _, params = algo.run_iteration(task, pop, fpop, pop[0], fpop[0], **params)
+        self.assertTrue(np.all(params['trials'] == 0))
+        self.assertTrue(np.array_equal(fpop, task.eval_batch(pop)))
+
+    def test_onlookers_same_source(self):
+        task = Task(problem='sphere', dimension=2, lower=-5.0, upper=5.0, max_iters=1)
+        algo = self.algo(population_size=8, limit=100, seed=self.seed)
+        population = np.zeros((4, 2))
+        population[2] = 1.0
+        population_fitness = task.eval_batch(population)
+        algo.uniform = lambda low, high, size=None: np.full(size, -0.5)
+        algo.rng = mock.Mock(wraps=algo.rng)
+        algo.rng.choice.return_value = np.asarray([2, 0, 2, 2])
+        trials = np.zeros(4, dtype=np.int32)
+        population, population_fitness, _, _, params = algo.run_iteration(task, population, population_fitness, population[0], 0.0, trials=trials)
+        self.assertTrue(np.array_equal([2, 1, 0, 1], params['trials']))
+        self.assertEqual(12, task.evals)
+        self.assertEqual(4, -np.sum(np.log2(population[2])))
+        self.assertEqual(population_fitness[2], task.eval(population[2]))
@@ -8,7 +8,7 @@ from unittest import TestCase
 import numpy as np
 from numpy.random import default_rng
 
-from niapy.algorithms.algorithm import Individual, Algorithm
+from niapy.algorithms.algorithm import Individual, Algorithm, Population
 from niapy.problems import Problem
 from niapy.task import Task
 from niapy.util import objects_to_array
@@ -91,6 +91,64 @@ class IndividualTestCase(TestCase):
         self.assertEqual(len(self.s1), len(self.x))
 
 
+class PopulationTestCase(TestCase):
+    r"""Test case for testing Population class.
+
+    See Also:
+        * :class:`niapy.algorithms.Population`
+
+    """
+
+    def setUp(self):
+        self.x = np.arange(12, dtype=float).reshape(4, 3)
+        self.pop = Population(self.x, np.arange(4.0), cr=0.5, rng=np.array([1.0, 2.0, 3.0, 4.0]))
+
+    def test_init(self):
+        self.assertEqual(len(self.pop), 4)
+        self.assertEqual(self.pop.columns, ('cr', 'rng'))
+        np.testing.assert_array_equal(self.pop.cr, np.full(4, 0.5))
+        np.testing.assert_array_equal(Population(self.x).f, np.full(4, np.inf))
+
+    def test_getitem_view(self):
+        part = self.pop[1:3]
+        part.x[0, 0] = -1
+        part.cr[0] = 0.1
+        self.assertEqual(self.pop.x[1, 0], -1)
+        self.assertEqual(self.pop.cr[1], 0.1)
+        one = self.pop[-1]
+        self.assertEqual(len(one), 1)
+        self.assertEqual(one.f[0], 3)
+        self.assertRaises(IndexError, lambda: self.pop[4])
+
+    def test_getitem_copy(self):
+        part = self.pop[np.array([3, 0])]
+        np.testing.assert_array_equal(part.rng, [4.0, 1.0])
+        part.x[0, 0] = -1
+        self.assertEqual(self.pop.x[3, 0], 9)
+        part = self.pop[self.pop.f > 1]
+        np.testing.assert_array_equal(part.f, [2.0, 3.0])
+
+    def test_setitem(self):
+        other = self.pop.copy()
+        other.f += 10
+        other.cr[:] = 0.9
+        mask = np.array([True, False, True, False])
+        self.pop[mask] = other[mask]
+        np.testing.assert_array_equal(self.pop.f, [10.0, 1.0, 12.0, 3.0])
+        np.testing.assert_array_equal(self.pop.cr, [0.9, 0.5, 0.9, 0.5])
+
+    def test_concatenate(self):
+        pop = Population.concatenate((self.pop, self.pop[:2]))
+        self.assertEqual(len(pop), 6)
+        np.testing.assert_array_equal(pop.rng, [1.0, 2.0, 3.0, 4.0, 1.0, 2.0])
+
+    def test_get_best(self):
+        algo = Algorithm()
+        xb, fxb = algo.get_best(self.pop, self.pop.f)
+        np.testing.assert_array_equal(xb, self.x[0])
+        self.assertEqual(fxb, 0)
+
+
 def init_pop_numpy(task, population_size, **_kwargs):
     r"""Custom population initialization function for numpy individual type.
 
@@ -1,5 +1,10 @@
 # encoding=utf8
+import numpy as np
+
 from niapy.algorithms.other.aso import AnarchicSocietyOptimization, elitism, sequential, crossover
+from niapy.problems import Sphere
+from niapy.task import Task
+from niapy.util.spatial import KDTree
 from tests.test_algorithm import AlgorithmTestCase, MyProblem
 
 
@@ -18,6 +23,14 @@ class ASOElitismTestCase(AlgorithmTestCase):
         aso_griewankc = self.algo(population_size=10, combination=elitism, seed=self.seed)
         AlgorithmTestCase.test_algorithm_run(self, aso_griewank, aso_griewankc)
 
+    def test_neighbor_index(self):
+        results = []
+        for neighbor_index in (None, KDTree):
+            algo = self.algo(population_size=30, nl=0.3, combination=elitism, neighbor_index=neighbor_index, seed=self.seed)
+            results.append(algo.run(Task(problem=Sphere(4), max_iters=10)))
+        self.assertTrue(np.allclose(results[0][0], results[1][0]))
+        self.assertAlmostEqual(results[0][1], results[1][1])
+
 
 class ASOSequentialTestCase(AlgorithmTestCase):
     def setUp(self):
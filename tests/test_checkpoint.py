@@ -0,0 +1,54 @@
+# encoding=utf8
+import os
+import tempfile
+from unittest import TestCase
+
+import numpy as np
+
+from niapy.algorithms.basic import DifferentialEvolution, ParticleSwarmAlgorithm
+from niapy.algorithms.modified import SuccessHistoryAdaptiveDifferentialEvolution
+from niapy.checkpoint import Checkpointer, load_checkpoint
+from niapy.task import Task
+
+
+class CheckpointTestCase(TestCase):
+    def setUp(self):
+        self.dir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.dir.name, 'run.ckpt')
+
+    def tearDown(self):
+        self.dir.cleanup()
+
+    def assert_resume(self, factory):
+        full_task = Task(problem='rastrigin', dimension=5, max_iters=20)
+        best_x, best_f = factory().run(full_task)
+        checkpointer = Checkpointer(self.path, every_iters=4)
+        factory().run(Task(problem='rastrigin', dimension=5, max_iters=10), checkpointer)
+        self.assertEqual(2, checkpointer.saved)
+        self.assertEqual(8, load_checkpoint(self.path)['task']['iters'])
+        task = Task(problem='rastrigin', dimension=5, max_iters=20)
+        resumed_x, resumed_f = factory(seed=123).resume(self.path, task)
+        self.assertEqual(best_f, resumed_f)
+        self.assertTrue(np.array_equal(best_x, resumed_x))
+        self.assertEqual(full_task.evals, task.evals)
+        for a, b in zip(full_task.convergence_data(), task.convergence_data()):
+            self.assertTrue(np.array_equal(a, b))
+
+    def test_resume_de(self):
+        self.assert_resume(lambda seed=1: DifferentialEvolution(population_size=10, seed=seed))
+
+    def test_resume_pso(self):
+        self.assert_resume(lambda seed=1: ParticleSwarmAlgorithm(population_size=10, seed=seed))
+
+    def test_resume_shade(self):
+        self.assert_resume(lambda seed=1: SuccessHistoryAdaptiveDifferentialEvolution(population_size=10, seed=seed))
+
+    def test_resume_wrong_algorithm(self):
+        DifferentialEvolution(population_size=10, seed=1).run(Task(problem='sphere', dimension=5, max_iters=2), Checkpointer(self.path))
+        self.assertRaises(ValueError, lambda: ParticleSwarmAlgorithm(seed=1).resume(self.path, Task(problem='sphere', dimension=5, max_iters=4)))
+
+    def test_every_seconds(self):
+        checkpointer = Checkpointer(self.path, every_seconds=3600)
+        DifferentialEvolution(population_size=10, seed=1).run(Task(problem='sphere', dimension=5, max_iters=5), checkpointer)
+        self.assertEqual(0, checkpointer.saved)
+        self.assertFalse(os.path.exists(self.path))
@@ -1,8 +1,12 @@
 # encoding=utf8
 
+import numpy as np
+from numpy.random import default_rng
+
 from niapy.algorithms.basic import DifferentialEvolution, DynNpDifferentialEvolution, AgingNpDifferentialEvolution, \
     MultiStrategyDifferentialEvolution, DynNpMultiStrategyDifferentialEvolution
-from niapy.algorithms.basic.de import cross_rand1, cross_rand2, cross_best1, cross_best2, cross_curr2rand1, cross_curr2best1
+from niapy.algorithms.basic.de import cross_rand1, cross_rand2, cross_best1, cross_best2, cross_curr2rand1, cross_curr2best1, \
+    batch_strategy, random_indices
 from tests.test_algorithm import AlgorithmTestCase, MyProblem
 
 
@@ -51,6 +55,39 @@ class DETestCase(AlgorithmTestCase):
         de_curr2best1c = self.algo(population_size=10, strategy=cross_curr2best1, seed=self.seed)
         AlgorithmTestCase.test_algorithm_run(self, de_curr2best1, de_curr2best1c)
 
+    def test_batch(self):
+        for strategy in (cross_rand1, cross_best1, cross_rand2, cross_best2, cross_curr2rand1, cross_curr2best1):
+            de_batch = self.algo(population_size=10, strategy=strategy, batch=True, seed=self.seed)
+            de_batchc = self.algo(population_size=10, strategy=strategy, batch=True, seed=self.seed)
+            AlgorithmTestCase.test_algorithm_run(self, de_batch, de_batchc)
+
+    def test_batch_strategies(self):
+        rng = default_rng(self.seed)
+        pop = rng.uniform(-10, 10, (10, 5))
+        for strategy in (cross_rand1, cross_best1, cross_rand2, cross_best2, cross_curr2rand1, cross_curr2best1):
+            trials = batch_strategy(strategy)(pop, 0.5, np.full(10, 0.9), rng, x_b=pop[0])
+            self.assertEqual(trials.shape, pop.shape)
+            self.assertTrue(np.all(np.any(trials != pop, axis=1)))
+
+    def test_batch_custom_strategy(self):
+        def towards_best(pop, ic, f, cr, generator, x_b=None, **_kwargs):
+            return pop[ic] + f * generator.random() * (x_b - pop[ic])
+
+        rng = default_rng(self.seed)
+        pop = rng.uniform(-10, 10, (10, 5))
+        trials = batch_strategy(towards_best)(pop, 0.5, 0.9, rng, x_b=pop[0])
+        self.assertEqual(trials.shape, pop.shape)
+        self.assertTrue(np.array_equal(pop[0], trials[0]))
+        de_custom = self.algo(population_size=10, strategy=towards_best, batch=True, seed=self.seed)
+        de_customc = self.algo(population_size=10, strategy=towards_best, batch=True, seed=self.seed)
+        AlgorithmTestCase.test_algorithm_run(self, de_custom, de_customc)
+
+    def test_random_indices(self):
+        r = random_indices(10, 5, default_rng(self.seed))
+        self.assertEqual(r.shape, (10, 5))
+        self.assertTrue(np.all(r != np.arange(10)[:, np.newaxis]))
+        self.assertTrue(all(len(set(row)) == 5 for row in r))
+
 
 class DynNpDETestCase(AlgorithmTestCase):
     def setUp(self):
@@ -67,12 +104,20 @@ class DynNpDETestCase(AlgorithmTestCase):
         de_griewankc = self.algo(population_size=10, crossover_probability=0.5, differential_weight=0.9, seed=self.seed)
         AlgorithmTestCase.test_algorithm_run(self, de_griewank, de_griewankc, 'griewank')
 
+    def test_batch(self):
+        de_batch = self.algo(population_size=10, batch=True, seed=self.seed)
+        de_batchc = self.algo(population_size=10, batch=True, seed=self.seed)
+        AlgorithmTestCase.test_algorithm_run(self, de_batch, de_batchc, 'griewank')
+
 
 class ANpDETestCase(AlgorithmTestCase):
     def setUp(self):
         AlgorithmTestCase.setUp(self)
         self.algo = AgingNpDifferentialEvolution
 
+    def test_batch_not_supported(self):
+        self.assertRaises(ValueError, self.algo, population_size=10, batch=True)
+
     def test_Custom(self):
         de_custom = self.algo(population_size=10, differential_weight=0.5, crossover_probability=0.9, seed=self.seed)
         de_customc = self.algo(population_size=10, differential_weight=0.5, crossover_probability=0.9, seed=self.seed)
@@ -99,6 +144,11 @@ class MsDETestCase(AlgorithmTestCase):
         de_griewankc = MultiStrategyDifferentialEvolution(population_size=10, crossover_probability=0.5, differential_weight=0.9, seed=self.seed)
         AlgorithmTestCase.test_algorithm_run(self, de_griewank, de_griewankc, 'griewank')
 
+    def test_batch(self):
+        de_batch = self.algo(population_size=10, batch=True, seed=self.seed)
+        de_batchc = self.algo(population_size=10, batch=True, seed=self.seed)
+        AlgorithmTestCase.test_algorithm_run(self, de_batch, de_batchc, 'griewank')
+
 
 class DynNpMsDETestCase(AlgorithmTestCase):
     def setUp(self):
@@ -114,3 +164,8 @@ class DynNpMsDETestCase(AlgorithmTestCase):
         de_griewank = self.algo(population_size=10, crossover_probability=0.5, differential_weight=0.9, seed=self.seed)
         de_griewankc = self.algo(population_size=10, crossover_probability=0.5, differential_weight=0.9, seed=self.seed)
         AlgorithmTestCase.test_algorithm_run(self, de_griewank, de_griewankc, 'griewank')
+
+    def test_batch(self):
+        de_batch = self.algo(population_size=10, batch=True, seed=self.seed)
+        de_batchc = self.algo(population_size=10, batch=True, seed=self.seed)
+        AlgorithmTestCase.test_algorithm_run(self, de_batch, de_batchc, MyProblem())
@@ -0,0 +1,155 @@
+# encoding=utf8
+import asyncio
+import pickle
+from unittest import TestCase
+
+import numpy as np
+from numpy.random import default_rng
+
+from niapy.algorithms.basic import DifferentialEvolution
+from niapy.evaluators import Evaluator, ThreadPoolEvaluator, ProcessPoolEvaluator, SharedMemoryEvaluator, AsyncEvaluator
+from niapy.task import Task
+from tests.test_algorithm import MyProblem
+
+
+class MyAsyncProblem(MyProblem):
+    def __init__(self, dimension=10, *_args, **_kwargs):
+        super().__init__(dimension)
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def _evaluate_async(self, x):
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        await asyncio.sleep(0.001)
+        self.in_flight -= 1
+        return self._evaluate(x)
+
+
+class EvaluatorTestCase(TestCase):
+    def setUp(self):
+        self.problem = MyProblem(dimension=10)
+        self.population = default_rng(1).uniform(self.problem.lower, self.problem.upper, (25, 10))
+        self.expected = self.problem.evaluate_batch(self.population)
+        self.evaluator = Evaluator()
+
+    def tearDown(self):
+        self.evaluator.close()
+
+    def test_evaluate(self):
+        self.assertTrue(np.array_equal(self.expected, self.evaluator.evaluate(self.problem, self.population)))
+
+    def test_evaluate_single(self):
+        self.assertTrue(np.array_equal(self.expected[:1], self.evaluator.evaluate(self.problem, self.population[:1])))
+
+    def test_task_eval_batch_budget(self):
+        task = Task(problem=self.problem, max_evals=20, evaluator=self.evaluator)
+        fitness = task.eval_batch(self.population)
+        self.assertEqual(20, task.evals)
+        self.assertTrue(np.array_equal(self.expected[:20], fitness[:20]))
+        self.assertTrue(np.all(fitness[20:] == np.inf))
+
+    def test_algorithm_run(self):
+        serial_task = Task(problem=self.problem, max_evals=500)
+        task = Task(problem=self.problem, max_evals=500, evaluator=self.evaluator)
+        x, fx = DifferentialEvolution(population_size=20, seed=1).run(serial_task)
+        y, fy = DifferentialEvolution(population_size=20, seed=1).run(task)
+        self.assertTrue(np.array_equal(x, y))
+        self.assertEqual(fx, fy)
+        self.assertEqual(serial_task.evals, task.evals)
+        self.assertTrue(np.array_equal(serial_task.n_evals, task.n_evals))
+
+
+class ThreadPoolEvaluatorTestCase(EvaluatorTestCase):
+    def setUp(self):
+        super().setUp()
+        self.evaluator = ThreadPoolEvaluator(max_workers=3)
+
+    def test_chunk_size(self):
+        evaluator = ThreadPoolEvaluator(max_workers=2, chunk_size=4)
+        with evaluator:
+            self.assertTrue(np.array_equal(self.expected, evaluator.evaluate(self.problem, self.population)))
+        self.assertIsNone(evaluator._executor)
+
+    def test_reuse(self):
+        self.evaluator.evaluate(self.problem, self.population)
+        executor = self.evaluator.executor
+        self.evaluator.evaluate(self.problem, self.population)
+        self.assertIs(executor, self.evaluator.executor)
+
+
+class ProcessPoolEvaluatorTestCase(EvaluatorTestCase):
+    def setUp(self):
+        super().setUp()
+        self.evaluator = ProcessPoolEvaluator(max_workers=2)
+
+
+class SharedMemoryEvaluatorTestCase(EvaluatorTestCase):
+    def setUp(self):
+        super().setUp()
+        self.evaluator = SharedMemoryEvaluator(max_workers=2)
+
+    def test_shared_buffer(self):
+        shared = self.evaluator.buffer(30, 10)
+        shared.x[:25] = self.population
+        fitness = self.evaluator.evaluate(self.problem, shared.x[:25])
+        self.assertIs(shared, self.evaluator.shared)
+        self.assertTrue(np.array_equal(self.expected, fitness))
+        self.assertTrue(np.array_equal(self.expected, shared.population(25).f))
+        self.assertTrue(np.array_equal(self.population, shared.population(25).x))
+
+    def test_grow(self):
+        self.evaluator.evaluate(self.problem, self.population[:5])
+        small = self.evaluator.shared
+        self.assertTrue(np.array_equal(self.expected, self.evaluator.evaluate(self.problem, self.population)))
+        self.assertIsNot(small, self.evaluator.shared)
+        self.assertEqual(25, self.evaluator.shared.size)
+
+    def test_pickle(self):
+        self.evaluator.evaluate(self.problem, self.population)
+        copy = pickle.loads(pickle.dumps(self.evaluator))
+        with copy:
+            self.assertIsNone(copy.shared)
+            self.assertTrue(np.array_equal(self.expected, copy.evaluate(self.problem, self.population)))
+
+
+class AsyncEvaluatorTestCase(TestCase):
+    def setUp(self):
+        self.problem = MyAsyncProblem(dimension=10)
+        self.population = default_rng(1).uniform(self.problem.lower, self.problem.upper, (25, 10))
+        self.expected = self.problem.evaluate_batch(self.population)
+
+    def test_evaluate_async(self):
+        evaluator = AsyncEvaluator(max_concurrency=4)
+        fitness = asyncio.run(evaluator.evaluate_async(self.problem, self.population))
+        self.assertTrue(np.array_equal(self.expected, fitness))
+        self.assertEqual(4, self.problem.max_in_flight)
+
+    def test_evaluate_without_loop(self):
+        self.assertRaises(RuntimeError, AsyncEvaluator().evaluate, self.problem, self.population)
+
+    def test_task_eval_batch_async(self):
+        task = Task(problem=self.problem, max_evals=20)
+        fitness = asyncio.run(task.eval_batch_async(self.population, max_concurrency=8))
+        self.assertEqual(20, task.evals)
+        self.assertTrue(np.array_equal(self.expected[:20], fitness[:20]))
+        self.assertTrue(np.all(fitness[20:] == np.inf))
+        self.assertEqual(8, self.problem.max_in_flight)
+
+    def test_run_async(self):
+        serial_task = Task(problem=MyProblem(dimension=10), max_evals=300)
+        task = Task(problem=self.problem, max_evals=300)
+        x, fx = DifferentialEvolution(population_size=20, seed=1).run(serial_task)
+        y, fy = asyncio.run(DifferentialEvolution(population_size=20, seed=1).run_async(task, max_concurrency=5))
+        self.assertTrue(np.array_equal(x, y))
+        self.assertEqual(fx, fy)
+        self.assertEqual(300, task.evals)
+        self.assertTrue(np.array_equal(serial_task.n_evals, task.n_evals))
+        self.assertEqual(5, self.problem.max_in_flight)
+        self.assertIsInstance(task.evaluator, Evaluator)
+        self.assertNotIsInstance(task.evaluator, AsyncEvaluator)
+
+    def test_run_async_raises(self):
+        task = Task(problem=self.problem, max_evals=300)
+        algorithm = DifferentialEvolution(population_size=20, seed=1, strategy=None)
+        self.assertRaises(TypeError, asyncio.run, algorithm.run_async(task))
@@ -1,4 +1,6 @@
 from niapy.algorithms.basic import FireflyAlgorithm
+from niapy.problems import Sphere
+from niapy.task import Task
 from tests.test_algorithm import AlgorithmTestCase, MyProblem
 
 
@@ -16,3 +18,14 @@ class FATestCase(AlgorithmTestCase):
         fa_griewank = self.algo(population_size=10, alpha=0.5, beta0=0.2, gamma=1.0, seed=self.seed)
         fa_griewankc = self.algo(population_size=10, alpha=0.5, beta0=0.2, gamma=1.0, seed=self.seed)
         AlgorithmTestCase.test_algorithm_run(self, fa_griewank, fa_griewankc)
+
+    def test_vectorized(self):
+        fa = self.algo(population_size=10, alpha=0.5, beta0=0.2, gamma=1.0, sequential=False, seed=self.seed)
+        fac = self.algo(population_size=10, alpha=0.5, beta0=0.2, gamma=1.0, sequential=False, seed=self.seed)
+        AlgorithmTestCase.test_algorithm_run(self, fa, fac, MyProblem())
+
+    def test_vectorized_evaluations(self):
+        task = Task(problem=Sphere(5), max_iters=3)
+        fa = self.algo(population_size=8, sequential=False, seed=self.seed)
+        fa.run(task)
+        self.assertEqual(task.evals, 8 * 4)
@@ -1,7 +1,17 @@
 # encoding=utf8
+from functools import partial
+from unittest import TestCase
+
+import numpy as np
+from numpy.random import default_rng
+
 from niapy.algorithms.basic import GeneticAlgorithm
 from niapy.algorithms.basic.ga import two_point_crossover, multi_point_crossover, creep_mutation, roulette_selection, \
-    crossover_uros, mutation_uros
+    mutation_uros, tournament_selection, uniform_crossover, uniform_mutation, two_point_crossover_batch, \
+    multi_point_crossover_batch, creep_mutation_batch, roulette_selection_batch, crossover_uros_batch, mutation_uros_batch, \
+    tournament_selection_batch, uniform_crossover_batch, uniform_mutation_batch, adapt_selection, adapt_crossover, \
+    adapt_mutation
+from niapy.task import Task
 from tests.test_algorithm import AlgorithmTestCase, MyProblem
 
 
@@ -21,61 +31,122 @@ class GATestCase(AlgorithmTestCase):
         AlgorithmTestCase.test_algorithm_run(self, ga_griewank, ga_griewankc)
 
     def test_two_point_crossover_fine_c(self):
-        ga_tpcr = self.algo(population_size=10, tournament_size=4, mutation_rate=0.05, crossover_rate=0.4, crossover=two_point_crossover, seed=self.seed)
-        ga_tpcrc = self.algo(population_size=10, tournament_size=4, mutation_rate=0.05, crossover_rate=0.4, crossover=two_point_crossover, seed=self.seed)
+        ga_tpcr = self.algo(population_size=10, tournament_size=4, mutation_rate=0.05, crossover_rate=0.4, crossover=two_point_crossover_batch, seed=self.seed)
+        ga_tpcrc = self.algo(population_size=10, tournament_size=4, mutation_rate=0.05, crossover_rate=0.4, crossover=two_point_crossover_batch, seed=self.seed)
         AlgorithmTestCase.test_algorithm_run(self, ga_tpcr, ga_tpcrc, MyProblem())
 
     def test_two_point_crossover(self):
-        ga_tpcr = self.algo(population_size=10, tournament_size=4, mutation_rate=0.05, crossover_rate=0.4, crossover=two_point_crossover, seed=self.seed)
-        ga_tpcrc = self.algo(population_size=10, tournament_size=4, mutation_rate=0.05, crossover_rate=0.4, crossover=two_point_crossover, seed=self.seed)
+        ga_tpcr = self.algo(population_size=10, tournament_size=4, mutation_rate=0.05, crossover_rate=0.4, crossover=two_point_crossover_batch, seed=self.seed)
+        ga_tpcrc = self.algo(population_size=10, tournament_size=4, mutation_rate=0.05, crossover_rate=0.4, crossover=two_point_crossover_batch, seed=self.seed)
         AlgorithmTestCase.test_algorithm_run(self, ga_tpcr, ga_tpcrc)
 
     def test_multi_point_crossover_fine_c(self):
-        ga_mpcr = self.algo(population_size=10, tournament_size=4, mutation_rate=0.05, crossover_rate=4, crossover=multi_point_crossover, seed=self.seed)
-        ga_mpcrc = self.algo(population_size=10, tournament_size=4, mutation_rate=0.05, crossover_rate=4, crossover=multi_point_crossover, seed=self.seed)
+        ga_mpcr = self.algo(population_size=10, tournament_size=4, mutation_rate=0.05, crossover=partial(multi_point_crossover_batch, n_points=4), seed=self.seed)
+        ga_mpcrc = self.algo(population_size=10, tournament_size=4, mutation_rate=0.05, crossover=partial(multi_point_crossover_batch, n_points=4), seed=self.seed)
         AlgorithmTestCase.test_algorithm_run(self, ga_mpcr, ga_mpcrc, MyProblem())
 
     def test_multi_point_crossover(self):
-        ga_mpcr = self.algo(population_size=10, tournament_size=4, mutation_rate=0.05, crossover_rate=4, crossover=multi_point_crossover, seed=self.seed)
-        ga_mpcrc = self.algo(population_size=10, tournament_size=4, mutation_rate=0.05, crossover_rate=4, crossover=multi_point_crossover, seed=self.seed)
+        ga_mpcr = self.algo(population_size=10, tournament_size=4, mutation_rate=0.05, crossover=partial(multi_point_crossover_batch, n_points=4), seed=self.seed)
+        ga_mpcrc = self.algo(population_size=10, tournament_size=4, mutation_rate=0.05, crossover=partial(multi_point_crossover_batch, n_points=4), seed=self.seed)
         AlgorithmTestCase.test_algorithm_run(self, ga_mpcr, ga_mpcrc)
 
     def test_creep_mutation_fine_c(self):
-        ga_crmt = self.algo(population_size=10, tournament_size=4, mutation_rate=0.05, crossover_rate=0.4, mutation=creep_mutation, seed=self.seed)
-        ga_crmtc = self.algo(population_size=10, tournament_size=4, mutation_rate=0.05, crossover_rate=0.4, mutation=creep_mutation, seed=self.seed)
+        ga_crmt = self.algo(population_size=10, tournament_size=4, mutation_rate=0.05, crossover_rate=0.4, mutation=creep_mutation_batch, seed=self.seed)
+        ga_crmtc = self.algo(population_size=10, tournament_size=4, mutation_rate=0.05, crossover_rate=0.4, mutation=creep_mutation_batch, seed=self.seed)
         AlgorithmTestCase.test_algorithm_run(self, ga_crmt, ga_crmtc, MyProblem())
 
     def test_creep_mutation(self):
-        ga_crmt = self.algo(population_size=10, tournament_size=4, mutation_rate=0.05, crossover_rate=0.4, mutation=creep_mutation, seed=self.seed)
-        ga_crmtc = self.algo(population_size=10, tournament_size=4, mutation_rate=0.05, crossover_rate=0.4, mutation=creep_mutation, seed=self.seed)
+        ga_crmt = self.algo(population_size=10, tournament_size=4, mutation_rate=0.05, crossover_rate=0.4, mutation=creep_mutation_batch, seed=self.seed)
+        ga_crmtc = self.algo(population_size=10, tournament_size=4, mutation_rate=0.05, crossover_rate=0.4, mutation=creep_mutation_batch, seed=self.seed)
         AlgorithmTestCase.test_algorithm_run(self, ga_crmt, ga_crmtc)
 
     def test_roulette_selection_c(self):
-        ga_crmt = self.algo(population_size=10, tournament_size=4, mutation_rate=0.05, crossover_rate=0.4, selection=roulette_selection, seed=self.seed)
-        ga_crmtc = self.algo(population_size=10, tournament_size=4, mutation_rate=0.05, crossover_rate=0.4, selection=roulette_selection, seed=self.seed)
+        ga_crmt = self.algo(population_size=10, tournament_size=4, mutation_rate=0.05, crossover_rate=0.4, selection=roulette_selection_batch, seed=self.seed)
+        ga_crmtc = self.algo(population_size=10, tournament_size=4, mutation_rate=0.05, crossover_rate=0.4, selection=roulette_selection_batch, seed=self.seed)
         AlgorithmTestCase.test_algorithm_run(self, ga_crmt, ga_crmtc, MyProblem())
 
     def test_roulette_selection(self):
-        ga_crmt = self.algo(population_size=10, tournament_size=4, mutation_rate=0.05, crossover_rate=0.4, selection=roulette_selection, seed=self.seed)
-        ga_crmtc = self.algo(population_size=10, tournament_size=4, mutation_rate=0.05, crossover_rate=0.4, selection=roulette_selection, seed=self.seed)
+        ga_crmt = self.algo(population_size=10, tournament_size=4, mutation_rate=0.05, crossover_rate=0.4, selection=roulette_selection_batch, seed=self.seed)
+        ga_crmtc = self.algo(population_size=10, tournament_size=4, mutation_rate=0.05, crossover_rate=0.4, selection=roulette_selection_batch, seed=self.seed)
         AlgorithmTestCase.test_algorithm_run(self, ga_crmt, ga_crmtc)
 
     def test_crossover_uros_c(self):
-        ga_crmt = self.algo(population_size=10, tournament_size=4, mutation_rate=0.05, crossover_rate=0.4, crossover=crossover_uros, seed=self.seed)
-        ga_crmtc = self.algo(population_size=10, tournament_size=4, mutation_rate=0.05, crossover_rate=0.4, crossover=crossover_uros, seed=self.seed)
+        ga_crmt = self.algo(population_size=10, tournament_size=4, mutation_rate=0.05, crossover_rate=0.4, crossover=crossover_uros_batch, seed=self.seed)
+        ga_crmtc = self.algo(population_size=10, tournament_size=4, mutation_rate=0.05, crossover_rate=0.4, crossover=crossover_uros_batch, seed=self.seed)
         AlgorithmTestCase.test_algorithm_run(self, ga_crmt, ga_crmtc, MyProblem())
 
     def test_crossover_uros(self):
-        ga_crmt = self.algo(population_size=10, tournament_size=4, mutation_rate=0.05, crossover_rate=0.4, crossover=crossover_uros, seed=self.seed)
-        ga_crmtc = self.algo(population_size=10, tournament_size=4, mutation_rate=0.05, crossover_rate=0.4, crossover=crossover_uros, seed=self.seed)
+        ga_crmt = self.algo(population_size=10, tournament_size=4, mutation_rate=0.05, crossover_rate=0.4, crossover=crossover_uros_batch, seed=self.seed)
+        ga_crmtc = self.algo(population_size=10, tournament_size=4, mutation_rate=0.05, crossover_rate=0.4, crossover=crossover_uros_batch, seed=self.seed)
         AlgorithmTestCase.test_algorithm_run(self, ga_crmt, ga_crmtc)
 
     def test_mutation_uros_c(self):
-        ga_crmt = self.algo(population_size=10, tournament_size=4, mutation_rate=0.05, crossover_rate=0.4, mutation=mutation_uros, seed=self.seed)
-        ga_crmtc = self.algo(population_size=10, tournament_size=4, mutation_rate=0.05, crossover_rate=0.4, mutation=mutation_uros, seed=self.seed)
+        ga_crmt = self.algo(population_size=10, tournament_size=4, mutation_rate=0.05, crossover_rate=0.4, mutation=mutation_uros_batch, seed=self.seed)
+        ga_crmtc = self.algo(population_size=10, tournament_size=4, mutation_rate=0.05, crossover_rate=0.4, mutation=mutation_uros_batch, seed=self.seed)
         AlgorithmTestCase.test_algorithm_run(self, ga_crmt, ga_crmtc, MyProblem())
 
     def test_mutation_uros(self):
-        ga_crmt = self.algo(population_size=10, tournament_size=4, mutation_rate=0.05, crossover_rate=0.4, mutation=mutation_uros, seed=self.seed)
-        ga_crmtc = self.algo(population_size=10, tournament_size=4, mutation_rate=0.05, crossover_rate=0.4, mutation=mutation_uros, seed=self.seed)
+        ga_crmt = self.algo(population_size=10, tournament_size=4, mutation_rate=0.05, crossover_rate=0.4, mutation=mutation_uros_batch, seed=self.seed)
+        ga_crmtc = self.algo(population_size=10, tournament_size=4, mutation_rate=0.05, crossover_rate=0.4, mutation=mutation_uros_batch, seed=self.seed)
         AlgorithmTestCase.test_algorithm_run(self, ga_crmt, ga_crmtc)
+
+    def test_adapters(self):
+        ga_adapted = self.algo(population_size=10, tournament_size=4, mutation_rate=0.05, crossover_rate=0.4, selection=adapt_selection(tournament_selection),
+                               crossover=adapt_crossover(uniform_crossover), mutation=adapt_mutation(uniform_mutation), seed=self.seed)
+        ga_adaptedc = self.algo(population_size=10, tournament_size=4, mutation_rate=0.05, crossover_rate=0.4, selection=adapt_selection(tournament_selection),
+                                crossover=adapt_crossover(uniform_crossover), mutation=adapt_mutation(uniform_mutation), seed=self.seed)
+        AlgorithmTestCase.test_algorithm_run(self, ga_adapted, ga_adaptedc)
+
+    def test_adapters_roulette_two_point_creep(self):
+        ga_adapted = self.algo(population_size=10, mutation_rate=0.05, crossover_rate=0.4, selection=adapt_selection(roulette_selection),
+                               crossover=adapt_crossover(two_point_crossover), mutation=adapt_mutation(creep_mutation), seed=self.seed)
+        ga_adaptedc = self.algo(population_size=10, mutation_rate=0.05, crossover_rate=0.4, selection=adapt_selection(roulette_selection),
+                                crossover=adapt_crossover(two_point_crossover), mutation=adapt_mutation(creep_mutation), seed=self.seed)
+        AlgorithmTestCase.test_algorithm_run(self, ga_adapted, ga_adaptedc)
+
+    def test_adapters_multi_point_uros(self):
+        ga_adapted = self.algo(population_size=10, mutation_rate=0.05, crossover_rate=2, crossover=adapt_crossover(multi_point_crossover),
+                               mutation=adapt_mutation(mutation_uros), seed=self.seed)
+        ga_adaptedc = self.algo(population_size=10, mutation_rate=0.05, crossover_rate=2, crossover=adapt_crossover(multi_point_crossover),
+                                mutation=adapt_mutation(mutation_uros), seed=self.seed)
+        AlgorithmTestCase.test_algorithm_run(self, ga_adapted, ga_adaptedc)
+
+
+class GAOperatorsTestCase(TestCase):
+    def setUp(self):
+        self.rng = default_rng(1)
+        self.task = Task(problem='sphere', dimension=6)
+        self.x = self.rng.uniform(-5, 5, (20, 6))
+        self.fitness = self.task.eval_batch(self.x)
+
+    def test_tournament_selection(self):
+        indices = tournament_selection_batch(self.x, self.fitness, 50, self.rng, tournament_size=20)
+        self.assertEqual((50,), indices.shape)
+        self.assertTrue(np.all(indices == np.argmin(self.fitness)))
+
+    def test_roulette_selection(self):
+        indices = roulette_selection_batch(self.x, self.fitness, 1000, self.rng)
+        self.assertNotIn(np.argmax(self.fitness), indices)
+        self.assertLess(np.mean(self.fitness[indices]), np.mean(self.fitness))
+
+    def test_crossovers(self):
+        for crossover in (uniform_crossover_batch, two_point_crossover_batch, partial(multi_point_crossover_batch, n_points=2)):
+            children = crossover(self.x, self.rng, crossover_rate=0.25)
+            self.assertEqual(self.x.shape, children.shape)
+            for j in range(self.x.shape[1]):
+                self.assertTrue(np.all(np.isin(children[:, j], self.x[:, j])))
+        self.assertEqual(self.x.shape, crossover_uros_batch(self.x, self.rng).shape)
+        self.assertRaises(ValueError, multi_point_crossover_batch, self.x, self.rng, n_points=0)
+
+    def test_mutations(self):
+        for mutation in (uniform_mutation_batch, creep_mutation_batch, mutation_uros_batch):
+            mutated = mutation(self.x, self.task, self.rng, mutation_rate=0.1)
+            self.assertEqual(self.x.shape, mutated.shape)
+            self.assertTrue(np.all((mutated >= self.task.lower) & (mutated <= self.task.upper)))
+        mutated = uniform_mutation_batch(self.x, self.task, self.rng, mutation_rate=0)
+        self.assertTrue(np.all(np.sum(mutated != self.x, axis=1) == 1))
+
+    def test_adapt_selection(self):
+        select = adapt_selection(tournament_selection)
+        indices = select(self.x, self.fitness, 30, self.rng, tournament_size=20)
+        self.assertTrue(np.all(indices == np.argmin(self.fitness)))
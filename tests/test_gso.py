@@ -1,7 +1,12 @@
 # encoding=utf8
 
+import numpy as np
+
 from niapy.algorithms.basic import GlowwormSwarmOptimization, GlowwormSwarmOptimizationV1, GlowwormSwarmOptimizationV2, \
     GlowwormSwarmOptimizationV3
+from niapy.problems import Sphere
+from niapy.task import Task
+from niapy.util.spatial import KDTree, GridIndex
 from tests.test_algorithm import AlgorithmTestCase, MyProblem
 
 
@@ -20,6 +25,15 @@ class GSOTestCase(AlgorithmTestCase):
         gso_griewankc = self.algo(population_size=10, a=5, Rmin=0.01, Rmax=3, seed=self.seed)
         AlgorithmTestCase.test_algorithm_run(self, gso_griewank, gso_griewankc)
 
+    def test_neighbor_index(self):
+        results = []
+        for neighbor_index in (None, KDTree, GridIndex):
+            algo = self.algo(population_size=30, neighbor_index=neighbor_index, seed=self.seed)
+            results.append(algo.run(Task(problem=Sphere(3), max_iters=20)))
+        for x, fx in results[1:]:
+            self.assertTrue(np.allclose(x, results[0][0]))
+            self.assertAlmostEqual(fx, results[0][1])
+
 
 class GSOv1TestCase(AlgorithmTestCase):
     def setUp(self):
@@ -21,6 +21,11 @@ class DEMTSTestCase(AlgorithmTestCase):
         ca_griewankc = self.algo(population_size=10, num_tests=1, num_searches=2, num_enabled=2, seed=self.seed)
         AlgorithmTestCase.test_algorithm_run(self, ca_griewank, ca_griewankc, max_iters=100)
 
+    def test_block_size(self):
+        ca_block = self.algo(population_size=10, num_tests=1, num_searches=2, num_enabled=2, block_size=4, seed=self.seed)
+        ca_blockc = self.algo(population_size=10, num_tests=1, num_searches=2, num_enabled=2, block_size=4, seed=self.seed)
+        AlgorithmTestCase.test_algorithm_run(self, ca_block, ca_blockc, MyProblem(), max_iters=100)
+
 
 class DEMTSv1TestCase(AlgorithmTestCase):
     def setUp(self):
@@ -0,0 +1,52 @@
+# encoding=utf8
+import json
+import os
+import subprocess
+import sys
+from unittest import TestCase
+
+import niapy
+import niapy.algorithms.basic as basic
+
+HEAVY = ('pandas', 'matplotlib', 'asyncio', 'niapy.runner', 'niapy.algorithms.basic.de', 'niapy.algorithms.basic.pso', 'niapy.problems.ackley')
+
+
+def import_in_subprocess(statement):
+    r"""Run import statement in a fresh interpreter.
+
+    Args:
+        statement (str): Import statement.
+
+    Returns:
+        List[str]: Heavy modules loaded by the statement.
+
+    """
+    code = '\n'.join([
+        'import json, sys',
+        statement,
+        'print(json.dumps([name for name in %r if name in sys.modules]))' % (HEAVY,)
+    ])
+    src = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'src')
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(filter(None, (src, os.environ.get('PYTHONPATH')))))
+    output = subprocess.run([sys.executable, '-c', code], env=env, capture_output=True, text=True, check=True).stdout
+    return json.loads(output)
+
+
+class ImportTestCase(TestCase):
+    def test_import_niapy(self):
+        self.assertEqual([], import_in_subprocess('import niapy'))
+
+    def test_import_task(self):
+        self.assertEqual([], import_in_subprocess('from niapy.task import Task; Task(problem="sphere", dimension=5)'))
+
+    def test_get_algorithm(self):
+        loaded = import_in_subprocess('from niapy.util.factory import get_algorithm; get_algorithm("DifferentialEvolution")')
+        self.assertEqual(['niapy.algorithms.basic.de'], loaded)
+
+    def test_runner(self):
+        self.assertEqual(['niapy.runner'], import_in_subprocess('from niapy import Runner'))
+
+    def test_lazy_attributes(self):
+        self.assertIs(niapy.algorithms.basic.DifferentialEvolution, basic.DifferentialEvolution)
+        self.assertIn('ParticleSwarmAlgorithm', dir(basic))
+        self.assertRaises(AttributeError, getattr, basic, 'NoSuchAlgorithm')
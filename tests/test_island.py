@@ -0,0 +1,63 @@
+# encoding=utf8
+import os
+import tempfile
+
+import numpy as np
+
+from niapy.algorithms.basic import DifferentialEvolution, GeneticAlgorithm, ParticleSwarmAlgorithm
+from niapy.algorithms.other import IslandModel
+from niapy.checkpoint import Checkpointer
+from niapy.task import Task
+from tests.test_algorithm import AlgorithmTestCase, MyProblem
+
+
+class IslandModelTestCase(AlgorithmTestCase):
+    def setUp(self):
+        AlgorithmTestCase.setUp(self)
+        self.algo = IslandModel
+
+    def test_custom(self):
+        im_custom = self.algo(algorithm=DifferentialEvolution(population_size=10), n_islands=3, migration_interval=5, seed=self.seed)
+        im_customc = self.algo(algorithm=DifferentialEvolution(population_size=10), n_islands=3, migration_interval=5, seed=self.seed)
+        AlgorithmTestCase.test_algorithm_run(self, im_custom, im_customc, MyProblem())
+
+    def test_griewank(self):
+        im_griewank = self.algo(algorithm='ParticleSwarmAlgorithm', topology='star', seed=self.seed)
+        im_griewankc = self.algo(algorithm='ParticleSwarmAlgorithm', topology='star', seed=self.seed)
+        AlgorithmTestCase.test_algorithm_run(self, im_griewank, im_griewankc)
+
+    def test_random_topology(self):
+        im = self.algo(algorithm=GeneticAlgorithm(population_size=10), topology='random', migration_size=2, seed=self.seed)
+        imc = self.algo(algorithm=GeneticAlgorithm(population_size=10), topology='random', migration_size=2, seed=self.seed)
+        AlgorithmTestCase.test_algorithm_run(self, im, imc)
+
+    def test_shared_budget(self):
+        task = Task(problem='sphere', dimension=10, max_evals=1003)
+        _, best_f = self.algo(algorithm=DifferentialEvolution(population_size=10), n_islands=4, seed=self.seed).run(task)
+        self.assertEqual(1003, task.evals)
+        self.assertEqual(best_f, task.x_f)
+        self.assertEqual(best_f, task.fitness_evals[-1])
+
+    def test_processes(self):
+        tasks = [Task(problem='rastrigin', dimension=5, max_evals=2000) for _ in range(2)]
+        x, fx = self.algo(algorithm=ParticleSwarmAlgorithm(population_size=10), n_jobs=1, seed=self.seed).run(tasks[0])
+        y, fy = self.algo(algorithm=ParticleSwarmAlgorithm(population_size=10), n_jobs=4, seed=self.seed).run(tasks[1])
+        self.assertEqual(fx, fy)
+        self.assertTrue(np.array_equal(x, y))
+        self.assertEqual(tasks[0].evals, tasks[1].evals)
+        self.assertTrue(np.array_equal(tasks[0].n_evals, tasks[1].n_evals))
+
+    def test_resume(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'run.ckpt')
+            full_task = Task(problem='rastrigin', dimension=5, max_iters=6)
+            best_x, best_f = self.algo(n_jobs=2, seed=self.seed).run(full_task)
+            self.algo(n_jobs=2, seed=self.seed).run(Task(problem='rastrigin', dimension=5, max_iters=3), Checkpointer(path, every_iters=3))
+            task = Task(problem='rastrigin', dimension=5, max_iters=6)
+            resumed_x, resumed_f = self.algo(n_jobs=2).resume(path, task)
+        self.assertEqual(best_f, resumed_f)
+        self.assertTrue(np.array_equal(best_x, resumed_x))
+        self.assertEqual(full_task.evals, task.evals)
+
+    def test_unknown_topology(self):
+        self.assertRaises(ValueError, self.algo(topology='grid', seed=self.seed).run, Task(problem='sphere', dimension=5, max_iters=2))
@@ -1,6 +1,7 @@
 # encoding=utf8
 from unittest import TestCase
 
+import numpy as np
 from numpy.random import default_rng
 
 from niapy.algorithms.modified import SelfAdaptiveDifferentialEvolution, \
@@ -46,6 +47,13 @@ class JDETestCase(AlgorithmTestCase):
                                                           crossover_probability=0.1, seed=self.seed)
         AlgorithmTestCase.test_algorithm_run(self, jde_griewank, jde_griewankc)
 
+    def test_init_population(self):
+        jde = SelfAdaptiveDifferentialEvolution(population_size=10, differential_weight=0.5, crossover_probability=0.1,
+                                                seed=self.seed)
+        pop, _, _ = jde.init_population(Task(problem=MyProblem(10)))
+        self.assertTrue(np.all(pop.differential_weight == SolutionJDE().differential_weight))
+        self.assertTrue(np.all(pop.crossover_probability == SolutionJDE().crossover_probability))
+
 
 class MsjDETestCase(AlgorithmTestCase):
     def test_custom(self):
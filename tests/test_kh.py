@@ -1,5 +1,10 @@
 # encoding=utf8
+import numpy as np
+
 from niapy.algorithms.basic import KrillHerd
+from niapy.problems import Sphere
+from niapy.task import Task
+from niapy.util.spatial import KDTree
 from tests.test_algorithm import AlgorithmTestCase, MyProblem
 
 
@@ -29,3 +34,39 @@ class KHTestCase(AlgorithmTestCase):
         kh_griewank = self.algo(population_size=10, C_a=5, C_r=0.5, seed=self.seed)
         kh_griewankc = self.algo(population_size=10, C_a=5, C_r=0.5, seed=self.seed)
         AlgorithmTestCase.test_algorithm_run(self, kh_griewank, kh_griewankc)
+
+    def test_neighbor_index(self):
+        results = []
+        for neighbor_index in (None, KDTree):
+            algo = self.algo(population_size=30, neighbor_index=neighbor_index, seed=self.seed)
+            results.append(algo.run(Task(problem=Sphere(4), max_iters=10)))
+        self.assertTrue(np.allclose(results[0][0], results[1][0]))
+        self.assertAlmostEqual(results[0][1], results[1][1])
+
+    def test_operators(self):
+        algo = self.algo(population_size=4, seed=self.seed)
+        x, xo = np.zeros((4, 3)), np.ones((4, 3))
+        crossed = algo.crossover(x, xo, np.asarray([0.0, 0.0, 1.0, 1.0]))
+        self.assertTrue(np.array_equal(np.repeat([[0.0], [0.0], [1.0], [1.0]], 3, axis=1), crossed))
+        mutated = algo.mutate(x, np.full(3, 10.0), np.asarray([2.0, 2.0, 0.0, 0.0]))
+        self.assertTrue(np.all(mutated[:2] == 0))
+        self.assertTrue(np.all((mutated[2:] >= 10) & (mutated[2:] < 11)))
+
+    def test_neighbours(self):
+        algo = self.algo(population_size=30, seed=self.seed)
+        population = algo.uniform(-5, 5, (30, 4))
+        krill, neighbors = algo.get_neighbours(population)
+        self.assertTrue(np.all(np.bincount(krill, minlength=30) > 0))
+        self.assertEqual(len(krill), len(neighbors))
+
+    def test_neighbors_motion(self):
+        task = Task(problem=Sphere(2), max_iters=10)
+        algo = self.algo(population_size=3, n_max=0.01, seed=self.seed)
+        algo.get_neighbours = lambda population: (np.asarray([0, 0, 1]), np.asarray([1, 2, 0]))
+        algo.random = lambda size=None: np.zeros(size)
+        population = np.asarray([[0.0, 0.0], [3.0, 4.0], [0.0, 1.0]])
+        population_fitness = np.asarray([0.0, 25.0, 1.0])
+        # alpha_l: krill 0 gets -1 * (0.6 + 0.8) - 0.04 * (0 + 1), krill 1 gets 1 * (-0.6 - 0.8), krill 2 has no neighbours.
+        motion = algo.induce_neighbors_motion(np.ones((3, 2)), 0.5, population, population_fitness, 0, 1, task)
+        expected = 0.01 * (np.asarray([-1.44, -1.4, 0.0]) + 2) + 0.5
+        self.assertTrue(np.allclose(np.repeat(expected[:, np.newaxis], 2, axis=1), motion))
@@ -1,5 +1,9 @@
 # encoding=utf8
-from niapy.algorithms.other import MultipleTrajectorySearch, MultipleTrajectorySearchV1
+import numpy as np
+from numpy.random import default_rng
+
+from niapy.algorithms.other import MultipleTrajectorySearch, MultipleTrajectorySearchV1, mts_ls1, mts_ls1v1, mts_ls2, mts_ls3
+from niapy.task import Task
 from tests.test_algorithm import AlgorithmTestCase, MyProblem
 
 
@@ -18,6 +22,26 @@ class MTSTestCase(AlgorithmTestCase):
         mts_griewankc = self.algo(population_size=10, C_a=5, C_r=0.5, seed=self.seed)
         AlgorithmTestCase.test_algorithm_run(self, mts_griewank, mts_griewankc, max_iters=100)
 
+    def test_block_size(self):
+        mts_block = self.algo(population_size=10, block_size=4, seed=self.seed)
+        mts_blockc = self.algo(population_size=10, block_size=4, seed=self.seed)
+        AlgorithmTestCase.test_algorithm_run(self, mts_block, mts_blockc, MyProblem(), max_iters=100)
+
+    def test_block_local_searches(self):
+        for local_search in (mts_ls1, mts_ls1v1, mts_ls2, mts_ls3):
+            task = Task(problem='sphere', dimension=20)
+            rng = default_rng(self.seed)
+            x = rng.uniform(task.lower, task.upper, task.dimension)
+            x_f = task.eval(x)
+            new_x, new_f, best_x, best_f, _, grade, _ = local_search(x.copy(), x_f, x.copy(), x_f, True, task.range / 4,
+                                                                      task, rng, block_size=8)
+            self.assertLess(new_f, x_f)
+            self.assertEqual(new_f, task.eval(new_x))
+            self.assertEqual(best_f, task.eval(best_x))
+            self.assertEqual(best_f, task.x_f)
+            self.assertGreater(grade, 0)
+            self.assertTrue(np.all(task.is_feasible(new_x)))
+
 
 class MTSv1TestCase(AlgorithmTestCase):
     def setUp(self):
@@ -33,3 +57,8 @@ class MTSv1TestCase(AlgorithmTestCase):
         mts_griewank = self.algo(population_size=10, C_a=5, C_r=0.5, seed=self.seed)
         mts_griewankc = self.algo(population_size=10, C_a=5, C_r=0.5, seed=self.seed)
         AlgorithmTestCase.test_algorithm_run(self, mts_griewank, mts_griewankc)
+
+    def test_block_size(self):
+        mts_block = self.algo(population_size=10, block_size=4, seed=self.seed)
+        mts_blockc = self.algo(population_size=10, block_size=4, seed=self.seed)
+        AlgorithmTestCase.test_algorithm_run(self, mts_block, mts_blockc, MyProblem())
@@ -30,3 +30,9 @@ class ProblemTestCase(TestCase):
 
     def test_function_eval(self):
         self.assertEqual(np.inf, self.b.evaluate(self.Upper))
+
+    def test_function_eval_batch(self):
+        x = np.asarray([self.Lower, self.Upper])
+        self.assertTrue(np.array_equal(np.full(2, np.inf), self.b.evaluate_batch(x)))
+        self.assertRaises(ValueError, self.b.evaluate_batch, self.Upper)
+        self.assertRaises(ValueError, self.b.evaluate_batch, np.zeros((2, 3)))
@@ -3,7 +3,9 @@
 from unittest import TestCase
 
 import numpy as np
+from numpy.random import default_rng
 
+import niapy.problems as problems
 from niapy.util.factory import get_problem
 
 
@@ -266,3 +268,14 @@ class TestProblemFunctions(TestCase):
         """Test the cosine mixture function."""
         fun = get_problem('cosine_mixture', dimension=2, lower=-1, upper=1)
         self.assertAlmostEqual(fun(np.zeros(2)), -0.2)
+
+    def test_evaluate_batch(self):
+        """Test that batch evaluation matches evaluation of single solutions."""
+        rng = default_rng(1)
+        for name in problems.__all__:
+            if name == 'Problem':
+                continue
+            fun = getattr(problems, name)(dimension=self.dimension)
+            x = rng.uniform(fun.lower, fun.upper, (10, fun.dimension))
+            expected = np.asarray([fun(xi) for xi in x])
+            self.assertTrue(np.allclose(expected, fun.evaluate_batch(x), equal_nan=True), msg=name)
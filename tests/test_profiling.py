@@ -0,0 +1,48 @@
+# encoding=utf8
+from unittest import TestCase
+
+from niapy.algorithms.basic import DifferentialEvolution
+from niapy.callbacks import ProfilingCallback
+from niapy.profiling import Profiler
+from niapy.task import Task
+
+
+class ProfilerTestCase(TestCase):
+    def test_add_merge(self):
+        profiler = Profiler()
+        profiler.add('evaluate', 1.0, 10)
+        with profiler.measure('repair'):
+            pass
+        other = Profiler()
+        other.merge(profiler)
+        other.merge({'evaluate': [0.5, 5]})
+        self.assertEqual([1.5, 15], other.timings['evaluate'])
+        self.assertEqual(1, other.timings['repair'][1])
+        other.reset()
+        self.assertEqual({}, other.timings)
+
+    def test_breakdown(self):
+        profiler = Profiler()
+        profiler.add('init_population', 1.0)
+        profiler.add('run_iteration', 3.0, 3)
+        profiler.add('evaluate', 2.0, 40)
+        profiler.add('repair', 1.0, 40)
+        breakdown = profiler.breakdown()
+        self.assertAlmostEqual(1.0, breakdown['overhead']['seconds'])
+        self.assertAlmostEqual(0.5, breakdown['evaluate']['share'])
+        self.assertEqual(40, breakdown['repair']['calls'])
+        self.assertEqual(len(breakdown) + 1, len(profiler.report().splitlines()))
+
+
+class ProfilingCallbackTestCase(TestCase):
+    def test_run(self):
+        callback = ProfilingCallback()
+        task = Task(problem='sphere', dimension=5, max_iters=10, profiler=callback.profiler)
+        DifferentialEvolution(population_size=10, callbacks=[callback], seed=1).run(task)
+        timings = callback.profiler.timings
+        self.assertEqual(1, timings['init_population'][1])
+        self.assertEqual(10, timings['run_iteration'][1])
+        self.assertEqual(task.evals, timings['evaluate'][1])
+        self.assertEqual(110, timings['repair'][1])
+        self.assertEqual(1, len(callback.runs))
+        self.assertIn('overhead', callback.runs[0])
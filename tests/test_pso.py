@@ -3,6 +3,7 @@ from niapy.algorithms.basic import ParticleSwarmOptimization, ParticleSwarmAlgor
     OppositionVelocityClampingParticleSwarmOptimization, CenterParticleSwarmOptimization, \
     MutatedParticleSwarmOptimization, MutatedCenterParticleSwarmOptimization, \
     ComprehensiveLearningParticleSwarmOptimizer, MutatedCenterUnifiedParticleSwarmOptimization
+from niapy.task import Task
 from tests.test_algorithm import AlgorithmTestCase, MyProblem
 
 
@@ -45,6 +46,17 @@ class PSATestCase(AlgorithmTestCase):
         wvcpso_griewankc = ParticleSwarmAlgorithm(population_size=10, c1=2.0, c2=2.0, w=0.7, min_velocity=-4, max_velocity=4, seed=self.seed)
         AlgorithmTestCase.test_algorithm_run(self, wvcpso_griewank, wvcpso_griewankc)
 
+    def test_asynchronous(self):
+        wvcpso_async = ParticleSwarmAlgorithm(population_size=10, synchronous=False, seed=self.seed)
+        wvcpso_asyncc = ParticleSwarmAlgorithm(population_size=10, synchronous=False, seed=self.seed)
+        AlgorithmTestCase.test_algorithm_run(self, wvcpso_async, wvcpso_asyncc)
+
+    def test_large_swarm(self):
+        task = Task(problem='sphere', dimension=10, max_iters=3)
+        ParticleSwarmAlgorithm(population_size=10000, seed=self.seed).run(task)
+        self.assertEqual(40000, task.evals)
+        self.assertLessEqual(task.x_f, task.fitness_iters[0])
+
 
 class OVCPSOTestCase(AlgorithmTestCase):
     def setUp(self):
@@ -65,6 +77,11 @@ class OVCPSOTestCase(AlgorithmTestCase):
         wvcpso_griewankc = self.algo(population_size=10, c1=2.0, c2=2.0, w=0.7, min_velocity=-4, max_velocity=4, seed=self.seed)
         AlgorithmTestCase.test_algorithm_run(self, wvcpso_griewank, wvcpso_griewankc)
 
+    def test_asynchronous(self):
+        ovcpso_async = self.algo(population_size=10, synchronous=False, seed=self.seed)
+        ovcpso_asyncc = self.algo(population_size=10, synchronous=False, seed=self.seed)
+        AlgorithmTestCase.test_algorithm_run(self, ovcpso_async, ovcpso_asyncc)
+
 
 class CPSOTestCase(AlgorithmTestCase):
     def setUp(self):
@@ -164,3 +181,13 @@ class CLPSOTestCase(AlgorithmTestCase):
         clpso_griewank = self.algo(population_size=10, c1=2.0, c2=2.0, w=0.7, min_velocity=-4, max_velocity=4, seed=self.seed)
         clpso_griewankc = self.algo(population_size=10, c1=2.0, c2=2.0, w=0.7, min_velocity=-4, max_velocity=4, seed=self.seed)
         AlgorithmTestCase.test_algorithm_run(self, clpso_griewank, clpso_griewankc)
+
+    def test_refresh(self):
+        clpso_refresh = self.algo(population_size=10, m=0, seed=self.seed)
+        clpso_refreshc = self.algo(population_size=10, m=0, seed=self.seed)
+        AlgorithmTestCase.test_algorithm_run(self, clpso_refresh, clpso_refreshc)
+
+    def test_asynchronous(self):
+        clpso_async = self.algo(population_size=10, m=0, synchronous=False, seed=self.seed)
+        clpso_asyncc = self.algo(population_size=10, m=0, synchronous=False, seed=self.seed)
+        AlgorithmTestCase.test_algorithm_run(self, clpso_async, clpso_asyncc)
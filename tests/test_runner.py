@@ -1,9 +1,15 @@
 # encoding=utf8
+import os
+import tempfile
 from unittest import TestCase
 
 import numpy as np
 import niapy
+from niapy.algorithms import Algorithm
+from niapy.algorithms.basic import ParticleSwarmAlgorithm
+from niapy.evaluators import ThreadPoolEvaluator, SharedMemoryEvaluator
 from niapy.problems import Problem
+from niapy.sinks import CSVSink, JSONLinesSink, ResultSink
 
 
 class MyProblem(Problem):
@@ -14,13 +20,20 @@ class MyProblem(Problem):
         return np.sum(x ** 2)
 
 
+class FailingAlgorithm(Algorithm):
+    Name = ['FailingAlgorithm']
+
+    def run_iteration(self, task, population, population_fitness, best_x, best_fitness, **params):
+        raise ValueError('Run failed')
+
+
 class RunnerTestCase(TestCase):
     def setUp(self):
         self.algorithms = ['DifferentialEvolution', 'GreyWolfOptimizer', 'GeneticAlgorithm']
         self.problems = ['griewank', MyProblem(7)]
 
     def test_runner(self):
-        self.assertTrue(niapy.Runner(7, 100, 2, self.algorithms, self.problems).run())
+        self.assertTrue(niapy.Runner(7, 100, 2, self.algorithms, self.problems).run(export=None))
 
     def test_runner_bad_algorithm_throws(self):
         self.assertRaises(KeyError, lambda: niapy.Runner(4, 10, 3, ['EvolutionStrategy'], self.problems).run())
@@ -31,3 +44,123 @@ class RunnerTestCase(TestCase):
     def test_runner_bad_export_throws(self):
         self.assertRaises(TypeError,
                           lambda: niapy.Runner(4, 10, 3, ['GreyWolfOptimizer'], self.problems).run(export="pandas"))
+
+    def test_runner_evaluator(self):
+        with ThreadPoolEvaluator(max_workers=2) as evaluator:
+            runner = niapy.Runner(7, 100, 2, self.algorithms, self.problems, evaluator=evaluator)
+            self.assertIs(evaluator, runner.task_factory('griewank').evaluator)
+            self.assertTrue(runner.run(export=None))
+
+    def test_runner_seed(self):
+        first = niapy.Runner(7, 100, 2, self.algorithms, self.problems, seed=1).run(export=None)
+        second = niapy.Runner(7, 100, 2, self.algorithms, self.problems, seed=1).run(export=None)
+        self.assertEqual(['DifferentialEvolution', 'GreyWolfOptimizer', 'GeneticAlgorithm'], list(first))
+        for alg in first:
+            self.assertEqual(['griewank', 'MyProblem'], list(first[alg]))
+            runs = [f for _, f in first[alg]['griewank']]
+            self.assertEqual(runs, [f for _, f in second[alg]['griewank']])
+            self.assertNotEqual(runs[0], runs[1])
+
+    def test_runner_n_jobs(self):
+        algorithms = ['DifferentialEvolution', ParticleSwarmAlgorithm(population_size=10)]
+        calls = []
+        serial = niapy.Runner(7, 100, 3, algorithms, self.problems, seed=2).run(export=None)
+        parallel = niapy.Runner(7, 100, 3, algorithms, self.problems, n_jobs=2, seed=2).run(export=None, progress=lambda *a: calls.append(a))
+        self.assertEqual([(i, 12) for i in range(1, 13)], calls)
+        for alg in serial:
+            for problem in serial[alg]:
+                for (xs, fs), (xp, fp) in zip(serial[alg][problem], parallel[alg][problem]):
+                    self.assertEqual(fs, fp)
+                    self.assertTrue(np.array_equal(xs, xp))
+
+    def assert_sink(self, sink_type):
+        with tempfile.TemporaryDirectory() as tmp:
+            sink = sink_type(os.path.join(tmp, 'results'))
+            calls = []
+            first = niapy.Runner(7, 100, 2, self.algorithms[:2], self.problems, seed=3, sink=sink).run(export=None)
+            second = niapy.Runner(7, 100, 3, self.algorithms[:2], self.problems, seed=3, sink=sink).run(export=None, progress=lambda *a: calls.append(a))
+            rows = sink.read()
+            self.assertEqual(12, len(rows))
+            self.assertEqual(4, len(calls))
+            self.assertEqual(12, len(sink.completed()))
+            for row in rows:
+                self.assertEqual(100, row['evals'])
+                self.assertGreater(row['iters'], 0)
+                self.assertEqual((7,), row['best_x'].shape)
+                self.assertEqual(row['best_fitness'], second[row['algorithm']][row['problem']][row['run']][1])
+            for alg in first:
+                for problem in first[alg]:
+                    self.assertEqual(3, len(second[alg][problem]))
+                    self.assertEqual([f for _, f in first[alg][problem]], [f for _, f in second[alg][problem][:2]])
+
+    def assert_partial_line(self, sink_type):
+        with tempfile.TemporaryDirectory() as tmp:
+            sink = sink_type(os.path.join(tmp, 'results'))
+            row = {'algorithm': 'DifferentialEvolution', 'problem': 'griewank', 'run': 0, 'seed': 0, 'dimension': 3, 'max_evals': 10, 'best_fitness': 1.5,
+                   'evals': 10, 'iters': 2, 'time': 0.1, 'best_x': np.ones(3)}
+            sink.write(row)
+            with open(sink.path, 'a') as file:
+                file.write('DifferentialEvolution,gri')
+            sink.write(dict(row, run=1))
+            self.assertEqual([0, 1], [r['run'] for r in sink.read()])
+
+    def test_runner_sink_settings(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            sink = JSONLinesSink(os.path.join(tmp, 'results'))
+            calls = []
+            niapy.Runner(7, 100, 1, self.algorithms[:1], self.problems, seed=3, sink=sink).run(export=None)
+            niapy.Runner(7, 100, 1, self.algorithms[:1], self.problems, seed=3, sink=sink).run(export=None, progress=lambda *a: calls.append(a))
+            self.assertEqual([], calls)
+            for dimension, max_evals, seed in ((7, 100, 4), (5, 100, 3), (7, 200, 3)):
+                niapy.Runner(dimension, max_evals, 1, self.algorithms[:1], self.problems, seed=seed, sink=sink).run(
+                    export=None, progress=lambda *a: calls.append(a))
+            self.assertEqual(6, len(calls))
+            self.assertEqual(8, len(sink.read()))
+
+    def test_runner_jsonl_sink(self):
+        self.assert_sink(JSONLinesSink)
+
+    def test_runner_csv_sink(self):
+        self.assert_sink(CSVSink)
+
+    def test_abstract_sink(self):
+        self.assertRaises(TypeError, ResultSink, 'results')
+
+    def test_jsonl_sink_partial_line(self):
+        self.assert_partial_line(JSONLinesSink)
+
+    def test_csv_sink_partial_line(self):
+        self.assert_partial_line(CSVSink)
+
+    def test_runner_failed_run(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            sink = JSONLinesSink(os.path.join(tmp, 'results'))
+            runner = niapy.Runner(7, 100, 2, [FailingAlgorithm(population_size=5)], self.problems, n_jobs=2, seed=3, sink=sink)
+            self.assertRaises(ValueError, runner.run, export=None)
+            self.assertEqual([], sink.read())
+            sink.write({'algorithm': 'DifferentialEvolution', 'problem': 'griewank', 'run': 0, 'seed': 0, 'dimension': 7, 'max_evals': 100, 'best_fitness': None,
+                        'evals': 0, 'iters': 0, 'time': 0.0, 'best_x': None})
+            self.assertEqual(set(), sink.completed())
+            results = niapy.Runner(7, 100, 1, self.algorithms[:1], self.problems, seed=3, sink=sink).run(export=None)
+            self.assertIsNotNone(results['DifferentialEvolution']['griewank'][0][1])
+
+    def test_runner_stale_exception(self):
+        algorithm = ParticleSwarmAlgorithm(population_size=10)
+        algorithm.exception = ValueError('Earlier run failed')
+        results = niapy.Runner(7, 100, 1, [algorithm], self.problems, seed=1).run(export=None)
+        self.assertIsNotNone(results['ParticleSwarmAlgorithm']['griewank'][0][1])
+
+    def test_runner_profile(self):
+        runner = niapy.Runner(7, 100, 2, self.algorithms[:2], self.problems, seed=4, profile=True)
+        runner.run(export=None)
+        timings = runner.profiler.timings
+        self.assertEqual(8, timings['init_population'][1])
+        self.assertEqual(800, timings['evaluate'][1])
+        self.assertIn('overhead', runner.profiler.breakdown())
+
+    def test_runner_shared_memory_evaluator(self):
+        with SharedMemoryEvaluator(max_workers=2) as evaluator:
+            shared = niapy.Runner(7, 100, 1, self.algorithms[:1], self.problems, evaluator=evaluator, seed=5).run(export=None)
+        serial = niapy.Runner(7, 100, 1, self.algorithms[:1], self.problems, seed=5).run(export=None)
+        for problem in serial['DifferentialEvolution']:
+            self.assertEqual(serial['DifferentialEvolution'][problem][0][1], shared['DifferentialEvolution'][problem][0][1])
@@ -4,6 +4,7 @@ from unittest import TestCase
 import numpy as np
 from numpy.random import default_rng
 
+from niapy.cache import EvaluationCache
 from niapy.problems import Problem
 from niapy.task import Task
 from niapy.util.array import full_array
@@ -157,3 +158,166 @@ class TaskTestCase(TestCase):
         t_r1, t_r2 = self.task.convergence_data(x_axis='evals')
         self.assertTrue(np.array_equal(r2, t_r2))
         self.assertTrue(np.array_equal(r1, t_r1))
+
+    def test_repair_batch(self):
+        population = default_rng(1).uniform(-20, 20, (8, self.D))
+        expected = np.asarray([self.task.repair(x.copy()) for x in population])
+        repaired = self.task.repair_batch(population)
+        self.assertTrue(np.array_equal(expected, repaired))
+        self.assertFalse(np.array_equal(expected, population))
+        self.assertIs(population, self.task.repair_batch(population, out=population))
+        self.assertTrue(np.array_equal(expected, population))
+
+    def test_repair_batch_custom(self):
+        def clip(x, lower, upper, rng=None):
+            self.assertEqual(1, x.ndim)
+            return np.clip(x, lower, upper)
+
+        task = Task(dimension=self.D, lower=self.Lower, upper=self.Upper, problem='sphere', repair_function=clip)
+        population = default_rng(1).uniform(-20, 20, (8, self.D))
+        self.assertTrue(np.array_equal(np.clip(population, task.lower, task.upper), task.repair_batch(population)))
+
+    def test_record_evals(self):
+        values = (10, 8, 9, 4, 4, 3, 5, 2, 7, 7)
+        full = Task(dimension=self.D, lower=self.Lower, upper=self.Upper, problem='sphere')
+        single = Task(dimension=self.D, lower=self.Lower, upper=self.Upper, problem='sphere', record_evals=np.array([0.1, 0.45, 0.5, 1.0]) * 10)
+        batch = Task(dimension=self.D, lower=self.Lower, upper=self.Upper, problem='sphere', record_evals=[1, 5, 10])
+        for v in values:
+            full.eval(np.full(self.D, v)), single.eval(np.full(self.D, v))
+        batch.eval_batch(np.asarray([np.full(self.D, v) for v in values[:4]]))
+        batch.eval_batch(np.asarray([np.full(self.D, v) for v in values[4:]]))
+        evals, fitness = full.convergence_data(x_axis='evals')
+        for task in (single, batch):
+            t_evals, t_fitness = task.convergence_data(x_axis='evals')
+            self.assertTrue(np.array_equal(task.record_evals, t_evals))
+            self.assertTrue(np.array_equal(fitness[np.minimum(t_evals, evals[-1]) - 1], t_fitness))
+
+    def test_eval_batch(self):
+        pop = np.asarray([np.full(self.D, v) for v in (10, 8, 9, 4, 4, 3)])
+        task = Task(dimension=self.D, lower=self.Lower, upper=self.Upper, problem='sphere', max_evals=self.nFES, max_iters=self.nGEN, cutoff_value=0.0)
+        fitness = [task.eval(x) for x in pop]
+        self.assertTrue(np.array_equal(fitness, self.task.eval_batch(pop)))
+        self.assertEqual(task.evals, self.task.evals)
+        self.assertEqual(task.x_f, self.task.x_f)
+        self.assertTrue(np.array_equal(task.n_evals, self.task.n_evals))
+        self.assertTrue(np.array_equal(task.fitness_evals, self.task.fitness_evals))
+
+    def test_eval_batch_nan(self):
+        pop = np.asarray([np.full(self.D, v) for v in (5, -1, 3, 4, 1)])
+        sequential, batch = Task(problem=NaNProblem(self.D)), Task(problem=NaNProblem(self.D))
+        fitness = [sequential.eval(x) for x in pop]
+        self.assertTrue(np.array_equal(fitness, batch.eval_batch(pop), equal_nan=True))
+        self.assertEqual(sequential.x_f, batch.x_f)
+        self.assertEqual(self.D, batch.x_f)
+        self.assertTrue(np.array_equal(sequential.n_evals, batch.n_evals))
+        self.assertTrue(np.array_equal(sequential.fitness_evals, batch.fitness_evals))
+
+    def test_add_evals(self):
+        self.task.eval(np.full(self.D, 3))
+        self.task.add_evals(4, 5.0)
+        self.task.add_evals(2)
+        self.assertEqual(7, self.task.evals)
+        self.assertEqual(5.0, self.task.x_f)
+        self.assertTrue(np.array_equal([1, 5], self.task.n_evals))
+        self.assertTrue(np.array_equal([self.D * 9, 5.0], self.task.fitness_evals))
+
+    def test_eval_batch_over_max_evals(self):
+        pop = np.ones((self.nFES + 5, self.D))
+        fitness = self.task.eval_batch(pop)
+        self.assertEqual(self.nFES, self.task.evals)
+        self.assertTrue(np.all(fitness[:self.nFES] == self.D))
+        self.assertTrue(np.all(fitness[self.nFES:] == np.inf))
+        self.assertTrue(np.all(self.task.eval_batch(pop) == np.inf))
+
+    def test_eval_batch_cutoff_value(self):
+        pop = np.asarray([np.full(self.D, v) for v in (1, 0, 1)])
+        fitness = self.task.eval_batch(pop)
+        self.assertTrue(np.array_equal([self.D, 0, np.inf], fitness))
+        self.assertEqual(2, self.task.evals)
+        self.assertTrue(self.task.stopping_condition())
+
+
+class NaNProblem(Problem):
+    def __init__(self, dimension=3):
+        super().__init__(dimension, -10, 10)
+
+    def _evaluate(self, x):
+        return np.nan if x[0] < 0 else np.sum(x ** 2)
+
+
+class CountingProblem(Problem):
+    def __init__(self, dimension=3):
+        super().__init__(dimension, -10, 10)
+        self.calls = 0
+
+    def _evaluate(self, x):
+        self.calls += 1
+        return np.sum(x ** 2)
+
+
+class EvaluationCacheTestCase(TestCase):
+    def test_hits_misses(self):
+        cache = EvaluationCache()
+        key = cache.key(np.ones(3))
+        self.assertIsNone(cache.get(key))
+        cache.put(key, 3.0)
+        self.assertEqual(3.0, cache.get(key))
+        self.assertEqual((1, 1), (cache.hits, cache.misses))
+        self.assertAlmostEqual(0.5, cache.hit_rate)
+        cache.clear()
+        self.assertEqual((0, 0, 0), (len(cache), cache.hits, cache.misses))
+
+    def test_lru_eviction(self):
+        cache = EvaluationCache(max_size=2)
+        keys = [cache.key(np.full(3, i)) for i in range(3)]
+        cache.put(keys[0], 0.0)
+        cache.put(keys[1], 1.0)
+        cache.get(keys[0])
+        cache.put(keys[2], 2.0)
+        self.assertIn(keys[0], cache)
+        self.assertNotIn(keys[1], cache)
+        self.assertIn(keys[2], cache)
+
+    def test_decimals(self):
+        cache = EvaluationCache(decimals=6)
+        self.assertEqual(cache.key(np.array([0.1 + 0.2, -0.0])), cache.key(np.array([0.3, 0.0])))
+        self.assertNotEqual(EvaluationCache().key(np.array([0.1 + 0.2])), EvaluationCache().key(np.array([0.3])))
+
+    def test_eval_count_hits(self):
+        problem = CountingProblem()
+        task = Task(problem=problem, max_evals=3, cache=EvaluationCache())
+        self.assertEqual(3, task.eval(np.ones(3)))
+        self.assertEqual(3, task.eval(np.ones(3)))
+        self.assertEqual((1, 2), (problem.calls, task.evals))
+
+    def test_eval_free_hits(self):
+        problem = CountingProblem()
+        task = Task(problem=problem, max_evals=2, cache=EvaluationCache(count_hits=False))
+        for _ in range(5):
+            task.eval(np.ones(3))
+        self.assertEqual((1, 1), (problem.calls, task.evals))
+        self.assertEqual(12, task.eval(np.full(3, 2)))
+        self.assertTrue(task.stopping_condition())
+        self.assertEqual(np.inf, task.eval(np.zeros(3)))
+
+    def test_eval_batch(self):
+        pop = np.asarray([np.full(3, v) for v in (3, 2, 3, 1, 2, 0)])
+        problem = CountingProblem()
+        task = Task(problem=problem, max_evals=5, cache=EvaluationCache())
+        expected = Task(problem=CountingProblem(), max_evals=5)
+        fitness = [expected.eval(x) for x in pop]
+        self.assertTrue(np.array_equal(fitness, task.eval_batch(pop)))
+        self.assertEqual(3, problem.calls)
+        self.assertEqual(expected.evals, task.evals)
+        self.assertTrue(np.array_equal(expected.n_evals, task.n_evals))
+        self.assertTrue(np.array_equal(expected.fitness_evals, task.fitness_evals))
+        self.assertEqual((2, 3), (task.cache.hits, task.cache.misses))
+
+    def test_eval_batch_free_hits(self):
+        pop = np.asarray([np.full(3, v) for v in (3, 3, 2, 3, 1, 0)])
+        problem = CountingProblem()
+        task = Task(problem=problem, max_evals=2, cache=EvaluationCache(count_hits=False))
+        fitness = task.eval_batch(pop)
+        self.assertTrue(np.array_equal([27, 27, 12, 27, np.inf, np.inf], fitness))
+        self.assertEqual((2, 2), (problem.calls, task.evals))
+        self.assertTrue(np.array_equal([1, 2], task.n_evals))
@@ -1,10 +1,17 @@
 # encoding=utf8
-from unittest import TestCase
+from importlib.metadata import EntryPoint
+from unittest import TestCase, mock
 
 import numpy as np
 from numpy.random import default_rng
 
-from niapy.util import full_array, repair
+from niapy.algorithms import Algorithm
+from niapy.algorithms.basic import DifferentialEvolution, ParticleSwarmAlgorithm
+from niapy.problems import Problem, Sphere
+from niapy.util import full_array, repair, GrowableArray
+from niapy.util.distances import euclidean, pairwise_distances, condensed_distances, radius_neighbors, DistanceCache
+from niapy.util.factory import _Registry, get_algorithm, get_problem, register_algorithm, register_problem
+from niapy.util.spatial import BruteForceIndex, KDTree, GridIndex
 
 
 class FullArrayTestCase(TestCase):
@@ -109,6 +116,141 @@ class FullArrayTestCase(TestCase):
         self.assertTrue(np.array_equal(arr, np.asarray(a)))
 
 
+class FactoryTestCase(TestCase):
+    def test_case_insensitive(self):
+        self.assertIsInstance(get_algorithm('differentialEVOLUTION', population_size=10), DifferentialEvolution)
+        self.assertIsInstance(get_problem('Sphere', dimension=5), Sphere)
+        self.assertRaises(KeyError, get_algorithm, 'NoSuchAlgorithm')
+
+    def test_builtin_aliases(self):
+        self.assertIsInstance(get_algorithm('DE'), DifferentialEvolution)
+        self.assertIsInstance(get_algorithm('pso'), ParticleSwarmAlgorithm)
+
+    def test_register_algorithm(self):
+        @register_algorithm
+        class MyRegisteredAlgorithm(Algorithm):
+            Name = ['MyRegisteredAlgorithm', 'MRA']
+
+        self.assertIsInstance(get_algorithm('mra'), MyRegisteredAlgorithm)
+        self.assertIsInstance(get_algorithm('MyRegisteredAlgorithm'), MyRegisteredAlgorithm)
+
+    def test_register_problem(self):
+        @register_problem('my_registered_problem', 'mrp')
+        class MyRegisteredProblem(Problem):
+            def __init__(self, dimension=4, *args, **kwargs):
+                super().__init__(dimension, -1.0, 1.0, *args, **kwargs)
+
+            def _evaluate(self, x):
+                return x.sum()
+
+        self.assertIsInstance(get_problem('MRP', dimension=3), MyRegisteredProblem)
+        self.assertEqual(3, get_problem('my_registered_problem', dimension=3).dimension)
+
+    def test_entry_points(self):
+        registry = _Registry('niapy.algorithms', {'DifferentialEvolution': 'niapy.algorithms.basic.DifferentialEvolution'})
+        plugin = EntryPoint(name='MyPlugin', value='niapy.algorithms.basic:ParticleSwarmAlgorithm', group='niapy.algorithms')
+        shadow = EntryPoint(name='DifferentialEvolution', value='niapy.algorithms.basic:ParticleSwarmAlgorithm', group='niapy.algorithms')
+        with mock.patch('niapy.util.factory.entry_points', return_value=[plugin, shadow]) as entry_points:
+            self.assertIs(ParticleSwarmAlgorithm, registry.get('myplugin'))
+            self.assertIs(DifferentialEvolution, registry.get('differentialevolution'))
+            self.assertRaises(KeyError, registry.get, 'unknown')
+        entry_points.assert_called_once_with(group='niapy.algorithms')
+        self.assertEqual(['differentialevolution', 'myplugin'], registry.names())
+
+
+class GrowableArrayTestCase(TestCase):
+    def test_append_extend(self):
+        a = GrowableArray(dtype=np.int64, capacity=2)
+        values = []
+        for i in range(10):
+            a.append(i)
+            values.append(i)
+        snapshot = a.values
+        a.extend(range(10, 50))
+        values.extend(range(10, 50))
+        self.assertEqual(50, len(a))
+        self.assertTrue(np.array_equal(values, a.values))
+        self.assertTrue(np.array_equal(np.arange(10), snapshot))
+        self.assertEqual(np.int64, np.asarray(a).dtype)
+        self.assertFalse(a.values.flags.writeable)
+
+
+class DistancesTestCase(TestCase):
+    def setUp(self):
+        rng = default_rng(1)
+        self.x = rng.uniform(-10, 10, (23, 4))
+        self.y = rng.uniform(-10, 10, (7, 4))
+        self.expected = euclidean(self.x[:, np.newaxis], self.x[np.newaxis, :])
+
+    def test_pairwise(self):
+        np.testing.assert_allclose(pairwise_distances(self.x), self.expected, atol=1e-10)
+        np.testing.assert_array_equal(np.diag(pairwise_distances(self.x)), np.zeros(23))
+        np.testing.assert_allclose(pairwise_distances(self.x, squared=True), self.expected ** 2, atol=1e-9)
+        np.testing.assert_allclose(pairwise_distances(self.x, self.y), euclidean(self.x[:, np.newaxis], self.y[np.newaxis, :]), atol=1e-10)
+
+    def test_pairwise_blocks(self):
+        np.testing.assert_allclose(pairwise_distances(self.x, block_size=5), pairwise_distances(self.x))
+        np.testing.assert_allclose(pairwise_distances(self.x, self.y, block_size=3), pairwise_distances(self.x, self.y))
+
+    def test_condensed(self):
+        i, j = np.triu_indices(23, k=1)
+        np.testing.assert_allclose(condensed_distances(self.x, block_size=4), self.expected[i, j], atol=1e-10)
+
+    def test_radius_neighbors(self):
+        neighbors = radius_neighbors(self.x, 8.0, block_size=6)
+        for i, n in enumerate(neighbors):
+            expected = np.flatnonzero(self.expected[i] <= 8.0)
+            np.testing.assert_array_equal(n, expected[expected != i])
+        radius = np.linspace(1, 20, 23)
+        neighbors = radius_neighbors(self.x, radius, include_self=True)
+        for i, n in enumerate(neighbors):
+            np.testing.assert_array_equal(n, np.flatnonzero(self.expected[i] <= radius[i]))
+
+    def test_cache(self):
+        cache = DistanceCache()
+        d = cache.distances(self.x)
+        self.assertIs(cache.distances(self.x), d)
+        self.assertIsNot(cache.distances(self.x.copy()), d)
+        cache.clear()
+        np.testing.assert_allclose(cache.distances(self.x), d)
+
+
+class SpatialIndexTestCase(TestCase):
+    def setUp(self):
+        rng = default_rng(2)
+        self.x = rng.uniform(-10, 10, (300, 3))
+        self.q = rng.uniform(-12, 12, (40, 3))
+        self.radius = rng.uniform(0.5, 6, 40)
+        self.distances = euclidean(self.q[:, np.newaxis], self.x[np.newaxis, :])
+
+    def check(self, index, strict=False):
+        neighbors = index.query_radius(self.q, self.radius, strict=strict)
+        self.assertEqual(len(neighbors), len(self.q))
+        for i, n in enumerate(neighbors):
+            inside = self.distances[i] < self.radius[i] if strict else self.distances[i] <= self.radius[i]
+            np.testing.assert_array_equal(n, np.flatnonzero(inside))
+
+    def test_brute_force(self):
+        self.check(BruteForceIndex(self.x))
+        self.check(BruteForceIndex(self.x), strict=True)
+
+    def test_kdtree(self):
+        self.check(KDTree(self.x))
+        self.check(KDTree(self.x, leaf_size=1), strict=True)
+        neighbors = KDTree(self.x).query_radius(self.x, 100.0)
+        np.testing.assert_array_equal(neighbors[0], np.arange(300))
+
+    def test_grid(self):
+        self.check(GridIndex(self.x))
+        self.check(GridIndex(self.x, cell_size=1.5), strict=True)
+
+    def test_duplicates(self):
+        x = np.zeros((50, 2))
+        for index in (BruteForceIndex(x), KDTree(x, leaf_size=4), GridIndex(x)):
+            neighbors = index.query_radius(x[:2], 0.0)
+            np.testing.assert_array_equal(neighbors[1], np.arange(50))
+
+
 def generate_individual(dim, upper, lower):
     upp, low = full_array(upper, dim), full_array(lower, dim)
     return default_rng().uniform(low, upp, dim)
@@ -144,6 +286,18 @@ class LimitRepairTestCase(TestCase):
         self.assertFalse((x > self.Upper).any())
         self.assertFalse((x < self.Lower).any())
 
+    def test_repair_population(self):
+        population = default_rng(1).uniform(-100, 100, (20, self.D))
+        rows = np.asarray([self.met(x.copy(), self.Lower, self.Upper, rng=default_rng(2)) for x in population])
+        scratch = {}
+        for _ in range(2):
+            x = population.copy()
+            self.assertIs(x, self.met(x, self.Lower, self.Upper, rng=default_rng(2), scratch=scratch))
+            self.assertFalse((x > self.Upper).any())
+            self.assertFalse((x < self.Lower).any())
+            if self.met is not repair.rand:
+                self.assertTrue(np.array_equal(rows, x))
+
 
 class LimitInverseRepairTestCase(LimitRepairTestCase):
     def setUp(self):